@@ -22,6 +22,9 @@ The corpus package includes basic and n-gram corpus classes:
 - :py:class:`NGramCorpus`
 - :py:class:`UnigramCorpus`
 
+and the :py:class:`SymSpell` spelling suggestion index & the
+:py:class:`WordSegmenter`, which use their counts.
+
 
 As a quick example of :py:class:`.Corpus`:
 
@@ -53,9 +56,17 @@ an :py:class:`.NGramCorpus` and calculate TF values:
 
 from ._corpus import Corpus
 from ._ngram_corpus import NGramCorpus
+from ._sym_spell import SymSpell
 from ._unigram_corpus import UnigramCorpus
-
-__all__ = ['Corpus', 'NGramCorpus', 'UnigramCorpus']
+from ._word_segmenter import WordSegmenter
+
+__all__ = [
+    'Corpus',
+    'NGramCorpus',
+    'SymSpell',
+    'UnigramCorpus',
+    'WordSegmenter',
+]
 
 
 if __name__ == '__main__':
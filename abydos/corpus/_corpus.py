@@ -20,13 +20,210 @@ The Corpus class is a container for linguistic corpora and includes various
 functions for corpus statistics, language modeling, etc.
 """
 
+from collections import Counter
+from glob import glob
 from math import log
-from typing import Callable, List, Optional, Set, Tuple, Union
+from typing import (
+    Callable,
+    Counter as TCounter,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 
 from ..tokenizer import _Tokenizer
 
 __all__ = ['Corpus']
 
+# The number of document frequency tables (one per distinct transform) kept
+_DF_TABLES = 8
+
+# The number of characters read from a file at a time when splitting it into
+# documents
+_CHUNK_SIZE = 1 << 16
+
+
+def _parse_document(
+    document: str,
+    sent_split: str,
+    filter_chars: Set[str],
+    stop_words: FrozenSet[str],
+    word_tokenizer: Optional[_Tokenizer],
+) -> List[List[str]]:
+    """Split a document into sentences of words.
+
+    Parameters
+    ----------
+    document : str
+        The document text
+    sent_split : str
+        A character or string used to split the document into sentences
+    filter_chars : set
+        Characters to filter out of the words
+    stop_words : frozenset
+        Words to filter out of the sentences
+    word_tokenizer : _Tokenizer
+        A tokenizer to apply to each sentence in order to retrieve the
+        individual "word" tokens. If set to none, str.split() will be used.
+
+    Returns
+    -------
+    [[str]]
+        The non-empty sentences of the document, as lists of words
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    doc = []  # type: List[List[str]]
+    for sentence in document.split(sent_split):
+        if word_tokenizer:
+            sentence_words = word_tokenizer.tokens(sentence)
+        else:
+            sentence_words = sentence.split()
+
+        if stop_words:
+            sentence_words = [
+                word for word in sentence_words if word not in stop_words
+            ]
+        for char in filter_chars:
+            sentence_words = [
+                word.replace(char, '') for word in sentence_words
+            ]
+        if sentence_words:
+            doc.append(sentence_words)
+    return doc
+
+
+class _FileDocuments:
+    """The documents of a sequence of text files, read as they are iterated.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self, paths: List[str], doc_split: str, encoding: str
+    ) -> None:
+        """Initialize _FileDocuments instance.
+
+        Parameters
+        ----------
+        paths : list of str
+            The filenames of the files
+        doc_split : str
+            A character or string used to split each file into documents
+        encoding : str
+            The encoding of the files
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._paths = paths
+        self._doc_split = doc_split
+        self._encoding = encoding
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the documents of the files.
+
+        Yields
+        ------
+        str
+            Each document, as the text between two doc_splits of a file
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        doc_split = self._doc_split
+        for path in self._paths:
+            with open(path, encoding=self._encoding) as text:
+                buffer = ''
+                for chunk in iter(lambda: text.read(_CHUNK_SIZE), ''):
+                    # only the text that has been added to the buffer (& a
+                    # split that may straddle it) need be searched
+                    search = max(0, len(buffer) - len(doc_split) + 1)
+                    buffer += chunk
+                    start = 0
+                    end = buffer.find(doc_split, search)
+                    while end >= 0:
+                        yield buffer[start:end]
+                        start = end + len(doc_split)
+                        end = buffer.find(doc_split, start)
+                    buffer = buffer[start:]
+                yield buffer
+
+
+class _Documents:
+    """The documents of a lazily constructed corpus.
+
+    Documents are parsed into sentences of words only as they are iterated
+    over, so a corpus larger than memory can be traversed any number of times.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        source: Iterable[str],
+        sent_split: str,
+        filter_chars: Set[str],
+        stop_words: FrozenSet[str],
+        word_tokenizer: Optional[_Tokenizer],
+    ) -> None:
+        """Initialize _Documents instance.
+
+        Parameters
+        ----------
+        source : iterable of str
+            The texts of the documents
+        sent_split : str
+            A character or string used to split documents into sentences
+        filter_chars : set
+            Characters to filter out of the words
+        stop_words : frozenset
+            Words to filter out of the sentences
+        word_tokenizer : _Tokenizer
+            A tokenizer to apply to each sentence in order to retrieve the
+            individual "word" tokens. If set to none, str.split() will be used.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._source = source
+        self._parse_args = (
+            sent_split,
+            filter_chars,
+            stop_words,
+            word_tokenizer,
+        )
+
+    def __iter__(self) -> Iterator[List[List[str]]]:
+        """Iterate over the non-empty documents, parsing each in turn.
+
+        Yields
+        ------
+        [[str]]
+            Each document, as a list of sentences of words
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for document in self._source:
+            doc = _parse_document(document, *self._parse_args)
+            if doc:
+                yield doc
+
 
 class Corpus:
     """Corpus class.
@@ -83,32 +280,233 @@ class Corpus:
         .. versionadded:: 0.1.0
 
         """
-        self.corpus = []  # type: List[List[List[str]]]
+        self.corpus = []  # type: Union[List[List[List[str]]], _Documents]
         self.doc_split = doc_split
         self.sent_split = sent_split
+        self._df_key = None  # type: Optional[Tuple[object, int]]
+        self._df_tables = (
+            {}
+        )  # type: Dict[Optional[Callable[[str], str]], TCounter[str]]
+        self._df_docs = 0
+        self._parse_args = (
+            sent_split,
+            set(filter_chars),
+            frozenset(stop_words or ()),
+            word_tokenizer,
+        )
 
         for document in corpus_text.split(doc_split):
-            doc = []  # type: List[List[str]]
-            for sentence in document.split(sent_split):
-                if word_tokenizer:
-                    word_tokenizer.tokenize(sentence)
-                    sentence_words = word_tokenizer.get_list()
-                else:
-                    sentence_words = sentence.split()
-
-                if stop_words:
-                    for word in set(stop_words):
-                        while word in sentence_words:
-                            sentence_words.remove(word)
-                for char in set(filter_chars):
-                    sentence_words = [
-                        word.replace(char, '') for word in sentence_words
-                    ]
-                if sentence_words:
-                    doc.append(sentence_words)
+            doc = _parse_document(document, *self._parse_args)
             if doc:
                 self.corpus.append(doc)
 
+    @classmethod
+    def from_iterable(
+        cls,
+        docs: Iterable[str],
+        sent_split: str = '\n',
+        filter_chars: Union[str, List[str], Set[str], Tuple[str]] = '',
+        stop_words: Optional[Union[List[str], Set[str], Tuple[str]]] = None,
+        word_tokenizer: Optional[_Tokenizer] = None,
+    ) -> 'Corpus':
+        r"""Construct a corpus whose documents are read lazily.
+
+        The documents are parsed only as the corpus is iterated over, by
+        :py:meth:`iter_docs` and the other iter\_ methods or by
+        :py:meth:`idf`, so the corpus need not fit in memory. Each traversal of
+        the corpus iterates over docs again, so docs should be a collection,
+        or an object whose __iter__ reads the documents afresh, rather than a
+        one-off iterator if the corpus is to be traversed more than once.
+
+        The document frequency tables behind :py:meth:`idf` are built in one
+        pass over docs & kept, since counting the documents to check for
+        changes would take another pass, so call :py:meth:`invalidate` after
+        docs changes to have them rebuilt.
+
+        Parameters
+        ----------
+        docs : iterable of str
+            The texts of the documents
+        sent_split : str
+            A character or string used to split documents into sentences
+        filter_chars : list or set or tuple or str
+            A list of characters (as a string, tuple, set, or list) to filter
+            out of the corpus text
+        stop_words : list or set or tuple
+            A list of words (as a tuple, set, or list) to filter out of the
+            corpus text
+        word_tokenizer : _Tokenizer
+            A tokenizer to apply to each sentence in order to retrieve the
+            individual "word" tokens. If set to none, str.split() will be used.
+
+        Returns
+        -------
+        Corpus
+            The corpus
+
+        Example
+        -------
+        >>> corp = Corpus.from_iterable(['The quick brown fox.',
+        ...                              'And then it slept.\n It slept.'])
+        >>> list(corp.iter_sents())
+        [['The', 'quick', 'brown', 'fox.'], ['And', 'then', 'it', 'slept.'],
+        ['It', 'slept.']]
+        >>> round(corp.idf('slept.'), 10)
+        0.6931471806
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        corpus = cls(
+            sent_split=sent_split,
+            filter_chars=filter_chars,
+            stop_words=stop_words,
+            word_tokenizer=word_tokenizer,
+        )
+        corpus.corpus = _Documents(docs, *corpus._parse_args)
+        return corpus
+
+    @classmethod
+    def from_files(
+        cls,
+        paths: Union[str, Iterable[str]],
+        doc_split: str = '\n\n',
+        sent_split: str = '\n',
+        filter_chars: Union[str, List[str], Set[str], Tuple[str]] = '',
+        stop_words: Optional[Union[List[str], Set[str], Tuple[str]]] = None,
+        word_tokenizer: Optional[_Tokenizer] = None,
+        encoding: str = 'utf-8',
+    ) -> 'Corpus':
+        r"""Construct a corpus whose documents are read lazily from files.
+
+        The files are split into documents as they are read, a chunk at a
+        time, and the documents are parsed only as the corpus is iterated
+        over, as in :py:meth:`from_iterable`, so neither the files nor the
+        corpus need fit in memory. The documents are those that the
+        concatenated texts would give to :py:class:`Corpus`, except that no
+        document spans two files.
+
+        As in :py:meth:`from_iterable`, the document frequency tables behind
+        :py:meth:`idf` are kept once built, so call :py:meth:`invalidate`
+        after the files change to have them rebuilt.
+
+        Parameters
+        ----------
+        paths : str or iterable of str
+            A glob pattern matching the files, or a list of their filenames
+        doc_split : str
+            A character or string used to split the files into documents
+        sent_split : str
+            A character or string used to split documents into sentences
+        filter_chars : list or set or tuple or str
+            A list of characters (as a string, tuple, set, or list) to filter
+            out of the corpus text
+        stop_words : list or set or tuple
+            A list of words (as a tuple, set, or list) to filter out of the
+            corpus text
+        word_tokenizer : _Tokenizer
+            A tokenizer to apply to each sentence in order to retrieve the
+            individual "word" tokens. If set to none, str.split() will be used.
+        encoding : str
+            The encoding of the files
+
+        Returns
+        -------
+        Corpus
+            The corpus
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(paths, str):
+            paths = sorted(glob(paths))
+        corpus = cls(
+            doc_split=doc_split,
+            sent_split=sent_split,
+            filter_chars=filter_chars,
+            stop_words=stop_words,
+            word_tokenizer=word_tokenizer,
+        )
+        corpus.corpus = _Documents(
+            _FileDocuments(list(paths), doc_split, encoding),
+            *corpus._parse_args
+        )
+        return corpus
+
+    def iter_docs(self) -> Iterator[List[List[str]]]:
+        r"""Iterate over the docs in the corpus.
+
+        Yields
+        ------
+        [[str]]
+            Each doc, as a list of sentences, each a list of words
+
+        Example
+        -------
+        >>> tqbf = 'The quick brown fox jumped over the lazy dog.\n\n'
+        >>> tqbf += 'And then it slept.\n And the dog ran off.'
+        >>> corp = Corpus(tqbf)
+        >>> for doc in corp.iter_docs():
+        ...     print(doc)
+        [['The', 'quick', 'brown', 'fox', 'jumped', 'over', 'the', 'lazy',
+        'dog.']]
+        [['And', 'then', 'it', 'slept.'], ['And', 'the', 'dog', 'ran',
+        'off.']]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return iter(self.corpus)
+
+    def iter_sents(self) -> Iterator[List[str]]:
+        r"""Iterate over the sentences in the corpus.
+
+        Yields
+        ------
+        [str]
+            Each sentence, as a list of words
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for doc in self.corpus:
+            yield from doc
+
+    def iter_words(self) -> Iterator[str]:
+        r"""Iterate over the words in the corpus.
+
+        Yields
+        ------
+        str
+            Each word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for doc in self.corpus:
+            for sent in doc:
+                yield from sent
+
+    def iter_docs_of_words(self) -> Iterator[List[str]]:
+        r"""Iterate over the docs in the corpus, with sentences flattened.
+
+        Yields
+        ------
+        [str]
+            Each doc, as a list of all its words
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for doc in self.corpus:
+            yield [words for sents in doc for words in sents]
+
     def docs(self) -> List[List[List[str]]]:
         r"""Return the docs in the corpus.
 
@@ -136,6 +534,8 @@ class Corpus:
         .. versionadded:: 0.1.0
 
         """
+        if isinstance(self.corpus, _Documents):
+            return list(self.corpus)
         return self.corpus
 
     def paras(self) -> List[List[List[str]]]:
@@ -192,7 +592,7 @@ class Corpus:
         3
 
         """
-        return [words for sents in self.corpus for words in sents]
+        return list(self.iter_sents())
 
     def words(self) -> List[str]:
         r"""Return the words in the corpus as a single list.
@@ -218,7 +618,7 @@ class Corpus:
         .. versionadded:: 0.1.0
 
         """
-        return [words for sents in self.sents() for words in sents]
+        return list(self.iter_words())
 
     def docs_of_words(self) -> List[List[str]]:
         r"""Return the docs in the corpus, with sentences flattened.
@@ -247,9 +647,7 @@ class Corpus:
         .. versionadded:: 0.1.0
 
         """
-        return [
-            [words for sents in doc for words in sents] for doc in self.corpus
-        ]
+        return list(self.iter_docs_of_words())
 
     def raw(self) -> str:
         r"""Return the raw corpus.
@@ -324,23 +722,143 @@ class Corpus:
         .. versionadded:: 0.1.0
 
         """
-        docs_with_term = 0
-        docs = self.docs_of_words()
-        for doc in docs:
-            doc_set = set(doc)
-            if transform:
-                transformed_doc = []
-                for word in doc_set:
-                    transformed_doc.append(transform(word))
-                doc_set = set(transformed_doc)
-
-            if term in doc_set:
-                docs_with_term += 1
-
+        docs_with_term = self.doc_freqs(transform).get(term, 0)
         if docs_with_term == 0:
             return float('inf')
 
-        return log(len(docs) / docs_with_term)
+        return log(self._df_docs / docs_with_term)
+
+    def idf_many(
+        self,
+        terms: Iterable[str],
+        transform: Optional[Callable[[str], str]] = None,
+    ) -> np.ndarray:
+        r"""Calculate the Inverse Document Frequencies of many terms.
+
+        Parameters
+        ----------
+        terms : iterable of str
+            The terms to calculate the IDFs of
+        transform : function
+            A function to apply to each document term before checking for the
+            presence of each term
+
+        Returns
+        -------
+        numpy.ndarray
+            The IDFs, as :py:meth:`idf` would return them
+
+        Examples
+        --------
+        >>> tqbf = 'The quick brown fox jumped over the lazy dog.\n\n'
+        >>> tqbf += 'And then it slept.\n\n And the dog ran off.'
+        >>> corp = Corpus(tqbf)
+        >>> corp.idf_many(['dog', 'the', 'cat']).round(10).tolist()
+        [1.0986122887, 0.4054651081, inf]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        doc_freqs = self.doc_freqs(transform)
+        docs_with_terms = np.array(
+            [doc_freqs.get(term, 0) for term in terms], dtype=np.float64
+        )
+        idfs = np.full(len(docs_with_terms), np.inf)
+        found = docs_with_terms > 0
+        idfs[found] = np.log(self._df_docs / docs_with_terms[found])
+        return idfs
+
+    def doc_freqs(
+        self, transform: Optional[Callable[[str], str]] = None
+    ) -> TCounter[str]:
+        r"""Return the number of documents in which each term occurs.
+
+        The table is built in one pass over the corpus the first time it is
+        needed for a transform, and kept for later calls with the same
+        transform, so :py:meth:`idf` & :py:meth:`idf_many` cost only a
+        lookup per term. Tables are rebuilt if self.corpus is replaced or
+        documents are added to or removed from it, but documents edited in
+        place are not noticed: call :py:meth:`invalidate` after editing them.
+
+        Parameters
+        ----------
+        transform : function
+            A function to apply to each document term before counting it
+
+        Returns
+        -------
+        Counter
+            The document frequency of each (transformed) term
+
+        Examples
+        --------
+        >>> tqbf = 'The quick brown fox jumped over the lazy dog.\n\n'
+        >>> tqbf += 'And then it slept.\n\n And the dog ran off.'
+        >>> corp = Corpus(tqbf)
+        >>> corp.doc_freqs()['the']
+        2
+        >>> corp.doc_freqs()['and']
+        0
+        >>> corp.doc_freqs(str.lower)['and']
+        2
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # only the identity of a lazily constructed corpus is checked, sparing
+        # a pass over its documents to count them; changes to its source need
+        # an explicit invalidate
+        size = len(self.corpus) if isinstance(self.corpus, list) else -1
+        if (
+            self._df_key is None
+            or self._df_key[0] is not self.corpus
+            or self._df_key[1] != size
+        ):
+            self.invalidate()
+            self._df_key = (self.corpus, size)
+
+        doc_freqs = self._df_tables.get(transform)
+        if doc_freqs is None:
+            doc_freqs = Counter()
+            self._df_docs = 0
+            for doc in self.corpus:
+                doc_set = {word for sent in doc for word in sent}
+                if transform:
+                    doc_set = {transform(word) for word in doc_set}
+                doc_freqs.update(doc_set)
+                self._df_docs += 1
+
+            if len(self._df_tables) >= _DF_TABLES:
+                del self._df_tables[next(iter(self._df_tables))]
+            self._df_tables[transform] = doc_freqs
+        return doc_freqs
+
+    def invalidate(self) -> None:
+        r"""Discard the document frequency tables, to rebuild them when needed.
+
+        Call this after editing the documents of self.corpus in place, or
+        after the source of a corpus constructed by :py:meth:`from_iterable`
+        or :py:meth:`from_files` changes, which :py:meth:`doc_freqs` cannot
+        notice.
+
+        Examples
+        --------
+        >>> corp = Corpus('a b\n\nc d')
+        >>> round(corp.idf('a'), 10)
+        0.6931471806
+        >>> corp.corpus[0] = [['x']]
+        >>> corp.invalidate()
+        >>> corp.idf('a')
+        inf
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._df_key = None
+        self._df_tables = {}
 
 
 if __name__ == '__main__':
@@ -0,0 +1,319 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.corpus._gng.
+
+Sharded Google NGram importing
+"""
+
+import bz2
+import gzip
+import io
+import os
+import pickle  # noqa: S403
+from collections import Counter
+from glob import glob
+from multiprocessing import Pool, cpu_count
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Counter as TCounter,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+__all__ = ['_count_ngram_shard', '_count_unigram_shard', '_import_shards']
+
+
+def _open_shard(path: str) -> IO[str]:
+    """Open a Google NGram file as text, decompressing it if necessary.
+
+    Gzip & bzip2 files are recognized by their magic numbers, whatever their
+    names.
+
+    Parameters
+    ----------
+    path : str
+        The filename of the Google NGram file
+
+    Returns
+    -------
+    file object
+        The file, opened for reading UTF-8 text
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    with open(path, 'rb') as shard:
+        magic = shard.read(3)
+    if magic[:2] == b'\x1f\x8b':
+        return io.TextIOWrapper(gzip.open(path), encoding='utf-8')
+    if magic == b'BZh':
+        return io.TextIOWrapper(bz2.open(path), encoding='utf-8')
+    return open(path, encoding='utf-8')
+
+
+def _count_unigram_shard(path: str) -> Tuple[TCounter[str], TCounter[str]]:
+    """Total the counts & document counts of each word in a unigram file.
+
+    As in :py:meth:`.UnigramCorpus.gng_importer`, part-of-speech suffixes are
+    removed from words.
+
+    Parameters
+    ----------
+    path : str
+        The filename of the Google NGram file
+
+    Returns
+    -------
+    tuple(Counter, Counter)
+        The counts & the document counts of the words
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    counts = Counter()  # type: TCounter[str]
+    doc_counts = Counter()  # type: TCounter[str]
+    with _open_shard(path) as gng:
+        for line in gng:
+            word, _, count, doc_count = line.rstrip().split('\t')
+            if '_' in word:
+                word = word[: word.find('_')]
+            counts[word] += int(count)
+            doc_counts[word] += int(doc_count)
+    return counts, doc_counts
+
+
+def _count_ngram_shard(path: str) -> TCounter[Tuple[str, ...]]:
+    """Total the counts of each n-gram in an n-gram file.
+
+    Parameters
+    ----------
+    path : str
+        The filename of the Google NGram file
+
+    Returns
+    -------
+    Counter
+        The counts of the n-grams, as tuples of words
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    counts = Counter()  # type: TCounter[Tuple[str, ...]]
+    with _open_shard(path) as gng:
+        for line in gng:
+            line_parts = line.rstrip().split('\t')
+            counts[tuple(line_parts[0].split())] += int(line_parts[2])
+    return counts
+
+
+def _merge(total: Any, partial: Any) -> None:
+    """Add a shard's counters to the running totals.
+
+    Parameters
+    ----------
+    total : Counter or tuple of Counters
+        The running totals
+    partial : Counter or tuple of Counters
+        The counters of a shard
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(total, tuple):
+        for total_counter, partial_counter in zip(total, partial):
+            total_counter.update(partial_counter)
+    else:
+        total.update(partial)
+
+
+def _import_shards(
+    corpus_files: Union[str, Iterable[str]],
+    count_shard: Callable[[str], Any],
+    total: Any,
+    n_jobs: Optional[int] = None,
+    checkpoint: Optional[str] = None,
+    progress: Optional[Callable[[int, int, str], None]] = None,
+) -> Any:
+    """Count the contents of many Google NGram files, in parallel.
+
+    Parameters
+    ----------
+    corpus_files : str or iterable of str
+        A glob pattern matching the files, or a list of their filenames
+    count_shard : function
+        A module-level function that counts the contents of one file
+    total : Counter or tuple of Counters
+        Empty counters, of the kind count_shard returns, to total the counts
+        of all the files in
+    n_jobs : int or None
+        The number of worker processes to count files with; None or 1 counts
+        them in this process and -1 uses one worker per CPU
+    checkpoint : str or None
+        The filename of a checkpoint, to which the counts of each file are
+        appended once it is counted; if it exists, the totals are restored
+        from it and the files it lists are skipped. It is removed once every
+        file has been counted.
+    progress : function or None
+        A function called after each file is counted, with the number of files
+        counted, the number of files, and the filename of the file
+
+    Returns
+    -------
+    Counter or tuple of Counters
+        The totals
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(corpus_files, str):
+        paths = sorted(glob(corpus_files))
+    else:
+        paths = list(corpus_files)
+
+    done = []  # type: List[str]
+    log = None  # type: Optional[IO[bytes]]
+    if checkpoint is not None:
+        if os.path.exists(checkpoint):
+            done = _resume(checkpoint, total)
+        log = open(checkpoint, 'ab')
+    counted = set(done)
+    pending = [path for path in paths if path not in counted]
+
+    def _record(path: str, partial: Any) -> None:
+        _merge(total, partial)
+        done.append(path)
+        if log is not None:
+            # Only this file's counts are appended, so checkpointing costs as
+            # much as the files do, rather than the running totals each time
+            pickle.dump((path, partial), log, pickle.HIGHEST_PROTOCOL)
+            log.flush()
+        if progress is not None:
+            progress(len(done), len(paths), path)
+
+    try:
+        if n_jobs is None or n_jobs == 1 or len(pending) < 2:
+            for path in pending:
+                _record(path, count_shard(path))
+        else:
+            processes = (cpu_count() or 1) if n_jobs < 0 else n_jobs
+            with Pool(min(processes, len(pending))) as pool:
+                for path, partial in pool.imap_unordered(
+                    _CountShard(count_shard), pending
+                ):
+                    _record(path, partial)
+    finally:
+        if log is not None:
+            log.close()
+
+    if checkpoint is not None:
+        os.remove(checkpoint)
+    return total
+
+
+def _resume(checkpoint: str, total: Any) -> List[str]:
+    """Restore the totals of an interrupted import from its checkpoint.
+
+    The checkpoint is a log of the counts of each file counted, appended as
+    each file is counted. An interruption while a file's counts were being
+    appended leaves them incomplete, so they are truncated & the file is
+    counted again.
+
+    Parameters
+    ----------
+    checkpoint : str
+        The filename of the checkpoint
+    total : Counter or tuple of Counters
+        Empty counters, to restore the totals in
+
+    Returns
+    -------
+    list of str
+        The filenames of the files already counted
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    done = []  # type: List[str]
+    with open(checkpoint, 'r+b') as log:
+        end = 0
+        while True:
+            try:
+                path, partial = pickle.load(log)  # noqa: S301
+            except (EOFError, pickle.UnpicklingError, ValueError):
+                break
+            _merge(total, partial)
+            done.append(path)
+            end = log.tell()
+        log.truncate(end)
+    return done
+
+
+class _CountShard:
+    """Picklable wrapper that returns a file's name with its counts.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, count_shard: Callable[[str], Any]) -> None:
+        """Initialize _CountShard instance.
+
+        Parameters
+        ----------
+        count_shard : function
+            A module-level function that counts the contents of one file
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._count_shard = count_shard
+
+    def __call__(self, path: str) -> Tuple[str, Any]:
+        """Count the contents of a file.
+
+        Parameters
+        ----------
+        path : str
+            The filename of the file
+
+        Returns
+        -------
+        tuple
+            The filename & its counts
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return path, self._count_shard(path)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -21,9 +21,27 @@ The NGram class is a container for an n-gram corpus
 
 from codecs import open as c_open
 from collections import Counter
-from typing import Any, Counter as TCounter, List, Optional, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Counter as TCounter,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
 
 from ._corpus import Corpus
+from ._gng import _count_ngram_shard, _import_shards
+from ._ngram_lm import _NGramStats
+from ._ngram_table import _NGramTable
 
 __all__ = ['NGramCorpus']
 
@@ -42,10 +60,26 @@ class NGramCorpus:
     the trigram frequency of 'colorless green ideas' would be the value stored
     in ``self.ngcorpus['colorless']['green']['ideas'][None]``.
 
+    Alternatively, with ``hashed=True``, the n-grams are stored in a flat hash
+    table of word ids with NumPy arrays of keys and counts, which takes a
+    fraction of the memory of the nested Counters and looks n-grams up in
+    constant time. This table can be saved with :py:meth:`save_hashed` and
+    memory-mapped by :py:meth:`load_hashed`.
+
+    Either way, the corpus can be queried as a language model, by
+    :py:meth:`probability`, :py:meth:`stupid_backoff`,
+    :py:meth:`kneser_ney` & :py:meth:`score_many`. The context totals and
+    continuation counts these need are computed once, when the corpus is
+    first queried, and kept until n-grams are next added.
+
     .. versionadded:: 0.3.0
+    .. versionchanged:: 0.6.0
+        Added the hashed n-gram table & language model queries
     """
 
-    def __init__(self, corpus: Optional[Corpus] = None) -> None:
+    def __init__(
+        self, corpus: Optional[Corpus] = None, hashed: bool = False
+    ) -> None:
         r"""Initialize Corpus.
 
         Parameters
@@ -54,6 +88,9 @@ class NGramCorpus:
             The :py:class:`Corpus` from which to initialize the n-gram corpus.
             By default, this is None, which initializes an empty NGramCorpus.
             This can then be populated using NGramCorpus methods.
+        hashed : bool
+            If True, the n-grams are stored in a hashed n-gram table rather
+            than in nested Counters
 
         Raises
         ------
@@ -68,9 +105,14 @@ class NGramCorpus:
 
 
         .. versionadded:: 0.3.0
+        .. versionchanged:: 0.6.0
+            Added hashed
 
         """
-        self.ngcorpus = Counter()  # type: TCounter[Optional[str]]
+        self.ngcorpus = (
+            _NGramTable() if hashed else Counter()
+        )  # type: Union[TCounter[Optional[str]], _NGramTable]
+        self._stats = None  # type: Optional[_NGramStats]
 
         if corpus is None:
             return
@@ -122,7 +164,7 @@ class NGramCorpus:
         if not corpus or not isinstance(corpus, Corpus):
             raise TypeError('Corpus argument of the Corpus class required.')
 
-        sentences = corpus.sents()
+        sentences = corpus.iter_sents()
 
         for sent in sentences:
             ngs = Counter(sent)
@@ -174,6 +216,10 @@ class NGramCorpus:
 
         """
         if not corpus:
+            if isinstance(self.ngcorpus, _NGramTable):
+                return self.ngcorpus.get(
+                    ngram.split() if isinstance(ngram, str) else ngram
+                )
             corpus = self.ngcorpus
 
         # if ngram is empty, we're at our leaf node and should return the
@@ -212,6 +258,11 @@ class NGramCorpus:
         .. versionadded:: 0.3.0
 
         """
+        self._stats = None
+        if isinstance(corpus, _NGramTable):
+            corpus.add(words, count)
+            return
+
         if words[0] not in corpus:
             corpus[words[0]] = Counter()
 
@@ -240,6 +291,472 @@ class NGramCorpus:
 
                 self._add_to_ngcorpus(self.ngcorpus, words, int(line_parts[2]))
 
+    def gng_import_many(
+        self,
+        corpus_files: Union[str, Iterable[str]],
+        n_jobs: Optional[int] = None,
+        checkpoint: Optional[str] = None,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+    ) -> None:
+        """Fill in self.ngcorpus from many Google NGram corpus files.
+
+        Each file, which may be gzip or bzip2 compressed, is totalled by a
+        worker process, and the totals of all the files are merged and then
+        added to the corpus, so each distinct n-gram is added only once. The
+        result is the same as calling :py:meth:`gng_importer` on each of the
+        files.
+
+        Parameters
+        ----------
+        corpus_files : str or iterable of str
+            A glob pattern matching the Google NGram files, or a list of their
+            filenames
+        n_jobs : int or None
+            The number of worker processes to read the files with; None or 1
+            reads them in this process and -1 uses one worker per CPU
+        checkpoint : str or None
+            The filename of a checkpoint to append the counts of each file to
+            after it is read. If an import is interrupted, calling this
+            method again with the same checkpoint resumes it, skipping the
+            files already read. The checkpoint is removed once the import
+            completes.
+        progress : function or None
+            A function called after each file is read, with the number of
+            files read so far, the number of files, and the filename of the
+            file just read
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        counts = _import_shards(
+            corpus_files,
+            _count_ngram_shard,
+            Counter(),
+            n_jobs,
+            checkpoint,
+            progress,
+        )
+        for words, count in counts.items():
+            self._add_to_ngcorpus(self.ngcorpus, list(words), count)
+
+    def save_hashed(self, filename: str) -> None:
+        r"""Save the corpus to a file as a hashed n-gram table.
+
+        A corpus stored in nested Counters is converted to a hashed n-gram
+        table to be saved.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to save the corpus to
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> handle, path = tempfile.mkstemp()
+        >>> os.close(handle)
+        >>> tqbf = 'The quick brown fox jumped over the lazy dog.\n'
+        >>> tqbf += 'And then it slept.\n And the dog ran off.'
+        >>> ngcorp = NGramCorpus()
+        >>> ngcorp.corpus_importer(Corpus(tqbf), n_val=2)
+        >>> ngcorp.save_hashed(path)
+        >>> ngcorp = NGramCorpus()
+        >>> ngcorp.load_hashed(path)
+        >>> ngcorp.get_count('the lazy')
+        1
+        >>> del ngcorp
+        >>> os.remove(path)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        table = self.ngcorpus
+        if not isinstance(table, _NGramTable):
+            table = _NGramTable()
+            for ngram, count in self._ngrams():
+                table.add(ngram, count)
+        table.save(filename)
+
+    def load_hashed(self, filename: str) -> None:
+        """Load the corpus from a file saved by :py:meth:`save_hashed`.
+
+        The table's keys and counts are memory-mapped copy-on-write, so
+        loading is quick and n-grams added afterwards do not change the file.
+        The loaded table replaces the corpus's n-grams.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to load the corpus from
+
+        Raises
+        ------
+        ValueError
+            The file is not a hashed n-gram table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.ngcorpus = _NGramTable.load(filename)
+        self._stats = None
+
+    def _ngrams(self) -> Iterator[Tuple[Tuple[str, ...], int]]:
+        """Iterate over the n-grams of the corpus & their counts.
+
+        Yields
+        ------
+        tuple
+            An n-gram, as a tuple of words, & its count
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(self.ngcorpus, _NGramTable):
+            yield from self.ngcorpus.items()
+            return
+        stack = [
+            ((), self.ngcorpus)
+        ]  # type: List[Tuple[Tuple[str, ...], Any]]
+        while stack:
+            prefix, counter = stack.pop()
+            for word, value in counter.items():
+                if word is None:
+                    if prefix:
+                        yield prefix, value
+                else:
+                    stack.append((prefix + (word,), value))
+
+    def _get_stats(self) -> _NGramStats:
+        """Return the language model statistics, computing them if necessary.
+
+        Returns
+        -------
+        _NGramStats
+            The context totals & continuation counts of the corpus
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._stats is None:
+            if isinstance(self.ngcorpus, _NGramTable):
+                self._stats = _NGramStats.from_table(self.ngcorpus)
+            else:
+                self._stats = _NGramStats(self._ngrams())
+        return self._stats
+
+    def _ngram_count(self, ngram: Tuple[str, ...]) -> int:
+        """Return the count of an n-gram, given as a tuple of words.
+
+        Parameters
+        ----------
+        ngram : tuple of str
+            The n-gram
+
+        Returns
+        -------
+        int
+            The n-gram count
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.get_count(list(ngram))
+
+    def _query(
+        self, word: str, context: Optional[Union[str, Sequence[str]]]
+    ) -> Tuple[str, ...]:
+        """Return a word & its context as an n-gram no longer than the corpus's.
+
+        Parameters
+        ----------
+        word : str
+            The word
+        context : str or sequence of str or None
+            The words preceding the word
+
+        Returns
+        -------
+        tuple of str
+            The n-gram
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if context is None:
+            context = ()
+        elif isinstance(context, str):
+            context = context.split()
+        order = max(self._get_stats().order, 1)
+        return (tuple(context) + (word,))[-order:]
+
+    def probability(
+        self, word: str, context: Optional[Union[str, Sequence[str]]] = None
+    ) -> float:
+        r"""Return the conditional probability of a word, given its context.
+
+        This is the maximum likelihood estimate: the count of the n-gram the
+        context & the word form, divided by the total count of the n-grams
+        that extend the context by one word. The context is shortened to one
+        word less than the longest n-grams in the corpus.
+
+        Parameters
+        ----------
+        word : str
+            The word
+        context : str or sequence of str or None
+            The words preceding the word
+
+        Returns
+        -------
+        float
+            The probability of the word
+
+        Examples
+        --------
+        >>> tqbf = 'The quick brown fox jumped over the lazy dog.\n'
+        >>> tqbf += 'And then it slept.\n And the dog ran off.'
+        >>> ngcorp = NGramCorpus()
+        >>> ngcorp.corpus_importer(Corpus(tqbf), n_val=2)
+        >>> round(ngcorp.probability('the'), 12)
+        0.111111111111
+        >>> ngcorp.probability('dog', 'the')
+        0.5
+        >>> ngcorp.probability('fox', 'the')
+        0.0
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._get_stats().probability(
+            self._query(word, context), self._ngram_count
+        )
+
+    def stupid_backoff(
+        self,
+        word: str,
+        context: Optional[Union[str, Sequence[str]]] = None,
+        alpha: float = 0.4,
+    ) -> float:
+        r"""Return the Stupid Backoff score of a word, given its context.
+
+        Stupid Backoff :cite:`Brants:2007` scores a word by its conditional
+        relative frequency given the context if the corpus holds the n-gram
+        they form, and otherwise by alpha times its score given the context
+        without its first word. The scores are not normalized probabilities.
+
+        Parameters
+        ----------
+        word : str
+            The word
+        context : str or sequence of str or None
+            The words preceding the word
+        alpha : float
+            The factor applied to the score each time the context is
+            shortened
+
+        Returns
+        -------
+        float
+            The score of the word
+
+        Examples
+        --------
+        >>> tqbf = 'The quick brown fox jumped over the lazy dog.\n'
+        >>> tqbf += 'And then it slept.\n And the dog ran off.'
+        >>> ngcorp = NGramCorpus()
+        >>> ngcorp.corpus_importer(Corpus(tqbf), n_val=2)
+        >>> ngcorp.stupid_backoff('dog', 'the')
+        0.5
+        >>> round(ngcorp.stupid_backoff('fox', 'the'), 12)
+        0.022222222222
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._get_stats().stupid_backoff(
+            self._query(word, context), self._ngram_count, alpha
+        )
+
+    def kneser_ney(
+        self,
+        word: str,
+        context: Optional[Union[str, Sequence[str]]] = None,
+        discount: float = 0.75,
+    ) -> float:
+        r"""Return the Kneser-Ney probability of a word, given its context.
+
+        This is interpolated Kneser-Ney smoothing :cite:`Kneser:1995` with a
+        single, fixed discount. The lower orders are estimated from the
+        number of distinct words that precede each n-gram, rather than from
+        its count, and the lowest order is interpolated with the uniform
+        distribution over the corpus's words, so every word has a non-zero
+        probability.
+
+        Parameters
+        ----------
+        word : str
+            The word
+        context : str or sequence of str or None
+            The words preceding the word
+        discount : float
+            The discount subtracted from each count, between 0 & 1
+
+        Returns
+        -------
+        float
+            The probability of the word
+
+        Examples
+        --------
+        >>> tqbf = 'The quick brown fox jumped over the lazy dog.\n'
+        >>> tqbf += 'And then it slept.\n And the dog ran off.'
+        >>> ngcorp = NGramCorpus()
+        >>> ngcorp.corpus_importer(Corpus(tqbf), n_val=2)
+        >>> round(ngcorp.kneser_ney('dog', 'the'), 12)
+        0.1625
+        >>> round(ngcorp.kneser_ney('fox', 'the'), 12)
+        0.0375
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._get_stats().kneser_ney(
+            self._query(word, context), self._ngram_count, discount
+        )
+
+    def score_many(
+        self,
+        sequences: Iterable[Union[str, Sequence[str]]],
+        method: str = 'kneser_ney',
+        order: Optional[int] = None,
+        alpha: float = 0.4,
+        discount: float = 0.75,
+    ) -> np.ndarray:
+        r"""Return the log scores of many word sequences.
+
+        Each sequence is scored by the sum of the natural logs of the scores
+        of its words, each given the words preceding it, up to one word less
+        than the order. Each distinct n-gram is scored once, however many of
+        the sequences it occurs in, which makes this much faster than scoring
+        the sequences' words separately when ranking candidate spellings or
+        segmentations that share most of their words.
+
+        Parameters
+        ----------
+        sequences : iterable of str or sequence of str
+            The word sequences, as strings of space-separated words or as
+            sequences of words
+        method : str
+            The scoring method: ``probability``, ``stupid_backoff``, or
+            ``kneser_ney`` (the default)
+        order : int or None
+            The longest n-grams to score words with, or None for the longest
+            n-gram length in the corpus
+        alpha : float
+            The backoff factor, for the ``stupid_backoff`` method
+        discount : float
+            The discount, for the ``kneser_ney`` method
+
+        Returns
+        -------
+        np.ndarray
+            The log scores of the sequences, which are -inf for sequences
+            that include a word with a score of 0
+
+        Raises
+        ------
+        ValueError
+            Unknown scoring method
+
+        Examples
+        --------
+        >>> tqbf = 'The quick brown fox jumped over the lazy dog.\n'
+        >>> tqbf += 'And then it slept.\n And the dog ran off.'
+        >>> ngcorp = NGramCorpus()
+        >>> ngcorp.corpus_importer(Corpus(tqbf), n_val=2)
+        >>> ngcorp.score_many(['the dog ran', 'the ran dog']).round(8)
+        array([-5.28314003, -8.78635903])
+        >>> ngcorp.score_many(['the dog ran', 'the ran dog'],
+        ... method='probability').round(8)
+        array([-2.89037176,        -inf])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        stats = self._get_stats()
+        if method == 'probability':
+            score = stats.probability  # type: Callable[..., float]
+            args = ()  # type: Tuple[float, ...]
+        elif method == 'stupid_backoff':
+            score = stats.stupid_backoff
+            args = (alpha,)
+        elif method == 'kneser_ney':
+            score = stats.kneser_ney
+            args = (discount,)
+        else:
+            raise ValueError('Unknown scoring method: {}'.format(method))
+        if order is None:
+            order = stats.order
+
+        # the sequence of each word, & the index of its n-gram's score
+        positions = []  # type: List[int]
+        indices = []  # type: List[int]
+        ngram_indices = {}  # type: Dict[Tuple[str, ...], int]
+        n_sequences = 0
+        for n_sequences, sequence in enumerate(sequences, 1):
+            words = sequence.split() if isinstance(sequence, str) else sequence
+            positions.extend([n_sequences - 1] * len(words))
+            for i in range(len(words)):
+                ngram = tuple(words[max(0, i + 1 - max(order, 1)) : i + 1])
+                index = ngram_indices.get(ngram)
+                if index is None:
+                    index = ngram_indices[ngram] = len(ngram_indices)
+                indices.append(index)
+
+        scores = np.fromiter(
+            (
+                score(ngram, self._ngram_count, *args)
+                for ngram in ngram_indices
+            ),
+            dtype=np.float64,
+            count=len(ngram_indices),
+        )
+        with np.errstate(divide='ignore'):
+            logs = np.log(scores)[np.array(indices, dtype=np.intp)]
+        # empty sequences score 0
+        return np.bincount(
+            np.array(positions, dtype=np.intp),
+            weights=logs,
+            minlength=n_sequences,
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state to pickle, without the cached statistics.
+
+        Returns
+        -------
+        dict
+            The instance's attributes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        state['_stats'] = None
+        return state
+
 
 if __name__ == '__main__':
     import doctest
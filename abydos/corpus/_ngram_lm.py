@@ -0,0 +1,448 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.corpus._ngram_lm.
+
+N-gram language model statistics
+"""
+
+from collections import Counter
+from typing import (
+    Callable,
+    Counter as TCounter,
+    Iterable,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from ._ngram_table import _NGramTable
+
+__all__ = ['_NGramStats']
+
+
+class _TableCounts:
+    """Counts keyed by n-grams, over the word ids of a hashed n-gram table.
+
+    The statistics of a hashed n-gram table are kept as columns of counts,
+    indexed by a hashed table of rows of word ids, rather than as Counters
+    keyed by tuples of words, so they take no more memory per n-gram than
+    the table itself. Like a Counter, it returns 0 for missing n-grams.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self, index: _NGramTable, column: np.ndarray, empty: int
+    ) -> None:
+        """Initialize _TableCounts instance.
+
+        Parameters
+        ----------
+        index : _NGramTable
+            A table of the n-grams, whose counts are 1 + their rows in column
+        column : np.ndarray
+            The counts of the n-grams
+        empty : int
+            The count of the empty n-gram
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._index = index
+        self._column = column
+        self._empty = empty
+
+    def get(self, ngram: Sequence[str], default: int = 0) -> int:
+        """Return the count of an n-gram.
+
+        Parameters
+        ----------
+        ngram : sequence of str
+            The n-gram
+        default : int
+            The value to return if the n-gram has no count
+
+        Returns
+        -------
+        int
+            The count of the n-gram
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not ngram:
+            count = self._empty
+        else:
+            row = self._index.get(ngram)
+            count = int(self._column[row - 1]) if row else 0
+        return count if count else default
+
+    def __getitem__(self, ngram: Sequence[str]) -> int:
+        """Return the count of an n-gram, or 0 if it has none.
+
+        Parameters
+        ----------
+        ngram : sequence of str
+            The n-gram
+
+        Returns
+        -------
+        int
+            The count of the n-gram
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.get(ngram)
+
+    def __contains__(self, ngram: Sequence[str]) -> bool:
+        """Return True if an n-gram has a count.
+
+        Parameters
+        ----------
+        ngram : sequence of str
+            The n-gram
+
+        Returns
+        -------
+        bool
+            True if the n-gram has a count
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return bool(self.get(ngram))
+
+
+_Counts = Union[TCounter[Tuple[str, ...]], _TableCounts]
+
+
+def _drop_last(keys: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Return rows of word ids without their last words.
+
+    Parameters
+    ----------
+    keys : np.ndarray
+        The keys, as rows of word ids padded with 0
+    lengths : np.ndarray
+        The number of words of each key
+
+    Returns
+    -------
+    np.ndarray
+        The keys without their last words, one column narrower
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    contexts = keys[:, : max(keys.shape[1] - 1, 0)].copy()
+    shorter = lengths < keys.shape[1]
+    contexts[np.flatnonzero(shorter), lengths[shorter] - 1] = 0
+    return contexts
+
+
+def _group(
+    vocabulary: _NGramTable, keys: np.ndarray, weights: np.ndarray
+) -> Tuple[_TableCounts, _TableCounts, np.ndarray]:
+    """Return the sums & sizes of the weights of each distinct key.
+
+    Parameters
+    ----------
+    vocabulary : _NGramTable
+        The table whose word ids the keys are made of
+    keys : np.ndarray
+        The keys, as rows of word ids padded with 0, which may be empty
+    weights : np.ndarray
+        The weight of each key
+
+    Returns
+    -------
+    tuple
+        The sum & the number of the weights of each distinct key, & the
+        distinct non-empty keys, in the order of the sums' column
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    empty = ~keys.any(axis=1)
+    empty_sum = int(weights[empty].sum())
+    empty_size = int(empty.sum())
+    keys, weights = keys[~empty], weights[~empty]
+
+    if len(keys):
+        keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        # counts are far below 2 ** 53, so their float sums are exact
+        sums = np.rint(
+            np.bincount(inverse, weights=weights, minlength=len(keys))
+        ).astype(np.int64)
+        sizes = np.bincount(inverse, minlength=len(keys)).astype(np.int64)
+    else:
+        keys = np.zeros((0, max(keys.shape[1], 1)), dtype=keys.dtype)
+        sums = sizes = np.zeros(0, dtype=np.int64)
+    index = _NGramTable.from_rows(
+        vocabulary, keys, np.arange(1, len(keys) + 1)
+    )
+    return (
+        _TableCounts(index, sums, empty_sum),
+        _TableCounts(index, sizes, empty_size),
+        keys,
+    )
+
+
+class _NGramStats:
+    """N-gram language model statistics.
+
+    The context totals & continuation counts of an n-gram corpus, which are
+    computed in a single pass over its n-grams, so that conditional
+    probabilities, Stupid Backoff scores & Kneser-Ney probabilities need only
+    the count of the n-gram itself to be looked up.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, ngrams: Iterable[Tuple[Tuple[str, ...], int]]) -> None:
+        """Initialize _NGramStats instance.
+
+        Parameters
+        ----------
+        ngrams : iterable of (tuple, int) tuples
+            The n-grams of the corpus, as tuples of words, & their counts
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        totals = Counter()  # type: TCounter[Tuple[str, ...]]
+        types = Counter()  # type: TCounter[Tuple[str, ...]]
+        continuations = Counter()  # type: TCounter[Tuple[str, ...]]
+        continuation_totals = Counter()  # type: TCounter[Tuple[str, ...]]
+        continuation_types = Counter()  # type: TCounter[Tuple[str, ...]]
+        self.order = 0
+
+        words = set()  # type: Set[str]
+        for ngram, count in ngrams:
+            if count <= 0:
+                continue
+            context = ngram[:-1]
+            totals[context] += count
+            types[context] += 1
+            if len(ngram) > 1:
+                continuations[ngram[1:]] += 1
+            words.add(ngram[-1])
+            self.order = max(self.order, len(ngram))
+        for suffix in continuations:
+            continuation_totals[suffix[:-1]] += continuations[suffix]
+            continuation_types[suffix[:-1]] += 1
+        self.vocabulary = len(words)
+
+        # the total count & the number of distinct words following each
+        # context
+        self.totals = totals  # type: _Counts
+        self.types = types  # type: _Counts
+        # the number of distinct words preceding each n-gram
+        self.continuations = continuations  # type: _Counts
+        # the total & number of distinct words of the continuation counts
+        # following each context
+        self.continuation_totals = continuation_totals  # type: _Counts
+        self.continuation_types = continuation_types  # type: _Counts
+
+    @classmethod
+    def from_table(cls, table: _NGramTable) -> '_NGramStats':
+        """Return the statistics of a hashed n-gram table.
+
+        The statistics are computed from the table's arrays of word ids with
+        NumPy, and kept as count columns indexed by rows of word ids, so no
+        n-gram is held as a Python object.
+
+        Parameters
+        ----------
+        table : _NGramTable
+            The table
+
+        Returns
+        -------
+        _NGramStats
+            The statistics of the table's n-grams
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        stats = cls(())
+        keys, counts = table.rows()
+        positive = counts > 0
+        keys, counts = keys[positive], counts[positive]
+        if not len(keys):
+            return stats
+
+        lengths = np.count_nonzero(keys, axis=1)
+        stats.order = int(lengths.max())
+        stats.vocabulary = len(
+            np.unique(keys[np.arange(len(keys)), lengths - 1])
+        )
+
+        stats.totals, stats.types, _ = _group(
+            table, _drop_last(keys, lengths), counts
+        )
+        longer = lengths > 1
+        continuations, _, suffixes = _group(
+            table, keys[longer, 1:], np.ones(longer.sum(), dtype=np.int64)
+        )
+        stats.continuations = continuations
+        stats.continuation_totals, stats.continuation_types, _ = _group(
+            table,
+            _drop_last(suffixes, np.count_nonzero(suffixes, axis=1)),
+            continuations._column,
+        )
+        return stats
+
+    def probability(
+        self,
+        ngram: Tuple[str, ...],
+        get_count: Callable[[Tuple[str, ...]], int],
+    ) -> float:
+        """Return the conditional probability of an n-gram's last word.
+
+        Parameters
+        ----------
+        ngram : tuple of str
+            The context & the word
+        get_count : function
+            A function that returns the count of an n-gram
+
+        Returns
+        -------
+        float
+            The maximum likelihood estimate of the probability of the word,
+            given the context
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        total = self.totals.get(ngram[:-1], 0)
+        if not total:
+            return 0.0
+        return get_count(ngram) / total
+
+    def stupid_backoff(
+        self,
+        ngram: Tuple[str, ...],
+        get_count: Callable[[Tuple[str, ...]], int],
+        alpha: float,
+    ) -> float:
+        """Return the Stupid Backoff score of an n-gram's last word.
+
+        Parameters
+        ----------
+        ngram : tuple of str
+            The context & the word
+        get_count : function
+            A function that returns the count of an n-gram
+        alpha : float
+            The factor applied to the score each time the context is
+            shortened
+
+        Returns
+        -------
+        float
+            The score of the word, given the context
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        factor = 1.0
+        while ngram:
+            total = self.totals.get(ngram[:-1], 0)
+            count = get_count(ngram) if total else 0
+            if count:
+                return factor * count / total
+            factor *= alpha
+            ngram = ngram[1:]
+        return 0.0
+
+    def kneser_ney(
+        self,
+        ngram: Tuple[str, ...],
+        get_count: Callable[[Tuple[str, ...]], int],
+        discount: float,
+    ) -> float:
+        """Return the Kneser-Ney probability of an n-gram's last word.
+
+        This is interpolated Kneser-Ney smoothing, with a single discount,
+        interpolated at the lowest order with the uniform distribution over
+        the vocabulary. Orders below the n-gram's use continuation counts,
+        except for contexts that no known n-gram of the order above extends,
+        for which the counts themselves are used.
+
+        Parameters
+        ----------
+        ngram : tuple of str
+            The context & the word
+        get_count : function
+            A function that returns the count of an n-gram
+        discount : float
+            The discount subtracted from each count, between 0 & 1
+
+        Returns
+        -------
+        float
+            The probability of the word, given the context
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # the terms of the interpolation, from the highest order down
+        terms = []
+        for start in range(len(ngram)):
+            suffix = ngram[start:]
+            context = suffix[:-1]
+            if start and context in self.continuation_totals:
+                count = self.continuations.get(suffix, 0)
+                total = self.continuation_totals[context]
+                types = self.continuation_types[context]
+            else:
+                total = self.totals.get(context, 0)
+                if not total:
+                    continue
+                count = get_count(suffix)
+                types = self.types[context]
+            terms.append(
+                (max(count - discount, 0) / total, discount * types / total)
+            )
+
+        probability = 1 / self.vocabulary if self.vocabulary else 0.0
+        for discounted, weight in reversed(terms):
+            probability = discounted + weight * probability
+        return probability
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
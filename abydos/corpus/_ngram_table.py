@@ -0,0 +1,464 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.corpus._ngram_table.
+
+Hashed n-gram table
+"""
+
+import mmap
+from struct import Struct
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from ..util._string_table import _StringTable, _pack_strings
+
+__all__ = ['_NGramTable']
+
+# An n-gram table file is laid out as:
+#   - the magic bytes, the number of words, V, the width of the keys, W, the
+#     number of slots, C, & the number of n-grams
+#   - V + 1 offsets of the words within the word table
+#   - C keys of W word ids (uint32), padded with 0
+#   - C counts (int64)
+#   - the word table: the UTF-8 encoded words, concatenated in id order
+# All integers are little-endian and offsets are relative to the start of the
+# word table.
+_MAGIC = b'ABYDNGT1'
+_HEADER = Struct('<8sQQQQ')
+_KEY = np.dtype('<u4')
+_COUNT = np.dtype('<i8')
+_OFFSET = np.dtype('<u8')
+
+# FNV-1a, over the word ids of a key
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+_MASK = 0xFFFFFFFFFFFFFFFF
+
+# Additions are buffered & merged into the table in batches of this size
+_BATCH = 1 << 16
+
+
+class _NGramTable:
+    """Hashed n-gram table.
+
+    A mapping of n-grams to their counts, for :py:class:`.NGramCorpus`. Words
+    are interned to integer ids (from 1) and each n-gram is stored as a
+    fixed-width row of ids, padded with 0, in an open-addressing hash table
+    with linear probing. The keys & counts are parallel NumPy arrays, so an
+    n-gram takes a few dozen bytes, rather than the hundreds that nested
+    Counters take, and is looked up with a single hash & probe.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self) -> None:
+        """Initialize _NGramTable instance.
+
+        .. versionadded:: 0.6.0
+        """
+        self._ids = {}  # type: Dict[str, int]
+        self._words = ['']  # type: List[str]
+        self._keys = np.zeros((8, 1), dtype=_KEY)
+        self._counts = np.zeros(8, dtype=_COUNT)
+        self._size = 0
+        self._pending = {}  # type: Dict[Tuple[int, ...], int]
+
+    def _hash(self, keys: np.ndarray) -> np.ndarray:
+        """Return the hashes of an array of keys.
+
+        Parameters
+        ----------
+        keys : np.ndarray
+            The keys, as rows of word ids
+
+        Returns
+        -------
+        np.ndarray
+            The hashes of the keys
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        hashes = np.full(len(keys), _FNV_OFFSET, dtype=np.uint64)
+        with np.errstate(over='ignore'):
+            for column in keys.T:
+                hashes ^= column.astype(np.uint64)
+                hashes *= np.uint64(_FNV_PRIME)
+        return hashes
+
+    def _find(self, keys: np.ndarray) -> np.ndarray:
+        """Return the slots of an array of keys.
+
+        Parameters
+        ----------
+        keys : np.ndarray
+            The keys, as rows of word ids
+
+        Returns
+        -------
+        np.ndarray
+            The slots of the keys, or -1 for keys that are not in the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        mask = len(self._keys) - 1
+        slots = (self._hash(keys) & np.uint64(mask)).astype(np.int64)
+        found = np.full(len(keys), -1, dtype=np.int64)
+        active = np.arange(len(keys))
+        while len(active):
+            stored = self._keys[slots[active]]
+            match = (stored == keys[active]).all(axis=1)
+            found[active[match]] = slots[active[match]]
+            active = active[~match & (stored[:, 0] != 0)]
+            slots[active] = (slots[active] + 1) & mask
+        return found
+
+    def _place(self, keys: np.ndarray, counts: np.ndarray) -> None:
+        """Insert distinct keys that are not yet in the table.
+
+        Parameters
+        ----------
+        keys : np.ndarray
+            The keys, as rows of word ids
+        counts : np.ndarray
+            The counts of the keys
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        mask = len(self._keys) - 1
+        slots = (self._hash(keys) & np.uint64(mask)).astype(np.int64)
+        active = np.arange(len(keys))
+        while len(active):
+            free = active[self._keys[slots[active], 0] == 0]
+            # of the keys probing the same free slot, the first claims it
+            _, first = np.unique(slots[free], return_index=True)
+            placed = free[first]
+            self._keys[slots[placed]] = keys[placed]
+            self._counts[slots[placed]] = counts[placed]
+            active = np.setdiff1d(active, placed, assume_unique=True)
+            slots[active] = (slots[active] + 1) & mask
+        self._size += len(keys)
+
+    def _rebuild(self, capacity: int, width: int) -> None:
+        """Rehash the table into a new number of slots & key width.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of slots, a power of 2
+        width : int
+            The maximum number of words in a key
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        occupied = self._keys[:, 0] != 0
+        keys = np.zeros((occupied.sum(), width), dtype=_KEY)
+        keys[:, : self._keys.shape[1]] = self._keys[occupied]
+        counts = self._counts[occupied]
+
+        self._keys = np.zeros((capacity, width), dtype=_KEY)
+        self._counts = np.zeros(capacity, dtype=_COUNT)
+        self._size = 0
+        self._place(keys, counts)
+
+    def _flush(self) -> None:
+        """Merge the buffered additions into the table.
+
+        .. versionadded:: 0.6.0
+        """
+        if not self._pending:
+            return
+        width = max(self._keys.shape[1], max(map(len, self._pending)))
+        keys = np.zeros((len(self._pending), width), dtype=_KEY)
+        for row, key in zip(keys, self._pending):
+            row[: len(key)] = key
+        counts = np.fromiter(
+            self._pending.values(), dtype=_COUNT, count=len(self._pending)
+        )
+        self._pending = {}
+
+        capacity = len(self._keys)
+        while 2 * (self._size + len(keys)) > capacity:
+            capacity *= 2
+        if capacity != len(self._keys) or width != self._keys.shape[1]:
+            self._rebuild(capacity, width)
+
+        slots = self._find(keys)
+        known = slots >= 0
+        self._counts[slots[known]] += counts[known]
+        self._place(keys[~known], counts[~known])
+
+    def add(self, ngram: Sequence[str], count: int) -> None:
+        """Add to the count of an n-gram.
+
+        Parameters
+        ----------
+        ngram : sequence of str
+            The words of the n-gram
+        count : int
+            The count to add
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not ngram:
+            return
+        key = []
+        for word in ngram:
+            word_id = self._ids.get(word)
+            if word_id is None:
+                word_id = self._ids[word] = len(self._words)
+                self._words.append(word)
+            key.append(word_id)
+        key_tuple = tuple(key)
+        self._pending[key_tuple] = self._pending.get(key_tuple, 0) + count
+        if len(self._pending) >= _BATCH:
+            self._flush()
+
+    def get(self, ngram: Sequence[str]) -> int:
+        """Return the count of an n-gram.
+
+        Parameters
+        ----------
+        ngram : sequence of str
+            The words of the n-gram
+
+        Returns
+        -------
+        int
+            The count of the n-gram, or 0 if it is not in the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._flush()
+        width = self._keys.shape[1]
+        if not ngram or len(ngram) > width:
+            return 0
+        key = [0] * width
+        digest = _FNV_OFFSET
+        for i, word in enumerate(ngram):
+            word_id = self._ids.get(word)
+            if word_id is None:
+                return 0
+            key[i] = word_id
+        for word_id in key:
+            digest = ((digest ^ word_id) * _FNV_PRIME) & _MASK
+
+        keys = self._keys
+        mask = len(keys) - 1
+        slot = digest & mask
+        while True:
+            stored = keys[slot].tolist()
+            if stored == key:
+                return int(self._counts[slot])
+            if not stored[0]:
+                return 0
+            slot = (slot + 1) & mask
+
+    @classmethod
+    def from_rows(
+        cls, vocabulary: '_NGramTable', keys: np.ndarray, counts: np.ndarray
+    ) -> '_NGramTable':
+        """Return a table of rows of the word ids of another table.
+
+        The table shares the words & ids of the other, so n-grams of its
+        words can be looked up in it, but it must not be added to.
+
+        Parameters
+        ----------
+        vocabulary : _NGramTable
+            The table whose word ids the keys are made of
+        keys : np.ndarray
+            The keys, as distinct, non-empty rows of word ids
+        counts : np.ndarray
+            The counts of the keys
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        table = cls()
+        table._ids = vocabulary._ids
+        table._words = vocabulary._words
+        capacity = 8
+        while 2 * len(keys) > capacity:
+            capacity *= 2
+        table._keys = np.zeros((capacity, max(keys.shape[1], 1)), dtype=_KEY)
+        table._counts = np.zeros(capacity, dtype=_COUNT)
+        table._place(keys, counts)
+        return table
+
+    def rows(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the keys & counts of the n-grams of the table.
+
+        Returns
+        -------
+        tuple
+            The keys, as rows of word ids padded with 0, & their counts
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._flush()
+        occupied = np.flatnonzero(self._keys[:, 0])
+        return self._keys[occupied], self._counts[occupied]
+
+    def items(self) -> Iterator[Tuple[Tuple[str, ...], int]]:
+        """Iterate over the n-grams of the table & their counts.
+
+        Yields
+        ------
+        tuple
+            An n-gram, as a tuple of words, & its count
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        words = self._words
+        keys, counts = self.rows()
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            yield tuple(words[i] for i in key if i), count
+
+    def __len__(self) -> int:
+        """Return the number of n-grams in the table.
+
+        Returns
+        -------
+        int
+            The number of n-grams
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._flush()
+        return self._size
+
+    def save(self, filename: str) -> None:
+        """Write the table to a file.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to write the table to
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._flush()
+        offsets, words = _pack_strings(self._words)
+
+        with open(filename, 'wb') as table:
+            table.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    len(self._words),
+                    self._keys.shape[1],
+                    len(self._keys),
+                    self._size,
+                )
+            )
+            table.write(np.array(offsets, dtype=_OFFSET).tobytes())
+            table.write(self._keys.astype(_KEY, copy=False).tobytes())
+            table.write(self._counts.astype(_COUNT, copy=False).tobytes())
+            table.write(words)
+
+    @classmethod
+    def load(cls, filename: str) -> '_NGramTable':
+        """Read a table from a file written by :py:meth:`save`.
+
+        The keys & counts are memory-mapped copy-on-write, so they are read
+        from the file only as they are probed, and the table can be added to
+        without changing the file.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the table
+
+        Returns
+        -------
+        _NGramTable
+            The table
+
+        Raises
+        ------
+        ValueError
+            The file is not an n-gram table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, 'rb') as table_file:
+            buffer = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        if len(buffer) < _HEADER.size:
+            raise ValueError('{} is not an n-gram table'.format(filename))
+        magic, vocab, width, capacity, size = _HEADER.unpack_from(buffer, 0)
+        start = _HEADER.size
+        lengths = (
+            (vocab + 1) * _OFFSET.itemsize,
+            capacity * width * _KEY.itemsize,
+            capacity * _COUNT.itemsize,
+        )
+        if (
+            magic != _MAGIC
+            or not vocab
+            or not width
+            or capacity & (capacity - 1)
+            or len(buffer) < start + sum(lengths)
+        ):
+            raise ValueError('{} is not an n-gram table'.format(filename))
+
+        offsets = np.frombuffer(buffer, _OFFSET, vocab + 1, start).tolist()
+        start += lengths[0]
+        keys = np.frombuffer(buffer, _KEY, capacity * width, start)
+        start += lengths[1]
+        counts = np.frombuffer(buffer, _COUNT, capacity, start)
+        start += lengths[2]
+        if len(buffer) != start + offsets[-1]:
+            raise ValueError('{} is not an n-gram table'.format(filename))
+
+        table = cls()
+        words = _StringTable(buffer, offsets, start)
+        table._words = [words[i] for i in range(vocab)]
+        table._ids = {word: i for i, word in enumerate(table._words) if i}
+        table._keys = keys.reshape(capacity, width)
+        table._counts = counts
+        table._size = size
+        return table
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
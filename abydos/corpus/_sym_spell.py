@@ -0,0 +1,520 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.corpus._sym_spell.
+
+SymSpell spelling suggestions
+"""
+
+import mmap
+from collections import defaultdict
+from hashlib import blake2b
+from struct import Struct
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    DefaultDict,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+
+from ._unigram_corpus import UnigramCorpus
+from ..util._string_table import _decode, _encode, _pack_strings
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..distance._distance import _Distance  # noqa: F401
+
+__all__ = ['SymSpell']
+
+# A SymSpell index file is laid out as:
+#   - the magic bytes, the number of words, W, the number of delete keys, K,
+#     the number of postings, P, the maximum edit distance, & the prefix
+#     length (0 for whole words)
+#   - W + 1 offsets of the words within the word table
+#   - W counts
+#   - K sorted delete keys: the 64-bit hashes of the deletes
+#   - K + 1 offsets of each key's postings
+#   - P postings: the ids of the words that each delete was made from
+#   - the word table: the UTF-8 encoded words, concatenated in id order
+# All integers are little-endian and offsets are relative to the start of the
+# word table or of the postings. Deletes are stored only as hashes, since a
+# collision only adds a candidate, which is then rejected when its distance is
+# verified.
+_MAGIC = b'ABYDSYM1'
+_HEADER = Struct('<8sQQQQQ')
+_OFFSET = np.dtype('<u8')
+_COUNT = np.dtype('<i8')
+_KEY = np.dtype('<u8')
+_POSTING = np.dtype('<u4')
+
+
+def _hash(word: str) -> int:
+    return int.from_bytes(
+        blake2b(_encode(word), digest_size=8).digest(), 'little'
+    )
+
+
+class SymSpell:
+    """SymSpell spelling suggestions.
+
+    SymSpell :cite:`Garbe:2012` finds the words of a corpus that are within
+    a maximum edit distance of a misspelling by way of symmetric deletes:
+    every string that can be made by deleting up to that many characters from
+    each word is indexed, and the candidates for a misspelling are the words
+    indexed under the strings made by deleting characters from it. Only the
+    candidates' distances are then calculated, with
+    :py:class:`.DamerauLevenshtein` by default, so the cost of a lookup
+    depends on the length of the misspelling and the maximum distance, not on
+    the size of the vocabulary.
+
+    Suggestions are ranked by edit distance and then by their count in the
+    corpus. The index can be saved to a compact binary file, which
+    :py:meth:`load` memory-maps.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        corpus: Optional[UnigramCorpus] = None,
+        max_distance: int = 2,
+        prefix_length: Optional[int] = 7,
+        min_count: int = 1,
+        metric: Optional['_Distance'] = None,
+    ) -> None:
+        """Initialize SymSpell instance.
+
+        Parameters
+        ----------
+        corpus : UnigramCorpus
+            The corpus whose words are suggested. By default, this is None,
+            which initializes an empty index.
+        max_distance : int
+            The maximum edit distance of suggestions
+        prefix_length : int or None
+            If set, only the deletes of the first prefix_length characters of
+            each word are indexed, which makes the index much smaller for a
+            small loss of recall among long words; None indexes whole words
+        min_count : int
+            The minimum count in the corpus of the words to index
+        metric : _Distance
+            The distance metric, whose dist_abs method verifies the
+            candidates' edit distances. By default, this is
+            :py:class:`.DamerauLevenshtein`; :py:class:`.Levenshtein` may be
+            used instead.
+
+        Examples
+        --------
+        >>> corpus = UnigramCorpus('the quick brown fox jumped over the lazy '
+        ... 'dog and the fox ran off')
+        >>> spell = SymSpell(corpus)
+        >>> spell.lookup('teh')
+        [('the', 1, 3)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if metric is None:
+            # imported here, since abydos.distance imports abydos.corpus
+            from ..distance._damerau_levenshtein import DamerauLevenshtein
+
+            metric = DamerauLevenshtein()
+        self.metric = metric
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._filename = None  # type: Optional[str]
+
+        words = []  # type: List[str]
+        counts = []  # type: List[int]
+        if corpus is not None:
+            for word, (count, _) in sorted(corpus.corpus.items()):
+                if word and count >= min_count:
+                    words.append(word)
+                    counts.append(int(count))
+        self._build(words, counts)
+
+    def _deletes(self, word: str, max_distance: int) -> Set[str]:
+        """Return the strings made by deleting characters from a word.
+
+        Parameters
+        ----------
+        word : str
+            The word, of which only the prefix is used if prefix_length is set
+        max_distance : int
+            The maximum number of characters to delete
+
+        Returns
+        -------
+        set of str
+            The word (or its prefix) & its deletes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.prefix_length:
+            word = word[: self.prefix_length]
+        deletes = {word}
+        frontier = deletes
+        for _ in range(max_distance):
+            frontier = {
+                delete[:i] + delete[i + 1 :]
+                for delete in frontier
+                for i in range(len(delete))
+            } - deletes
+            deletes |= frontier
+        return deletes
+
+    def _build(self, words: List[str], counts: List[int]) -> None:
+        """Index the deletes of words.
+
+        Parameters
+        ----------
+        words : list of str
+            The words
+        counts : list of int
+            The counts of the words
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        postings = defaultdict(list)  # type: DefaultDict[int, List[int]]
+        for word_id, word in enumerate(words):
+            for delete in self._deletes(word, self.max_distance):
+                postings[_hash(delete)].append(word_id)
+
+        offsets, blob = _pack_strings(words)
+        self._blob = blob  # type: Any
+        self._offsets = np.array(offsets, dtype=_OFFSET)
+        self._counts = np.array(counts, dtype=_COUNT)
+
+        self._keys = np.array(sorted(postings), dtype=_KEY)
+        lists = [postings[key] for key in self._keys.tolist()]
+        self._key_offsets = np.zeros(len(lists) + 1, dtype=_OFFSET)
+        np.cumsum([len(ids) for ids in lists], out=self._key_offsets[1:])
+        self._postings = np.fromiter(
+            (word_id for ids in lists for word_id in ids),
+            dtype=_POSTING,
+            count=int(self._key_offsets[-1]),
+        )
+
+    def _word(self, word_id: int) -> str:
+        """Return a word, by its id.
+
+        Parameters
+        ----------
+        word_id : int
+            The id of the word
+
+        Returns
+        -------
+        str
+            The word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        start, end = self._offsets[word_id : word_id + 2].tolist()
+        return _decode(self._blob[start:end])
+
+    def lookup(
+        self,
+        word: str,
+        max_distance: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[str, float, int]]:
+        """Return the suggestions for a word.
+
+        Parameters
+        ----------
+        word : str
+            The word, which may be misspelled
+        max_distance : int or None
+            The maximum edit distance of the suggestions, which may not exceed
+            the index's; None uses the index's
+        limit : int or None
+            The maximum number of suggestions to return, or None to return all
+            of them
+
+        Returns
+        -------
+        list of (str, float, int) tuples
+            The suggestions, each with its edit distance from the word & its
+            count, ordered by distance, then count (descending), then the
+            suggestion itself
+
+        Raises
+        ------
+        ValueError
+            max_distance may not exceed the index's maximum distance
+
+        Examples
+        --------
+        >>> corpus = UnigramCorpus('the quick brown fox jumped over the lazy '
+        ... 'dog and the fox ran off')
+        >>> spell = SymSpell(corpus)
+        >>> spell.lookup('fax')
+        [('fox', 1, 2), ('ran', 2, 1)]
+        >>> spell.lookup('fax', max_distance=1)
+        [('fox', 1, 2)]
+        >>> spell.lookup('quack', limit=1)
+        [('quick', 1, 1)]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+        elif max_distance > self.max_distance:
+            raise ValueError(
+                'max_distance may not exceed the maximum distance of the '
+                + 'index, {}.'.format(self.max_distance)
+            )
+        if not len(self._keys):
+            return []
+
+        hashes = np.array(
+            [_hash(delete) for delete in self._deletes(word, max_distance)],
+            dtype=_KEY,
+        )
+        slots = np.minimum(
+            np.searchsorted(self._keys, hashes), len(self._keys) - 1
+        )
+        slots = slots[self._keys[slots] == hashes]
+        starts = self._key_offsets[slots].tolist()
+        ends = self._key_offsets[slots + 1].tolist()
+
+        seen = set()  # type: Set[int]
+        suggestions = []  # type: List[Tuple[str, float, int]]
+        for start, end in zip(starts, ends):
+            for word_id in self._postings[start:end].tolist():
+                if word_id in seen:
+                    continue
+                seen.add(word_id)
+                candidate = self._word(word_id)
+                if abs(len(candidate) - len(word)) > max_distance:
+                    continue
+                distance = (
+                    0
+                    if candidate == word
+                    else self.metric.dist_abs(word, candidate)
+                )
+                if distance <= max_distance:
+                    suggestions.append(
+                        (candidate, distance, int(self._counts[word_id]))
+                    )
+
+        suggestions.sort(key=lambda _: (_[1], -_[2], _[0]))
+        return suggestions[:limit]
+
+    def save(self, filename: str) -> None:
+        r"""Save the index to a file.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to save the index to
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> handle, path = tempfile.mkstemp()
+        >>> os.close(handle)
+        >>> SymSpell(UnigramCorpus('the quick brown fox')).save(path)
+        >>> spell = SymSpell.load(path)
+        >>> spell.lookup('qiuck')
+        [('quick', 1, 1)]
+        >>> del spell
+        >>> os.remove(path)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, 'wb') as index:
+            index.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    len(self._counts),
+                    len(self._keys),
+                    len(self._postings),
+                    self.max_distance,
+                    self.prefix_length or 0,
+                )
+            )
+            for column, dtype in (
+                (self._offsets, _OFFSET),
+                (self._counts, _COUNT),
+                (self._keys, _KEY),
+                (self._key_offsets, _OFFSET),
+                (self._postings, _POSTING),
+            ):
+                index.write(column.astype(dtype, copy=False).tobytes())
+            index.write(self._blob)
+
+    @classmethod
+    def load(
+        cls, filename: str, metric: Optional['_Distance'] = None
+    ) -> 'SymSpell':
+        """Load an index from a file saved by :py:meth:`save`.
+
+        The file is memory-mapped, so loading is quick and only the parts of
+        the index that lookups touch are read.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of the index
+        metric : _Distance
+            The distance metric, as in :py:class:`SymSpell`
+
+        Returns
+        -------
+        SymSpell
+            The index
+
+        Raises
+        ------
+        ValueError
+            The file is not a SymSpell index
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        spell = cls(metric=metric)
+        spell._filename = filename
+        spell._open()
+        return spell
+
+    def _open(self) -> None:
+        """Memory-map the index file.
+
+        Raises
+        ------
+        ValueError
+            The file is not a SymSpell index
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(self._filename, 'rb') as index:
+            buffer = mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(buffer) < _HEADER.size:
+            raise ValueError(
+                '{} is not a SymSpell index'.format(self._filename)
+            )
+        (
+            magic,
+            n_words,
+            n_keys,
+            n_postings,
+            self.max_distance,
+            prefix_length,
+        ) = _HEADER.unpack_from(buffer, 0)
+        self.prefix_length = prefix_length or None
+
+        columns = []
+        start = _HEADER.size
+        for length, dtype in (
+            (n_words + 1, _OFFSET),
+            (n_words, _COUNT),
+            (n_keys, _KEY),
+            (n_keys + 1, _OFFSET),
+            (n_postings, _POSTING),
+        ):
+            if (
+                magic != _MAGIC
+                or len(buffer) < start + length * dtype.itemsize
+            ):
+                raise ValueError(
+                    '{} is not a SymSpell index'.format(self._filename)
+                )
+            columns.append(np.frombuffer(buffer, dtype, length, start))
+            start += length * dtype.itemsize
+        (
+            self._offsets,
+            self._counts,
+            self._keys,
+            self._key_offsets,
+            self._postings,
+        ) = columns
+        if len(buffer) != start + int(self._offsets[-1]):
+            raise ValueError(
+                '{} is not a SymSpell index'.format(self._filename)
+            )
+        self._blob = memoryview(buffer)[start:]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state to pickle.
+
+        An index loaded from a file is pickled as its filename & is mapped
+        again when unpickled.
+
+        Returns
+        -------
+        dict
+            The instance's attributes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        if self._filename is not None:
+            for name in (
+                '_blob',
+                '_offsets',
+                '_counts',
+                '_keys',
+                '_key_offsets',
+                '_postings',
+            ):
+                del state[name]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state of an unpickled instance.
+
+        Parameters
+        ----------
+        state : dict
+            The instance's attributes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        if self._filename is not None:
+            self._open()
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -19,12 +19,24 @@
 Unigram Corpus
 """
 
+import os
 import pickle  # noqa: S403
 from codecs import open as c_open
 from collections import Counter, defaultdict
 from math import log1p
-from typing import Any, Callable, DefaultDict, Optional, Tuple
-
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ._gng import _count_unigram_shard, _import_shards
+from ._unigram_segments import _SegmentedTable
+from ._unigram_table import _UnigramTable
 from ..tokenizer import _Tokenizer
 
 __all__ = ['UnigramCorpus']
@@ -83,7 +95,7 @@ class UnigramCorpus:
         """
         self.corpus = defaultdict(
             _dd_default
-        )  # type: DefaultDict[str, Tuple[int, int]]
+        )  # type: Union[DefaultDict[str, Tuple[int, int]], _UnigramTable, _SegmentedTable]  # noqa: E501
         self.transform = word_transform
         self.tokenizer = word_tokenizer
         self.doc_count = documents
@@ -98,10 +110,17 @@ class UnigramCorpus:
         doc : str
             A string, representing the document to be added.
 
+        Raises
+        ------
+        ValueError
+            A columnar corpus is read-only; open it with open_segments to add
+            documents to it.
+
 
         .. versionadded:: 0.4.0
 
         """
+        self._check_writable()
         for word, count in Counter(doc.split()).items():
             self._add_word(word, count, 1)
         self.doc_count += 1
@@ -145,14 +164,266 @@ class UnigramCorpus:
             self.corpus = pickle.load(pkl)  # noqa: S301
         self._update_doc_count()
 
+    def save_columnar(self, filename: str) -> None:
+        """Save the corpus to a file in a columnar, memory-mappable format.
+
+        The terms are written as a sorted table of UTF-8 strings with
+        offsets, alongside parallel arrays of their counts & document counts,
+        and the corpus's document count. Unlike a pickled corpus, a columnar
+        corpus is opened by :py:meth:`load_columnar` without reading it into
+        memory.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to save the corpus to.
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> handle, path = tempfile.mkstemp()
+        >>> os.close(handle)
+        >>> UnigramCorpus('the quick brown fox jumped over the lazy dog'
+        ...               ).save_columnar(path)
+        >>> corp = UnigramCorpus()
+        >>> corp.load_columnar(path)
+        >>> corp.corpus['the']
+        (2, 1)
+        >>> round(corp.idf('fox'), 10)
+        0.6931471806
+        >>> del corp
+        >>> os.remove(path)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        _UnigramTable.write(filename, self.corpus.items(), self.doc_count)
+
+    def load_columnar(self, filename: str) -> None:
+        """Open a corpus saved by :py:meth:`save_columnar`.
+
+        The file is memory-mapped & its terms are looked up by binary search,
+        so opening it takes constant time & memory, and every process that
+        opens the same file shares one copy of it in the operating system's
+        page cache. The corpus is read-only while it is memory-mapped, but
+        documents can be added to it once it is opened as the first segment
+        of a segmented corpus, with :py:meth:`open_segments`. Other
+        parameters of the corpus, such as its word_tokenizer, will not be
+        affected and should be set during initialization.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to load the corpus from.
+
+        Raises
+        ------
+        ValueError
+            The file is not a columnar corpus
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        table = _UnigramTable(filename)
+        self.corpus = table
+        self.doc_count = max(table.doc_count, self.doc_count)
+
+    def open_segments(self, directory: str) -> None:
+        """Open a directory of corpus segments, to read & append to.
+
+        A segmented corpus is stored as a series of columnar segments, each
+        holding the counts of the documents added since the one before, and
+        its counts & document count are the sums of its segments' and of the
+        documents added since the last segment, which are held in memory
+        until :py:meth:`append_segment` writes them as a new segment. The
+        segments are memory-mapped, as in :py:meth:`load_columnar`, so
+        opening a corpus, or refreshing it with :py:meth:`refresh_segments`
+        to pick up segments appended by another process, costs little
+        regardless of its size, and IDFs are calculated as for any other
+        corpus.
+
+        The counts & the document count of the corpus as it was, whether in
+        memory, columnar, or the segments of another directory, become the
+        first delta to be appended, so document counts and IDFs are the same
+        as those of an in-memory corpus of the same documents. (Note that this
+        includes the empty document that ``UnigramCorpus()`` counts, as it
+        does for any corpus initialized without corpus_text.) Segments should
+        only be appended & merged by one process at a time, but any number of
+        processes may read them.
+
+        Parameters
+        ----------
+        directory : str
+            The directory of the segments, which is created if it does not
+            exist
+
+        Raises
+        ------
+        ValueError
+            The directory does not hold corpus segments
+
+        Examples
+        --------
+        >>> import shutil, tempfile
+        >>> path = tempfile.mkdtemp()
+        >>> writer = UnigramCorpus('the quick brown fox')
+        >>> writer.open_segments(path)
+        >>> writer.append_segment()
+        >>> writer.add_document('the lazy dog')
+        >>> writer.append_segment()
+        >>> writer.doc_count
+        2
+        >>> reader = UnigramCorpus('the end')
+        >>> reader.open_segments(path)
+        >>> reader.doc_count
+        3
+        >>> reader.corpus['the']
+        (3, 3)
+        >>> round(reader.idf('dog'), 10)
+        1.3862943611
+        >>> writer.merge_segments()
+        >>> del writer, reader
+        >>> shutil.rmtree(path)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(self.corpus, _SegmentedTable) and os.path.realpath(
+            self.corpus.directory
+        ) == os.path.realpath(directory):
+            # reopening the same segments keeps the documents added since the
+            # last segment
+            delta = self.corpus.delta
+            delta_docs = self.doc_count - self.corpus.doc_count
+        else:
+            if isinstance(self.corpus, (_UnigramTable, _SegmentedTable)):
+                delta = defaultdict(_dd_default)
+                delta.update(self.corpus.items())
+            else:
+                delta = self.corpus
+            delta_docs = self.doc_count
+
+        table = _SegmentedTable(directory, delta)
+        self.corpus = table
+        self.doc_count = table.doc_count + delta_docs
+
+    def append_segment(self) -> None:
+        """Write the documents added since the last segment as a new segment.
+
+        The cost of appending a segment is proportional to the number of terms
+        in the documents added since the last segment, not to the size of the
+        corpus.
+
+        Raises
+        ------
+        ValueError
+            The corpus must be opened with open_segments before segments can
+            be appended.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(self.corpus, _SegmentedTable):
+            raise ValueError(
+                'The corpus must be opened with open_segments before segments '
+                + 'can be appended.'
+            )
+        self.corpus.append(self.doc_count - self.corpus.doc_count)
+        # the delta is now empty, & segments appended by other processes have
+        # been mapped along with this one
+        self.doc_count = self.corpus.doc_count
+
+    def refresh_segments(self) -> None:
+        """Map the segments that other processes have appended or merged.
+
+        The documents added since the last segment are kept, and the document
+        count is that of the current segments and of those documents.
+
+        Raises
+        ------
+        ValueError
+            The corpus must be opened with open_segments before segments can
+            be refreshed.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(self.corpus, _SegmentedTable):
+            raise ValueError(
+                'The corpus must be opened with open_segments before segments '
+                + 'can be refreshed.'
+            )
+        delta_docs = self.doc_count - self.corpus.doc_count
+        self.corpus.refresh()
+        self.doc_count = self.corpus.doc_count + delta_docs
+
+    def merge_segments(self) -> None:
+        """Merge the corpus's segments into a single segment.
+
+        Lookups check every segment, so segments should be merged from time
+        to time. The documents added since the last segment are not merged;
+        they remain to be appended.
+
+        Raises
+        ------
+        ValueError
+            The corpus must be opened with open_segments before segments can
+            be merged.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not isinstance(self.corpus, _SegmentedTable):
+            raise ValueError(
+                'The corpus must be opened with open_segments before segments '
+                + 'can be merged.'
+            )
+        delta_docs = self.doc_count - self.corpus.doc_count
+        self.corpus.merge()
+        self.doc_count = self.corpus.doc_count + delta_docs
+
     def _update_doc_count(self) -> None:
         """Update document count, if necessary.
 
         .. versionadded:: 0.4.0
         """
-        max_docs = max(self.corpus.values(), key=lambda _: _[1])[1]
+        if isinstance(self.corpus, _SegmentedTable):
+            # no term's document count in the segments exceeds theirs, so
+            # only the delta is scanned
+            max_docs = self.corpus.doc_count + max(
+                (counts[1] for counts in self.corpus.delta.values()), default=0
+            )
+        elif isinstance(self.corpus, _UnigramTable):
+            max_docs = self.corpus.doc_count
+        else:
+            max_docs = max(self.corpus.values(), key=lambda _: _[1])[1]
         self.doc_count = max(max_docs, self.doc_count)
 
+    def _check_writable(self) -> None:
+        """Raise an error if the corpus is a read-only columnar corpus.
+
+        Raises
+        ------
+        ValueError
+            A columnar corpus is read-only; open it with open_segments to add
+            documents to it.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(self.corpus, _UnigramTable):
+            raise ValueError(
+                'A columnar corpus is read-only; open it with open_segments '
+                + 'to add documents to it.'
+            )
+
     def _add_word(self, word: str, count: int, doc_count: int) -> None:
         """Add a term to the corpus, possibly after tokenization.
 
@@ -169,25 +440,25 @@ class UnigramCorpus:
         .. versionadded:: 0.4.0
 
         """
+        self._check_writable()
         if self.transform is not None:
             word = self.transform(word)
 
         if self.tokenizer is not None:
-            self.tokenizer.tokenize(word)
-            tokens = self.tokenizer.get_counter()
-            for tok in tokens:
-                n = tokens[tok] * count
-                prior_count, prior_doc_count = self.corpus[tok]
-                self.corpus[tok] = (
+            tokens = self.tokenizer.counts(word)
+            terms = [(tok, tokens[tok] * count) for tok in tokens]
+        else:
+            terms = [(word, count)]
+        for term, n in terms:
+            if isinstance(self.corpus, _SegmentedTable):
+                # a segmented corpus adds to its in-memory delta
+                self.corpus.add(term, n, doc_count)
+            else:
+                prior_count, prior_doc_count = self.corpus[term]
+                self.corpus[term] = (
                     prior_count + n,
                     prior_doc_count + doc_count,
                 )
-        else:
-            prior_count, prior_doc_count = self.corpus[word]
-            self.corpus[word] = (
-                prior_count + count,
-                prior_doc_count + doc_count,
-            )
 
     def gng_importer(self, corpus_file: str) -> None:
         """Fill in self.corpus from a Google NGram corpus file.
@@ -197,10 +468,17 @@ class UnigramCorpus:
         corpus_file : file
             The Google NGram file from which to initialize the n-gram corpus
 
+        Raises
+        ------
+        ValueError
+            A columnar corpus is read-only; open it with open_segments to add
+            documents to it.
+
 
         .. versionadded:: 0.4.0
 
         """
+        self._check_writable()
         with c_open(corpus_file, 'r', encoding='utf-8') as gng:
             for line in gng:
                 word, _, count, doc_count = line.rstrip().split('\t')
@@ -210,6 +488,81 @@ class UnigramCorpus:
                 self._add_word(word, int(count), int(doc_count))
             self._update_doc_count()
 
+    def gng_import_many(
+        self,
+        corpus_files: Union[str, Iterable[str]],
+        n_jobs: Optional[int] = None,
+        checkpoint: Optional[str] = None,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+    ) -> None:
+        """Fill in self.corpus from many Google NGram corpus files.
+
+        Each file, which may be gzip or bzip2 compressed, is totalled by a
+        worker process, and the totals of all the files are merged and then
+        added to the corpus, so each distinct word is transformed and
+        tokenized only once. The result is the same as calling
+        :py:meth:`gng_importer` on each of the files.
+
+        Parameters
+        ----------
+        corpus_files : str or iterable of str
+            A glob pattern matching the Google NGram files, or a list of their
+            filenames
+        n_jobs : int or None
+            The number of worker processes to read the files with; None or 1
+            reads them in this process and -1 uses one worker per CPU
+        checkpoint : str or None
+            The filename of a checkpoint to append the counts of each file to
+            after it is read. If an import is interrupted, calling this
+            method again with the same checkpoint resumes it, skipping the
+            files already read. The checkpoint is removed once the import
+            completes.
+        progress : function or None
+            A function called after each file is read, with the number of
+            files read so far, the number of files, and the filename of the
+            file just read
+
+        Raises
+        ------
+        ValueError
+            A columnar corpus is read-only; open it with open_segments to add
+            documents to it.
+
+        Examples
+        --------
+        >>> import gzip, os, tempfile
+        >>> tmpdir = tempfile.mkdtemp()
+        >>> for i, line in enumerate(['quick_ADJ\\t1900\\t3\\t2\\n',
+        ...                           'quick\\t1900\\t5\\t4\\n']):
+        ...     with gzip.open(os.path.join(tmpdir, '{}.gz'.format(i)),
+        ...                    'wt') as gng:
+        ...         _ = gng.write(line)
+        >>> corp = UnigramCorpus()
+        >>> corp.gng_import_many(os.path.join(tmpdir, '*.gz'))
+        >>> corp.corpus['quick']
+        (8, 6)
+        >>> for i in range(2):
+        ...     os.remove(os.path.join(tmpdir, '{}.gz'.format(i)))
+        >>> os.rmdir(tmpdir)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._check_writable()
+        counts, doc_counts = _import_shards(
+            corpus_files,
+            _count_unigram_shard,
+            (Counter(), Counter()),
+            n_jobs,
+            checkpoint,
+            progress,
+        )
+        for word, count in counts.items():
+            self._add_word(word, count, doc_counts[word])
+        if self.corpus:
+            self._update_doc_count()
+
     def idf(self, term: str) -> float:
         r"""Calculate the Inverse Document Frequency of a term in the corpus.
 
@@ -237,11 +590,10 @@ class UnigramCorpus:
         .. versionadded:: 0.4.0
 
         """
-        if term in self.corpus:
-            count, term_doc_count = self.corpus[term]
-            return log1p(self.doc_count / term_doc_count)
-        else:
+        counts = self.corpus.get(term)
+        if counts is None:
             return float('inf')
+        return log1p(self.doc_count / counts[1])
 
 
 if __name__ == '__main__':
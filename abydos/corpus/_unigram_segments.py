@@ -0,0 +1,419 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.corpus._unigram_segments.
+
+Segmented unigram table
+"""
+
+import json
+import os
+from heapq import merge
+from itertools import groupby, repeat
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+)
+
+from ._unigram_table import _UnigramTable
+
+__all__ = ['_SegmentedTable']
+
+# A segmented table is a directory holding unigram table files, one per
+# segment, & a manifest: a JSON object listing the current segments' filenames
+# in the order they were written, the number of the next segment to be
+# written, & the number of distinct terms in the segments. The manifest is
+# replaced atomically whenever segments are added or merged, so readers always
+# see a consistent set of segments.
+_MANIFEST = 'MANIFEST'
+_SEGMENT = 'segment-{:08d}.uni'
+_RETRIES = 8
+
+
+class _SegmentedTable(Mapping[str, Tuple[Union[int, float], int]]):
+    """Segmented unigram table.
+
+    A mapping of terms to (count, doc_count) tuples that sums the counts of a
+    series of memory-mapped :py:class:`_UnigramTable` segments and of an
+    in-memory delta, to which new counts are added. The delta is written out
+    as a new segment by :py:meth:`append`, at a cost proportional to the
+    delta alone, and segments are combined by :py:meth:`merge`. New counts
+    are added by :py:meth:`add`, which keeps count of the distinct terms, so
+    the table's length is known without merging its segments.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        delta: DefaultDict[str, Tuple[Union[int, float], int]],
+    ) -> None:
+        """Initialize _SegmentedTable instance.
+
+        Parameters
+        ----------
+        directory : str
+            The directory of the segments, which is created if it does not
+            exist
+        delta : defaultdict
+            The in-memory counts, not yet written to a segment
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.directory = directory
+        self.delta = delta
+        os.makedirs(directory, exist_ok=True)
+        self._open()
+
+    def _open(self) -> None:
+        """Memory-map the segments listed in the manifest.
+
+        If a merge removes segments while they are being opened, the manifest
+        is read again.
+
+        .. versionadded:: 0.6.0
+        """
+        for attempt in range(_RETRIES):
+            manifest = self._read_manifest()
+            try:
+                self.segments = [
+                    _UnigramTable(os.path.join(self.directory, name))
+                    for name in manifest['segments']
+                ]
+            except FileNotFoundError:
+                if attempt == _RETRIES - 1:
+                    raise
+            else:
+                break
+        self._names = manifest['segments']  # type: List[str]
+        self._next = manifest['next']  # type: int
+        self.doc_count = sum(segment.doc_count for segment in self.segments)
+
+        terms = manifest.get('terms')
+        if terms is None:
+            # the manifest predates the count of terms, so it is counted once
+            terms = (
+                len(self.segments[0])
+                if len(self.segments) == 1
+                else sum(1 for _ in self._merged(self.segments, False))
+            )
+        self._terms = terms  # type: int
+        # the number of terms in the delta & in no segment
+        self._new_terms = sum(
+            1
+            for term in self.delta
+            if not any(term in segment for segment in self.segments)
+        )
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        """Return the contents of the manifest.
+
+        Returns
+        -------
+        dict
+            The segments' filenames, the number of the next segment & the
+            number of distinct terms in the segments, if it was recorded
+
+        Raises
+        ------
+        ValueError
+            The directory does not hold a segmented table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        path = os.path.join(self.directory, _MANIFEST)
+        if not os.path.exists(path):
+            return {'segments': [], 'next': 0, 'terms': 0}
+        with open(path, encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)
+        if (
+            not isinstance(manifest, dict)
+            or not isinstance(manifest.get('segments'), list)
+            or not isinstance(manifest.get('next'), int)
+            or not isinstance(manifest.get('terms', 0), int)
+        ):
+            raise ValueError(
+                '{} is not a segmented unigram table'.format(self.directory)
+            )
+        return manifest
+
+    def _write_manifest(self, segments: List[str], terms: int) -> None:
+        """Replace the manifest.
+
+        Parameters
+        ----------
+        segments : list of str
+            The segments' filenames
+        terms : int
+            The number of distinct terms in the segments
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        path = os.path.join(self.directory, _MANIFEST)
+        with open(path + '.tmp', 'w', encoding='utf-8') as manifest_file:
+            json.dump(
+                {'segments': segments, 'next': self._next, 'terms': terms},
+                manifest_file,
+            )
+        os.replace(path + '.tmp', path)
+
+    def _write_segment(
+        self,
+        items: Iterator[Tuple[str, Tuple[Union[int, float], int]]],
+        doc_count: int,
+    ) -> str:
+        """Write a new segment file.
+
+        Parameters
+        ----------
+        items : iterator of (str, (int or float, int)) tuples
+            The terms, each with its count & document count
+        doc_count : int
+            The number of documents the segment's counts were taken from
+
+        Returns
+        -------
+        str
+            The filename of the segment, within the directory
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        name = _SEGMENT.format(self._next)
+        self._next += 1
+        path = os.path.join(self.directory, name)
+        _UnigramTable.write(path + '.tmp', items, doc_count)
+        os.replace(path + '.tmp', path)
+        return name
+
+    def refresh(self) -> None:
+        """Memory-map the segments that are currently listed in the manifest.
+
+        .. versionadded:: 0.6.0
+        """
+        self._open()
+
+    def add(self, term: str, count: Union[int, float], doc_count: int) -> None:
+        """Add to the count & document count of a term in the delta.
+
+        Parameters
+        ----------
+        term : str
+            The term
+        count : int or float
+            The count to add
+        doc_count : int
+            The document count to add
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        prior = self.delta.get(term)
+        if prior is None:
+            prior = (0, 0)
+            if not any(term in segment for segment in self.segments):
+                self._new_terms += 1
+        self.delta[term] = (prior[0] + count, prior[1] + doc_count)
+
+    def append(self, doc_count: int) -> None:
+        """Write the delta as a new segment & clear it.
+
+        Parameters
+        ----------
+        doc_count : int
+            The number of documents the delta's counts were taken from
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self.delta and not doc_count:
+            return
+        # the delta's new terms are counted against the current segments,
+        # including any appended by another process
+        self._open()
+        name = self._write_segment(iter(self.delta.items()), doc_count)
+        self._write_manifest(self._names + [name], len(self))
+        self.delta.clear()
+        self._open()
+
+    def merge(self) -> None:
+        """Merge the segments into a single segment.
+
+        The files of the merged segments are removed. Processes that have
+        already mapped them keep reading them until they refresh.
+
+        .. versionadded:: 0.6.0
+        """
+        self._open()
+        if len(self.segments) < 2:
+            return
+        old = [segment._filename for segment in self.segments]  # noqa: SF01
+        name = self._write_segment(
+            self._merged(self.segments, False), self.doc_count
+        )
+        self._write_manifest([name], self._terms)
+        self._open()
+        for path in old:
+            os.remove(path)
+
+    @staticmethod
+    def _merged(
+        tables: List[Mapping[str, Tuple[Union[int, float], int]]],
+        sort_last: bool,
+    ) -> Iterator[Tuple[str, Tuple[Union[int, float], int]]]:
+        """Iterate over the summed counts of tables, in term order.
+
+        Parameters
+        ----------
+        tables : list of mappings
+            The tables, each a mapping of terms to count & document count
+            tuples that iterates over its terms in sorted order, except that
+            the last table's terms are sorted here if sort_last is True
+        sort_last : bool
+            True if the last table is an unsorted delta
+
+        Yields
+        ------
+        tuple
+            Each term & its summed count & document count
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        iterators = []
+        for i, table in enumerate(tables):
+            terms = (
+                sorted(table)
+                if sort_last and i == len(tables) - 1
+                else iter(table)
+            )
+            iterators.append(zip(terms, repeat(i)))
+        for term, group in groupby(merge(*iterators), key=lambda _: _[0]):
+            count = 0  # type: Union[int, float]
+            doc_count = 0
+            for _, i in group:
+                term_count, term_doc_count = tables[i][term]
+                count += term_count
+                doc_count += term_doc_count
+            yield term, (count, doc_count)
+
+    def __getitem__(self, term: str) -> Tuple[Union[int, float], int]:
+        """Return the summed count & document count of a term.
+
+        Parameters
+        ----------
+        term : str
+            The term to look up
+
+        Returns
+        -------
+        tuple
+            The count & document count of the term
+
+        Raises
+        ------
+        KeyError
+            The term is in no segment & not in the delta
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        found = False
+        count = 0  # type: Union[int, float]
+        doc_count = 0
+        for table in self.segments + [self.delta]:
+            counts = table.get(term)
+            if counts is not None:
+                found = True
+                count += counts[0]
+                doc_count += counts[1]
+        if not found:
+            raise KeyError(term)
+        return count, doc_count
+
+    def __contains__(self, term: object) -> bool:
+        """Return True if a term is in any segment or the delta.
+
+        Parameters
+        ----------
+        term : str
+            The term to look up
+
+        Returns
+        -------
+        bool
+            True if the term is in the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return term in self.delta or any(
+            term in segment for segment in self.segments
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the terms of the table, in sorted order.
+
+        Yields
+        ------
+        str
+            The terms
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for term, _ in self._merged(self.segments + [self.delta], True):
+            yield term
+
+    def __len__(self) -> int:
+        """Return the number of distinct terms in the table.
+
+        Returns
+        -------
+        int
+            The number of terms
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._terms + self._new_terms
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,275 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.corpus._unigram_table.
+
+Memory-mapped columnar unigram table
+"""
+
+import mmap
+from array import array
+from struct import Struct
+from typing import Any, Dict, Iterable, Iterator, Mapping, Tuple, Union
+
+from ..util._string_table import (
+    _ITEM_SIZE,
+    _StringTable,
+    _encode,
+    _pack_strings,
+    _view_columns,
+    _write_columns,
+)
+
+__all__ = ['_UnigramTable']
+
+# A unigram table file is laid out as:
+#   - the magic bytes, the number of terms, N, the corpus's document count,
+#     & flags (bit 0 set if the counts are float64 rather than uint64)
+#   - N + 1 offsets of the terms within the term table
+#   - N counts
+#   - N document counts
+#   - the term table: the UTF-8 encoded terms, concatenated in sorted order
+# All integers are little-endian unsigned 64-bit, as are the floats, and
+# offsets are relative to the start of the term table.
+_MAGIC = b'ABYDUNI1'
+_HEADER = Struct('<8sQQQ')
+_FLOAT_COUNTS = 1
+
+
+class _UnigramTable(Mapping[str, Tuple[Union[int, float], int]]):
+    """Memory-mapped columnar unigram table.
+
+    A read-only mapping of terms to (count, doc_count) tuples, stored as a
+    sorted string table with parallel count columns. The file is
+    memory-mapped and searched by bisection, so it is never read into memory
+    as a whole & every process that opens it shares one copy in the
+    operating system's page cache.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, filename: str) -> None:
+        """Initialize _UnigramTable instance.
+
+        Parameters
+        ----------
+        filename : str
+            The filename of a table written by :py:meth:`write`
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._filename = filename
+        self._open()
+
+    def _open(self) -> None:
+        """Memory-map the table.
+
+        Raises
+        ------
+        ValueError
+            The file is not a unigram table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(self._filename, 'rb') as table:
+            self._map = mmap.mmap(table.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < _HEADER.size:
+            raise ValueError(
+                '{} is not a unigram table'.format(self._filename)
+            )
+        magic, self._size, self.doc_count, flags = _HEADER.unpack_from(
+            self._map, 0
+        )
+        if (
+            magic != _MAGIC
+            or len(self._map)
+            < _HEADER.size + (3 * self._size + 1) * _ITEM_SIZE
+        ):
+            raise ValueError(
+                '{} is not a unigram table'.format(self._filename)
+            )
+
+        (offsets, self._counts, self._doc_counts), start = _view_columns(
+            self._map,
+            _HEADER.size,
+            (
+                (self._size + 1, 'Q'),
+                (self._size, 'd' if flags & _FLOAT_COUNTS else 'Q'),
+                (self._size, 'Q'),
+            ),
+        )
+        self._terms = _StringTable(self._map, offsets, start)
+
+    @staticmethod
+    def write(
+        filename: str,
+        items: Iterable[Tuple[str, Tuple[Union[int, float], int]]],
+        doc_count: int,
+    ) -> None:
+        """Write terms & their counts to a unigram table file.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to write the table to
+        items : iterable of (str, (int or float, int)) tuples
+            The terms, each with its count & document count, as from the
+            items of a UnigramCorpus's corpus
+        doc_count : int
+            The number of documents in the corpus
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        entries = sorted(items, key=lambda _: _encode(_[0]))
+        float_counts = any(
+            not isinstance(count, int) for _, (count, _) in entries
+        )
+
+        offsets, terms = _pack_strings(term for term, _ in entries)
+        counts = array(
+            'd' if float_counts else 'Q', [count for _, (count, _) in entries]
+        )
+        doc_counts = array('Q', [term_docs for _, (_, term_docs) in entries])
+
+        with open(filename, 'wb') as table:
+            table.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    len(entries),
+                    doc_count,
+                    _FLOAT_COUNTS if float_counts else 0,
+                )
+            )
+            _write_columns(table, (offsets, counts, doc_counts))
+            table.write(terms)
+
+    def __getitem__(self, term: str) -> Tuple[Union[int, float], int]:
+        """Return the count & document count of a term.
+
+        Parameters
+        ----------
+        term : str
+            The term to look up
+
+        Returns
+        -------
+        tuple
+            The count & document count of the term
+
+        Raises
+        ------
+        KeyError
+            The term is not in the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        index = self._terms.find(term)
+        if index < 0:
+            raise KeyError(term)
+        return self._counts[index], self._doc_counts[index]
+
+    def __contains__(self, term: object) -> bool:
+        """Return True if a term is in the table.
+
+        Parameters
+        ----------
+        term : str
+            The term to look up
+
+        Returns
+        -------
+        bool
+            True if the term is in the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return isinstance(term, str) and self._terms.find(term) >= 0
+
+    def __len__(self) -> int:
+        """Return the number of terms in the table.
+
+        Returns
+        -------
+        int
+            The number of terms
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the terms of the table, in sorted order.
+
+        Yields
+        ------
+        str
+            The terms
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        terms = self._terms
+        for index in range(self._size):
+            yield terms[index]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the table's state for pickling, without its memory map.
+
+        Returns
+        -------
+        dict
+            The filename of the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return {'_filename': self._filename}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the table's state, memory-mapping the file again.
+
+        Parameters
+        ----------
+        state : dict
+            The filename of the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._open()
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
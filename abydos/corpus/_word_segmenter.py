@@ -0,0 +1,337 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.corpus._word_segmenter.
+
+Word segmentation
+"""
+
+from math import log
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
+
+from ._ngram_corpus import NGramCorpus
+from ._unigram_corpus import UnigramCorpus
+from ..util._lru_cache import _LRUCache
+
+__all__ = ['WordSegmenter']
+
+
+class WordSegmenter:
+    """Word segmenter.
+
+    This splits strings written without spaces, such as compounds or
+    hashtags, into the sequence of words that is most probable according to
+    a :py:class:`UnigramCorpus` or an :py:class:`NGramCorpus`, by dynamic
+    programming over the positions of the string (the Viterbi algorithm)
+    :cite:`Norvig:2009`. Words are no longer than max_word_length, so a
+    string of n characters is segmented with at most n * max_word_length
+    word probabilities (or, with bigrams, n * max_word_length ** 2).
+
+    Words are scored by their unigram probabilities or, with ``order=2``
+    and an :py:class:`NGramCorpus`, by their Stupid Backoff scores given
+    the preceding word. Words that are not in the corpus are penalized by
+    their length. The log-probabilities are cached, up to ``_cache_size``
+    of them, and the cache is shared by all the strings segmented, so
+    segmenting many strings with :py:meth:`segment_many` scores each word
+    only once.
+
+    .. versionadded:: 0.6.0
+    """
+
+    _cache_size = 2 ** 18
+
+    def __init__(
+        self,
+        corpus: Union[UnigramCorpus, NGramCorpus],
+        order: int = 1,
+        max_word_length: int = 24,
+    ) -> None:
+        """Initialize WordSegmenter instance.
+
+        Parameters
+        ----------
+        corpus : UnigramCorpus or NGramCorpus
+            The corpus whose word counts the segmentation is scored by
+        order : int
+            1 to score words by their unigram probabilities, or 2 to score
+            them given the preceding word, which requires an
+            :py:class:`NGramCorpus` of bigrams
+        max_word_length : int
+            The maximum length of a word
+
+        Raises
+        ------
+        ValueError
+            Segmenting with bigrams requires an NGramCorpus
+
+        Examples
+        --------
+        >>> corpus = UnigramCorpus('kunden service zentrum kunde zentrum')
+        >>> segmenter = WordSegmenter(corpus)
+        >>> segmenter.segment('kundenservicezentrum')
+        ['kunden', 'service', 'zentrum']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if order not in {1, 2}:
+            raise ValueError('order must be 1 or 2.')
+        if order == 2 and not isinstance(corpus, NGramCorpus):
+            raise ValueError(
+                'Segmenting with bigrams requires an NGramCorpus.'
+            )
+        self.corpus = corpus
+        self.order = order
+        self.max_word_length = max_word_length
+
+        if isinstance(corpus, NGramCorpus):
+            total = corpus._get_stats().totals[()]  # noqa: SF01
+        else:
+            total = sum(counts[0] for counts in corpus.corpus.values())
+        self._log_total = log(max(total, 1))
+
+    def _count(self, word: str) -> Union[int, float]:
+        """Return the count of a word in the corpus.
+
+        Parameters
+        ----------
+        word : str
+            The word
+
+        Returns
+        -------
+        int or float
+            The count of the word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(self.corpus, NGramCorpus):
+            return self.corpus.get_count([word])
+        counts = self.corpus.corpus.get(word)
+        return counts[0] if counts else 0
+
+    def _score(self, prev: Optional[str], word: str) -> float:
+        """Return the log-probability of a word.
+
+        Parameters
+        ----------
+        prev : str or None
+            The preceding word, or None at the start of a string or when
+            scoring by unigram probabilities
+        word : str
+            The word
+
+        Returns
+        -------
+        float
+            The log-probability (or log Stupid Backoff score) of the word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        count = self._count(word)
+        if not count:
+            # as if the word occurred once in ten corpora as large, & a tenth
+            # as likely again for each character after the first
+            return log(10) - self._log_total - len(word) * log(10)
+        if prev is not None:
+            return log(
+                cast(NGramCorpus, self.corpus).stupid_backoff(word, [prev])
+            )
+        return log(count) - self._log_total
+
+    def _cached_score(self, prev: Optional[str], word: str) -> float:
+        """Return the log-probability of a word, from the cache if possible.
+
+        Parameters
+        ----------
+        prev : str or None
+            The preceding word
+        word : str
+            The word
+
+        Returns
+        -------
+        float
+            The log-probability of the word
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            cache = self.__dict__['_score_cache']
+        except KeyError:
+            cache = self.__dict__['_score_cache'] = _LRUCache(self._cache_size)
+        return cache(self._score, prev, word)
+
+    def segment(self, text: str) -> List[str]:
+        """Return the most probable segmentation of a string into words.
+
+        Parameters
+        ----------
+        text : str
+            The string to segment
+
+        Returns
+        -------
+        list of str
+            The words
+
+        Examples
+        --------
+        >>> corpus = UnigramCorpus('best day ever the best of days every '
+        ... 'day the day ever best ever')
+        >>> segmenter = WordSegmenter(corpus)
+        >>> segmenter.segment('bestdayever')
+        ['best', 'day', 'ever']
+        >>> segmenter.segment('thebestofdays')
+        ['the', 'best', 'of', 'days']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self.order == 2:
+            return self._segment_bigrams(text)
+
+        # the best score of the text up to each position, & the start of
+        # its last word
+        best = [0.0] + [float('-inf')] * len(text)
+        starts = [0] * (len(text) + 1)
+        for end in range(1, len(text) + 1):
+            for start in range(max(0, end - self.max_word_length), end):
+                score = best[start] + self._cached_score(None, text[start:end])
+                if score > best[end]:
+                    best[end] = score
+                    starts[end] = start
+
+        words = []
+        end = len(text)
+        while end:
+            words.append(text[starts[end] : end])
+            end = starts[end]
+        return words[::-1]
+
+    def _segment_bigrams(self, text: str) -> List[str]:
+        """Return the most probable segmentation of a string, by bigrams.
+
+        Parameters
+        ----------
+        text : str
+            The string to segment
+
+        Returns
+        -------
+        list of str
+            The words
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # for each position, the best score of the text up to it ending in
+        # each word, with the start of that word & the word before it
+        best = [
+            {} for _ in range(len(text) + 1)
+        ]  # type: List[Dict[str, Tuple[float, int, Optional[str]]]]
+        for end in range(1, len(text) + 1):
+            for start in range(max(0, end - self.max_word_length), end):
+                word = text[start:end]
+                if start:
+                    score, prev = max(
+                        (prev_score + self._cached_score(prev, word), prev,)
+                        for prev, (prev_score, _, _) in best[start].items()
+                    )
+                else:
+                    score, prev = self._cached_score(None, word), None
+                if word not in best[end] or score > best[end][word][0]:
+                    best[end][word] = (score, start, prev)
+
+        words = []  # type: List[str]
+        if not text:
+            return words
+        word = max(best[-1], key=lambda _: best[-1][_][0])
+        end = len(text)
+        while True:
+            words.append(word)
+            _, start, prev = best[end][word]
+            if prev is None:
+                break
+            end, word = start, prev
+        return words[::-1]
+
+    def segment_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """Return the most probable segmentations of many strings.
+
+        Each distinct string is segmented once, and the word probabilities
+        cached while segmenting each string are reused for the rest.
+
+        Parameters
+        ----------
+        texts : iterable of str
+            The strings to segment
+
+        Returns
+        -------
+        list of lists of str
+            The words of each string
+
+        Examples
+        --------
+        >>> corpus = UnigramCorpus('best day ever the best of days every '
+        ... 'day the day ever best ever')
+        >>> segmenter = WordSegmenter(corpus)
+        >>> segmenter.segment_many(['bestdayever', 'theday', 'bestdayever'])
+        [['best', 'day', 'ever'], ['the', 'day'], ['best', 'day', 'ever']]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        segmentations = {}  # type: Dict[str, List[str]]
+        results = []
+        for text in texts:
+            if text not in segmentations:
+                segmentations[text] = self.segment(text)
+            results.append(list(segmentations[text]))
+        return results
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the segmenter's state for pickling, without its cache.
+
+        Returns
+        -------
+        dict
+            The instance's attributes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        state.pop('_score_cache', None)
+        return state
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
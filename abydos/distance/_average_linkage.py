@@ -110,8 +110,8 @@ class AverageLinkage(_TokenDistance):
         if not src and not tar:
             return 0.0
 
-        src = self.params['tokenizer'].tokenize(src).get_list()
-        tar = self.params['tokenizer'].tokenize(tar).get_list()
+        src = self.params['tokenizer'].tokens(src)
+        tar = self.params['tokenizer'].tokens(tar)
 
         if not src or not tar:
             return 1.0
@@ -148,10 +148,8 @@ class BLEU(_Distance):
         bleu_null = True
 
         for i in range(len(self._tokenizers)):
-            self._tokenizers[i].tokenize(tar)
-            tar_tokens = self._tokenizers[i].get_counter()
-            self._tokenizers[i].tokenize(src)
-            tokens_int = self._tokenizers[i].get_counter() & tar_tokens
+            tar_tokens = self._tokenizers[i].counts(tar)
+            tokens_int = self._tokenizers[i].counts(src) & tar_tokens
             tar_total = sum(tar_tokens.values())
 
             if tokens_int:
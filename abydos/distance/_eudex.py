@@ -30,12 +30,19 @@ from typing import (
     cast,
 )
 
+import numpy as np
+
 from ._distance import _Distance
 from ..phonetic import Eudex as EudexPhonetic
 
 __all__ = ['Eudex']
 
 
+# The number of set bits and the bit length of each byte value
+_POPCOUNT = np.array([bin(_).count('1') for _ in range(256)], dtype=np.uint8)
+_BIT_LENGTH = np.array([_.bit_length() for _ in range(256)], dtype=np.uint8)
+
+
 class Eudex(_Distance):
     """Distance between the Eudex hashes of two terms.
 
@@ -143,6 +150,47 @@ class Eudex(_Distance):
         self._max_length = max_length
         self._phonetic_alg = EudexPhonetic(max_length=max_length)
 
+    def _weights_list(self) -> List[float]:
+        """Return the byte weights, most significant byte first.
+
+        Returns
+        -------
+        list
+            The weights, ordered from the most significant byte to the least
+
+        Raises
+        ------
+        ValueError
+            Unrecognized weights value or type.
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        # If self._weights is a function, it should create a generator,
+        # which we now use to populate a list
+        weights_list = []  # List[float]
+        if hasattr(self._weights, '__iter__') and not isinstance(
+            self._weights, str
+        ):
+            weights_list = cast(List[float], self._weights)[::-1]
+            weights_gen = None
+        elif callable(self._weights):
+            weights_gen = self._weights()
+        elif self._weights == 'exponential':
+            weights_gen = Eudex.gen_exponential()
+        elif self._weights == 'fibonacci':
+            weights_gen = Eudex.gen_fibonacci()
+        else:
+            raise ValueError('Unrecognized weights value or type.')
+
+        if isinstance(weights_gen, Generator):
+            weights_list = [
+                next(weights_gen) for _ in range(self._max_length)
+            ][::-1]
+
+        return weights_list
+
     def dist_abs(self, src: str, tar: str, normalized: bool = False) -> float:
         """Calculate the distance between the Eudex hashes of two terms.
 
@@ -211,9 +259,9 @@ class Eudex(_Distance):
         """
 
         # Calculate the eudex hashes and XOR them
-        xored = int(self._phonetic_alg.encode(src)) ^ int(
-            self._phonetic_alg.encode(tar)
-        )
+        xored = self._phonetic_alg.encode_int(
+            src
+        ) ^ self._phonetic_alg.encode_int(tar)
 
         # Simple hamming distance (all bits are equal)
         if not self._weights:
@@ -223,27 +271,7 @@ class Eudex(_Distance):
                 return distance / (len(binary) - 2)
             return distance
 
-        # If self._weights is a function, it should create a generator,
-        # which we now use to populate a list
-        weights_list = []  # List[float]
-        if hasattr(self._weights, '__iter__') and not isinstance(
-            self._weights, str
-        ):
-            weights_list = cast(List[float], self._weights)[::-1]
-            weights_gen = None
-        elif callable(self._weights):
-            weights_gen = self._weights()
-        elif self._weights == 'exponential':
-            weights_gen = Eudex.gen_exponential()
-        elif self._weights == 'fibonacci':
-            weights_gen = Eudex.gen_fibonacci()
-        else:
-            raise ValueError('Unrecognized weights value or type.')
-
-        if isinstance(weights_gen, Generator):
-            weights_list = [
-                next(weights_gen) for _ in range(self._max_length)
-            ][::-1]
+        weights_list = self._weights_list()
 
         # Sum the weighted hamming distance
         distance = 0
@@ -295,6 +323,143 @@ class Eudex(_Distance):
         """
         return self.dist_abs(src, tar, True)
 
+    def dist_abs_array(
+        self,
+        src: Union[str, int],
+        tars: Union[np.ndarray, Iterable[str]],
+        normalized: bool = False,
+    ) -> np.ndarray:
+        """Calculate the distances between one Eudex hash and many.
+
+        The XORed hashes are split into bytes, whose set bits are counted by
+        table lookup and weighted, all as array operations. Hashing the
+        targets once with :py:meth:`abydos.phonetic.Eudex.encode_array` and
+        passing the resulting array here makes each query cost only these
+        array operations.
+
+        Parameters
+        ----------
+        src : str or int
+            Source string, or its Eudex hash, for comparison
+        tars : numpy.ndarray or iterable of str
+            Target Eudex hashes (as an array of dtype uint64) or target
+            strings for comparison
+        normalized : bool
+            Normalizes to [0, 1] if True
+
+        Returns
+        -------
+        numpy.ndarray
+            The Eudex Hamming distances from src to each target
+
+        Examples
+        --------
+        >>> cmp = Eudex()
+        >>> cmp.dist_abs_array('Niall', ['Niall', 'Neil', 'Colin'])
+        array([  0.,   2., 524.])
+
+        >>> from abydos.phonetic import Eudex as EudexPhonetic
+        >>> hashes = EudexPhonetic().encode_array(['cat', 'bat', 'hat'])
+        >>> Eudex(weights='fibonacci').dist_abs_array('cat', hashes)
+        array([ 0., 68., 34.])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(src, str):
+            src = self._phonetic_alg.encode_int(src)
+        if not isinstance(tars, np.ndarray):
+            tars = self._phonetic_alg.encode_array(tars)
+
+        # Split each XORed hash into its 8 bytes, least significant first
+        xored = np.bitwise_xor(tars.astype('<u8'), np.uint64(src))
+        xored_bytes = xored.view(np.uint8).reshape(-1, 8)
+        bit_counts = _POPCOUNT[xored_bytes]
+
+        # Simple hamming distance (all bits are equal)
+        if not self._weights:
+            distances = bit_counts.sum(axis=1).astype(np.float64)
+            if normalized:
+                # Normalize by the bit length of each XORed value
+                bit_lengths = _BIT_LENGTH[xored_bytes].astype(np.int64)
+                bit_lengths = np.where(
+                    bit_lengths > 0, bit_lengths + 8 * np.arange(8), 0
+                ).max(axis=1)
+                distances /= np.maximum(bit_lengths, 1)
+            return distances
+
+        weights_list = self._weights_list()[::-1]
+        weights = np.zeros(8, dtype=np.float64)
+        weights[: min(8, len(weights_list))] = weights_list[:8]
+
+        distances = bit_counts @ weights
+        if normalized:
+            distances /= 8 * sum(weights_list)
+        return distances
+
+    def dist_array(
+        self, src: Union[str, int], tars: Union[np.ndarray, Iterable[str]]
+    ) -> np.ndarray:
+        """Return normalized distances between one Eudex hash and many.
+
+        This is Eudex distance normalized to [0, 1].
+
+        Parameters
+        ----------
+        src : str or int
+            Source string, or its Eudex hash, for comparison
+        tars : numpy.ndarray or iterable of str
+            Target Eudex hashes (as an array of dtype uint64) or target
+            strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Eudex Hamming distances from src to each target
+
+        Examples
+        --------
+        >>> cmp = Eudex()
+        >>> cmp.dist_array('Niall', ['Niall', 'Neil', 'Colin']).round(6)
+        array([0.      , 0.00098 , 0.256863])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.dist_abs_array(src, tars, True)
+
+    def sim_array(
+        self, src: Union[str, int], tars: Union[np.ndarray, Iterable[str]]
+    ) -> np.ndarray:
+        """Return normalized similarities between one Eudex hash and many.
+
+        Parameters
+        ----------
+        src : str or int
+            Source string, or its Eudex hash, for comparison
+        tars : numpy.ndarray or iterable of str
+            Target Eudex hashes (as an array of dtype uint64) or target
+            strings for comparison
+
+        Returns
+        -------
+        numpy.ndarray
+            The normalized Eudex similarities from src to each target
+
+        Examples
+        --------
+        >>> cmp = Eudex()
+        >>> cmp.sim_array('Niall', ['Niall', 'Neil', 'Colin']).round(6)
+        array([1.      , 0.99902 , 0.743137])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 1.0 - self.dist_array(src, tars)
+
 
 if __name__ == '__main__':
     import doctest
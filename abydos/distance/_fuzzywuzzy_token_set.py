@@ -99,8 +99,8 @@ class FuzzyWuzzyTokenSet(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        src_tok = self.params['tokenizer'].tokenize(src).get_set()
-        tar_tok = self.params['tokenizer'].tokenize(tar).get_set()
+        src_tok = set(self.params['tokenizer'].counts(src))
+        tar_tok = set(self.params['tokenizer'].counts(tar))
 
         intersection = src_tok & tar_tok
         src_tok -= intersection
@@ -140,8 +140,8 @@ class Guth(_Distance):
             return 0.0
 
         if self.params['tokenizer']:
-            src = self.params['tokenizer'].tokenize(src).get_list()
-            tar = self.params['tokenizer'].tokenize(tar).get_list()
+            src = self.params['tokenizer'].tokens(src)
+            tar = self.params['tokenizer'].tokens(tar)
 
         for pos in range(len(src)):
             s = self._token_at(src, pos)
@@ -212,8 +212,8 @@ class Guth(_Distance):
             return 0.0
 
         if self.params['tokenizer']:
-            src = self.params['tokenizer'].tokenize(src).get_list()
-            tar = self.params['tokenizer'].tokenize(tar).get_list()
+            src = self.params['tokenizer'].tokens(src)
+            tar = self.params['tokenizer'].tokens(tar)
 
         score = 0.0
         for pos in range(len(src)):
@@ -161,10 +161,8 @@ class JaroWinkler(_Distance):
             return 1.0
 
         tokenizer = QGrams(self._qval)
-        tokenizer.tokenize(src.strip())
-        src_list = tokenizer.get_list()
-        tokenizer.tokenize(tar.strip())
-        tar_list = tokenizer.get_list()
+        src_list = tokenizer.tokens(src.strip())
+        tar_list = tokenizer.tokens(tar.strip())
 
         lens = len(src_list)
         lent = len(tar_list)
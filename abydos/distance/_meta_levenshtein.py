@@ -141,13 +141,11 @@ class MetaLevenshtein(_Distance):
         if not tar:
             return float(len(src))
 
-        src_tok = self.params['tokenizer'].tokenize(src)
-        src_ordered = src_tok.get_list()
-        src_tok = src_tok.get_counter()
+        src_ordered = self.params['tokenizer'].tokens(src)
+        src_tok = self.params['tokenizer'].counts(src)
 
-        tar_tok = self.params['tokenizer'].tokenize(tar)
-        tar_ordered = tar_tok.get_list()
-        tar_tok = tar_tok.get_counter()
+        tar_ordered = self.params['tokenizer'].tokens(tar)
+        tar_tok = self.params['tokenizer'].counts(tar)
 
         if self._corpus is None:
             corpus = UnigramCorpus(word_tokenizer=self.params['tokenizer'])
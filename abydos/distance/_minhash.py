@@ -122,8 +122,8 @@ class MinHash(_Distance):
         if not src and not tar:
             return 1.0
 
-        src_tokens = self.params['tokenizer'].tokenize(src).get_set()
-        tar_tokens = self.params['tokenizer'].tokenize(tar).get_set()
+        src_tokens = set(self.params['tokenizer'].counts(src))
+        tar_tokens = set(self.params['tokenizer'].counts(tar))
 
         k = self._k if self._k else max(len(src_tokens), len(tar_tokens))
 
@@ -112,10 +112,8 @@ class MongeElkan(_Distance):
             return 1.0
 
         tokenizer = QGrams()
-        tokenizer.tokenize(src)
-        q_src = sorted(tokenizer.get_list())
-        tokenizer.tokenize(tar)
-        q_tar = sorted(tokenizer.get_list())
+        q_src = sorted(tokenizer.tokens(src))
+        q_tar = sorted(tokenizer.tokens(tar))
 
         if not q_src or not q_tar:
             return 0.0
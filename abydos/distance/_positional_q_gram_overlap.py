@@ -115,8 +115,8 @@ class PositionalQGramOverlap(_Distance):
         if not src or not tar:
             return 0.0
 
-        src_list = self.params['tokenizer'].tokenize(src).get_list()
-        tar_list = self.params['tokenizer'].tokenize(tar).get_list()
+        src_list = self.params['tokenizer'].tokens(src)
+        tar_list = self.params['tokenizer'].tokens(tar)
 
         src_pos = defaultdict(list)  # type: DefaultDict[str, List[int]]
         tar_pos = defaultdict(list)  # type: DefaultDict[str, List[int]]
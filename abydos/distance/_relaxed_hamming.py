@@ -122,8 +122,8 @@ class RelaxedHamming(_Distance):
                 tar += replacement_char * (len(src) - len(tar))
 
         if self.params['tokenizer']:
-            src = self.params['tokenizer'].tokenize(src).get_list()
-            tar = self.params['tokenizer'].tokenize(tar).get_list()
+            src = self.params['tokenizer'].tokens(src)
+            tar = self.params['tokenizer'].tokens(tar)
 
         score = 0.0
         for pos in range(len(src)):
@@ -194,8 +194,8 @@ class RelaxedHamming(_Distance):
         score = self.dist_abs(src, tar)
 
         if self.params['tokenizer']:
-            src = self.params['tokenizer'].tokenize(src).get_list()
-            tar = self.params['tokenizer'].tokenize(tar).get_list()
+            src = self.params['tokenizer'].tokens(src)
+            tar = self.params['tokenizer'].tokens(tar)
 
         return score / max(len(src), len(tar))
 
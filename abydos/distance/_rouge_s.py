@@ -19,7 +19,7 @@
 Rouge-S similarity
 """
 
-from typing import Any
+from typing import Any, Optional
 
 from ._distance import _Distance
 from ..tokenizer import QSkipgrams
@@ -36,21 +36,35 @@ class RougeS(_Distance):
     .. versionadded:: 0.4.0
     """
 
-    def __init__(self, qval: int = 2, **kwargs: Any) -> None:
+    def __init__(
+        self, qval: int = 2, max_gap: Optional[int] = None, **kwargs: Any
+    ) -> None:
         """Initialize RougeS instance.
 
         Parameters
         ----------
+        qval : int
+            The length of each skipgram
+        max_gap : int or None
+            The maximum number of characters that may be skipped between
+            consecutive characters of a skipgram (the skip distance of
+            Rouge-S), or None for no limit
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_gap parameter & counts skipgrams without enumerating
+            them
 
         """
         super(RougeS, self).__init__(**kwargs)
         self._qval = qval
-        self._tokenizer = QSkipgrams(qval=qval, start_stop='')
+        self._max_gap = max_gap
+        self._tokenizer = QSkipgrams(
+            qval=qval, start_stop='', max_gap=max_gap, counts_only=True
+        )
 
     def sim(self, src: str, tar: str, beta: float = 8) -> float:
         """Return the Rouge-S similarity of two strings.
@@ -88,15 +102,18 @@ class RougeS(_Distance):
         if src == tar:
             return 1.0
 
-        qsg_src = self._tokenizer.tokenize(src).get_counter()
-        qsg_tar = self._tokenizer.tokenize(tar).get_counter()
+        qsg_src = self._tokenizer.counts(src)
+        qsg_tar = self._tokenizer.counts(tar)
         intersection = sum((qsg_src & qsg_tar).values())
 
-        if intersection:
+        if not intersection:
+            return 0.0
+        if self._max_gap is None:
             r_skip = intersection / _ncr(len(src), self._qval)
             p_skip = intersection / _ncr(len(tar), self._qval)
         else:
-            return 0.0
+            r_skip = intersection / sum(qsg_src.values())
+            p_skip = intersection / sum(qsg_tar.values())
 
         beta_sq = beta * beta
 
@@ -19,7 +19,7 @@
 Rouge-SU similarity
 """
 
-from typing import Any
+from typing import Any, Optional
 
 from . import RougeS
 
@@ -35,19 +35,29 @@ class RougeSU(RougeS):
     .. versionadded:: 0.4.0
     """
 
-    def __init__(self, qval: int = 2, **kwargs: Any) -> None:
+    def __init__(
+        self, qval: int = 2, max_gap: Optional[int] = None, **kwargs: Any
+    ) -> None:
         """Initialize RougeSU instance.
 
         Parameters
         ----------
+        qval : int
+            The length of each skipgram
+        max_gap : int or None
+            The maximum number of characters that may be skipped between
+            consecutive characters of a skipgram (the skip distance of
+            Rouge-S), or None for no limit
         **kwargs
             Arbitrary keyword arguments
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_gap parameter
 
         """
-        super(RougeSU, self).__init__(qval=qval, **kwargs)
+        super(RougeSU, self).__init__(qval=qval, max_gap=max_gap, **kwargs)
 
     def sim(self, src: str, tar: str, beta: float = 8) -> float:
         """Return the Rouge-SU similarity of two strings.
@@ -142,15 +142,32 @@ class SAPS(_Distance):
         .. versionadded:: 0.4.0
 
         """
-        self._tokenizer.tokenize(src)
-        src = ''.join(
-            [_[0].upper() + _[1:].lower() for _ in self._tokenizer.get_list()]
-        )
-        self._tokenizer.tokenize(tar)
-        tar = ''.join(
-            [_[0].upper() + _[1:].lower() for _ in self._tokenizer.get_list()]
+        return self._score(
+            self._tokenizer.tokens(src), self._tokenizer.tokens(tar)
         )
 
+    def _score(self, src_tokens: List[str], tar_tokens: List[str]) -> float:
+        """Return the SAPS similarity between two lists of syllables.
+
+        Parameters
+        ----------
+        src_tokens : list of str
+            The syllables of the source string
+        tar_tokens : list of str
+            The syllables of the target string
+
+        Returns
+        -------
+        int
+            The SAPS similarity between the syllables
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        src = ''.join([_[0].upper() + _[1:].lower() for _ in src_tokens])
+        tar = ''.join([_[0].upper() + _[1:].lower() for _ in tar_tokens])
+
         d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_int)
         for i in range(len(src)):
             d_mat[i + 1, 0] = d_mat[i, 0] + self._g(src[i])
@@ -198,14 +215,14 @@ class SAPS(_Distance):
         .. versionadded:: 0.4.0
 
         """
-        score = self.sim_score(src, tar)
+        src_tokens = self._tokenizer.tokens(src)
+        tar_tokens = self._tokenizer.tokens(tar)
+        score = self._score(src_tokens, tar_tokens)
         if score <= 0:
             return 0.0
 
-        self._tokenizer.tokenize(src)
-        src_max = sum(5 + len(_) for _ in self._tokenizer.get_list())
-        self._tokenizer.tokenize(tar)
-        tar_max = sum(5 + len(_) for _ in self._tokenizer.get_list())
+        src_max = sum(5 + len(_) for _ in src_tokens)
+        tar_max = sum(5 + len(_) for _ in tar_tokens)
 
         return score / max(src_max, tar_max)
 
@@ -156,8 +156,8 @@ class Sift4Extended(_Distance):
         .. versionadded:: 0.4.0
 
         """
-        src_list = self._tokenizer.tokenize(src).get_list()
-        tar_list = self._tokenizer.tokenize(tar).get_list()
+        src_list = self._tokenizer.tokens(src)
+        tar_list = self._tokenizer.tokens(tar)
 
         if not src_list:
             return len(tar_list)
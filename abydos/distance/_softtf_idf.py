@@ -20,19 +20,19 @@ SoftTF-IDF similarity
 """
 
 from collections import defaultdict
-from math import log1p
-from typing import Any, DefaultDict, Optional, Tuple
+from typing import Any, DefaultDict, Dict, Optional, Tuple
 
 from ._distance import _Distance
 from ._jaro_winkler import JaroWinkler
-from ._token_distance import _TokenDistance
+from ._tf_idf import TFIDF
 from ..corpus import UnigramCorpus
 from ..tokenizer import _Tokenizer
+from ..util._lru_cache import _LRUCache
 
 __all__ = ['SoftTFIDF']
 
 
-class SoftTFIDF(_TokenDistance):
+class SoftTFIDF(TFIDF):
     r"""SoftTF-IDF similarity.
 
     For two sets X and Y and a population N, SoftTF-IDF similarity
@@ -60,10 +60,20 @@ class SoftTFIDF(_TokenDistance):
     Rather than needing to exceed the threshold value, as in :cite:`Cohen:2003`
     the similarity must be greater than or equal to the threshold.
 
+    As with :py:class:`TFIDF`, the measure can be fit to a collection of
+    records, whose weight vectors are then reused. The similarities of the
+    most recently compared token pairs are also cached, up to
+    ``_cache_size`` pairs, so soft matches are scored only once.
+
     .. versionadded:: 0.4.0
+    .. versionchanged:: 0.6.0
+        Derived from TFIDF
 
     """
 
+    # The number of token pairs whose metric similarities are retained
+    _cache_size = 2 ** 16
+
     def __init__(
         self,
         tokenizer: Optional[_Tokenizer] = None,
@@ -101,11 +111,39 @@ class SoftTFIDF(_TokenDistance):
         .. versionadded:: 0.4.0
 
         """
-        super(SoftTFIDF, self).__init__(tokenizer=tokenizer, **kwargs)
-        self._corpus = corpus
+        super(SoftTFIDF, self).__init__(
+            tokenizer=tokenizer, corpus=corpus, **kwargs
+        )
         self._threshold = threshold
         self._metric = JaroWinkler() if metric is None else metric
 
+    def _metric_sim(self, src: str, tar: str) -> float:
+        """Return the metric similarity of two tokens, through a cache.
+
+        Parameters
+        ----------
+        src : str
+            Source token for comparison
+        tar : str
+            Target token for comparison
+
+        Returns
+        -------
+        float
+            The metric similarity of the tokens
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            cache = self.__dict__['_metric_cache']
+        except KeyError:
+            cache = self.__dict__['_metric_cache'] = _LRUCache(
+                self._cache_size
+            )
+        return cache(self._metric.sim, src, tar)
+
     def sim(self, src: str, tar: str) -> float:
         """Return the SoftTF-IDF similarity of two strings.
 
@@ -135,18 +173,34 @@ class SoftTFIDF(_TokenDistance):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Reuses the weight vectors of records once fit & caches metric
+            similarities
 
         """
-        self._tokenize(src, tar)
+        if (
+            self._fit_corpus is not None
+            and isinstance(src, str)
+            and isinstance(tar, str)
+        ):
+            src_tok, vws = self._record(src)
+            tar_tok, vwt = self._record(tar)
+            self._tokenize(src_tok, tar_tok)
+        else:
+            self._tokenize(src, tar)
+            src_tok, tar_tok = self._get_tokens()
 
-        src_tok, tar_tok = self._get_tokens()
+            if self._fit_corpus is not None:
+                corpus = self._fit_corpus
+            elif self._corpus is None:
+                corpus = UnigramCorpus(word_tokenizer=self.params['tokenizer'])
+                corpus.add_document(src)
+                corpus.add_document(tar)
+            else:
+                corpus = self._corpus
 
-        if self._corpus is None:
-            corpus = UnigramCorpus(word_tokenizer=self.params['tokenizer'])
-            corpus.add_document(src)
-            corpus.add_document(tar)
-        else:
-            corpus = self._corpus
+            vws = self._vector(src_tok, corpus)
+            vwt = self._vector(tar_tok, corpus)
 
         matches = {(tok, tok): 1.0 for tok in self._crisp_intersection()}
         sims = defaultdict(float)  # type: DefaultDict[Tuple[str, str], float]
@@ -154,7 +208,7 @@ class SoftTFIDF(_TokenDistance):
         t_toks = set(self._tar_only().keys())
         for s_tok in s_toks:
             for t_tok in t_toks:
-                sim = self._metric.sim(s_tok, t_tok)
+                sim = self._metric_sim(s_tok, t_tok)
                 if sim > self._threshold:
                     sims[(s_tok, t_tok)] = sim
         for tokens, value in sorted(
@@ -165,30 +219,32 @@ class SoftTFIDF(_TokenDistance):
                 s_toks.remove(tokens[0])
                 t_toks.remove(tokens[1])
 
-        vws_dict = {}
-        vwt_dict = {}
-        for token in src_tok.keys():
-            vws_dict[token] = log1p(src_tok[token]) * corpus.idf(token)
-        for token in tar_tok.keys():
-            vwt_dict[token] = log1p(tar_tok[token]) * corpus.idf(token)
-
-        vws_rss = sum(score ** 2 for score in vws_dict.values()) ** 0.5
-        vwt_rss = sum(score ** 2 for score in vwt_dict.values()) ** 0.5
-
         return float(
             round(
                 sum(
-                    vws_dict[s_tok]
-                    / vws_rss
-                    * vwt_dict[t_tok]
-                    / vwt_rss
-                    * matches[(s_tok, t_tok)]
+                    vws[s_tok] * vwt[t_tok] * matches[(s_tok, t_tok)]
                     for s_tok, t_tok in matches.keys()
                 ),
                 14,
             )
         )
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the measure's state for pickling, without its cache.
+
+        Returns
+        -------
+        dict
+            The instance attributes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        state.pop('_metric_cache', None)
+        return state
+
 
 if __name__ == '__main__':
     import doctest
@@ -40,6 +40,7 @@ class SSK(_TokenDistance):
         self,
         tokenizer: Optional[_Tokenizer] = None,
         ssk_lambda: float = 0.9,
+        max_gap: Optional[int] = None,
         **kwargs: Any
     ) -> None:
         """Initialize SSK instance.
@@ -53,6 +54,9 @@ class SSK(_TokenDistance):
             characters according to the method described in :cite:`Lodhi:2002`.
             To supply multiple values of lambda, provide an Iterable of numeric
             values, such as (0.5, 0.05) or np.arange(0.05, 0.5, 0.05)
+        max_gap : int or None
+            The maximum number of characters that may be skipped between
+            consecutive characters of a q-skipgram, or None for no limit
         **kwargs
             Arbitrary keyword arguments
 
@@ -65,10 +69,16 @@ class SSK(_TokenDistance):
 
 
         .. versionadded:: 0.4.1
+        .. versionchanged:: 0.6.0
+            Added max_gap parameter & counts q-skipgrams without enumerating
+            them
 
         """
         super(SSK, self).__init__(
-            tokenizer=tokenizer, ssk_lambda=ssk_lambda, **kwargs
+            tokenizer=tokenizer,
+            ssk_lambda=ssk_lambda,
+            max_gap=max_gap,
+            **kwargs
         )
 
         qval = 2 if 'qval' not in self.params else self.params['qval']
@@ -76,7 +86,12 @@ class SSK(_TokenDistance):
             tokenizer
             if tokenizer is not None
             else QSkipgrams(
-                qval=qval, start_stop='', scaler='SSK', ssk_lambda=ssk_lambda
+                qval=qval,
+                start_stop='',
+                scaler='SSK',
+                ssk_lambda=ssk_lambda,
+                max_gap=max_gap,
+                counts_only=True,
             )
         )
 
@@ -101,11 +116,11 @@ class SSK(_TokenDistance):
         >>> cmp.dist_abs('cat', 'hat')
         0.6441281138790036
         >>> cmp.dist_abs('Niall', 'Neil')
-        0.5290992177869402
+        0.5290992177869401
         >>> cmp.dist_abs('aluminum', 'Catalan')
         0.862398428061774
         >>> cmp.dist_abs('ATCG', 'TAGC')
-        0.38591004719395017
+        0.38591004719395006
 
 
         .. versionadded:: 0.4.1
@@ -143,11 +158,11 @@ class SSK(_TokenDistance):
         >>> cmp.sim('cat', 'hat')
         0.3558718861209964
         >>> cmp.sim('Niall', 'Neil')
-        0.4709007822130597
+        0.47090078221305987
         >>> cmp.sim('aluminum', 'Catalan')
         0.13760157193822603
         >>> cmp.sim('ATCG', 'TAGC')
-        0.6140899528060498
+        0.6140899528060499
 
 
         .. versionadded:: 0.4.1
@@ -20,7 +20,18 @@ TF-IDF similarity
 """
 
 from math import log1p
-from typing import Any, Optional
+from typing import (
+    Any,
+    Counter as TCounter,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
 
 from ._token_distance import _TokenDistance
 from ..corpus import UnigramCorpus
@@ -49,6 +60,10 @@ class TFIDF(_TokenDistance):
     ensure the logarithms do not fall to 0, which will tend to result in 0.0
     similarities even when there is a degree of matching.
 
+    To compare the records of a collection with one another, the measure can
+    be fit to the collection with :py:meth:`fit`, which computes the weight
+    vector V of each record once, to be reused in every comparison.
+
     .. versionadded:: 0.4.0
 
     """
@@ -84,6 +99,184 @@ class TFIDF(_TokenDistance):
         """
         super(TFIDF, self).__init__(tokenizer=tokenizer, **kwargs)
         self._corpus = corpus
+        self._fit_corpus = None  # type: Optional[UnigramCorpus]
+        self._records = (
+            {}
+        )  # type: Dict[str, Tuple[TCounter[str], Dict[str, float]]]
+
+    @staticmethod
+    def _vector(
+        tokens: TCounter[str], corpus: UnigramCorpus
+    ) -> Dict[str, float]:
+        """Return the L2-normalized TF-IDF weight vector of some tokens.
+
+        Parameters
+        ----------
+        tokens : Counter
+            The tokens of a string & their counts
+        corpus : UnigramCorpus
+            The corpus to take IDFs from
+
+        Returns
+        -------
+        dict
+            The weight of each token
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        weights = {
+            token: log1p(count) * corpus.idf(token)
+            for token, count in tokens.items()
+        }
+        rss = sum(weight ** 2 for weight in weights.values()) ** 0.5
+        if not rss:
+            return weights
+        return {token: weight / rss for token, weight in weights.items()}
+
+    def _record(self, string: str) -> Tuple[TCounter[str], Dict[str, float]]:
+        """Return the tokens & weight vector of a string, once fit.
+
+        Parameters
+        ----------
+        string : str
+            The string
+
+        Returns
+        -------
+        tuple
+            The tokens of the string & their weights, as stored by
+            :py:meth:`fit` for a record of the collection
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        record = self._records.get(string)
+        if record is None:
+            tokens = self.params['tokenizer'].counts(string)
+            record = tokens, self._vector(tokens, self._fit_corpus)
+        return record
+
+    def fit(self, collection: Iterable[str]) -> 'TFIDF':
+        """Fit the measure to a collection of records.
+
+        If the measure has no corpus, a :py:class:`UnigramCorpus` of the
+        records, each as a document, is made its corpus; otherwise the IDFs
+        still come from its corpus. The tokens & L2-normalized weight vector
+        of each distinct record are then computed once and stored, to be
+        reused by :py:meth:`sim`, :py:meth:`sim_many`, :py:meth:`transform`,
+        and the measures based on these, whenever the record is compared.
+        Fitting again replaces the stored records.
+
+        Parameters
+        ----------
+        collection : iterable of str
+            The records
+
+        Returns
+        -------
+        TFIDF
+            The measure itself
+
+        Examples
+        --------
+        >>> cmp = TFIDF().fit(['Niall', 'Neil', 'Nigel', 'Colin'])
+        >>> cmp.sim('Niall', 'Neil')
+        0.15623658748664
+        >>> cmp.sim('Niall', 'Nigel')
+        0.2661755518521
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        records = list(collection)
+        corpus = self._corpus
+        if corpus is None:
+            corpus = UnigramCorpus(word_tokenizer=self.params['tokenizer'])
+            for record in records:
+                corpus.add_document(record)
+        self._fit_corpus = corpus
+
+        self._records = {}
+        for record in records:
+            if record not in self._records:
+                self._records[record] = self._record(record)
+        return self
+
+    def transform(self, strings: Iterable[str]) -> List[Dict[str, float]]:
+        """Return the L2-normalized TF-IDF weight vectors of strings.
+
+        The vectors of records of the collection the measure was fit to are
+        those stored by :py:meth:`fit`; those of other strings are computed
+        with the same IDFs.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            The strings
+
+        Returns
+        -------
+        list of dict
+            The weight of each token of each string
+
+        Raises
+        ------
+        ValueError
+            The measure must be fit with fit before transform can be used.
+
+        Examples
+        --------
+        >>> cmp = TFIDF(qval=1).fit(['aab', 'bc'])
+        >>> [{token: round(weight, 10) for token, weight in vector.items()}
+        ...  for vector in cmp.transform(['aab', 'c'])]
+        [{'a': 0.9229604839, 'b': 0.3848947195}, {'c': 1.0}]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._fit_corpus is None:
+            raise ValueError(
+                'The measure must be fit with fit before transform can be '
+                + 'used.'
+            )
+        return [self._record(string)[1] for string in strings]
+
+    def sim_many(
+        self,
+        pairs: Iterable[
+            Tuple[Union[str, TCounter[str]], Union[str, TCounter[str]]]
+        ],
+    ) -> np.ndarray:
+        """Return the similarities of many pairs of strings.
+
+        Parameters
+        ----------
+        pairs : iterable of (str, str) tuples
+            The source & target strings (or QGrams/Counter objects) to compare
+
+        Returns
+        -------
+        numpy.ndarray
+            The similarities, as :py:meth:`sim` would return them
+
+        Examples
+        --------
+        >>> cmp = TFIDF().fit(['Niall', 'Neil', 'Nigel', 'Colin'])
+        >>> cmp.sim_many([('Niall', 'Neil'), ('Niall', 'Nigel')]).tolist()
+        [0.15623658748664, 0.2661755518521]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return np.array(
+            [self.sim(src, tar) for src, tar in pairs], dtype=np.float64
+        )
 
     def sim(self, src: str, tar: str) -> float:
         """Return the TF-IDF similarity of two strings.
@@ -114,33 +307,51 @@ class TFIDF(_TokenDistance):
 
 
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Reuses the weight vectors of records once fit
 
         """
+        if (
+            self._fit_corpus is not None
+            and isinstance(src, str)
+            and isinstance(tar, str)
+            and self.params['intersection_type'] == 'crisp'
+        ):
+            vws = self._record(src)[1]
+            vwt = self._record(tar)[1]
+            if len(vws) > len(vwt):
+                vws, vwt = vwt, vws
+            return float(
+                round(
+                    sum(
+                        weight * vwt[token]
+                        for token, weight in vws.items()
+                        if token in vwt
+                    ),
+                    14,
+                )
+            )
+
         self._tokenize(src, tar)
 
         src_tok, tar_tok = self._get_tokens()
 
-        if self._corpus is None:
+        if self._fit_corpus is not None:
+            corpus = self._fit_corpus
+        elif self._corpus is None:
             corpus = UnigramCorpus(word_tokenizer=self.params['tokenizer'])
             corpus.add_document(src)
             corpus.add_document(tar)
         else:
             corpus = self._corpus
 
-        vws_dict = {}
-        vwt_dict = {}
-        for token in src_tok.keys():
-            vws_dict[token] = log1p(src_tok[token]) * corpus.idf(token)
-        for token in tar_tok.keys():
-            vwt_dict[token] = log1p(tar_tok[token]) * corpus.idf(token)
-
-        vws_rss = sum(score ** 2 for score in vws_dict.values()) ** 0.5
-        vwt_rss = sum(score ** 2 for score in vwt_dict.values()) ** 0.5
+        vws = self._vector(src_tok, corpus)
+        vwt = self._vector(tar_tok, corpus)
 
         return float(
             round(
                 sum(
-                    vws_dict[token] / vws_rss * vwt_dict[token] / vwt_rss
+                    vws[token] * vwt[token]
                     for token in self._intersection().keys()
                 ),
                 14,
@@ -322,15 +322,11 @@ class _TokenDistance(_Distance):
         if isinstance(src, Counter):
             self._src_tokens = src
         else:
-            self._src_tokens = (
-                self.params['tokenizer'].tokenize(src).get_counter()
-            )
+            self._src_tokens = self.params['tokenizer'].counts(src)
         if isinstance(tar, Counter):
             self._tar_tokens = tar
         else:
-            self._tar_tokens = (
-                self.params['tokenizer'].tokenize(tar).get_counter()
-            )
+            self._tar_tokens = self.params['tokenizer'].counts(tar)
 
         self._population_card_value = self._calc_population_card()
 
@@ -96,9 +96,7 @@ class QGram(_Fingerprint):
         """
         phrase = unicode_normalize('NFKD', phrase.strip().lower())
         phrase = ''.join(c for c in phrase if c.isalnum())
-        phrase = self._joiner.join(
-            sorted(self._tokenizer.tokenize(phrase).get_set())
-        )
+        phrase = self._joiner.join(sorted(set(self._tokenizer.counts(phrase))))
         return phrase
 
 
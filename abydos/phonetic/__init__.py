@@ -97,6 +97,23 @@ encoding, as demonstrated below:
 >>> rus.encode_alpha('Abramson')
 'ABRMCN'
 
+Classes whose codes are drawn from a fixed alphabet (:py:class:`.Soundex`,
+:py:class:`.RefinedSoundex`, :py:class:`.FuzzySoundex`, :py:class:`.Phonex`,
+:py:class:`.NYSIIS`, & :py:class:`.Caverphone`) also have ``encode_int`` and
+``encode_array`` methods, which pack codes into ints (or NumPy arrays of ints),
+and a ``decode_int`` method to recover the codes. Codes of a bounded length
+pack into ints that sort in the same order as the codes, and any characters
+outside the alphabet, such as non-ASCII initials, are escaped:
+
+>>> sdx = Soundex()
+>>> sdx.encode_int('Abramson')
+424087
+>>> sdx.decode_int(424087)
+'A165'
+>>> nys = NYSIIS()
+>>> nys.decode_int(nys.encode_int('Förster'))
+'FÖRSTA'
+
 ----
 
 """
@@ -36,6 +36,8 @@ class Caverphone(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
+    _int_alphabet = '1ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
     def __init__(self, version: int = 2) -> None:
         """Initialize Caverphone instance.
 
@@ -50,6 +52,20 @@ class Caverphone(_Phonetic):
         """
         self._version = version
 
+    def _int_length(self) -> int:
+        """Return the code length used to pack codes into ints.
+
+        Returns
+        -------
+        int
+            The length of the encoder's codes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return 6 if self._version == 1 else 10
+
     def encode_alpha(self, word: str) -> str:
         """Return the alphabetic Caverphone code for a word.
 
@@ -19,7 +19,7 @@
 Daitch-Mokotoff Soundex
 """
 
-from typing import Dict, Tuple, Union, cast
+from typing import Any, Dict, Set, Tuple, Union
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
@@ -27,6 +27,44 @@ from ._phonetic import _Phonetic
 __all__ = ['DaitchMokotoff']
 
 
+def _compile_dms_trie(
+    table: Dict[str, Tuple[Union[int, str, Tuple[Union[int, str], ...]], ...]]
+) -> Dict[str, Any]:
+    """Compile the Daitch-Mokotoff rule table into a character trie.
+
+    Each node is a dict keyed by the next character. A node that completes a
+    rule stores, under the key '', the rule's three positional variants
+    (initial, pre-vocalic, elsewhere), each as a tuple of alternative code
+    strings.
+
+    Parameters
+    ----------
+    table : dict
+        A mapping from substrings to their coding triples
+
+    Returns
+    -------
+    dict
+        The root node of the trie
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    trie = {}  # type: Dict[str, Any]
+    for sstr, variants in table.items():
+        node = trie
+        for char in sstr:
+            node = node.setdefault(char, {})
+        node[''] = tuple(
+            tuple(str(alt) for alt in val)
+            if isinstance(val, tuple)
+            else (str(val),)
+            for val in variants
+        )
+    return trie
+
+
 class DaitchMokotoff(_Phonetic):
     """Daitch-Mokotoff Soundex.
 
@@ -159,93 +197,9 @@ class DaitchMokotoff(_Phonetic):
         'J': ((1, 4), ('_', 4), ('_', 4)),
         'RZ': ((94, 4), (94, 4), (94, 4)),
         'RS': ((94, 4), (94, 4), (94, 4)),
-    }
-
-    _dms_order = {
-        'A': ('AI', 'AJ', 'AU', 'AY', 'A'),
-        'B': ('B',),
-        'C': ('CHS', 'CSZ', 'CZS', 'CH', 'CK', 'CS', 'CZ', 'C'),
-        'D': ('DRS', 'DRZ', 'DSH', 'DSZ', 'DZH', 'DZS', 'DS', 'DT', 'DZ', 'D'),
-        'E': ('EI', 'EJ', 'EU', 'EY', 'E'),
-        'F': ('FB', 'F'),
-        'G': ('G',),
-        'H': ('H',),
-        'I': ('IA', 'IE', 'IO', 'IU', 'I'),
-        'J': ('J',),
-        'K': ('KH', 'KS', 'K'),
-        'L': ('L',),
-        'M': ('MN', 'M'),
-        'N': ('NM', 'N'),
-        'O': ('OI', 'OJ', 'OY', 'O'),
-        'P': ('PF', 'PH', 'P'),
-        'Q': ('Q',),
-        'R': ('RS', 'RZ', 'R'),
-        'S': (
-            'SCHTSCH',
-            'SCHTCH',
-            'SCHTSH',
-            'SHTCH',
-            'SHTSH',
-            'STSCH',
-            'SCHD',
-            'SCHT',
-            'SHCH',
-            'STCH',
-            'STRS',
-            'STRZ',
-            'STSH',
-            'SZCS',
-            'SZCZ',
-            'SCH',
-            'SHD',
-            'SHT',
-            'SZD',
-            'SZT',
-            'SC',
-            'SD',
-            'SH',
-            'ST',
-            'SZ',
-            'S',
-        ),
-        'T': (
-            'TTSCH',
-            'TSCH',
-            'TTCH',
-            'TTSZ',
-            'TCH',
-            'THS',
-            'TRS',
-            'TRZ',
-            'TSH',
-            'TSZ',
-            'TTS',
-            'TTZ',
-            'TZS',
-            'TC',
-            'TH',
-            'TS',
-            'TZ',
-            'T',
-        ),
-        'U': ('UE', 'UI', 'UJ', 'UY', 'U'),
-        'V': ('V',),
-        'W': ('W',),
-        'X': ('X',),
-        'Y': ('Y',),
-        'Z': (
-            'ZHDZH',
-            'ZDZH',
-            'ZSCH',
-            'ZDZ',
-            'ZHD',
-            'ZSH',
-            'ZD',
-            'ZH',
-            'ZS',
-            'Z',
-        ),
-    }  # type: Dict[str, Tuple[str, ...]]
+    }  # type: Dict[str, Tuple[Union[int, str, Tuple[Union[int, str], ...]], ...]]  # noqa: E501
+
+    _dms_trie = _compile_dms_trie(_dms_table)
 
     _uc_v_set = set('AEIJOUY')
 
@@ -357,8 +311,6 @@ class DaitchMokotoff(_Phonetic):
             Made return a str only (comma-separated)
 
         """
-        dms = ['']  # initialize empty code list
-
         # uppercase, normalize, decompose, and filter non-A-Z
         word = unicode_normalize('NFKD', word.upper())
         word = ''.join(c for c in word if c in self._uc_set)
@@ -369,73 +321,71 @@ class DaitchMokotoff(_Phonetic):
                 return '0' * self._max_length
             return '0'
 
-        pos = 0
-        while pos < len(word):
-            # Iterate through _dms_order, which specifies the possible
-            # substrings for which codes exist in the Daitch-Mokotoff coding
-            for sstr in self._dms_order[word[pos]]:  # pragma: no branch
-                if word[pos:].startswith(sstr):
-                    # Having determined a valid substring start, retrieve the
-                    # code
-                    dm_tup = cast(
-                        Tuple[
-                            Union[
-                                int,
-                                str,
-                                Tuple[Union[int, str], Union[int, str]],
-                            ],
-                            Union[
-                                int,
-                                str,
-                                Tuple[Union[int, str], Union[int, str]],
-                            ],
-                            Union[
-                                int,
-                                str,
-                                Tuple[Union[int, str], Union[int, str]],
-                            ],
-                        ],
-                        self._dms_table[sstr],
-                    )
-
-                    # Having retried the code (triple), determine the correct
-                    # positional variant (first, pre-vocalic, elsewhere)
-                    if pos == 0:
-                        dm_val = dm_tup[
-                            0
-                        ]  # type: Union[int, str, Tuple[Union[int, str], Union[int, str]]]  # noqa: E501
-                    elif (
-                        pos + len(sstr) < len(word)
-                        and word[pos + len(sstr)] in self._uc_v_set
-                    ):
-                        dm_val = dm_tup[1]
-                    else:
-                        dm_val = dm_tup[2]
+        # Partial codes are kept as a set of (code, last) pairs, where last is
+        # the most recent raw code character (which may be the _ placeholder)
+        # and governs the deletion of repeats. Branches that converge on the
+        # same pair are thereby merged as they arise, and codes that have
+        # reached max_length are set aside in complete.
+        partials = {('', '')}  # type: Set[Tuple[str, str]]
+        complete = set()  # type: Set[str]
 
-                    # Build the code strings
-                    if isinstance(dm_val, tuple):
-                        dms = [_ + str(dm_val[0]) for _ in dms] + [
-                            _ + str(dm_val[1]) for _ in dms
-                        ]
-                    else:
-                        dms = [_ + str(dm_val) for _ in dms]
-                    pos += len(sstr)
+        pos = 0
+        wlen = len(word)
+        while pos < wlen and partials:
+            # Walk the trie to find the longest substring starting at pos for
+            # which a code exists in the Daitch-Mokotoff coding
+            node = self._dms_trie
+            end = pos
+            variants = None  # type: Any
+            i = pos
+            while i < wlen:
+                node = node.get(word[i])
+                if node is None:
                     break
+                i += 1
+                if '' in node:
+                    end = i
+                    variants = node['']
+
+            # Having determined the matched substring, determine the correct
+            # positional variant (first, pre-vocalic, elsewhere)
+            if pos == 0:
+                alts = variants[0]
+            elif end < wlen and word[end] in self._uc_v_set:
+                alts = variants[1]
+            else:
+                alts = variants[2]
+            pos = end
+
+            # Extend each partial code by each alternative, deleting repeats
+            # and _ placeholders as we go
+            extended = set()  # type: Set[Tuple[str, str]]
+            for code, last in partials:
+                for alt in alts:
+                    new_code = code
+                    new_last = last
+                    for char in alt:
+                        if char != new_last:
+                            if char != '_':
+                                new_code += char
+                            new_last = char
+                    if len(new_code) >= self._max_length:
+                        complete.add(new_code[: self._max_length])
+                    else:
+                        extended.add((new_code, new_last))
+            partials = extended
 
-        # Filter out double letters and _ placeholders
-        dms = [
-            ''.join(c for c in self._delete_consecutive_repeats(_) if c != '_')
-            for _ in dms
-        ]
+        complete.update(code for code, _ in partials)
 
-        # Trim codes and return set
+        # Pad codes and return them
         if self._zero_pad:
-            dms = [
-                (_ + ('0' * self._max_length))[: self._max_length] for _ in dms
-            ]
+            dms = {
+                (_ + ('0' * self._max_length))[: self._max_length]
+                for _ in complete
+            }
         else:
-            dms = [_[: self._max_length] for _ in dms]
-        return ','.join(sorted(set(dms)))
+            dms = complete
+        return ','.join(sorted(dms))
 
 
 if __name__ == '__main__':
@@ -19,7 +19,7 @@
 Double Metaphone
 """
 
-from typing import Set, Tuple
+from typing import Callable, Dict, Tuple
 
 from ._phonetic import _Phonetic
 
@@ -120,116 +120,6 @@ class DoubleMetaphone(_Phonetic):
             Made return a str only (comma-separated)
 
         """
-        primary = ''
-        secondary = ''
-
-        def _slavo_germanic() -> bool:
-            """Return True if the word appears to be Slavic or Germanic.
-
-            Returns
-            -------
-            bool
-                True if the word appears to be Slavic or Germanic
-
-            .. versionadded:: 0.1.0
-
-            """
-            if 'W' in word or 'K' in word or 'CZ' in word:
-                return True
-            return False
-
-        def _metaph_add(pri: str, sec: str = '') -> Tuple[str, str]:
-            """Return a new metaphone tuple with the supplied elements.
-
-            Parameters
-            ----------
-            pri : str
-                The primary element
-            sec : str
-                The secondary element
-
-            Returns
-            -------
-            tuple
-                A new metaphone tuple with the supplied elements
-
-            .. versionadded:: 0.1.0
-
-            """
-            newpri = primary
-            newsec = secondary
-            if pri:
-                newpri += pri
-            if sec:
-                if sec != ' ':
-                    newsec += sec
-            else:
-                newsec += pri
-            return newpri, newsec
-
-        def _is_vowel(pos: int) -> bool:
-            """Return True if the character at word[pos] is a vowel.
-
-            Parameters
-            ----------
-            pos : int
-                Position in the word
-
-            Returns
-            -------
-            bool
-                True if the character is a vowel
-
-            .. versionadded:: 0.1.0
-
-            """
-            if pos >= 0 and word[pos] in {'A', 'E', 'I', 'O', 'U', 'Y'}:
-                return True
-            return False
-
-        def _get_at(pos: int) -> str:
-            """Return the character at word[pos].
-
-            Parameters
-            ----------
-            pos : int
-                Position in the word
-
-            Returns
-            -------
-            str
-                Character at word[pos]
-
-            .. versionadded:: 0.1.0
-
-            """
-            return word[pos]
-
-        def _string_at(pos: int, slen: int, substrings: Set[str]) -> bool:
-            """Return True if word[pos:pos+slen] is in substrings.
-
-            Parameters
-            ----------
-            pos : int
-                Position in the word
-            slen : int
-                Substring length
-            substrings : set
-                Substrings to search
-
-            Returns
-            -------
-            bool
-                True if word[pos:pos+slen] is in substrings
-
-            .. versionadded:: 0.1.0
-
-            """
-            if pos < 0:
-                return False
-            return word[pos : pos + slen] in substrings
-
-        current = 0
         length = len(word)
         if length < 1:
             return ','
@@ -241,772 +131,781 @@ class DoubleMetaphone(_Phonetic):
         # world
         word += '     '
 
+        # Word-level context that the rules consult repeatedly
+        slavo_germanic = 'W' in word or 'K' in word or 'CZ' in word
+        germanic = word.startswith(('VAN ', 'VON ', 'SCH'))
+
+        primary = ''
+        secondary = ''
+        current = 0
+
         # Skip these when at start of word
         if word[0:2] in {'GN', 'KN', 'PN', 'WR', 'PS'}:
             current += 1
 
         # Initial 'X' is pronounced 'Z' e.g. 'Xavier'
-        if _get_at(0) == 'X':
-            primary, secondary = _metaph_add('S')  # 'Z' maps to 'S'
+        if word[0] == 'X':
+            primary = secondary = 'S'  # 'Z' maps to 'S'
             current += 1
 
         # Main loop
-        while True:
-            if current >= length:
-                break
-
-            if _get_at(current) in {'A', 'E', 'I', 'O', 'U', 'Y'}:
-                if current == 0:
-                    # All init vowels now map to 'A'
-                    primary, secondary = _metaph_add('A')
+        dispatch = self._dispatch
+        while current < length:
+            handler = dispatch.get(word[current])
+            if handler is None:
                 current += 1
                 continue
+            pri, sec, current = handler(
+                self, word, current, last, slavo_germanic, germanic
+            )
+            primary += pri
+            secondary += sec
 
-            elif _get_at(current) == 'B':
-                # "-mb", e.g", "dumb", already skipped over...
-                primary, secondary = _metaph_add('P')
-                if _get_at(current + 1) == 'B':
-                    current += 2
-                else:
-                    current += 1
-                continue
+        if self._max_length > 0:
+            primary = primary[: self._max_length]
+            secondary = secondary[: self._max_length]
+        if primary == secondary:
+            secondary = ''
 
-            elif _get_at(current) == 'Ç':
-                primary, secondary = _metaph_add('S')
-                current += 1
-                continue
+        return ','.join((primary, secondary))
 
-            elif _get_at(current) == 'C':
-                # Various Germanic
-                if (
+    # Each of the handlers below encodes the letter at word[current] and
+    # returns a triple of the primary code to add, the secondary code to add,
+    # and the position at which to resume. Beyond the word itself, a handler
+    # receives the index of the word's last character and two word-level
+    # flags: whether the word appears Slavic or Germanic (contains W, K, or
+    # CZ) and whether it begins with VAN, VON, or SCH.
+
+    def _vowel(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode A, E, I, O, U, & Y."""
+        if current == 0:
+            # All init vowels now map to 'A'
+            return 'A', 'A', 1
+        return '', '', current + 1
+
+    def _b(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode B."""
+        # "-mb", e.g", "dumb", already skipped over...
+        if word[current + 1] == 'B':
+            return 'P', 'P', current + 2
+        return 'P', 'P', current + 1
+
+    def _c_cedilla(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode Ç."""
+        return 'S', 'S', current + 1
+
+    def _c(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode C."""
+        # Various Germanic
+        if (
+            current > 1
+            and word[current - 2] not in self._uc_vy_set
+            and word[current - 1 : current + 2] == 'ACH'
+            and word[current + 2] != 'I'
+            and (
+                word[current + 2] != 'E'
+                or word[current - 2 : current + 4] in {'BACHER', 'MACHER'}
+            )
+        ):
+            return 'K', 'K', current + 2
+
+        # Special case 'caesar'
+        if current == 0 and word.startswith('CAESAR'):
+            return 'S', 'S', current + 2
+
+        # Italian 'chianti'
+        if word.startswith('CHIA', current):
+            return 'K', 'K', current + 2
+
+        if word.startswith('CH', current):
+            # Find 'Michael'
+            if current > 0 and word.startswith('CHAE', current):
+                return 'K', 'X', current + 2
+
+            # Greek roots e.g. 'chemistry', 'chorus'
+            if (
+                current == 0
+                and (
+                    word[1:6] in {'HARAC', 'HARIS'}
+                    or word[1:4] in {'HOR', 'HYM', 'HIA', 'HEM'}
+                )
+                and not word.startswith('CHORE')
+            ):
+                return 'K', 'K', current + 2
+
+            # Germanic, Greek, or otherwise 'ch' for 'kh' sound
+            if (
+                germanic
+                # 'architect but not 'arch', 'orchestra', 'orchid'
+                or (
                     current > 1
-                    and not _is_vowel(current - 2)
-                    and _string_at((current - 1), 3, {'ACH'})
-                    and (
-                        (_get_at(current + 2) != 'I')
-                        and (
-                            (_get_at(current + 2) != 'E')
-                            or _string_at(
-                                (current - 2), 6, {'BACHER', 'MACHER'}
-                            )
-                        )
-                    )
+                    and word[current - 2 : current + 4]
+                    in {'ORCHES', 'ARCHIT', 'ORCHID'}
+                )
+                or word[current + 2] in {'T', 'S'}
+                or (
+                    (current == 0 or word[current - 1] in {'A', 'O', 'U', 'E'})
+                    # e.g., 'wachtler', 'wechsler', but not 'tichner'
+                    and word[current + 2] in self._ch_k_next
+                )
+            ):
+                return 'K', 'K', current + 2
+
+            if current > 0:
+                if word.startswith('MC'):
+                    # e.g., "McHugh"
+                    return 'K', 'K', current + 2
+                return 'X', 'K', current + 2
+            return 'X', 'X', current + 2
+
+        # e.g, 'czerny'
+        if word.startswith('CZ', current) and not (
+            current > 1 and word[current - 2 : current + 2] == 'WICZ'
+        ):
+            return 'S', 'X', current + 2
+
+        # e.g., 'focaccia'
+        if word[current + 1 : current + 4] == 'CIA':
+            return 'X', 'X', current + 3
+
+        # double 'C', but not if e.g. 'McClellan'
+        if word.startswith('CC', current) and not (
+            current == 1 and word[0] == 'M'
+        ):
+            # 'bellocchio' but not 'bacchus'
+            if word[current + 2] in {'I', 'E', 'H'} and not word.startswith(
+                'HU', current + 2
+            ):
+                # 'accident', 'accede' 'succeed'
+                if (current == 1 and word[0] == 'A') or (
+                    current > 0
+                    and word[current - 1 : current + 4] in {'UCCEE', 'UCCES'}
                 ):
-                    primary, secondary = _metaph_add('K')
-                    current += 2
-                    continue
-
-                # Special case 'caesar'
-                elif current == 0 and _string_at(current, 6, {'CAESAR'}):
-                    primary, secondary = _metaph_add('S')
-                    current += 2
-                    continue
-
-                # Italian 'chianti'
-                elif _string_at(current, 4, {'CHIA'}):
-                    primary, secondary = _metaph_add('K')
-                    current += 2
-                    continue
-
-                elif _string_at(current, 2, {'CH'}):
-                    # Find 'Michael'
-                    if current > 0 and _string_at(current, 4, {'CHAE'}):
-                        primary, secondary = _metaph_add('K', 'X')
-                        current += 2
-                        continue
-
-                    # Greek roots e.g. 'chemistry', 'chorus'
-                    elif (
-                        current == 0
-                        and (
-                            _string_at((current + 1), 5, {'HARAC', 'HARIS'})
-                            or _string_at(
-                                (current + 1), 3, {'HOR', 'HYM', 'HIA', 'HEM'}
-                            )
-                        )
-                        and not _string_at(0, 5, {'CHORE'})
-                    ):
-                        primary, secondary = _metaph_add('K')
-                        current += 2
-                        continue
-
-                    # Germanic, Greek, or otherwise 'ch' for 'kh' sound
-                    elif (
-                        (
-                            _string_at(0, 4, {'VAN ', 'VON '})
-                            or _string_at(0, 3, {'SCH'})
-                        )
-                        # 'architect but not 'arch', 'orchestra', 'orchid'
-                        or _string_at(
-                            (current - 2), 6, {'ORCHES', 'ARCHIT', 'ORCHID'}
-                        )
-                        or _string_at((current + 2), 1, {'T', 'S'})
-                        or (
-                            (
-                                _string_at(
-                                    (current - 1), 1, {'A', 'O', 'U', 'E'}
-                                )
-                                or (current == 0)
-                            )
-                            # e.g., 'wachtler', 'wechsler', but not 'tichner'
-                            and _string_at(
-                                (current + 2),
-                                1,
-                                {
-                                    'L',
-                                    'R',
-                                    'N',
-                                    'M',
-                                    'B',
-                                    'H',
-                                    'F',
-                                    'V',
-                                    'W',
-                                    ' ',
-                                },
-                            )
-                        )
-                    ):
-                        primary, secondary = _metaph_add('K')
-
-                    else:
-                        if current > 0:
-                            if _string_at(0, 2, {'MC'}):
-                                # e.g., "McHugh"
-                                primary, secondary = _metaph_add('K')
-                            else:
-                                primary, secondary = _metaph_add('X', 'K')
-                        else:
-                            primary, secondary = _metaph_add('X')
-
-                    current += 2
-                    continue
-
-                # e.g, 'czerny'
-                elif _string_at(current, 2, {'CZ'}) and not _string_at(
-                    (current - 2), 4, {'WICZ'}
-                ):
-                    primary, secondary = _metaph_add('S', 'X')
-                    current += 2
-                    continue
-
-                # e.g., 'focaccia'
-                elif _string_at((current + 1), 3, {'CIA'}):
-                    primary, secondary = _metaph_add('X')
-                    current += 3
-
-                # double 'C', but not if e.g. 'McClellan'
-                elif _string_at(current, 2, {'CC'}) and not (
-                    (current == 1) and (_get_at(0) == 'M')
-                ):
-                    # 'bellocchio' but not 'bacchus'
-                    if _string_at(
-                        (current + 2), 1, {'I', 'E', 'H'}
-                    ) and not _string_at((current + 2), 2, {'HU'}):
-                        # 'accident', 'accede' 'succeed'
-                        if (
-                            (current == 1) and _get_at(current - 1) == 'A'
-                        ) or _string_at((current - 1), 5, {'UCCEE', 'UCCES'}):
-                            primary, secondary = _metaph_add('KS')
-                        # 'bacci', 'bertucci', other italian
-                        else:
-                            primary, secondary = _metaph_add('X')
-                        current += 3
-                        continue
-                    else:  # Pierce's rule
-                        primary, secondary = _metaph_add('K')
-                        current += 2
-                        continue
-
-                elif _string_at(current, 2, {'CK', 'CG', 'CQ'}):
-                    primary, secondary = _metaph_add('K')
-                    current += 2
-                    continue
-
-                elif _string_at(current, 2, {'CI', 'CE', 'CY'}):
-                    # Italian vs. English
-                    if _string_at(current, 3, {'CIO', 'CIE', 'CIA'}):
-                        primary, secondary = _metaph_add('S', 'X')
-                    else:
-                        primary, secondary = _metaph_add('S')
-                    current += 2
-                    continue
-
-                # else
-                else:
-                    primary, secondary = _metaph_add('K')
-
-                    # name sent in 'mac caffrey', 'mac gregor
-                    if _string_at((current + 1), 2, {' C', ' Q', ' G'}):
-                        current += 3
-                    elif _string_at(
-                        (current + 1), 1, {'C', 'K', 'Q'}
-                    ) and not _string_at((current + 1), 2, {'CE', 'CI'}):
-                        current += 2
-                    else:
-                        current += 1
-                    continue
-
-            elif _get_at(current) == 'D':
-                if _string_at(current, 2, {'DG'}):
-                    if _string_at((current + 2), 1, {'I', 'E', 'Y'}):
-                        # e.g. 'edge'
-                        primary, secondary = _metaph_add('J')
-                        current += 3
-                        continue
-                    else:
-                        # e.g. 'edgar'
-                        primary, secondary = _metaph_add('TK')
-                        current += 2
-                        continue
-
-                elif _string_at(current, 2, {'DT', 'DD'}):
-                    primary, secondary = _metaph_add('T')
-                    current += 2
-                    continue
-
-                # else
-                else:
-                    primary, secondary = _metaph_add('T')
-                    current += 1
-                    continue
-
-            elif _get_at(current) == 'F':
-                if _get_at(current + 1) == 'F':
-                    current += 2
-                else:
-                    current += 1
-                primary, secondary = _metaph_add('F')
-                continue
-
-            elif _get_at(current) == 'G':
-                if _get_at(current + 1) == 'H':
-                    if (current > 0) and not _is_vowel(current - 1):
-                        primary, secondary = _metaph_add('K')
-                        current += 2
-                        continue
-
-                    # 'ghislane', ghiradelli
-                    elif current == 0:
-                        if _get_at(current + 2) == 'I':
-                            primary, secondary = _metaph_add('J')
-                        else:
-                            primary, secondary = _metaph_add('K')
-                        current += 2
-                        continue
-
-                    # Parker's rule (with some further refinements) -
-                    # e.g., 'hugh'
-                    elif (
-                        (
-                            (current > 1)
-                            and _string_at((current - 2), 1, {'B', 'H', 'D'})
-                        )
-                        # e.g., 'bough'
-                        or (
-                            (current > 2)
-                            and _string_at((current - 3), 1, {'B', 'H', 'D'})
-                        )
-                        # e.g., 'broughton'
-                        or (
-                            (current > 3)
-                            and _string_at((current - 4), 1, {'B', 'H'})
-                        )
-                    ):
-                        current += 2
-                        continue
-                    else:
-                        # e.g. 'laugh', 'McLaughlin', 'cough',
-                        #      'gough', 'rough', 'tough'
-                        if (
-                            (current > 2)
-                            and (_get_at(current - 1) == 'U')
-                            and (
-                                _string_at(
-                                    (current - 3), 1, {'C', 'G', 'L', 'R', 'T'}
-                                )
-                            )
-                        ):
-                            primary, secondary = _metaph_add('F')
-                        elif (current > 0) and _get_at(current - 1) != 'I':
-                            primary, secondary = _metaph_add('K')
-                        current += 2
-                        continue
-
-                elif _get_at(current + 1) == 'N':
-                    if (
-                        (current == 1)
-                        and _is_vowel(0)
-                        and not _slavo_germanic()
-                    ):
-                        primary, secondary = _metaph_add('KN', 'N')
-                    # not e.g. 'cagney'
-                    elif (
-                        not _string_at((current + 2), 2, {'EY'})
-                        and (_get_at(current + 1) != 'Y')
-                        and not _slavo_germanic()
-                    ):
-                        primary, secondary = _metaph_add('N', 'KN')
-                    else:
-                        primary, secondary = _metaph_add('KN')
-                    current += 2
-                    continue
-
-                # 'tagliaro'
-                elif (
-                    _string_at((current + 1), 2, {'LI'})
-                    and not _slavo_germanic()
-                ):
-                    primary, secondary = _metaph_add('KL', 'L')
-                    current += 2
-                    continue
-
-                # -ges-, -gep-, -gel-, -gie- at beginning
-                elif (current == 0) and (
-                    (_get_at(current + 1) == 'Y')
-                    or _string_at(
-                        (current + 1),
-                        2,
-                        {
-                            'ES',
-                            'EP',
-                            'EB',
-                            'EL',
-                            'EY',
-                            'IB',
-                            'IL',
-                            'IN',
-                            'IE',
-                            'EI',
-                            'ER',
-                        },
-                    )
-                ):
-                    primary, secondary = _metaph_add('K', 'J')
-                    current += 2
-                    continue
-
-                #  -ger-,  -gy-
-                elif (
+                    return 'KS', 'KS', current + 3
+                # 'bacci', 'bertucci', other italian
+                return 'X', 'X', current + 3
+            # Pierce's rule
+            return 'K', 'K', current + 2
+
+        if word[current : current + 2] in {'CK', 'CG', 'CQ'}:
+            return 'K', 'K', current + 2
+
+        if word[current : current + 2] in {'CI', 'CE', 'CY'}:
+            # Italian vs. English
+            if word[current : current + 3] in {'CIO', 'CIE', 'CIA'}:
+                return 'S', 'X', current + 2
+            return 'S', 'S', current + 2
+
+        # name sent in 'mac caffrey', 'mac gregor
+        if word[current + 1 : current + 3] in {' C', ' Q', ' G'}:
+            return 'K', 'K', current + 3
+        if word[current + 1] in {'C', 'K', 'Q'} and word[
+            current + 1 : current + 3
+        ] not in {'CE', 'CI'}:
+            return 'K', 'K', current + 2
+        return 'K', 'K', current + 1
+
+    def _d(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode D."""
+        if word.startswith('DG', current):
+            if word[current + 2] in {'I', 'E', 'Y'}:
+                # e.g. 'edge'
+                return 'J', 'J', current + 3
+            # e.g. 'edgar'
+            return 'TK', 'TK', current + 2
+
+        if word[current : current + 2] in {'DT', 'DD'}:
+            return 'T', 'T', current + 2
+        return 'T', 'T', current + 1
+
+    def _f(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode F."""
+        if word[current + 1] == 'F':
+            return 'F', 'F', current + 2
+        return 'F', 'F', current + 1
+
+    def _g(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode G."""
+        if word[current + 1] == 'H':
+            if current > 0 and word[current - 1] not in self._uc_vy_set:
+                return 'K', 'K', current + 2
+
+            # 'ghislane', ghiradelli
+            if current == 0:
+                if word[current + 2] == 'I':
+                    return 'J', 'J', current + 2
+                return 'K', 'K', current + 2
+
+            # Parker's rule (with some further refinements) - e.g., 'hugh'
+            if (
+                (current > 1 and word[current - 2] in {'B', 'H', 'D'})
+                # e.g., 'bough'
+                or (current > 2 and word[current - 3] in {'B', 'H', 'D'})
+                # e.g., 'broughton'
+                or (current > 3 and word[current - 4] in {'B', 'H'})
+            ):
+                return '', '', current + 2
+
+            # e.g. 'laugh', 'McLaughlin', 'cough', 'gough', 'rough', 'tough'
+            if (
+                current > 2
+                and word[current - 1] == 'U'
+                and word[current - 3] in {'C', 'G', 'L', 'R', 'T'}
+            ):
+                return 'F', 'F', current + 2
+            if word[current - 1] != 'I':
+                return 'K', 'K', current + 2
+            return '', '', current + 2
+
+        if word[current + 1] == 'N':
+            if (
+                current == 1
+                and word[0] in self._uc_vy_set
+                and not slavo_germanic
+            ):
+                return 'KN', 'N', current + 2
+            # not e.g. 'cagney'
+            if word[current + 2 : current + 4] != 'EY' and not slavo_germanic:
+                return 'N', 'KN', current + 2
+            return 'KN', 'KN', current + 2
+
+        # 'tagliaro'
+        if word.startswith('LI', current + 1) and not slavo_germanic:
+            return 'KL', 'L', current + 2
+
+        # -ges-, -gep-, -gel-, -gie- at beginning
+        if current == 0 and (
+            word[1] == 'Y' or word[1:3] in self._g_initial_next
+        ):
+            return 'K', 'J', current + 2
+
+        #  -ger-,  -gy-
+        if (
+            (word.startswith('ER', current + 1) or word[current + 1] == 'Y')
+            and word[0:6] not in {'DANGER', 'RANGER', 'MANGER'}
+            and not (current > 0 and word[current - 1] in {'E', 'I'})
+            and not (
+                current > 0
+                and word[current - 1 : current + 2] in {'RGY', 'OGY'}
+            )
+        ):
+            return 'K', 'J', current + 2
+
+        #  italian e.g, 'biaggi'
+        if word[current + 1] in {'E', 'I', 'Y'} or (
+            current > 0 and word[current - 1 : current + 3] in {'AGGI', 'OGGI'}
+        ):
+            # obvious germanic
+            if germanic or word.startswith('ET', current + 1):
+                return 'K', 'K', current + 2
+            if word.startswith('IER ', current + 1):
+                return 'J', 'J', current + 2
+            return 'J', 'K', current + 2
+
+        if word[current + 1] == 'G':
+            return 'K', 'K', current + 2
+        return 'K', 'K', current + 1
+
+    def _h(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode H."""
+        # only keep if first & before vowel or btw. 2 vowels
+        if (current == 0 or word[current - 1] in self._uc_vy_set) and word[
+            current + 1
+        ] in self._uc_vy_set:
+            return 'H', 'H', current + 2
+        # also takes care of 'HH'
+        return '', '', current + 1
+
+    def _j(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode J."""
+        # obvious spanish, 'jose', 'san jacinto'
+        if word.startswith('SAN '):
+            return 'H', 'H', current + 1
+        if word.startswith('JOSE', current):
+            if current == 0 and word[current + 4] == ' ':
+                return 'H', 'H', current + 1
+            return 'J', 'H', current + 1
+
+        if word[current + 1] == 'J':  # it could happen!
+            advance = current + 2
+        else:
+            advance = current + 1
+
+        if current == 0:
+            # Yankelovich/Jankelowicz
+            return 'J', 'A', advance
+        # Spanish pron. of e.g. 'bajador'
+        if (
+            word[current - 1] in self._uc_vy_set
+            and not slavo_germanic
+            and word[current + 1] in {'A', 'O'}
+        ):
+            return 'J', 'H', advance
+        if current == last:
+            return 'J', '', advance
+        if word[current + 1] not in self._j_not_next and word[
+            current - 1
+        ] not in {'S', 'K', 'L'}:
+            return 'J', 'J', advance
+        return '', '', advance
+
+    def _k(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode K."""
+        if word[current + 1] == 'K':
+            return 'K', 'K', current + 2
+        return 'K', 'K', current + 1
+
+    def _l(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode L."""
+        if word[current + 1] == 'L':
+            # Spanish e.g. 'cabrillo', 'gallegos'
+            if current > 0 and (
+                (
+                    current == last - 2
+                    and word[current - 1 : current + 3]
+                    in {'ILLO', 'ILLA', 'ALLE'}
+                )
+                or (
                     (
-                        _string_at((current + 1), 2, {'ER'})
-                        or (_get_at(current + 1) == 'Y')
-                    )
-                    and not _string_at(0, 6, {'DANGER', 'RANGER', 'MANGER'})
-                    and not _string_at((current - 1), 1, {'E', 'I'})
-                    and not _string_at((current - 1), 3, {'RGY', 'OGY'})
-                ):
-                    primary, secondary = _metaph_add('K', 'J')
-                    current += 2
-                    continue
-
-                #  italian e.g, 'biaggi'
-                elif _string_at(
-                    (current + 1), 1, {'E', 'I', 'Y'}
-                ) or _string_at((current - 1), 4, {'AGGI', 'OGGI'}):
-                    # obvious germanic
-                    if (
-                        _string_at(0, 4, {'VAN ', 'VON '})
-                        or _string_at(0, 3, {'SCH'})
-                    ) or _string_at((current + 1), 2, {'ET'}):
-                        primary, secondary = _metaph_add('K')
-                    elif _string_at((current + 1), 4, {'IER '}):
-                        primary, secondary = _metaph_add('J')
-                    else:
-                        primary, secondary = _metaph_add('J', 'K')
-                    current += 2
-                    continue
-
-                else:
-                    if _get_at(current + 1) == 'G':
-                        current += 2
-                    else:
-                        current += 1
-                    primary, secondary = _metaph_add('K')
-                    continue
-
-            elif _get_at(current) == 'H':
-                # only keep if first & before vowel or btw. 2 vowels
-                if ((current == 0) or _is_vowel(current - 1)) and _is_vowel(
-                    current + 1
-                ):
-                    primary, secondary = _metaph_add('H')
-                    current += 2
-                else:  # also takes care of 'HH'
-                    current += 1
-                continue
-
-            elif _get_at(current) == 'J':
-                # obvious spanish, 'jose', 'san jacinto'
-                if _string_at(current, 4, {'JOSE'}) or _string_at(
-                    0, 4, {'SAN '}
-                ):
-                    if (
-                        (current == 0) and (_get_at(current + 4) == ' ')
-                    ) or _string_at(0, 4, {'SAN '}):
-                        primary, secondary = _metaph_add('H')
-                    else:
-                        primary, secondary = _metaph_add('J', 'H')
-                    current += 1
-                    continue
-
-                elif (current == 0) and not _string_at(current, 4, {'JOSE'}):
-                    # Yankelovich/Jankelowicz
-                    primary, secondary = _metaph_add('J', 'A')
-                # Spanish pron. of e.g. 'bajador'
-                elif (
-                    _is_vowel(current - 1)
-                    and not _slavo_germanic()
-                    and (
-                        (_get_at(current + 1) == 'A')
-                        or (_get_at(current + 1) == 'O')
-                    )
-                ):
-                    primary, secondary = _metaph_add('J', 'H')
-                elif current == last:
-                    primary, secondary = _metaph_add('J', ' ')
-                elif not _string_at(
-                    (current + 1), 1, {'L', 'T', 'K', 'S', 'N', 'M', 'B', 'Z'}
-                ) and not _string_at((current - 1), 1, {'S', 'K', 'L'}):
-                    primary, secondary = _metaph_add('J')
-
-                if _get_at(current + 1) == 'J':  # it could happen!
-                    current += 2
-                else:
-                    current += 1
-                continue
-
-            elif _get_at(current) == 'K':
-                if _get_at(current + 1) == 'K':
-                    current += 2
-                else:
-                    current += 1
-                primary, secondary = _metaph_add('K')
-                continue
-
-            elif _get_at(current) == 'L':
-                if _get_at(current + 1) == 'L':
-                    # Spanish e.g. 'cabrillo', 'gallegos'
-                    if (
-                        (current == (length - 3))
-                        and _string_at(
-                            (current - 1), 4, {'ILLO', 'ILLA', 'ALLE'}
-                        )
-                    ) or (
                         (
-                            _string_at((last - 1), 2, {'AS', 'OS'})
-                            or _string_at(last, 1, {'A', 'O'})
-                        )
-                        and _string_at((current - 1), 4, {'ALLE'})
-                    ):
-                        primary, secondary = _metaph_add('L', ' ')
-                        current += 2
-                        continue
-                    current += 2
-                else:
-                    current += 1
-                primary, secondary = _metaph_add('L')
-                continue
-
-            elif _get_at(current) == 'M':
-                if (
-                    (
-                        _string_at((current - 1), 3, {'UMB'})
-                        and (
-                            ((current + 1) == last)
-                            or _string_at((current + 2), 2, {'ER'})
+                            last > 0
+                            and word[last - 1 : last + 1] in {'AS', 'OS'}
                         )
+                        or word[last] in {'A', 'O'}
                     )
-                    # 'dumb', 'thumb'
-                    or (_get_at(current + 1) == 'M')
-                ):
-                    current += 2
-                else:
-                    current += 1
-                primary, secondary = _metaph_add('M')
-                continue
-
-            elif _get_at(current) == 'N':
-                if _get_at(current + 1) == 'N':
-                    current += 2
-                else:
-                    current += 1
-                primary, secondary = _metaph_add('N')
-                continue
-
-            elif _get_at(current) == 'Ñ':
-                current += 1
-                primary, secondary = _metaph_add('N')
-                continue
-
-            elif _get_at(current) == 'P':
-                if _get_at(current + 1) == 'H':
-                    primary, secondary = _metaph_add('F')
-                    current += 2
-                    continue
-
-                # also account for "campbell", "raspberry"
-                elif _string_at((current + 1), 1, {'P', 'B'}):
-                    current += 2
-                else:
-                    current += 1
-                primary, secondary = _metaph_add('P')
-                continue
-
-            elif _get_at(current) == 'Q':
-                if _get_at(current + 1) == 'Q':
-                    current += 2
-                else:
-                    current += 1
-                primary, secondary = _metaph_add('K')
-                continue
-
-            elif _get_at(current) == 'R':
-                # french e.g. 'rogier', but exclude 'hochmeier'
+                    and word[current - 1 : current + 3] == 'ALLE'
+                )
+            ):
+                return 'L', '', current + 2
+            return 'L', 'L', current + 2
+        return 'L', 'L', current + 1
+
+    def _m(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode M."""
+        if (
+            current > 0
+            and word[current - 1 : current + 2] == 'UMB'
+            and (current + 1 == last or word.startswith('ER', current + 2))
+        ) or word[current + 1] == 'M':
+            # 'dumb', 'thumb'
+            return 'M', 'M', current + 2
+        return 'M', 'M', current + 1
+
+    def _n(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode N."""
+        if word[current + 1] == 'N':
+            return 'N', 'N', current + 2
+        return 'N', 'N', current + 1
+
+    def _n_tilde(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode Ñ."""
+        return 'N', 'N', current + 1
+
+    def _p(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode P."""
+        if word[current + 1] == 'H':
+            return 'F', 'F', current + 2
+        # also account for "campbell", "raspberry"
+        if word[current + 1] in {'P', 'B'}:
+            return 'P', 'P', current + 2
+        return 'P', 'P', current + 1
+
+    def _q(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode Q."""
+        if word[current + 1] == 'Q':
+            return 'K', 'K', current + 2
+        return 'K', 'K', current + 1
+
+    def _r(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode R."""
+        if word[current + 1] == 'R':
+            advance = current + 2
+        else:
+            advance = current + 1
+
+        # french e.g. 'rogier', but exclude 'hochmeier'
+        if (
+            current == last
+            and not slavo_germanic
+            and current > 1
+            and word[current - 2 : current] == 'IE'
+            and not (
+                current > 3 and word[current - 4 : current - 2] in {'ME', 'MA'}
+            )
+        ):
+            return '', 'R', advance
+        return 'R', 'R', advance
+
+    def _s(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode S."""
+        # special cases 'island', 'isle', 'carlisle', 'carlysle'
+        if current > 0 and word[current - 1 : current + 2] in {'ISL', 'YSL'}:
+            return '', '', current + 1
+
+        # special case 'sugar-'
+        if current == 0 and word.startswith('SUGAR'):
+            return 'X', 'S', current + 1
+
+        if word.startswith('SH', current):
+            # Germanic
+            if word[current + 1 : current + 5] in {
+                'HEIM',
+                'HOEK',
+                'HOLM',
+                'HOLZ',
+            }:
+                return 'S', 'S', current + 2
+            return 'X', 'X', current + 2
+
+        # Italian & Armenian
+        if word[current : current + 3] in {'SIO', 'SIA'}:
+            if not slavo_germanic:
+                return 'S', 'X', current + 3
+            return 'S', 'S', current + 3
+
+        # German & anglicisations, e.g. 'smith' match 'schmidt',
+        #                               'snider' match 'schneider'
+        # also, -sz- in Slavic language although in Hungarian it is
+        #       pronounced 's'
+        if word[current + 1] == 'Z':
+            return 'S', 'X', current + 2
+        if current == 0 and word[current + 1] in {'M', 'N', 'L', 'W'}:
+            return 'S', 'X', current + 1
+
+        if word.startswith('SC', current):
+            # Schlesinger's rule
+            if word[current + 2] == 'H':
+                # dutch origin, e.g. 'school', 'schooner'
+                if word[current + 3 : current + 5] in {
+                    'OO',
+                    'ER',
+                    'EN',
+                    'UY',
+                    'ED',
+                    'EM',
+                }:
+                    # 'schermerhorn', 'schenker'
+                    if word[current + 3 : current + 5] in {'ER', 'EN'}:
+                        return 'X', 'SK', current + 3
+                    return 'SK', 'SK', current + 3
                 if (
-                    (current == last)
-                    and not _slavo_germanic()
-                    and _string_at((current - 2), 2, {'IE'})
-                    and not _string_at((current - 4), 2, {'ME', 'MA'})
-                ):
-                    primary, secondary = _metaph_add('', 'R')
-                else:
-                    primary, secondary = _metaph_add('R')
-
-                if _get_at(current + 1) == 'R':
-                    current += 2
-                else:
-                    current += 1
-                continue
-
-            elif _get_at(current) == 'S':
-                # special cases 'island', 'isle', 'carlisle', 'carlysle'
-                if _string_at((current - 1), 3, {'ISL', 'YSL'}):
-                    current += 1
-                    continue
-
-                # special case 'sugar-'
-                elif (current == 0) and _string_at(current, 5, {'SUGAR'}):
-                    primary, secondary = _metaph_add('X', 'S')
-                    current += 1
-                    continue
-
-                elif _string_at(current, 2, {'SH'}):
-                    # Germanic
-                    if _string_at(
-                        (current + 1), 4, {'HEIM', 'HOEK', 'HOLM', 'HOLZ'}
-                    ):
-                        primary, secondary = _metaph_add('S')
-                    else:
-                        primary, secondary = _metaph_add('X')
-                    current += 2
-                    continue
-
-                # Italian & Armenian
-                elif _string_at(current, 3, {'SIO', 'SIA'}) or _string_at(
-                    current, 4, {'SIAN'}
-                ):
-                    if not _slavo_germanic():
-                        primary, secondary = _metaph_add('S', 'X')
-                    else:
-                        primary, secondary = _metaph_add('S')
-                    current += 3
-                    continue
-
-                # German & anglicisations, e.g. 'smith' match 'schmidt',
-                #                               'snider' match 'schneider'
-                # also, -sz- in Slavic language although in Hungarian it is
-                #       pronounced 's'
-                elif (
-                    (current == 0)
-                    and _string_at((current + 1), 1, {'M', 'N', 'L', 'W'})
-                ) or _string_at((current + 1), 1, {'Z'}):
-                    primary, secondary = _metaph_add('S', 'X')
-                    if _string_at((current + 1), 1, {'Z'}):
-                        current += 2
-                    else:
-                        current += 1
-                    continue
-
-                elif _string_at(current, 2, {'SC'}):
-                    # Schlesinger's rule
-                    if _get_at(current + 2) == 'H':
-                        # dutch origin, e.g. 'school', 'schooner'
-                        if _string_at(
-                            (current + 3),
-                            2,
-                            {'OO', 'ER', 'EN', 'UY', 'ED', 'EM'},
-                        ):
-                            # 'schermerhorn', 'schenker'
-                            if _string_at((current + 3), 2, {'ER', 'EN'}):
-                                primary, secondary = _metaph_add('X', 'SK')
-                            else:
-                                primary, secondary = _metaph_add('SK')
-                            current += 3
-                            continue
-                        else:
-                            if (
-                                (current == 0)
-                                and not _is_vowel(3)
-                                and (_get_at(3) != 'W')
-                            ):
-                                primary, secondary = _metaph_add('X', 'S')
-                            else:
-                                primary, secondary = _metaph_add('X')
-                            current += 3
-                            continue
-
-                    elif _string_at((current + 2), 1, {'I', 'E', 'Y'}):
-                        primary, secondary = _metaph_add('S')
-                        current += 3
-                        continue
-
-                    # else
-                    else:
-                        primary, secondary = _metaph_add('SK')
-                        current += 3
-                        continue
-
-                else:
-                    # french e.g. 'resnais', 'artois'
-                    if (current == last) and _string_at(
-                        (current - 2), 2, {'AI', 'OI'}
-                    ):
-                        primary, secondary = _metaph_add('', 'S')
-                    else:
-                        primary, secondary = _metaph_add('S')
-
-                    if _string_at((current + 1), 1, {'S', 'Z'}):
-                        current += 2
-                    else:
-                        current += 1
-                    continue
-
-            elif _get_at(current) == 'T':
-                if _string_at(current, 4, {'TION'}):
-                    primary, secondary = _metaph_add('X')
-                    current += 3
-                    continue
-
-                elif _string_at(current, 3, {'TIA', 'TCH'}):
-                    primary, secondary = _metaph_add('X')
-                    current += 3
-                    continue
-
-                elif _string_at(current, 2, {'TH'}) or _string_at(
-                    current, 3, {'TTH'}
+                    current == 0
+                    and word[3] not in self._uc_vy_set
+                    and word[3] != 'W'
                 ):
-                    # special case 'thomas', 'thames' or germanic
-                    if (
-                        _string_at((current + 2), 2, {'OM', 'AM'})
-                        or _string_at(0, 4, {'VAN ', 'VON '})
-                        or _string_at(0, 3, {'SCH'})
-                    ):
-                        primary, secondary = _metaph_add('T')
-                    else:
-                        primary, secondary = _metaph_add('0', 'T')
-                    current += 2
-                    continue
-
-                elif _string_at((current + 1), 1, {'T', 'D'}):
-                    current += 2
-                else:
-                    current += 1
-                primary, secondary = _metaph_add('T')
-                continue
-
-            elif _get_at(current) == 'V':
-                if _get_at(current + 1) == 'V':
-                    current += 2
-                else:
-                    current += 1
-                primary, secondary = _metaph_add('F')
-                continue
-
-            elif _get_at(current) == 'W':
-                # can also be in middle of word
-                if _string_at(current, 2, {'WR'}):
-                    primary, secondary = _metaph_add('R')
-                    current += 2
-                    continue
-                elif (current == 0) and (
-                    _is_vowel(current + 1) or _string_at(current, 2, {'WH'})
-                ):
-                    # Wasserman should match Vasserman
-                    if _is_vowel(current + 1):
-                        primary, secondary = _metaph_add('A', 'F')
-                    else:
-                        # need Uomo to match Womo
-                        primary, secondary = _metaph_add('A')
-
-                # Arnow should match Arnoff
-                if (
-                    ((current == last) and _is_vowel(current - 1))
-                    or _string_at(
-                        (current - 1), 5, {'EWSKI', 'EWSKY', 'OWSKI', 'OWSKY'}
-                    )
-                    or _string_at(0, 3, {'SCH'})
-                ):
-                    primary, secondary = _metaph_add('', 'F')
-                    current += 1
-                    continue
-                # Polish e.g. 'filipowicz'
-                elif _string_at(current, 4, {'WICZ', 'WITZ'}):
-                    primary, secondary = _metaph_add('TS', 'FX')
-                    current += 4
-                    continue
-                # else skip it
-                else:
-                    current += 1
-                    continue
-
-            elif _get_at(current) == 'X':
-                # French e.g. breaux
-                if not (
-                    (current == last)
-                    and (
-                        _string_at((current - 3), 3, {'IAU', 'EAU'})
-                        or _string_at((current - 2), 2, {'AU', 'OU'})
-                    )
-                ):
-                    primary, secondary = _metaph_add('KS')
-
-                if _string_at((current + 1), 1, {'C', 'X'}):
-                    current += 2
-                else:
-                    current += 1
-                continue
-
-            elif _get_at(current) == 'Z':
-                # Chinese Pinyin e.g. 'zhao'
-                if _get_at(current + 1) == 'H':
-                    primary, secondary = _metaph_add('J')
-                    current += 2
-                    continue
-                elif _string_at((current + 1), 2, {'ZO', 'ZI', 'ZA'}) or (
-                    _slavo_germanic()
-                    and ((current > 0) and _get_at(current - 1) != 'T')
-                ):
-                    primary, secondary = _metaph_add('S', 'TS')
-                else:
-                    primary, secondary = _metaph_add('S')
-
-                if _get_at(current + 1) == 'Z':
-                    current += 2
-                else:
-                    current += 1
-                continue
-
-            else:
-                current += 1
-
-        if self._max_length > 0:
-            primary = primary[: self._max_length]
-            secondary = secondary[: self._max_length]
-        if primary == secondary:
-            secondary = ''
-
-        return ','.join((primary, secondary))
+                    return 'X', 'S', current + 3
+                return 'X', 'X', current + 3
+
+            if word[current + 2] in {'I', 'E', 'Y'}:
+                return 'S', 'S', current + 3
+
+            return 'SK', 'SK', current + 3
+
+        if word[current + 1] in {'S', 'Z'}:
+            advance = current + 2
+        else:
+            advance = current + 1
+
+        # french e.g. 'resnais', 'artois'
+        if (
+            current == last
+            and current > 1
+            and word[current - 2 : current] in {'AI', 'OI'}
+        ):
+            return '', 'S', advance
+        return 'S', 'S', advance
+
+    def _t(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode T."""
+        if word.startswith('TION', current):
+            return 'X', 'X', current + 3
+
+        if word[current : current + 3] in {'TIA', 'TCH'}:
+            return 'X', 'X', current + 3
+
+        if word.startswith('TH', current) or word.startswith('TTH', current):
+            # special case 'thomas', 'thames' or germanic
+            if germanic or word[current + 2 : current + 4] in {'OM', 'AM'}:
+                return 'T', 'T', current + 2
+            return '0', 'T', current + 2
+
+        if word[current + 1] in {'T', 'D'}:
+            return 'T', 'T', current + 2
+        return 'T', 'T', current + 1
+
+    def _v(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode V."""
+        if word[current + 1] == 'V':
+            return 'F', 'F', current + 2
+        return 'F', 'F', current + 1
+
+    def _w(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode W."""
+        # can also be in middle of word
+        if word.startswith('WR', current):
+            return 'R', 'R', current + 2
+
+        pri = sec = ''
+        if current == 0:
+            # Wasserman should match Vasserman
+            if word[1] in self._uc_vy_set:
+                pri, sec = 'A', 'F'
+            # need Uomo to match Womo
+            elif word[1] == 'H':
+                pri = sec = 'A'
+
+        # Arnow should match Arnoff
+        if (
+            (
+                current == last
+                and current > 0
+                and word[current - 1] in self._uc_vy_set
+            )
+            or (
+                current > 0
+                and word[current - 1 : current + 4]
+                in {'EWSKI', 'EWSKY', 'OWSKI', 'OWSKY'}
+            )
+            or word.startswith('SCH')
+        ):
+            return pri, sec + 'F', current + 1
+
+        # Polish e.g. 'filipowicz'
+        if word[current : current + 4] in {'WICZ', 'WITZ'}:
+            return pri + 'TS', sec + 'FX', current + 4
+
+        # else skip it
+        return pri, sec, current + 1
+
+    def _x(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode X."""
+        if word[current + 1] in {'C', 'X'}:
+            advance = current + 2
+        else:
+            advance = current + 1
+
+        # French e.g. breaux
+        if current == last and (
+            (current > 2 and word[current - 3 : current] in {'IAU', 'EAU'})
+            or (current > 1 and word[current - 2 : current] in {'AU', 'OU'})
+        ):
+            return '', '', advance
+        return 'KS', 'KS', advance
+
+    def _z(
+        self,
+        word: str,
+        current: int,
+        last: int,
+        slavo_germanic: bool,
+        germanic: bool,
+    ) -> Tuple[str, str, int]:
+        """Encode Z."""
+        # Chinese Pinyin e.g. 'zhao'
+        if word[current + 1] == 'H':
+            return 'J', 'J', current + 2
+
+        if word[current + 1] == 'Z':
+            advance = current + 2
+        else:
+            advance = current + 1
+
+        if word[current + 1 : current + 3] in {'ZO', 'ZI', 'ZA'} or (
+            slavo_germanic and current > 0 and word[current - 1] != 'T'
+        ):
+            return 'S', 'TS', advance
+        return 'S', 'S', advance
+
+    _ch_k_next = frozenset('LRNMBHFVW ')
+    _g_initial_next = frozenset(
+        ('ES', 'EP', 'EB', 'EL', 'EY', 'IB', 'IL', 'IN', 'IE', 'EI', 'ER')
+    )
+    _j_not_next = frozenset('LTKSNMBZ')
+
+    _dispatch = {
+        'A': _vowel,
+        'E': _vowel,
+        'I': _vowel,
+        'O': _vowel,
+        'U': _vowel,
+        'Y': _vowel,
+        'B': _b,
+        'Ç': _c_cedilla,
+        'C': _c,
+        'D': _d,
+        'F': _f,
+        'G': _g,
+        'H': _h,
+        'J': _j,
+        'K': _k,
+        'L': _l,
+        'M': _m,
+        'N': _n,
+        'Ñ': _n_tilde,
+        'P': _p,
+        'Q': _q,
+        'R': _r,
+        'S': _s,
+        'T': _t,
+        'V': _v,
+        'W': _w,
+        'X': _x,
+        'Z': _z,
+    }  # type: Dict[str, Callable[..., Tuple[str, str, int]]]
 
 
 if __name__ == '__main__':
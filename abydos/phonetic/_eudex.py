@@ -19,6 +19,10 @@
 Eudex phonetic hash
 """
 
+from typing import Iterable
+
+import numpy as np
+
 from ._phonetic import _Phonetic
 
 __all__ = ['Eudex']
@@ -173,8 +177,8 @@ class Eudex(_Phonetic):
         """
         self._max_length = max_length
 
-    def encode(self, word: str) -> str:
-        """Return the eudex phonetic hash of a word.
+    def encode_int(self, word: str) -> int:
+        """Return the eudex phonetic hash of a word as an int.
 
         Parameters
         ----------
@@ -183,29 +187,21 @@ class Eudex(_Phonetic):
 
         Returns
         -------
-        str
+        int
             The eudex hash
 
         Examples
         --------
         >>> pe = Eudex()
-        >>> pe.encode('Colin')
-        '432345564238053650'
-        >>> pe.encode('Christopher')
-        '433648490138894409'
-        >>> pe.encode('Niall')
-        '648518346341351840'
-        >>> pe.encode('Smith')
-        '720575940412906756'
-        >>> pe.encode('Schmidt')
-        '720589151732307997'
+        >>> pe.encode_int('Colin')
+        432345564238053650
+        >>> pe.encode_int('Christopher')
+        433648490138894409
+        >>> pe.encode_int('Niall')
+        648518346341351840
 
 
-        .. versionadded:: 0.3.0
-        .. versionchanged:: 0.3.6
-            Encapsulated in class
-        .. versionchanged:: 0.6.0
-            Made return a str instead of int
+        .. versionadded:: 0.6.0
 
         """
         # Lowercase input & filter unknown characters
@@ -239,7 +235,81 @@ class Eudex(_Phonetic):
         for val in values:
             hash_value = (hash_value << 8) | val
 
-        return str(hash_value)
+        return hash_value
+
+    def encode_array(self, words: Iterable[str]) -> np.ndarray:
+        """Return the eudex phonetic hashes of words as an array.
+
+        Parameters
+        ----------
+        words : iterable of str
+            The words to transform
+
+        Returns
+        -------
+        numpy.ndarray
+            The eudex hashes, as an array of dtype uint64
+
+        Raises
+        ------
+        ValueError
+            max_length must not exceed 8 for hashes to fit in 64 bits
+
+        Examples
+        --------
+        >>> pe = Eudex()
+        >>> pe.encode_array(['Colin', 'Christopher', 'Niall'])
+        array([432345564238053650, 433648490138894409, 648518346341351840],
+              dtype=uint64)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._max_length > 8:
+            raise ValueError(
+                'max_length must not exceed 8 for hashes to fit in 64 bits.'
+            )
+        return np.fromiter(
+            (self.encode_int(word) for word in words), dtype=np.uint64
+        )
+
+    def encode(self, word: str) -> str:
+        """Return the eudex phonetic hash of a word.
+
+        Parameters
+        ----------
+        word : str
+            The word to transform
+
+        Returns
+        -------
+        str
+            The eudex hash
+
+        Examples
+        --------
+        >>> pe = Eudex()
+        >>> pe.encode('Colin')
+        '432345564238053650'
+        >>> pe.encode('Christopher')
+        '433648490138894409'
+        >>> pe.encode('Niall')
+        '648518346341351840'
+        >>> pe.encode('Smith')
+        '720575940412906756'
+        >>> pe.encode('Schmidt')
+        '720589151732307997'
+
+
+        .. versionadded:: 0.3.0
+        .. versionchanged:: 0.3.6
+            Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Made return a str instead of int
+
+        """
+        return str(self.encode_int(word))
 
 
 if __name__ == '__main__':
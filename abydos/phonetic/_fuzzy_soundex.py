@@ -44,6 +44,8 @@ class FuzzySoundex(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '01345679'), 'APTLNRKS'))
 
+    _int_alphabet = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
     def __init__(self, max_length: int = 5, zero_pad: bool = True) -> None:
         """Initialize FuzzySoundex instance.
 
@@ -24,6 +24,7 @@ from typing import List, Set, Tuple, Union, cast
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
+from ._rewrite import _Rewriter
 
 __all__ = ['Haase']
 
@@ -38,6 +39,8 @@ class Haase(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
+    _umlauts = _Rewriter((('Ä', 'AE'), ('Ö', 'OE'), ('Ü', 'UE')))
+
     _uc_v_set = set('AEIJOUY')
 
     _alphabetic = dict(zip((ord(_) for _ in '123456789'), 'PTFKLNRSA'))
@@ -179,9 +182,7 @@ class Haase(_Phonetic):
 
         word = unicode_normalize('NFKD', word.upper())
 
-        word = word.replace('Ä', 'AE')
-        word = word.replace('Ö', 'OE')
-        word = word.replace('Ü', 'UE')
+        word = self._umlauts.apply(word)
         word = ''.join(c for c in word if c in self._uc_set)
 
         variants = []  # type: List[Union[str, Tuple[str, ...]]]
@@ -23,6 +23,7 @@ from typing import Set
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
+from ._rewrite import _Rewriter
 
 __all__ = [
     'Koelner',
@@ -37,6 +38,8 @@ class Koelner(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
+    _umlauts = _Rewriter((('Ä', 'AE'), ('Ö', 'OE'), ('Ü', 'UE')))
+
     _uc_v_set = set('AEIOUJY')
 
     _num_trans = dict(zip((ord(_) for _ in '012345678'), 'APTFKLNRS'))
@@ -129,9 +132,7 @@ class Koelner(_Phonetic):
 
         word = unicode_normalize('NFKD', word.upper())
 
-        word = word.replace('Ä', 'AE')
-        word = word.replace('Ö', 'OE')
-        word = word.replace('Ü', 'UE')
+        word = self._umlauts.apply(word)
         word = ''.join(c for c in word if c in self._uc_set)
 
         # Nothing to convert, return base case
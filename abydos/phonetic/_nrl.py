@@ -19,14 +19,94 @@
 NRL English-to-phoneme algorithm
 """
 
-from re import match as re_match
-from typing import Dict, Tuple
+from re import compile as re_compile
+from typing import Dict, Optional, Pattern, Tuple
 
 from ._phonetic import _Phonetic
 
 __all__ = ['NRL']
 
 
+def _to_regex(pattern: str, left_match: bool = True) -> str:
+    """Convert an NRL context pattern to a regular expression.
+
+    Parameters
+    ----------
+    pattern : str
+        The context pattern
+    left_match : bool
+        True if the pattern describes the left context
+
+    Returns
+    -------
+    str
+        The corresponding regular expression
+
+    .. versionadded:: 0.6.0
+
+    """
+    new_pattern = ''
+    replacements = {
+        '#': '[AEIOU]+',
+        ':': '[BCDFGHJKLMNPQRSTVWXYZ]*',
+        '^': '[BCDFGHJKLMNPQRSTVWXYZ]',
+        '.': '[BDVGJLMNTWZ]',
+        '%': '(ER|E|ES|ED|ING|ELY)',
+        '+': '[EIY]',
+        ' ': '^',
+    }
+    for char in pattern:
+        new_pattern += replacements[char] if char in replacements else char
+
+    if left_match:
+        new_pattern += '$'
+        if '^' not in pattern:
+            new_pattern = '^.*' + new_pattern
+    else:
+        new_pattern = '^' + new_pattern.replace('^', '$')
+        if '$' not in new_pattern:
+            new_pattern += '.*$'
+
+    return new_pattern
+
+
+def _compile_rules(
+    rules: Dict[str, Tuple[Tuple[str, str, str, str], ...]]
+) -> Dict[
+    str, Tuple[Tuple[str, Optional[Pattern], Optional[Pattern], str], ...]
+]:
+    """Compile the context patterns of the NRL rules.
+
+    Parameters
+    ----------
+    rules : dict
+        The NRL rules, keyed by their first character
+
+    Returns
+    -------
+    dict
+        The rules as (match, left regex, right regex, output) tuples, where
+        an empty context is None
+
+    .. versionadded:: 0.6.0
+
+    """
+    return {
+        first: tuple(
+            (
+                match,
+                re_compile(_to_regex(left, left_match=True)) if left else None,
+                re_compile(_to_regex(right, left_match=False))
+                if right
+                else None,
+                out,
+            )
+            for left, match, right, out in first_rules
+        )
+        for first, first_rules in rules.items()
+    }
+
+
 class NRL(_Phonetic):
     """Naval Research Laboratory English-to-phoneme encoder.
 
@@ -427,6 +507,8 @@ class NRL(_Phonetic):
         'Z': (('', 'Z', '', 'z'),),
     }  # type: Dict[str, Tuple[Tuple[str, str, str, str], ...]]
 
+    _compiled_rules = _compile_rules(_rules)
+
     def encode(self, word: str) -> str:
         """Return the Naval Research Laboratory phonetic encoding of a word.
 
@@ -463,33 +545,6 @@ class NRL(_Phonetic):
 
         """
 
-        def _to_regex(pattern: str, left_match: bool = True) -> str:
-            new_pattern = ''
-            replacements = {
-                '#': '[AEIOU]+',
-                ':': '[BCDFGHJKLMNPQRSTVWXYZ]*',
-                '^': '[BCDFGHJKLMNPQRSTVWXYZ]',
-                '.': '[BDVGJLMNTWZ]',
-                '%': '(ER|E|ES|ED|ING|ELY)',
-                '+': '[EIY]',
-                ' ': '^',
-            }
-            for char in pattern:
-                new_pattern += (
-                    replacements[char] if char in replacements else char
-                )
-
-            if left_match:
-                new_pattern += '$'
-                if '^' not in pattern:
-                    new_pattern = '^.*' + new_pattern
-            else:
-                new_pattern = '^' + new_pattern.replace('^', '$')
-                if '$' not in new_pattern:
-                    new_pattern += '.*$'
-
-            return new_pattern
-
         word = word.upper()
 
         pron = ''
@@ -498,16 +553,10 @@ class NRL(_Phonetic):
             left_orig = word[:pos]
             right_orig = word[pos:]
             first = word[pos] if word[pos] in self._rules else ' '
-            for rule in self._rules[first]:
-                left, match, right, out = rule
+            for match, left, right, out in self._compiled_rules[first]:
                 if right_orig.startswith(match):
-                    if left:
-                        l_pattern = _to_regex(left, left_match=True)
-                    if right:
-                        r_pattern = _to_regex(right, left_match=False)
-                    if (not left or re_match(l_pattern, left_orig)) and (
-                        not right
-                        or re_match(r_pattern, right_orig[len(match) :])
+                    if (left is None or left.match(left_orig)) and (
+                        right is None or right.match(right_orig[len(match) :])
                     ):
                         pron += out
                         pos += len(match)
@@ -37,6 +37,8 @@ class NYSIIS(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
+    _int_alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
     def __init__(self, max_length: int = 6, modified: bool = False) -> None:
         """Initialize AlphaSIS instance.
 
@@ -22,6 +22,7 @@ Phonem
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
+from ._rewrite import _Rewriter
 
 __all__ = ['Phonem']
 
@@ -41,24 +42,26 @@ class Phonem(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
-    _substitutions = (
-        ('SC', 'C'),
-        ('SZ', 'C'),
-        ('CZ', 'C'),
-        ('TZ', 'C'),
-        ('TS', 'C'),
-        ('KS', 'X'),
-        ('PF', 'V'),
-        ('QU', 'KW'),
-        ('PH', 'V'),
-        ('UE', 'Y'),
-        ('AE', 'E'),
-        ('OE', 'Ö'),
-        ('EI', 'AY'),
-        ('EY', 'AY'),
-        ('EU', 'OY'),
-        ('AU', 'A§'),
-        ('OU', '§'),
+    _substitutions = _Rewriter(
+        (
+            ('SC', 'C'),
+            ('SZ', 'C'),
+            ('CZ', 'C'),
+            ('TZ', 'C'),
+            ('TS', 'C'),
+            ('KS', 'X'),
+            ('PF', 'V'),
+            ('QU', 'KW'),
+            ('PH', 'V'),
+            ('UE', 'Y'),
+            ('AE', 'E'),
+            ('OE', 'Ö'),
+            ('EI', 'AY'),
+            ('EY', 'AY'),
+            ('EU', 'OY'),
+            ('AU', 'A§'),
+            ('OU', '§'),
+        )
     )
 
     _trans = dict(
@@ -102,8 +105,7 @@ class Phonem(_Phonetic):
 
         """
         word = unicode_normalize('NFC', word.upper())
-        for i, j in self._substitutions:
-            word = word.replace(i, j)
+        word = self._substitutions.apply(word)
         word = word.translate(self._trans)
 
         return ''.join(
@@ -19,7 +19,11 @@
 The phonetic._phonetic module implements abstract class Phonetic.
 """
 
+import sys
 from itertools import groupby
+from typing import Iterable, Tuple
+
+import numpy as np
 
 __all__ = ['_Phonetic']
 
@@ -37,6 +41,11 @@ class _Phonetic:
     _uc_vy_set = set('AEIOUY')
     _lc_vy_set = set('aeiouy')
 
+    # The characters of codes, in sort order; encoders that set this support
+    # encode_int, encode_array, & decode_int, which escape any other
+    # characters of their codes
+    _int_alphabet = ''
+
     def _delete_consecutive_repeats(self, word: str) -> str:
         """Delete consecutive repeated characters in a word.
 
@@ -102,6 +111,194 @@ class _Phonetic:
         """
         return self.encode(word)
 
+    def _int_length(self) -> int:
+        """Return the code length used to pack codes into ints.
+
+        Returns
+        -------
+        int
+            The maximum length of the encoder's codes, or 0 if their length
+            is unbounded
+
+        Raises
+        ------
+        NotImplementedError
+            The encoder does not define a code alphabet
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if not self._int_alphabet:
+            raise NotImplementedError(
+                '{} codes cannot be packed into ints.'.format(
+                    type(self).__name__
+                )
+            )
+        return max(getattr(self, '_max_length', 0), 0)
+
+    def _int_base(self) -> Tuple[int, int]:
+        """Return the base & escape width used to pack codes into ints.
+
+        Returns
+        -------
+        tuple
+            The base, which is two more than the number of characters in the
+            code alphabet, & the number of digits of an escaped code point
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        base = len(self._int_alphabet) + 2
+        width = 1
+        while base ** width <= sys.maxunicode:
+            width += 1
+        return base, width
+
+    def encode_int(self, word: str) -> int:
+        """Return the phonetic code of a word packed into an int.
+
+        The code is read as a base-N number, where N is two more than the
+        number of characters in the encoder's code alphabet: each character
+        of the alphabet becomes its 1-based rank in it, any other character
+        (such as an unfiltered non-ASCII initial) becomes the escape digit
+        N - 1 followed by the digits of its code point, and codes shorter
+        than the maximum length are padded with 0 digits. The mapping is
+        reversible (by :py:meth:`decode_int`), and the ints of codes of
+        alphabet characters sort in the same order as the codes. Codes with
+        escaped characters sort after all of those, and codes of unbounded
+        length are not padded, so neither sorts like the codes.
+
+        Parameters
+        ----------
+        word : str
+            The word to transform
+
+        Returns
+        -------
+        int
+            The packed code
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> pe = Soundex()
+        >>> pe.encode_int('Christopher')
+        523733
+        >>> pe.encode_int('Niall') < pe.encode_int('Smith')
+        True
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        length = self._int_length()
+        alphabet = self._int_alphabet
+        base, width = self._int_base()
+
+        code = self.encode(word)
+        value = 0
+        for char in code:
+            digit = alphabet.find(char) + 1
+            if digit:
+                value = value * base + digit
+            else:
+                value = (value * base + base - 1) * base ** width + ord(char)
+        return value * base ** max(length - len(code), 0)
+
+    def encode_array(self, words: Iterable[str]) -> np.ndarray:
+        """Return the phonetic codes of words packed into an array of ints.
+
+        Parameters
+        ----------
+        words : iterable of str
+            The words to transform
+
+        Returns
+        -------
+        numpy.ndarray
+            The packed codes (see :py:meth:`encode_int`), as an array of dtype
+            uint32 if every code fits in 32 bits, uint64 if every code fits in
+            64 bits, and object (of Python ints) otherwise
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> pe = Soundex()
+        >>> pe.encode_array(['Christopher', 'Niall', 'Smith', 'Schmidt'])
+        array([ 523733, 1034282, 1268966, 1268966], dtype=uint32)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        length = self._int_length()
+        values = [self.encode_int(word) for word in words]
+
+        # the dtype holds every code of alphabet characters, so it depends on
+        # the words only if some of their codes have escaped characters
+        top = max(values, default=0)
+        if length:
+            top = max(top, self._int_base()[0] ** length - 1)
+        if top < 2 ** 32:
+            return np.array(values, dtype=np.uint32)
+        if top < 2 ** 64:
+            return np.array(values, dtype=np.uint64)
+        return np.array(values, dtype=object)
+
+    def decode_int(self, value: int) -> str:
+        """Return the phonetic code packed into an int.
+
+        Parameters
+        ----------
+        value : int
+            A code packed by :py:meth:`encode_int`
+
+        Returns
+        -------
+        str
+            The phonetic code
+
+        Examples
+        --------
+        >>> from abydos.phonetic import Soundex
+        >>> pe = Soundex()
+        >>> pe.decode_int(523733)
+        'C623'
+        >>> pe.decode_int(pe.encode_int('Niall'))
+        'N400'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._int_length()
+        alphabet = self._int_alphabet
+        base, width = self._int_base()
+
+        value = int(value)
+        digits = []
+        while value:
+            value, digit = divmod(value, base)
+            digits.append(digit)
+        digits.reverse()
+
+        code = []
+        pos = 0
+        # the code ends at the end of the digits or at its 0 padding
+        while pos < len(digits) and digits[pos]:
+            if digits[pos] == base - 1:
+                point = 0
+                for digit in digits[pos + 1 : pos + 1 + width]:
+                    point = point * base + digit
+                code.append(chr(point))
+                pos += 1 + width
+            else:
+                code.append(alphabet[digits[pos] - 1])
+                pos += 1
+        return ''.join(code)
+
 
 if __name__ == '__main__':
     import doctest
@@ -36,6 +36,8 @@ class Phonex(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '123456'), 'PSTLNR'))
 
+    _int_alphabet = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
     def __init__(self, max_length: int = 4, zero_pad: bool = True) -> None:
         """Initialize Phonex instance.
 
@@ -19,10 +19,11 @@
 Phonix
 """
 
-from typing import Any, Optional, Set, Tuple
+from typing import Any, List, Optional, Set, Tuple
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
+from ._rewrite import _Rewriter
 
 __all__ = ['Phonix']
 
@@ -182,6 +183,46 @@ class Phonix(_Phonetic):
             (3, 'MPT', 'MT'),
         )  # type: Tuple[Tuple[Any, ...], ...]
 
+        # Rules applying throughout the word are compiled into rewriters;
+        # contexts are expanded in sorted order so that the result does not
+        # depend on set iteration order.
+        def _expand(
+            src: str,
+            tar: str,
+            pre: Optional[Set[str]] = None,
+            post: Optional[Set[str]] = None,
+        ) -> List[Tuple[str, str]]:
+            return [
+                (i + src + j, i + tar + j)
+                for i in sorted(pre or {''})
+                for j in sorted(post or {''})
+            ]
+
+        self._steps = []  # type: List[Tuple[Any, ...]]
+        rules = []  # type: List[Tuple[str, str]]
+        for trans in self._substitutions:
+            pre = trans[3] if len(trans) > 3 else None
+            post = trans[4] if len(trans) > 4 else None
+            if trans[0] == 3 or (trans[0] == 2 and pre and post):
+                rules += _expand(trans[1], trans[2], pre, post)
+                continue
+            if rules:
+                self._steps.append((3, _Rewriter(rules)))
+                rules = []
+            if trans[0] == 2:
+                self._steps.append(
+                    (
+                        2,
+                        _Rewriter(_expand(trans[1], trans[2], pre, post)),
+                        bool(pre),
+                        bool(post),
+                    )
+                )
+            else:
+                self._steps.append(trans)
+        if rules:
+            self._steps.append((3, _Rewriter(rules)))
+
         # Clamp max_length to [4, 64]
         if max_length != -1:
             self._max_length = min(max(4, max_length), 64)
@@ -319,26 +360,20 @@ class Phonix(_Phonetic):
             return word
 
         def _mid_repl(
-            word: str,
-            src: str,
-            tar: str,
-            pre: Optional[Set[str]] = None,
-            post: Optional[Set[str]] = None,
+            word: str, rewriter: _Rewriter, pre: bool, post: bool
         ) -> str:
-            """Replace src with tar in the middle of word.
+            """Apply rewriter to the middle of word.
 
             Parameters
             ----------
             word : str
                 The word to modify
-            src : str
-                Substring to match
-            tar : str
-                Substring to substitute
-            pre : set
-                Preceding characters
-            post : set
-                Following characters
+            rewriter : _Rewriter
+                The compiled replacements
+            pre : bool
+                True if the replacements have a preceding context
+            post : bool
+                True if the replacements have a following context
 
             Returns
             -------
@@ -346,67 +381,30 @@ class Phonix(_Phonetic):
                 Modified string
 
             .. versionadded:: 0.1.0
+            .. versionchanged:: 0.6.0
+                Takes compiled replacements
 
             """
             if pre or post:
                 if not pre:
-                    return word[0] + _all_repl(word[1:], src, tar, pre, post)
+                    return word[0] + rewriter.apply(word[1:])
                 elif not post:
-                    return _all_repl(word[:-1], src, tar, pre, post) + word[-1]
-                return _all_repl(word, src, tar, pre, post)
-            return (
-                word[0] + _all_repl(word[1:-1], src, tar, pre, post) + word[-1]
-            )
-
-        def _all_repl(
-            word: str,
-            src: str,
-            tar: str,
-            pre: Optional[Set[str]] = None,
-            post: Optional[Set[str]] = None,
-        ) -> str:
-            """Replace src with tar anywhere in word.
-
-            Parameters
-            ----------
-            word : str
-                The word to modify
-            src : str
-                Substring to match
-            tar : str
-                Substring to substitute
-            pre : set
-                Preceding characters
-            post : set
-                Following characters
-
-            Returns
-            -------
-            str
-                Modified string
-
-            .. versionadded:: 0.1.0
-
-            """
-            if pre or post:
-                post = post if post else {''}
-                pre = pre if pre else {''}
-
-                for i, j in ((i, j) for i in pre for j in post):
-                    word = word.replace(i + src + j, i + tar + j)
-                return word
-            else:
-                return word.replace(src, tar)
+                    return rewriter.apply(word[:-1]) + word[-1]
+                return rewriter.apply(word)
+            return word[0] + rewriter.apply(word[1:-1]) + word[-1]
 
-        repl_at = (_start_repl, _end_repl, _mid_repl, _all_repl)
+        repl_at = (_start_repl, _end_repl, _mid_repl)
 
         sdx = ''
 
         word = unicode_normalize('NFKD', word.upper())
         word = ''.join(c for c in word if c in self._uc_set)
         if word:
-            for trans in self._substitutions:
-                word = repl_at[trans[0]](word, *trans[1:])
+            for step in self._steps:
+                if step[0] == 3:
+                    word = step[1].apply(word)
+                else:
+                    word = repl_at[step[0]](word, *step[1:])
             if word[0] in self._uc_vy_set:
                 sdx = 'v' + word[1:].translate(self._trans)
             else:
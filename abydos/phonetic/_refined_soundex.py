@@ -44,6 +44,8 @@ class RefinedSoundex(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '123456789'), 'PFKGZTLNR'))
 
+    _int_alphabet = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
     def __init__(
         self,
         max_length: int = -1,
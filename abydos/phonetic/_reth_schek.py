@@ -19,7 +19,10 @@
 Reth-Schek Phonetik
 """
 
+from itertools import chain
+
 from ._phonetic import _Phonetic
+from ._rewrite import _Rewriter, _alternation
 
 __all__ = ['RethSchek']
 
@@ -48,6 +51,8 @@ class RethSchek(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
+    _umlauts = _Rewriter((('Ä', 'AE'), ('Ö', 'OE'), ('Ü', 'UE')))
+
     _replacements = {
         3: {
             'AEH': 'E',
@@ -114,6 +119,7 @@ class RethSchek(_Phonetic):
             'Y': 'I',
         },
     }
+    _pattern = _alternation(chain.from_iterable(_replacements.values()))
 
     def encode(self, word: str) -> str:
         """Return Reth-Schek Phonetik code for a word.
@@ -152,24 +158,22 @@ class RethSchek(_Phonetic):
         word = word.upper()
 
         # Replace umlauts/eszett
-        word = word.replace('Ä', 'AE')
-        word = word.replace('Ö', 'OE')
-        word = word.replace('Ü', 'UE')
+        word = self._umlauts.apply(word)
 
         # Main loop, using above replacements table
-        pos = 0
-        while pos < len(word):
-            for num in range(3, 0, -1):
-                if word[pos : pos + num] in self._replacements[num]:
-                    word = (
-                        word[:pos]
-                        + self._replacements[num][word[pos : pos + num]]
-                        + word[pos + num :]
-                    )
-                    pos += 1
-                    break
-            else:
-                pos += 1  # Advance if nothing is recognized
+        # Each replacement is rescanned from its second character on, so
+        # search for the next (longest) match rather than substituting in a
+        # single pass
+        match = self._pattern.search(word)
+        while match is not None:
+            pos = match.start()
+            src = match.group()
+            word = (
+                word[:pos]
+                + self._replacements[len(src)][src]
+                + word[match.end() :]
+            )
+            match = self._pattern.search(word, pos + 1)
 
         # Change 'CH' back(?) to 'SCH'
         word = word.replace('CH', 'SCH')
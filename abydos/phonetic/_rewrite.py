@@ -0,0 +1,201 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.phonetic._rewrite.
+
+Compiled rewrite rules for rule-list phonetic algorithms
+"""
+
+from functools import partial
+from operator import methodcaller
+from re import compile as re_compile, escape as re_escape
+from typing import Any, Callable, Iterable, List, Pattern, Tuple
+
+__all__ = ['_Rewriter', '_alternation']
+
+
+def _alternation(patterns: Iterable[str]) -> Pattern:
+    """Compile literal patterns into one regex, preferring longer patterns.
+
+    Parameters
+    ----------
+    patterns : Iterable[str]
+        The literal strings to match
+
+    Returns
+    -------
+    Pattern
+        A regular expression matching any of the patterns, trying longer
+        patterns first at each position
+
+    Examples
+    --------
+    >>> _alternation(('A', 'AB', 'C')).findall('ABAC')
+    ['AB', 'A', 'C']
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return re_compile(
+        '|'.join(
+            re_escape(pattern)
+            for pattern in sorted(patterns, key=len, reverse=True)
+        )
+    )
+
+
+def _overlaps(first: str, second: str) -> bool:
+    """Return True if occurrences of two patterns can overlap.
+
+    Parameters
+    ----------
+    first : str
+        A pattern
+    second : str
+        Another pattern
+
+    Returns
+    -------
+    bool
+        True if one pattern contains the other or a proper prefix of one is
+        a suffix of the other
+
+    .. versionadded:: 0.6.0
+
+    """
+    if first in second or second in first:
+        return True
+    return any(
+        first.endswith(second[:i]) or second.endswith(first[:i])
+        for i in range(1, min(len(first), len(second)))
+    )
+
+
+class _Rewriter:
+    """Ordered replacement rules, compiled into single-pass stages.
+
+    Applying the rewriter gives exactly the result of calling
+    :py:meth:`str.replace` for each rule in order. Consecutive rules are
+    merged into one stage, applied in a single left-to-right pass, as long as
+    no rule in the stage can affect another:
+
+    - no pattern overlaps or contains another pattern of the stage and
+    - no replacement is empty or overlaps the pattern of a later rule of the
+      stage.
+
+    Single-rule stages use :py:meth:`str.replace`, stages of single-character
+    patterns use :py:meth:`str.translate`, and all others use one alternation
+    regex with a table lookup.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, rules: Iterable[Tuple[str, str]]) -> None:
+        """Initialize _Rewriter instance.
+
+        Parameters
+        ----------
+        rules : Iterable[Tuple[str, str]]
+            The (pattern, replacement) pairs, in the order they apply
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        stages = []  # type: List[List[Tuple[str, str]]]
+        for src, tar in rules:
+            if stages and all(
+                prev_tar
+                and not _overlaps(prev_tar, src)
+                and not _overlaps(prev_src, src)
+                for prev_src, prev_tar in stages[-1]
+            ):
+                stages[-1].append((src, tar))
+            else:
+                stages.append([(src, tar)])
+
+        self._stages = tuple(
+            self._compile(stage) for stage in stages
+        )  # type: Tuple[Callable[[str], str], ...]
+
+    @staticmethod
+    def _compile(stage: List[Tuple[str, str]]) -> Callable[[str], str]:
+        """Return a function applying one stage of rules.
+
+        Parameters
+        ----------
+        stage : list of tuples
+            The (pattern, replacement) pairs of the stage
+
+        Returns
+        -------
+        Callable[[str], str]
+            A function applying the stage to a word
+
+        .. versionadded:: 0.6.0
+
+        """
+        if len(stage) == 1:
+            return methodcaller('replace', *stage[0])
+        if all(len(src) == 1 for src, _ in stage):
+            return methodcaller(
+                'translate', {ord(src): tar for src, tar in stage}
+            )
+
+        table = dict(stage)
+
+        def _lookup(match: Any) -> str:
+            return table[match.group()]
+
+        return partial(
+            _alternation(src for src, _ in stage).sub, _lookup
+        )  # type: ignore
+
+    def apply(self, word: str) -> str:
+        """Apply the rules to a word.
+
+        Parameters
+        ----------
+        word : str
+            The word to transform
+
+        Returns
+        -------
+        str
+            The transformed word
+
+        Examples
+        --------
+        >>> rw = _Rewriter((('SC', 'C'), ('SZ', 'C'), ('CZ', 'C')))
+        >>> len(rw._stages)
+        2
+        >>> rw.apply('SCZ')
+        'C'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        for stage in self._stages:
+            word = stage(word)
+        return word
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
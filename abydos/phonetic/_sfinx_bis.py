@@ -22,6 +22,7 @@ SfinxBis
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
+from ._rewrite import _Rewriter
 
 __all__ = ['SfinxBis']
 
@@ -96,6 +97,37 @@ class SfinxBis(_Phonetic):
         'X',
         'Z',
     }
+
+    # Vowel and consonant rules are listed in sorted order so that rules
+    # which interact (e.g. for 'EYI') always apply in the same order.
+    _foersvenskning = _Rewriter(
+        (
+            ('STIERN', 'STJÄRN'),
+            ('HIE', 'HJ'),
+            ('SIÖ', 'SJÖ'),
+            ('SCH', 'SH'),
+            ('QU', 'KV'),
+            ('IO', 'JO'),
+            ('PH', 'F'),
+        )
+        + tuple(
+            (vokal + i, vokal + 'J')
+            for vokal in sorted(_harde_vokaler)
+            for i in 'ÜYI'
+        )
+        + tuple(
+            (vokal + i, vokal + 'J')
+            for vokal in sorted(_mjuka_vokaler)
+            for i in 'ÜYI'
+        )
+        + tuple(('H' + i, i) for i in sorted(_uc_c_set))
+        + (('Ð', 'ETH'), ('Þ', 'TH'))
+    )
+
+    _rest_substitutions = _Rewriter(
+        (('DT', 'T'), ('X', 'KS'))
+        + tuple(('C' + vokal, '8' + vokal) for vokal in sorted(_mjuka_vokaler))
+    )
     _uc_set = {
         'A',
         'B',
@@ -251,33 +283,8 @@ class SfinxBis(_Phonetic):
             .. versionadded:: 0.1.0
 
             """
-            lokal_ordet = lokal_ordet.replace('STIERN', 'STJÄRN')
-            lokal_ordet = lokal_ordet.replace('HIE', 'HJ')
-            lokal_ordet = lokal_ordet.replace('SIÖ', 'SJÖ')
-            lokal_ordet = lokal_ordet.replace('SCH', 'SH')
-            lokal_ordet = lokal_ordet.replace('QU', 'KV')
-            lokal_ordet = lokal_ordet.replace('IO', 'JO')
-            lokal_ordet = lokal_ordet.replace('PH', 'F')
-
-            for i in self._harde_vokaler:
-                lokal_ordet = lokal_ordet.replace(i + 'Ü', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'Y', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'I', i + 'J')
-            for i in self._mjuka_vokaler:
-                lokal_ordet = lokal_ordet.replace(i + 'Ü', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'Y', i + 'J')
-                lokal_ordet = lokal_ordet.replace(i + 'I', i + 'J')
-
-            if 'H' in lokal_ordet:
-                for i in self._uc_c_set:
-                    lokal_ordet = lokal_ordet.replace('H' + i, i)
-
-            lokal_ordet = lokal_ordet.translate(self._substitutions)
-
-            lokal_ordet = lokal_ordet.replace('Ð', 'ETH')
-            lokal_ordet = lokal_ordet.replace('Þ', 'TH')
-
-            return lokal_ordet
+            lokal_ordet = self._foersvenskning.apply(lokal_ordet)
+            return lokal_ordet.translate(self._substitutions)
 
         def _koda_foersta_ljudet(lokal_ordet: str) -> str:
             """Return the word with the first sound coded.
@@ -383,13 +390,11 @@ class SfinxBis(_Phonetic):
         rest = [ordet[1:] for ordet in ordlista]
 
         # Steg 8, Utför fonetisk transformation i resten
-        rest = [ordet.replace('DT', 'T') for ordet in rest]
-        rest = [ordet.replace('X', 'KS') for ordet in rest]
-
         # Steg 9, Koda resten till en sifferkod
-        for vokal in self._mjuka_vokaler:
-            rest = [ordet.replace('C' + vokal, '8' + vokal) for ordet in rest]
-        rest = [ordet.translate(self._trans) for ordet in rest]
+        rest = [
+            self._rest_substitutions.apply(ordet).translate(self._trans)
+            for ordet in rest
+        ]
 
         # Steg 10, Ta bort intilliggande dubbletter
         rest = [self._delete_consecutive_repeats(ordet) for ordet in rest]
@@ -54,6 +54,9 @@ class Soundex(_Phonetic):
 
     _alphabetic = dict(zip((ord(_) for _ in '01234569'), 'APKTLNRH'))
 
+    # the comma separates the two codes of prefixed names in Census Soundex
+    _int_alphabet = ',0123456ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
     def __init__(
         self,
         max_length: int = 4,
@@ -102,6 +105,23 @@ class Soundex(_Phonetic):
         self._reverse = reverse
         self._zero_pad = zero_pad
 
+    def _int_length(self) -> int:
+        """Return the code length used to pack codes into ints.
+
+        Returns
+        -------
+        int
+            The maximum length of the encoder's codes, which for Census
+            Soundex is that of two codes & the comma between them
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._var == 'Census':
+            return 2 * self._max_length + 1
+        return self._max_length
+
     def encode_alpha(self, word: str) -> str:
         """Return the alphabetic Soundex code for a word.
 
@@ -22,6 +22,7 @@ Spanish Metaphone
 from unicodedata import normalize as unicode_normalize
 
 from ._phonetic import _Phonetic
+from ._rewrite import _Rewriter
 
 __all__ = ['SpanishMetaphone']
 
@@ -39,6 +40,27 @@ class SpanishMetaphone(_Phonetic):
     .. versionadded:: 0.3.6
     """
 
+    _modified_substitutions = _Rewriter(
+        (('MB', 'NB'), ('MP', 'NP'), ('BS', 'S'))
+    )
+
+    _substitutions = _Rewriter(
+        (
+            ('Á', 'A'),
+            ('CH', 'X'),
+            ('Ç', 'S'),
+            ('É', 'E'),
+            ('Í', 'I'),
+            ('Ó', 'O'),
+            ('Ú', 'U'),
+            ('Ñ', 'NY'),
+            ('GÜ', 'W'),
+            ('Ü', 'U'),
+            ('B', 'V'),
+            ('LL', 'Y'),
+        )
+    )
+
     def __init__(self, max_length: int = 6, modified: bool = False) -> None:
         """Initialize AlphaSIS instance.
 
@@ -118,25 +140,12 @@ class SpanishMetaphone(_Phonetic):
 
         # do some replacements for the modified version
         if self._modified:
-            word = word.replace('MB', 'NB')
-            word = word.replace('MP', 'NP')
-            word = word.replace('BS', 'S')
+            word = self._modified_substitutions.apply(word)
             if word[:2] == 'PS':
                 word = word[1:]
 
         # simple replacements
-        word = word.replace('Á', 'A')
-        word = word.replace('CH', 'X')
-        word = word.replace('Ç', 'S')
-        word = word.replace('É', 'E')
-        word = word.replace('Í', 'I')
-        word = word.replace('Ó', 'O')
-        word = word.replace('Ú', 'U')
-        word = word.replace('Ñ', 'NY')
-        word = word.replace('GÜ', 'W')
-        word = word.replace('Ü', 'U')
-        word = word.replace('B', 'V')
-        word = word.replace('LL', 'Y')
+        word = self._substitutions.apply(word)
 
         while len(meta_key) < self._max_length:
             if pos >= len(word):
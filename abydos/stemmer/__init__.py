@@ -66,6 +66,19 @@ form:
 >>> stmr.stem('trusted')
 'trust'
 
+To stem a stream of tokens, ``stem_many`` reads it in batches, stems each
+distinct token of a batch only once (optionally across a pool of worker
+processes, with ``n_jobs``) and yields the stems in token order:
+
+>>> list(stmr.stem_many(['trusted', 'democracy', 'trusted']))
+['trust', 'democraci', 'trust']
+
+To share stems across many processes, :py:meth:`.LexiconStemmer.write_lexicon`
+writes a stemmer's stems of a vocabulary (such as the words of a
+:py:class:`.UnigramCorpus`) to a lexicon file, and a :py:class:`.LexiconStemmer`
+memory-maps that lexicon read-only, looking words up by binary search &
+falling back to the live stemmer for words not in it.
+
 ----
 
 """
@@ -74,6 +87,7 @@ from ._caumanns import Caumanns
 from ._clef_german import CLEFGerman
 from ._clef_german_plus import CLEFGermanPlus
 from ._clef_swedish import CLEFSwedish
+from ._lexicon_stemmer import LexiconStemmer
 from ._lovins import Lovins
 from ._paice_husk import PaiceHusk
 from ._porter import Porter
@@ -108,6 +122,7 @@ __all__ = [
     'CLEFGerman',
     'CLEFGermanPlus',
     'CLEFSwedish',
+    'LexiconStemmer',
 ]
 
 
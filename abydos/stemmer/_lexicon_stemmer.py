@@ -0,0 +1,281 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.stemmer._lexicon_stemmer.
+
+Lexicon stemmer
+"""
+
+import mmap
+from struct import Struct
+from typing import Any, Dict, Iterable, Optional, Union
+
+from ._stemmer import _Stemmer
+from ..corpus import Corpus, UnigramCorpus
+from ..util._string_table import (
+    _ITEM_SIZE,
+    _StringTable,
+    _encode,
+    _pack_strings,
+    _view_columns,
+    _write_columns,
+)
+
+__all__ = ['LexiconStemmer']
+
+# A lexicon file is laid out as:
+#   - the magic bytes & the number of words, N
+#   - N + 1 offsets of the words within the word table
+#   - N + 1 offsets of the stems within the stem table
+#   - the word table: the UTF-8 encoded words, concatenated in sorted order
+#   - the stem table: the UTF-8 encoded stems, concatenated in the same order
+# All integers are little-endian unsigned 64-bit and offsets are relative to
+# the start of their table.
+_MAGIC = b'ABYDLEX1'
+_HEADER = Struct('<8sQ')
+
+
+class LexiconStemmer(_Stemmer):
+    """Lexicon stemmer.
+
+    A lexicon stemmer looks words up in a lexicon of precomputed stems,
+    written by :py:meth:`write_lexicon`, and falls back to a live stemmer for
+    words that are not in it.
+
+    The lexicon is a sorted string table with offsets, memory-mapped read-only
+    and searched by bisection, so any number of processes that open the same
+    lexicon share a single copy of it in the operating system's page cache
+    instead of each stemming & caching the vocabulary for itself.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self, lexicon: str, stemmer: Optional[_Stemmer] = None
+    ) -> None:
+        """Initialize LexiconStemmer instance.
+
+        Parameters
+        ----------
+        lexicon : str
+            The filename of a lexicon written by :py:meth:`write_lexicon`
+        stemmer : _Stemmer
+            The stemmer to apply to words that are not in the lexicon; if
+            None, such words are returned unchanged
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._lexicon = lexicon
+        self._stemmer = stemmer
+        self._open()
+
+    def _open(self) -> None:
+        """Memory-map the lexicon.
+
+        Raises
+        ------
+        ValueError
+            The file is not a lexicon
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(self._lexicon, 'rb') as lexicon:
+            self._map = mmap.mmap(lexicon.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < _HEADER.size:
+            raise ValueError('{} is not a lexicon'.format(self._lexicon))
+        magic, self._size = _HEADER.unpack_from(self._map, 0)
+        if (
+            magic != _MAGIC
+            or len(self._map)
+            < _HEADER.size + 2 * (self._size + 1) * _ITEM_SIZE
+        ):
+            raise ValueError('{} is not a lexicon'.format(self._lexicon))
+
+        (word_offsets, stem_offsets), start = _view_columns(
+            self._map, _HEADER.size, [(self._size + 1, 'Q')] * 2
+        )
+        self._words = _StringTable(self._map, word_offsets, start)
+        self._stems = _StringTable(self._map, stem_offsets, self._words.end())
+
+    @staticmethod
+    def write_lexicon(
+        filename: str,
+        stemmer: _Stemmer,
+        vocabulary: Union[Iterable[str], Corpus, UnigramCorpus],
+        n_jobs: Optional[int] = None,
+    ) -> None:
+        """Write a stemmer's stems of a vocabulary to a lexicon file.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to write the lexicon to
+        stemmer : _Stemmer
+            The stemmer whose stems to record
+        vocabulary : iterable of str, Corpus, or UnigramCorpus
+            The words to stem; for a :py:class:`.Corpus` or a
+            :py:class:`.UnigramCorpus`, the words of the corpus
+        n_jobs : int or None
+            The number of worker processes to stem the vocabulary with, as in
+            :py:meth:`_Stemmer.stem_many`
+
+        Raises
+        ------
+        TypeError
+            The vocabulary must consist of strings
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(vocabulary, UnigramCorpus):
+            vocabulary = vocabulary.corpus.keys()
+        elif isinstance(vocabulary, Corpus):
+            vocabulary = vocabulary.iter_words()
+        words = set(vocabulary)
+        for word in words:
+            if not isinstance(word, str):
+                raise TypeError(
+                    'The vocabulary must consist of strings, not {}.'.format(
+                        type(word).__name__
+                    )
+                )
+        words = sorted(words, key=_encode)
+        stems = list(stemmer.stem_many(words, n_jobs=n_jobs))
+
+        word_offsets, word_blob = _pack_strings(words)
+        stem_offsets, stem_blob = _pack_strings(stems)
+
+        with open(filename, 'wb') as lexicon:
+            lexicon.write(_HEADER.pack(_MAGIC, len(words)))
+            _write_columns(lexicon, (word_offsets, stem_offsets))
+            lexicon.write(word_blob)
+            lexicon.write(stem_blob)
+
+    def __len__(self) -> int:
+        """Return the number of words in the lexicon.
+
+        Returns
+        -------
+        int
+            The number of words in the lexicon
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._size
+
+    def __contains__(self, word: str) -> bool:
+        """Return True if a word is in the lexicon.
+
+        Parameters
+        ----------
+        word : str
+            The word to look up
+
+        Returns
+        -------
+        bool
+            True if the word is in the lexicon
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._words.find(word) >= 0
+
+    def stem(self, word: str) -> str:
+        """Return the stem of a word from the lexicon.
+
+        Parameters
+        ----------
+        word : str
+            The word to stem
+
+        Returns
+        -------
+        str
+            Word stem
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> from abydos.stemmer import Porter
+        >>> handle, path = tempfile.mkstemp()
+        >>> os.close(handle)
+        >>> LexiconStemmer.write_lexicon(path, Porter(), ['reading', 'read'])
+        >>> stmr = LexiconStemmer(path, Porter())
+        >>> stmr.stem('reading')
+        'read'
+        >>> stmr.stem('democracy')
+        'democraci'
+        >>> del stmr
+        >>> os.remove(path)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        index = self._words.find(word)
+        if index < 0:
+            if self._stemmer is None:
+                return word
+            return self._stemmer.stem(word)
+        return self._stems[index]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the stemmer's state for pickling, without its memory map.
+
+        Returns
+        -------
+        dict
+            The instance attributes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = super().__getstate__()
+        for name in ('_map', '_words', '_stems'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the stemmer's state, memory-mapping the lexicon again.
+
+        Parameters
+        ----------
+        state : dict
+            The instance attributes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.__dict__.update(state)
+        self._open()
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
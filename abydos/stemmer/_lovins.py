@@ -19,10 +19,11 @@
 Lovins stemmer.
 """
 
-from typing import Callable, Dict, Optional, Tuple, Union, cast
+from typing import Callable, Dict, Optional, Tuple, Union
 from unicodedata import normalize
 
 from ._stemmer import _Stemmer
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['Lovins']
 
@@ -1171,6 +1172,8 @@ class Lovins(_Stemmer):
             ('yz', 'ys'),
         )
 
+        self._suffix_trie = _SuffixTrie(self._suffix)
+
     def stem(self, word: str) -> str:
         """Return Lovins stem.
 
@@ -1203,19 +1206,10 @@ class Lovins(_Stemmer):
         # lowercase, normalize, and compose
         word = normalize('NFC', word.lower())
 
-        for suffix_len in range(11, 0, -1):
-            ending = word[-suffix_len:]
-            if (
-                ending in self._suffix
-                and len(word) - suffix_len >= 2
-                and (
-                    self._suffix[ending] is None
-                    or cast(Callable[[str, int], bool], self._suffix[ending])(
-                        word, suffix_len
-                    )
-                )
-            ):
-                word = word[:-suffix_len]
+        for ending in self._suffix_trie.matches(word, 2):
+            condition = self._suffix[ending]
+            if condition is None or condition(word, len(ending)):
+                word = word[: -len(ending)]
                 break
 
         if word[-2:] in {
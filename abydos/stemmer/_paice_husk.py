@@ -19,9 +19,11 @@
 Paice-Husk Stemmer
 """
 
+from itertools import chain
 from typing import Dict, Optional, Tuple
 
 from ._stemmer import _Stemmer
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['PaiceHusk']
 
@@ -165,6 +167,8 @@ class PaiceHusk(_Stemmer):
         },
     }  # type: Dict[int, Dict[str, Tuple[Tuple[bool, int, Optional[str], bool], ...]]]  # noqa: E501
 
+    _rule_trie = _SuffixTrie(chain.from_iterable(_rule_table.values()))
+
     def _has_vowel(self, word: str) -> bool:
         for char in word:
             if char in {'a', 'e', 'i', 'o', 'u', 'y'}:
@@ -236,18 +240,17 @@ class PaiceHusk(_Stemmer):
         terminate = False
         intact = True
         while not terminate:
-            for n in range(6, 0, -1):
-                if word[-n:] in self._rule_table[n]:
-                    accept = False
-                    for rule in self._rule_table[n][word[-n:]]:
-                        (word, accept, intact, terminate,) = self._apply_rule(
-                            word, rule, intact, terminate
-                        )
-                        if accept:
-                            break
-
+            for ending in self._rule_trie.matches(word):
+                accept = False
+                for rule in self._rule_table[len(ending)][ending]:
+                    (word, accept, intact, terminate,) = self._apply_rule(
+                        word, rule, intact, terminate
+                    )
                     if accept:
                         break
+
+                if accept:
+                    break
             else:
                 break
 
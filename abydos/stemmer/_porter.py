@@ -19,6 +19,7 @@
 Porter stemmer
 """
 
+from re import compile as re_compile
 from unicodedata import normalize
 
 from ._stemmer import _Stemmer
@@ -35,8 +36,12 @@ class Porter(_Stemmer):
     """
 
     _vowels = {'a', 'e', 'i', 'o', 'u', 'y'}
+    # Non-overlapping vowel-consonant pairs are exactly the V to C
+    # transitions counted by the m-degree
+    _vc_transitions = re_compile('[aeiouy][^aeiouy]')
+    _vowel_letters = re_compile('[aeiouy]')
 
-    def _m_degree(self, term: str) -> int:
+    def _m_degree(self, term: str, suffix_len: int = 0) -> int:
         """Return Porter helper function _m_degree value.
 
         m-degree is equal to the number of V to C transitions
@@ -45,6 +50,9 @@ class Porter(_Stemmer):
         ----------
         term : str
             The word for which to calculate the m-degree
+        suffix_len : int
+            The length of a candidate suffix at the end of the word, which is
+            excluded from the count without slicing it off
 
         Returns
         -------
@@ -55,26 +63,24 @@ class Porter(_Stemmer):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added suffix_len parameter
 
         """
-        mdeg = 0
-        last_was_vowel = False
-        for letter in term:
-            if letter in self._vowels:
-                last_was_vowel = True
-            else:
-                if last_was_vowel:
-                    mdeg += 1
-                last_was_vowel = False
-        return mdeg
+        return len(
+            self._vc_transitions.findall(term, 0, len(term) - suffix_len)
+        )
 
-    def _has_vowel(self, term: str) -> bool:
+    def _has_vowel(self, term: str, suffix_len: int = 0) -> bool:
         """Return Porter helper function _has_vowel value.
 
         Parameters
         ----------
         term : str
             The word to scan for vowels
+        suffix_len : int
+            The length of a candidate suffix at the end of the word, which is
+            excluded from the scan without slicing it off
 
         Returns
         -------
@@ -86,12 +92,14 @@ class Porter(_Stemmer):
         .. versionadded:: 0.1.0
         .. versionchanged:: 0.3.6
             Encapsulated in class
+        .. versionchanged:: 0.6.0
+            Added suffix_len parameter
 
         """
-        for letter in term:
-            if letter in self._vowels:
-                return True
-        return False
+        return (
+            self._vowel_letters.search(term, 0, len(term) - suffix_len)
+            is not None
+        )
 
     def _ends_in_doubled_cons(self, term: str) -> bool:
         """Return Porter helper function _ends_in_doubled_cons value.
@@ -202,11 +210,14 @@ class Porter(_Stemmer):
             return word
 
         # Re-map consonantal y to Y (Y will be C, y will be V)
-        if word[0] == 'y':
-            word = 'Y' + word[1:]
-        for i in range(1, len(word)):
-            if word[i] == 'y' and word[i - 1] in self._vowels:
-                word = word[:i] + 'Y' + word[i + 1 :]
+        if 'y' in word:
+            buffer = list(word)
+            if buffer[0] == 'y':
+                buffer[0] = 'Y'
+            for i in range(1, len(buffer)):
+                if buffer[i] == 'y' and buffer[i - 1] in self._vowels:
+                    buffer[i] = 'Y'
+            word = ''.join(buffer)
 
         # Step 1a
         if word[-1] == 's':
@@ -222,23 +233,23 @@ class Porter(_Stemmer):
         # Step 1b
         step1b_flag = False
         if word[-3:] == 'eed':
-            if self._m_degree(word[:-3]) > 0:
+            if self._m_degree(word, 3) > 0:
                 word = word[:-1]
         elif word[-2:] == 'ed':
-            if self._has_vowel(word[:-2]):
+            if self._has_vowel(word, 2):
                 word = word[:-2]
                 step1b_flag = True
         elif word[-3:] == 'ing':
-            if self._has_vowel(word[:-3]):
+            if self._has_vowel(word, 3):
                 word = word[:-3]
                 step1b_flag = True
         elif self._early_english:
             if word[-3:] == 'est':
-                if self._has_vowel(word[:-3]):
+                if self._has_vowel(word, 3):
                     word = word[:-3]
                     step1b_flag = True
             elif word[-3:] == 'eth':
-                if self._has_vowel(word[:-3]):
+                if self._has_vowel(word, 3):
                     word = word[:-3]
                     step1b_flag = True
 
@@ -255,134 +266,134 @@ class Porter(_Stemmer):
                 word += 'e'
 
         # Step 1c
-        if word[-1] in {'Y', 'y'} and self._has_vowel(word[:-1]):
+        if word[-1] in {'Y', 'y'} and self._has_vowel(word, 1):
             word = word[:-1] + 'i'
 
         # Step 2
         if len(word) > 1:
             if word[-2] == 'a':
                 if word[-7:] == 'ational':
-                    if self._m_degree(word[:-7]) > 0:
+                    if self._m_degree(word, 7) > 0:
                         word = word[:-5] + 'e'
                 elif word[-6:] == 'tional':
-                    if self._m_degree(word[:-6]) > 0:
+                    if self._m_degree(word, 6) > 0:
                         word = word[:-2]
             elif word[-2] == 'c':
                 if word[-4:] in {'enci', 'anci'}:
-                    if self._m_degree(word[:-4]) > 0:
+                    if self._m_degree(word, 4) > 0:
                         word = word[:-1] + 'e'
             elif word[-2] == 'e':
                 if word[-4:] == 'izer':
-                    if self._m_degree(word[:-4]) > 0:
+                    if self._m_degree(word, 4) > 0:
                         word = word[:-1]
             elif word[-2] == 'g':
                 if word[-4:] == 'logi':
-                    if self._m_degree(word[:-4]) > 0:
+                    if self._m_degree(word, 4) > 0:
                         word = word[:-1]
             elif word[-2] == 'l':
                 if word[-3:] == 'bli':
-                    if self._m_degree(word[:-3]) > 0:
+                    if self._m_degree(word, 3) > 0:
                         word = word[:-1] + 'e'
                 elif word[-4:] == 'alli':
-                    if self._m_degree(word[:-4]) > 0:
+                    if self._m_degree(word, 4) > 0:
                         word = word[:-2]
                 elif word[-5:] == 'entli':
-                    if self._m_degree(word[:-5]) > 0:
+                    if self._m_degree(word, 5) > 0:
                         word = word[:-2]
                 elif word[-3:] == 'eli':
-                    if self._m_degree(word[:-3]) > 0:
+                    if self._m_degree(word, 3) > 0:
                         word = word[:-2]
                 elif word[-5:] == 'ousli':
-                    if self._m_degree(word[:-5]) > 0:
+                    if self._m_degree(word, 5) > 0:
                         word = word[:-2]
             elif word[-2] == 'o':
                 if word[-7:] == 'ization':
-                    if self._m_degree(word[:-7]) > 0:
+                    if self._m_degree(word, 7) > 0:
                         word = word[:-5] + 'e'
                 elif word[-5:] == 'ation':
-                    if self._m_degree(word[:-5]) > 0:
+                    if self._m_degree(word, 5) > 0:
                         word = word[:-3] + 'e'
                 elif word[-4:] == 'ator':
-                    if self._m_degree(word[:-4]) > 0:
+                    if self._m_degree(word, 4) > 0:
                         word = word[:-2] + 'e'
             elif word[-2] == 's':
                 if word[-5:] == 'alism':
-                    if self._m_degree(word[:-5]) > 0:
+                    if self._m_degree(word, 5) > 0:
                         word = word[:-3]
                 elif word[-7:] in {'iveness', 'fulness', 'ousness'}:
-                    if self._m_degree(word[:-7]) > 0:
+                    if self._m_degree(word, 7) > 0:
                         word = word[:-4]
             elif word[-2] == 't':
                 if word[-5:] == 'aliti':
-                    if self._m_degree(word[:-5]) > 0:
+                    if self._m_degree(word, 5) > 0:
                         word = word[:-3]
                 elif word[-5:] == 'iviti':
-                    if self._m_degree(word[:-5]) > 0:
+                    if self._m_degree(word, 5) > 0:
                         word = word[:-3] + 'e'
                 elif word[-6:] == 'biliti':
-                    if self._m_degree(word[:-6]) > 0:
+                    if self._m_degree(word, 6) > 0:
                         word = word[:-5] + 'le'
 
         # Step 3
         if word[-5:] in 'icate':
-            if self._m_degree(word[:-5]) > 0:
+            if self._m_degree(word, 5) > 0:
                 word = word[:-3]
         elif word[-5:] == 'ative':
-            if self._m_degree(word[:-5]) > 0:
+            if self._m_degree(word, 5) > 0:
                 word = word[:-5]
         elif word[-5:] in {'alize', 'iciti'}:
-            if self._m_degree(word[:-5]) > 0:
+            if self._m_degree(word, 5) > 0:
                 word = word[:-3]
         elif word[-4:] == 'ical':
-            if self._m_degree(word[:-4]) > 0:
+            if self._m_degree(word, 4) > 0:
                 word = word[:-2]
         elif word[-3:] == 'ful':
-            if self._m_degree(word[:-3]) > 0:
+            if self._m_degree(word, 3) > 0:
                 word = word[:-3]
         elif word[-4:] == 'ness':
-            if self._m_degree(word[:-4]) > 0:
+            if self._m_degree(word, 4) > 0:
                 word = word[:-4]
 
         # Step 4
         if word[-2:] == 'al':
-            if self._m_degree(word[:-2]) > 1:
+            if self._m_degree(word, 2) > 1:
                 word = word[:-2]
         elif word[-4:] in {'ance', 'ence'}:
-            if self._m_degree(word[:-4]) > 1:
+            if self._m_degree(word, 4) > 1:
                 word = word[:-4]
         elif word[-2:] in {'er', 'ic'}:
-            if self._m_degree(word[:-2]) > 1:
+            if self._m_degree(word, 2) > 1:
                 word = word[:-2]
         elif word[-4:] in {'able', 'ible'}:
-            if self._m_degree(word[:-4]) > 1:
+            if self._m_degree(word, 4) > 1:
                 word = word[:-4]
         elif word[-3:] == 'ant':
-            if self._m_degree(word[:-3]) > 1:
+            if self._m_degree(word, 3) > 1:
                 word = word[:-3]
         elif word[-5:] == 'ement':
-            if self._m_degree(word[:-5]) > 1:
+            if self._m_degree(word, 5) > 1:
                 word = word[:-5]
         elif word[-4:] == 'ment':
-            if self._m_degree(word[:-4]) > 1:
+            if self._m_degree(word, 4) > 1:
                 word = word[:-4]
         elif word[-3:] == 'ent':
-            if self._m_degree(word[:-3]) > 1:
+            if self._m_degree(word, 3) > 1:
                 word = word[:-3]
         elif word[-4:] in {'sion', 'tion'}:
-            if self._m_degree(word[:-3]) > 1:
+            if self._m_degree(word, 3) > 1:
                 word = word[:-3]
         elif word[-2:] == 'ou':
-            if self._m_degree(word[:-2]) > 1:
+            if self._m_degree(word, 2) > 1:
                 word = word[:-2]
         elif word[-3:] in {'ism', 'ate', 'iti', 'ous', 'ive', 'ize'}:
-            if self._m_degree(word[:-3]) > 1:
+            if self._m_degree(word, 3) > 1:
                 word = word[:-3]
 
         # Step 5a
         if word[-1] == 'e':
-            if self._m_degree(word[:-1]) > 1:
+            if self._m_degree(word, 1) > 1:
                 word = word[:-1]
-            elif self._m_degree(word[:-1]) == 1 and not self._ends_in_cvc(
+            elif self._m_degree(word, 1) == 1 and not self._ends_in_cvc(
                 word[:-1]
             ):
                 word = word[:-1]
@@ -392,9 +403,7 @@ class Porter(_Stemmer):
             word = word[:-1]
 
         # Change 'Y' back to 'y' if it survived stemming
-        for i in range(len(word)):
-            if word[i] == 'Y':
-                word = word[:i] + 'y' + word[i + 1 :]
+        word = word.replace('Y', 'y')
 
         return word
 
@@ -19,7 +19,7 @@
 Snowball Stemmer base class
 """
 
-from typing import Iterable, Optional, cast
+from typing import Iterable, Optional, Tuple, cast
 
 from ._stemmer import _Stemmer
 
@@ -58,19 +58,79 @@ class _Snowball(_Stemmer):
             Encapsulated in class
 
         """
-        vowel_found = False
         if hasattr(r1_prefixes, '__iter__'):
             for prefix in cast(Iterable[str], r1_prefixes):
-                if term[: len(prefix)] == prefix:
+                if term.startswith(prefix):
                     return len(prefix)
+        return self._sb_region_end(term, 0)
+
+    def _sb_region_end(self, term: str, start: int) -> int:
+        """Return the end of the first vowel-consonant sequence after start.
+
+        Parameters
+        ----------
+        term : str
+            The term to examine
+        start : int
+            The offset at which to begin scanning
 
-        for i in range(len(term)):
-            if not vowel_found and term[i] in self._vowels:
+        Returns
+        -------
+        int
+            The offset just past the first non-vowel that follows a vowel at
+            or after start, or the length of the term if there is none
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        vowels = self._vowels
+        vowel_found = False
+        for i in range(start, len(term)):
+            if term[i] in vowels:
                 vowel_found = True
-            elif vowel_found and term[i] not in self._vowels:
+            elif vowel_found:
                 return i + 1
         return len(term)
 
+    def _sb_regions(
+        self, term: str, r1_prefixes: Optional[Iterable[str]] = None
+    ) -> Tuple[int, int]:
+        """Return the R1 & R2 regions, as defined in the Porter2 specification.
+
+        The regions are found in a single scan of the term and, since the
+        Snowball stemmers define them on the word before any suffix is
+        removed, need only be computed once per word. Steps then compare
+        suffix lengths against these offsets rather than slicing the regions
+        out of the word.
+
+        Parameters
+        ----------
+        term : str
+            The term to examine
+        r1_prefixes : iterable
+            Prefixes to consider
+
+        Returns
+        -------
+        tuple of ints
+            The start offsets of the R1 and R2 regions
+
+        Examples
+        --------
+        >>> sb = _Snowball()
+        >>> sb._sb_regions('beautiful')
+        (5, 7)
+        >>> sb._sb_regions('generously', {'gener'})
+        (5, 8)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        r1_start = self._sb_r1(term, r1_prefixes)
+        return r1_start, self._sb_region_end(term, r1_start)
+
     def _sb_r2(
         self, term: str, r1_prefixes: Optional[Iterable[str]] = None
     ) -> int:
@@ -94,8 +154,7 @@ class _Snowball(_Stemmer):
             Encapsulated in class
 
         """
-        r1_start = self._sb_r1(term, r1_prefixes)
-        return r1_start + self._sb_r1(term[r1_start:])
+        return self._sb_regions(term, r1_prefixes)[1]
 
     def _sb_ends_in_short_syllable(self, term: str) -> bool:
         """Return True iff term ends in a short syllable.
@@ -186,10 +245,36 @@ class _Snowball(_Stemmer):
             Encapsulated in class
 
         """
-        for letter in term:
-            if letter in self._vowels:
-                return True
-        return False
+        return self._sb_first_vowel(term) < len(term)
+
+    def _sb_first_vowel(self, term: str) -> int:
+        """Return the offset of the first vowel in term.
+
+        Since the Snowball steps only remove or replace suffixes, the prefix
+        of a word before a candidate suffix is unchanged from the start of
+        stemming and a single offset answers whether any such prefix contains
+        a vowel.
+
+        Parameters
+        ----------
+        term : str
+            The term to examine
+
+        Returns
+        -------
+        int
+            The offset of the first vowel, or the length of the term if it
+            has none
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        vowels = self._vowels
+        for i, letter in enumerate(term):
+            if letter in vowels:
+                return i
+        return len(term)
 
 
 if __name__ == '__main__':
@@ -94,73 +94,79 @@ class SnowballDanish(_Snowball):
         r1_start = min(max(3, self._sb_r1(word)), len(word))
 
         # Step 1
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'erendes':
+        if word.endswith('erendes', r1_start):
             word = word[:-7]
-        elif _r1[-6:] in {'erende', 'hedens'}:
+        elif word.endswith(('erende', 'hedens'), r1_start):
             word = word[:-6]
-        elif _r1[-5:] in {
-            'ethed',
-            'erede',
-            'heden',
-            'heder',
-            'endes',
-            'ernes',
-            'erens',
-            'erets',
-        }:
+        elif word.endswith(
+            (
+                'ethed',
+                'erede',
+                'heden',
+                'heder',
+                'endes',
+                'ernes',
+                'erens',
+                'erets',
+            ),
+            r1_start,
+        ):
             word = word[:-5]
-        elif _r1[-4:] in {
-            'ered',
-            'ende',
-            'erne',
-            'eren',
-            'erer',
-            'heds',
-            'enes',
-            'eres',
-            'eret',
-        }:
+        elif word.endswith(
+            (
+                'ered',
+                'ende',
+                'erne',
+                'eren',
+                'erer',
+                'heds',
+                'enes',
+                'eres',
+                'eret',
+            ),
+            r1_start,
+        ):
             word = word[:-4]
-        elif _r1[-3:] in {'hed', 'ene', 'ere', 'ens', 'ers', 'ets'}:
+        elif word.endswith(
+            ('hed', 'ene', 'ere', 'ens', 'ers', 'ets'), r1_start
+        ):
             word = word[:-3]
-        elif _r1[-2:] in {'en', 'er', 'es', 'et'}:
+        elif word.endswith(('en', 'er', 'es', 'et'), r1_start):
             word = word[:-2]
-        elif _r1[-1:] == 'e':
+        elif word.endswith('e', r1_start):
             word = word[:-1]
-        elif _r1[-1:] == 's':
+        elif word.endswith('s', r1_start):
             if len(word) > 1 and word[-2] in self._s_endings:
                 word = word[:-1]
 
         # Step 2
-        if word[r1_start:][-2:] in {'gd', 'dt', 'gt', 'kt'}:
+        if word.endswith(('gd', 'dt', 'gt', 'kt'), r1_start):
             word = word[:-1]
 
         # Step 3
         if word[-4:] == 'igst':
             word = word[:-2]
 
-        _r1 = word[r1_start:]
         repeat_step2 = False
-        if _r1[-4:] == 'elig':
+        if word.endswith('elig', r1_start):
             word = word[:-4]
             repeat_step2 = True
-        elif _r1[-4:] == 'løst':
+        elif word.endswith('løst', r1_start):
             word = word[:-1]
-        elif _r1[-3:] in {'lig', 'els'}:
+        elif word.endswith(('lig', 'els'), r1_start):
             word = word[:-3]
             repeat_step2 = True
-        elif _r1[-2:] == 'ig':
+        elif word.endswith('ig', r1_start):
             word = word[:-2]
             repeat_step2 = True
 
         if repeat_step2:
-            if word[r1_start:][-2:] in {'gd', 'dt', 'gt', 'kt'}:
+            if word.endswith(('gd', 'dt', 'gt', 'kt'), r1_start):
                 word = word[:-1]
 
         # Step 4
         if (
-            len(word[r1_start:]) >= 1
+            len(word) - r1_start >= 1
             and len(word) >= 2
             and word[-1] == word[-2]
             and word[-1] not in self._vowels
@@ -38,6 +38,7 @@ class SnowballGerman(_Snowball):
     _vowels = {'a', 'e', 'i', 'o', 'u', 'y', 'ä', 'ö', 'ü'}
     _s_endings = {'b', 'd', 'f', 'g', 'h', 'k', 'l', 'm', 'n', 'r', 't'}
     _st_endings = {'b', 'd', 'f', 'g', 'h', 'k', 'l', 'm', 'n', 't'}
+    _lowercase = dict(zip((ord(_) for _ in 'YUäöü'), 'yuaou'))
 
     def __init__(self, alternate_vowels: bool = False) -> None:
         """Initialize SnowballGerman instance.
@@ -86,13 +87,15 @@ class SnowballGerman(_Snowball):
         word = normalize('NFC', word.lower())
         word = word.replace('ß', 'ss')
 
-        if len(word) > 2:
-            for i in range(2, len(word)):
-                if word[i] in self._vowels and word[i - 2] in self._vowels:
-                    if word[i - 1] == 'u':
-                        word = word[: i - 1] + 'U' + word[i:]
-                    elif word[i - 1] == 'y':
-                        word = word[: i - 1] + 'Y' + word[i:]
+        if len(word) > 2 and ('u' in word or 'y' in word):
+            buffer = list(word)
+            for i in range(2, len(buffer)):
+                if buffer[i] in self._vowels and buffer[i - 2] in self._vowels:
+                    if buffer[i - 1] == 'u':
+                        buffer[i - 1] = 'U'
+                    elif buffer[i - 1] == 'y':
+                        buffer[i - 1] = 'Y'
+            word = ''.join(buffer)
 
         if self._alternate_vowels:
             word = word.replace('ae', 'ä')
@@ -101,35 +104,35 @@ class SnowballGerman(_Snowball):
             word = word.replace('ue', 'ü')
             word = word.replace('Q', 'que')
 
-        r1_start = max(3, self._sb_r1(word))
-        r2_start = self._sb_r2(word)
+        r1_start, r2_start = self._sb_regions(word)
+        r1_start = max(3, r1_start)
 
         # Step 1
         niss_flag = False
         if word[-3:] == 'ern':
-            if len(word[r1_start:]) >= 3:
+            if len(word) - r1_start >= 3:
                 word = word[:-3]
         elif word[-2:] == 'em':
-            if len(word[r1_start:]) >= 2:
+            if len(word) - r1_start >= 2:
                 word = word[:-2]
         elif word[-2:] == 'er':
-            if len(word[r1_start:]) >= 2:
+            if len(word) - r1_start >= 2:
                 word = word[:-2]
         elif word[-2:] == 'en':
-            if len(word[r1_start:]) >= 2:
+            if len(word) - r1_start >= 2:
                 word = word[:-2]
                 niss_flag = True
         elif word[-2:] == 'es':
-            if len(word[r1_start:]) >= 2:
+            if len(word) - r1_start >= 2:
                 word = word[:-2]
                 niss_flag = True
         elif word[-1:] == 'e':
-            if len(word[r1_start:]) >= 1:
+            if len(word) - r1_start >= 1:
                 word = word[:-1]
                 niss_flag = True
         elif word[-1:] == 's':
             if (
-                len(word[r1_start:]) >= 1
+                len(word) - r1_start >= 1
                 and len(word) >= 2
                 and word[-2] in self._s_endings
             ):
@@ -140,17 +143,17 @@ class SnowballGerman(_Snowball):
 
         # Step 2
         if word[-3:] == 'est':
-            if len(word[r1_start:]) >= 3:
+            if len(word) - r1_start >= 3:
                 word = word[:-3]
         elif word[-2:] == 'en':
-            if len(word[r1_start:]) >= 2:
+            if len(word) - r1_start >= 2:
                 word = word[:-2]
         elif word[-2:] == 'er':
-            if len(word[r1_start:]) >= 2:
+            if len(word) - r1_start >= 2:
                 word = word[:-2]
         elif word[-2:] == 'st':
             if (
-                len(word[r1_start:]) >= 2
+                len(word) - r1_start >= 2
                 and len(word) >= 6
                 and word[-3] in self._st_endings
             ):
@@ -158,43 +161,36 @@ class SnowballGerman(_Snowball):
 
         # Step 3
         if word[-4:] == 'isch':
-            if len(word[r2_start:]) >= 4 and word[-5] != 'e':
+            if len(word) - r2_start >= 4 and word[-5] != 'e':
                 word = word[:-4]
         elif word[-4:] in {'lich', 'heit'}:
-            if len(word[r2_start:]) >= 4:
+            if len(word) - r2_start >= 4:
                 word = word[:-4]
-                if word[-2:] in {'er', 'en'} and len(word[r1_start:]) >= 2:
+                if word[-2:] in {'er', 'en'} and len(word) - r1_start >= 2:
                     word = word[:-2]
         elif word[-4:] == 'keit':
-            if len(word[r2_start:]) >= 4:
+            if len(word) - r2_start >= 4:
                 word = word[:-4]
-                if word[-4:] == 'lich' and len(word[r2_start:]) >= 4:
+                if word[-4:] == 'lich' and len(word) - r2_start >= 4:
                     word = word[:-4]
-                elif word[-2:] == 'ig' and len(word[r2_start:]) >= 2:
+                elif word[-2:] == 'ig' and len(word) - r2_start >= 2:
                     word = word[:-2]
         elif word[-3:] in {'end', 'ung'}:
-            if len(word[r2_start:]) >= 3:
+            if len(word) - r2_start >= 3:
                 word = word[:-3]
                 if (
                     word[-2:] == 'ig'
-                    and len(word[r2_start:]) >= 2
+                    and len(word) - r2_start >= 2
                     and word[-3] != 'e'
                 ):
                     word = word[:-2]
         elif word[-2:] in {'ig', 'ik'}:
-            if len(word[r2_start:]) >= 2 and word[-3] != 'e':
+            if len(word) - r2_start >= 2 and word[-3] != 'e':
                 word = word[:-2]
 
-        # Change 'Y' and 'U' back to lowercase if survived stemming
-        for i in range(0, len(word)):
-            if word[i] == 'Y':
-                word = word[:i] + 'y' + word[i + 1 :]
-            elif word[i] == 'U':
-                word = word[:i] + 'u' + word[i + 1 :]
-
-        # Remove umlauts
-        _umlauts = dict(zip((ord(_) for _ in 'äöü'), 'aou'))
-        word = word.translate(_umlauts)
+        # Change 'Y' and 'U' back to lowercase if survived stemming & remove
+        # umlauts
+        word = word.translate(self._lowercase)
 
         return word
 
@@ -91,38 +91,30 @@ class SnowballNorwegian(_Snowball):
         r1_start = min(max(3, self._sb_r1(word)), len(word))
 
         # Step 1
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'hetenes':
+        if word.endswith('hetenes', r1_start):
             word = word[:-7]
-        elif _r1[-6:] in {'hetene', 'hetens'}:
+        elif word.endswith(('hetene', 'hetens'), r1_start):
             word = word[:-6]
-        elif _r1[-5:] in {'heten', 'heter', 'endes'}:
+        elif word.endswith(('heten', 'heter', 'endes'), r1_start):
             word = word[:-5]
-        elif _r1[-4:] in {'ande', 'ende', 'edes', 'enes', 'erte'}:
+        elif word.endswith(('ande', 'ende', 'edes', 'enes', 'erte'), r1_start):
             if word[-4:] == 'erte':
                 word = word[:-2]
             else:
                 word = word[:-4]
-        elif _r1[-3:] in {
-            'ede',
-            'ane',
-            'ene',
-            'ens',
-            'ers',
-            'ets',
-            'het',
-            'ast',
-            'ert',
-        }:
+        elif word.endswith(
+            ('ede', 'ane', 'ene', 'ens', 'ers', 'ets', 'het', 'ast', 'ert'),
+            r1_start,
+        ):
             if word[-3:] == 'ert':
                 word = word[:-1]
             else:
                 word = word[:-3]
-        elif _r1[-2:] in {'en', 'ar', 'er', 'as', 'es', 'et'}:
+        elif word.endswith(('en', 'ar', 'er', 'as', 'es', 'et'), r1_start):
             word = word[:-2]
-        elif _r1[-1:] in {'a', 'e'}:
+        elif word.endswith(('a', 'e'), r1_start):
             word = word[:-1]
-        elif _r1[-1:] == 's':
+        elif word.endswith('s', r1_start):
             if (len(word) > 1 and word[-2] in self._s_endings) or (
                 len(word) > 2
                 and word[-2] == 'k'
@@ -131,18 +123,17 @@ class SnowballNorwegian(_Snowball):
                 word = word[:-1]
 
         # Step 2
-        if word[r1_start:][-2:] in {'dt', 'vt'}:
+        if word.endswith(('dt', 'vt'), r1_start):
             word = word[:-1]
 
         # Step 3
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'hetslov':
+        if word.endswith('hetslov', r1_start):
             word = word[:-7]
-        elif _r1[-4:] in {'eleg', 'elig', 'elov', 'slov'}:
+        elif word.endswith(('eleg', 'elig', 'elov', 'slov'), r1_start):
             word = word[:-4]
-        elif _r1[-3:] in {'leg', 'eig', 'lig', 'els', 'lov'}:
+        elif word.endswith(('leg', 'eig', 'lig', 'els', 'lov'), r1_start):
             word = word[:-3]
-        elif _r1[-2:] == 'ig':
+        elif word.endswith('ig', r1_start):
             word = word[:-2]
 
         return word
@@ -91,58 +91,66 @@ class SnowballSwedish(_Snowball):
         r1_start = min(max(3, self._sb_r1(word)), len(word))
 
         # Step 1
-        _r1 = word[r1_start:]
-        if _r1[-7:] == 'heterna':
+        if word.endswith('heterna', r1_start):
             word = word[:-7]
-        elif _r1[-6:] == 'hetens':
+        elif word.endswith('hetens', r1_start):
             word = word[:-6]
-        elif _r1[-5:] in {
-            'anden',
-            'heten',
-            'heter',
-            'arnas',
-            'ernas',
-            'ornas',
-            'andes',
-            'arens',
-            'andet',
-        }:
+        elif word.endswith(
+            (
+                'anden',
+                'heten',
+                'heter',
+                'arnas',
+                'ernas',
+                'ornas',
+                'andes',
+                'arens',
+                'andet',
+            ),
+            r1_start,
+        ):
             word = word[:-5]
-        elif _r1[-4:] in {
-            'arna',
-            'erna',
-            'orna',
-            'ande',
-            'arne',
-            'aste',
-            'aren',
-            'ades',
-            'erns',
-        }:
+        elif word.endswith(
+            (
+                'arna',
+                'erna',
+                'orna',
+                'ande',
+                'arne',
+                'aste',
+                'aren',
+                'ades',
+                'erns',
+            ),
+            r1_start,
+        ):
             word = word[:-4]
-        elif _r1[-3:] in {'ade', 'are', 'ern', 'ens', 'het', 'ast'}:
+        elif word.endswith(
+            ('ade', 'are', 'ern', 'ens', 'het', 'ast'), r1_start
+        ):
             word = word[:-3]
-        elif _r1[-2:] in {'ad', 'en', 'ar', 'er', 'or', 'as', 'es', 'at'}:
+        elif word.endswith(
+            ('ad', 'en', 'ar', 'er', 'or', 'as', 'es', 'at'), r1_start
+        ):
             word = word[:-2]
-        elif _r1[-1:] in {'a', 'e'}:
+        elif word.endswith(('a', 'e'), r1_start):
             word = word[:-1]
-        elif _r1[-1:] == 's':
+        elif word.endswith('s', r1_start):
             if len(word) > 1 and word[-2] in self._s_endings:
                 word = word[:-1]
 
         # Step 2
-        if word[r1_start:][-2:] in {'dd', 'gd', 'nn', 'dt', 'gt', 'kt', 'tt'}:
+        if word.endswith(('dd', 'gd', 'nn', 'dt', 'gt', 'kt', 'tt'), r1_start):
             word = word[:-1]
 
         # Step 3
-        _r1 = word[r1_start:]
-        if _r1[-5:] == 'fullt':
+        if word.endswith('fullt', r1_start):
             word = word[:-1]
-        elif _r1[-4:] == 'löst':
+        elif word.endswith('löst', r1_start):
             word = word[:-1]
-        elif _r1[-3:] in {'lig', 'els'}:
+        elif word.endswith(('lig', 'els'), r1_start):
             word = word[:-3]
-        elif _r1[-2:] == 'ig':
+        elif word.endswith('ig', r1_start):
             word = word[:-2]
 
         return word
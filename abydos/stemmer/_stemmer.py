@@ -19,6 +19,13 @@
 abstract class _Stemmer
 """
 
+from itertools import islice
+from multiprocessing import Pool
+from os import cpu_count
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from ..util._lru_cache import _LRUCache
+
 __all__ = ['_Stemmer']
 
 
@@ -28,6 +35,11 @@ class _Stemmer:
     .. versionadded:: 0.3.6
     """
 
+    # The number of distinct words whose stems stem_cached retains
+    _cache_size = 2 ** 16
+    # The number of tokens stem_many reads & stems at a time
+    _batch_size = 2 ** 16
+
     def stem(self, word: str) -> str:
         """Return stem.
 
@@ -47,6 +59,159 @@ class _Stemmer:
         """
         return word
 
+    def stem_cached(self, word: str) -> str:
+        """Return stem, caching recently stemmed words.
+
+        The cache keeps the stems of the most recently used words, up to
+        ``_cache_size`` distinct words, and belongs to the stemmer instance.
+
+        Parameters
+        ----------
+        word : str
+            The word to stem
+
+        Returns
+        -------
+        str
+            Word stem
+
+        Examples
+        --------
+        >>> from abydos.stemmer import Porter
+        >>> stmr = Porter()
+        >>> stmr.stem_cached('democracy')
+        'democraci'
+        >>> stmr.stem_cached('democracy')
+        'democraci'
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            cache = self.__dict__['_stem_cache']
+        except KeyError:
+            cache = self.__dict__['_stem_cache'] = _LRUCache(self._cache_size)
+        return cache(self.stem, word)
+
+    def stem_many(
+        self, tokens: Iterable[str], n_jobs: Optional[int] = None
+    ) -> Iterator[str]:
+        """Iterate over the stems of a stream of tokens.
+
+        The tokens are read & stemmed in batches of ``_batch_size`` tokens,
+        so a stream of any length is stemmed in bounded memory. Each distinct
+        token of a batch is stemmed only once and the stems are mapped back
+        onto the batch's tokens, preserving their order.
+
+        Parameters
+        ----------
+        tokens : iterable of str
+            The tokens to stem
+        n_jobs : int or None
+            The number of worker processes to stem distinct tokens with; None
+            or 1 stems them in this process (using :py:meth:`stem_cached`)
+            and -1 uses one worker per CPU
+
+        Returns
+        -------
+        iterator of str
+            The stems of the tokens, in order
+
+        Raises
+        ------
+        ValueError
+            n_jobs must be None, a positive int, or -1
+
+        Examples
+        --------
+        >>> from abydos.stemmer import Porter
+        >>> stmr = Porter()
+        >>> list(stmr.stem_many(['trusted', 'democracy', 'trusted']))
+        ['trust', 'democraci', 'trust']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if n_jobs is not None and (n_jobs == 0 or n_jobs < -1):
+            raise ValueError(
+                'n_jobs must be None, a positive int, or -1 (one worker per '
+                'CPU), not {}.'.format(n_jobs)
+            )
+        return self._stem_batches(iter(tokens), n_jobs)
+
+    def _stem_batches(
+        self, tokens: Iterator[str], n_jobs: Optional[int]
+    ) -> Iterator[str]:
+        """Iterate over the stems of a stream of tokens, a batch at a time.
+
+        Parameters
+        ----------
+        tokens : iterator of str
+            The tokens to stem
+        n_jobs : int or None
+            The number of worker processes to stem distinct tokens with, as
+            in :py:meth:`stem_many`
+
+        Yields
+        ------
+        str
+            The stems of the tokens, in order
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        processes = 1
+        if n_jobs is not None and n_jobs != 1:
+            processes = (cpu_count() or 1) if n_jobs == -1 else n_jobs
+        pool = None
+        try:
+            while True:
+                batch = list(islice(tokens, self._batch_size))
+                if not batch:
+                    return
+                types = list(dict.fromkeys(batch))
+
+                if processes == 1 or len(types) < 2:
+                    stems = {word: self.stem_cached(word) for word in types}
+                else:
+                    if pool is None:
+                        pool = Pool(processes)
+                    stems = dict(
+                        zip(
+                            types,
+                            pool.map(
+                                self.stem,
+                                types,
+                                chunksize=-(-len(types) // (4 * processes)),
+                            ),
+                        )
+                    )
+
+                for word in batch:
+                    yield stems[word]
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the stemmer's state for pickling, without its cache.
+
+        Returns
+        -------
+        dict
+            The instance attributes
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        state = self.__dict__.copy()
+        state.pop('_stem_cache', None)
+        return state
+
 
 if __name__ == '__main__':
     import doctest
@@ -0,0 +1,101 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.stemmer._suffix_trie.
+
+Reversed-suffix trie for matching stemmer rule tables
+"""
+
+from typing import Any, Dict, Iterable, List
+
+__all__ = ['_SuffixTrie']
+
+
+class _SuffixTrie:
+    """Reversed-suffix trie.
+
+    The suffixes are stored back to front, so every suffix that ends a word
+    is found in a single backward scan of the word.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, suffixes: Iterable[str]) -> None:
+        """Initialize _SuffixTrie instance.
+
+        Parameters
+        ----------
+        suffixes : iterable of str
+            The suffixes to match
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._root = {}  # type: Dict[str, Any]
+        for suffix in suffixes:
+            node = self._root
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            # The empty key (never a character of a word) marks the end of a
+            # suffix and holds the suffix itself
+            node[''] = suffix
+
+    def matches(self, word: str, min_stem: int = 0) -> List[str]:
+        """Return the suffixes that end a word, longest first.
+
+        Parameters
+        ----------
+        word : str
+            The word to match
+        min_stem : int
+            The minimum number of characters that must precede a suffix
+
+        Returns
+        -------
+        list of str
+            The matching suffixes, longest first
+
+        Examples
+        --------
+        >>> trie = _SuffixTrie(('s', 'es', 'ies', 'ing'))
+        >>> trie.matches('flies')
+        ['ies', 'es', 's']
+        >>> trie.matches('flies', min_stem=3)
+        ['es', 's']
+        >>> trie.matches('fly')
+        []
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        found = []
+        node = self._root
+        for pos in range(len(word) - 1, min_stem - 1, -1):
+            node = node.get(word[pos])
+            if node is None:
+                break
+            if '' in node:
+                found.append(node[''])
+        found.reverse()
+        return found
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
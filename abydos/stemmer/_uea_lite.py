@@ -19,10 +19,12 @@
 UEA-Lite stemmer
 """
 
+from itertools import chain
 from re import match as re_match
 from typing import Dict, Optional, Tuple
 
 from ._stemmer import _Stemmer
+from ._suffix_trie import _SuffixTrie
 
 __all__ = ['UEALite']
 
@@ -609,6 +611,11 @@ class UEALite(_Stemmer):
         'Perl': _perl_rule_table,
     }  # type: Dict[str, Dict[int, Dict[str, Tuple[float, int, Optional[str]]]]]
 
+    _rule_tries = {
+        var: _SuffixTrie(chain.from_iterable(table.values()))
+        for var, table in _rules.items()
+    }
+
     def __init__(
         self,
         max_word_length: int = 20,
@@ -778,18 +785,18 @@ class UEALite(_Stemmer):
                 ):
                     return word, 97
 
-            for n in range(7, 1, -1):
-                if word[-n:] in self._rules[self._var][n]:
-                    rule_no, del_len, add_str = self._rules[self._var][n][
-                        word[-n:]
-                    ]
-                    if del_len:
-                        stemmed_word = word[:-del_len]
-                    else:
-                        stemmed_word = word
-                    if add_str:
-                        stemmed_word += add_str
-                    break
+            endings = self._rule_tries[self._var].matches(word)
+            if endings:
+                ending = endings[0]
+                rule_no, del_len, add_str = self._rules[self._var][
+                    len(ending)
+                ][ending]
+                if del_len:
+                    stemmed_word = word[:-del_len]
+                else:
+                    stemmed_word = word
+                if add_str:
+                    stemmed_word += add_str
 
             if not rule_no:
                 if re_match(r'.*\w\wings?$', word):  # rule 58
@@ -19,7 +19,18 @@
 LegaliPy tokenizer class
 """
 
-from typing import Callable, Optional, Union
+import json
+from functools import lru_cache
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from ._tokenizer import _Tokenizer
 
@@ -33,6 +44,16 @@ except ImportError:  # pragma: no cover
     gen_onsets = None  # type: ignore
 
 
+@lru_cache(maxsize=1 << 16)
+def _legalipy(word: str, onsets: FrozenSet[str]) -> Tuple[str, ...]:
+    """Return the LegaliPy syllables of a word, caching them.
+
+    The cache is shared by every LegaliPyTokenizer; LegaliPy only tests
+    onsets for membership, so keying it by the frozen set of onsets is exact.
+    """
+    return tuple(LegaliPy(word, onsets))
+
+
 class LegaliPyTokenizer(_Tokenizer):
     """LegaliPy tokenizer.
 
@@ -74,6 +95,7 @@ class LegaliPyTokenizer(_Tokenizer):
         super(LegaliPyTokenizer, self).__init__(scaler)
 
         self._onsets = ['']
+        self._onset_set = frozenset(self._onsets)
 
     def train_onsets(
         self,
@@ -104,6 +126,58 @@ class LegaliPyTokenizer(_Tokenizer):
             self._onsets = list(set(self._onsets + new_onsets))
         else:
             self._onsets = new_onsets
+        self._onset_set = frozenset(self._onsets)
+
+    def save_onsets(self, filename: str) -> None:
+        """Save the onsets to a file.
+
+        The onsets are written as a JSON list, so that a tokenizer can be
+        given onsets trained on a large text without training it again.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to save the onsets to
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, 'w', encoding='utf-8') as onset_file:
+            json.dump(sorted(self._onsets), onset_file, ensure_ascii=False)
+
+    def load_onsets(self, filename: str, append: bool = False) -> None:
+        """Load onsets saved by :py:meth:`save_onsets`.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to load the onsets from
+        append : bool
+            If True, the current onset list is extended
+
+        Raises
+        ------
+        ValueError
+            The file does not hold a list of onsets
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        with open(filename, encoding='utf-8') as onset_file:
+            new_onsets = json.load(onset_file)
+        if not isinstance(new_onsets, list) or not all(
+            isinstance(onset, str) for onset in new_onsets
+        ):
+            raise ValueError(
+                '{} does not hold a list of onsets'.format(filename)
+            )
+        if append:
+            self._onsets = list(set(self._onsets + new_onsets))
+        else:
+            self._onsets = new_onsets
+        self._onset_set = frozenset(self._onsets)
 
     def tokenize(self, string: str, ipa: bool = False) -> 'LegaliPyTokenizer':
         """Tokenize the term and store it.
@@ -133,13 +207,53 @@ class LegaliPyTokenizer(_Tokenizer):
 
         self._ordered_tokens = []
         for word in string.split():
-            self._ordered_tokens += LegaliPy(word, self._onsets)
+            self._ordered_tokens += _legalipy(word, self._onset_set)
         if not self._ordered_tokens:
             self._ordered_tokens = [self._string]
 
         self._scale_and_counterize()
         return self
 
+    def tokenize_many(self, strings: Iterable[str]) -> List[List[str]]:
+        """Return the syllables of many strings.
+
+        Each distinct word of the strings is syllabified only once, and the
+        syllabifications are cached as by :py:meth:`tokenize`.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            The strings to tokenize
+
+        Returns
+        -------
+        list of lists of str
+            The syllables of each string, as :py:meth:`tokens` would return
+            them
+
+        Examples
+        --------
+        >>> LegaliPyTokenizer().tokenize_many(['nelson', 'nelson neilson'])
+        [['n', 'els', 'on'], ['n', 'els', 'on', 'n', 'eils', 'on']]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        syllables = {}  # type: Dict[str, Tuple[str, ...]]
+        tokens = []
+        for string in strings:
+            string_tokens = []  # type: List[str]
+            for word in string.split():
+                word_tokens = syllables.get(word)
+                if word_tokens is None:
+                    word_tokens = syllables[word] = _legalipy(
+                        word, self._onset_set
+                    )
+                string_tokens += word_tokens
+            tokens.append(string_tokens if string_tokens else [string])
+        return tokens
+
 
 if __name__ == '__main__':
     import doctest
@@ -20,12 +20,49 @@ QGrams multi-set class
 """
 
 from collections import Iterable
-from typing import Callable, Iterable as TIterable, Optional, Union, cast
+from typing import (
+    Callable,
+    Iterable as TIterable,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import numpy as np
 
 from ._tokenizer import _Tokenizer
 
 __all__ = ['QGrams']
 
+# Q-gram ids are base-(0x110000 + 1) numbers whose digits are the characters'
+# code points + 1, so that no digit is 0 and q-grams of different lengths
+# never coincide. Up to 3 digits fit in 64 bits, making the ids of q-grams up
+# to length 3 exact; longer q-grams wrap modulo 2**64, i.e. they are hashed.
+_ID_BASE = np.uint64(0x110001)
+
+
+def _exclusive_cumsum(values: np.ndarray) -> np.ndarray:
+    """Return the running totals of values, starting from 0."""
+    totals = np.zeros(len(values), dtype=np.int64)
+    np.cumsum(values[:-1], out=totals[1:])
+    return totals
+
+
+def _ranges(
+    starts: Union[int, np.ndarray], counts: Union[int, np.ndarray]
+) -> np.ndarray:
+    """Return the concatenated ranges starts[i] ... starts[i] + counts[i] - 1.
+
+    Either argument may be a scalar, applying to every range.
+    """
+    starts, counts = np.broadcast_arrays(starts, counts)
+    total = int(counts.sum())
+    range_starts = _exclusive_cumsum(counts)
+    return np.arange(total, dtype=np.int64) - np.repeat(
+        range_starts - starts, counts
+    )
+
 
 class QGrams(_Tokenizer):
     """A q-gram class, which functions like a bag/multiset.
@@ -190,6 +227,161 @@ class QGrams(_Tokenizer):
         self._scale_and_counterize()
         return self
 
+    def encode_array(self, string: str) -> np.ndarray:
+        """Return the ids of a string's q-grams as an array.
+
+        The q-grams are those that :py:meth:`tokenize` would produce, in the
+        same order, but each is represented by an integer id computed from the
+        string's code points with array arithmetic, so no q-gram is ever built
+        as a str. Start & stop symbols are added as code points, rather than
+        by concatenating strings.
+
+        Ids of q-grams up to length 3 are exact: two q-grams have the same id
+        if and only if they are the same string. Ids of longer q-grams are
+        64-bit polynomial hashes of their characters.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        numpy.ndarray
+            The q-gram ids, of dtype uint64
+
+        Examples
+        --------
+        >>> QGrams().encode_array('ABA')
+        array([41222247, 73531525, 74645637, 73531494], dtype=uint64)
+        >>> QGrams(qval=1).encode_array('ABA')
+        array([66, 67, 66], dtype=uint64)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self.tokenize_array((string,))[0]
+
+    def tokenize_array(
+        self, strings: TIterable[str]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the ids of many strings' q-grams as a flat array.
+
+        All of the strings are encoded together, in a fixed number of array
+        operations, so tokenizing a batch of short strings costs little more
+        per string than the ids themselves.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            The strings to tokenize
+
+        Returns
+        -------
+        tuple(numpy.ndarray, numpy.ndarray)
+            The concatenated q-gram ids of all the strings, as returned by
+            :py:meth:`encode_array`, and an array of offsets, of dtype int64
+            and one longer than the number of strings, such that the ids of
+            the i-th string are ``ids[offsets[i]:offsets[i + 1]]``
+
+        Examples
+        --------
+        >>> ids, offsets = QGrams(qval=1).tokenize_array(['AB', '', 'ABA'])
+        >>> ids
+        array([66, 67, 66, 67, 66], dtype=uint64)
+        >>> offsets
+        array([0, 2, 2, 5])
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        strings = list(strings)
+        lengths = np.fromiter(
+            (len(string) for string in strings), np.int64, len(strings)
+        )
+        digits = (
+            np.frombuffer(
+                ''.join(strings).encode('utf-32-le', 'surrogatepass'),
+                dtype='<u4',
+            ).astype(np.uint64)
+            + 1
+        )
+        starts = _exclusive_cumsum(lengths)
+        if self.start_stop:
+            start = np.uint64(ord(self.start_stop[0]) + 1)
+            stop = np.uint64(ord(self.start_stop[-1]) + 1)
+
+        qvals = self.qval if isinstance(self.qval, Iterable) else (self.qval,)
+        skips = self.skip if isinstance(self.skip, Iterable) else (self.skip,)
+
+        # Each (qval, skip) pair yields a run of q-grams per string, & each
+        # string's runs are concatenated in the order tokenize produces them
+        runs = []
+        totals = np.zeros(len(strings), dtype=np.int64)
+        for qval_i in cast(TIterable[int], qvals):
+            for skip_i in cast(TIterable[int], skips):
+                if qval_i < 1:
+                    continue
+
+                if self.start_stop:
+                    pad = qval_i - 1
+                    padded_lengths = lengths + 2 * pad
+                    padded_starts = _exclusive_cumsum(padded_lengths)
+                    padded = np.full(
+                        int(padded_lengths.sum()), start, dtype=np.uint64
+                    )
+                    padded[_ranges(padded_starts + pad + lengths, pad)] = stop
+                    padded[
+                        np.arange(len(digits))
+                        + np.repeat(padded_starts + pad - starts, lengths)
+                    ] = digits
+                else:
+                    padded_lengths = lengths
+                    padded_starts = starts
+                    padded = digits
+
+                counts = np.where(
+                    lengths > 0,
+                    np.maximum(padded_lengths - (qval_i - 1), 0),
+                    0,
+                )
+                firsts = np.repeat(padded_starts, counts) + _ranges(0, counts)
+                # As in tokenize, q-grams that would run past the end of a
+                # string (with skips) are truncated there
+                ends = np.repeat(padded_starts + padded_lengths, counts)
+
+                skip_i += 1
+                ids = np.zeros(len(firsts), dtype=np.uint64)
+                for pos in range(qval_i):
+                    chars = firsts + pos * skip_i
+                    within = chars < ends
+                    if within.all():
+                        ids *= _ID_BASE
+                        ids += padded[chars]
+                    elif within.any():
+                        ids[within] *= _ID_BASE
+                        ids[within] += padded[chars[within]]
+                    else:
+                        break
+
+                runs.append((ids, counts, totals.copy()))
+                totals += counts
+
+        offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+        np.cumsum(totals, out=offsets[1:])
+        if len(runs) == 1:
+            return runs[0][0], offsets
+
+        flat = np.zeros(offsets[-1], dtype=np.uint64)
+        for ids, counts, preceding in runs:
+            flat[
+                np.repeat(offsets[:-1] + preceding, counts)
+                + _ranges(0, counts)
+            ] = ids
+        return flat, offsets
+
 
 if __name__ == '__main__':
     import doctest
@@ -19,9 +19,22 @@
 Q-Skipgrams multi-set class
 """
 
-from collections import Iterable
+from collections import Iterable, defaultdict, deque
 from itertools import combinations
-from typing import Callable, Iterable as TIterable, Optional, Union, cast
+from math import exp, log1p, log2
+from typing import (
+    Callable,
+    DefaultDict,
+    Deque,
+    Dict,
+    Iterable as TIterable,
+    Iterator as TIterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from ._tokenizer import _Tokenizer
 
@@ -45,6 +58,8 @@ class QSkipgrams(_Tokenizer):
         start_stop: str = '$#',
         scaler: Optional[Union[str, Callable[[float], float]]] = None,
         ssk_lambda: Union[float, TIterable[float]] = 0.9,
+        max_gap: Optional[int] = None,
+        counts_only: bool = False,
     ) -> None:
         """Initialize QSkipgrams.
 
@@ -83,6 +98,19 @@ class QSkipgrams(_Tokenizer):
             characters according to the method described in :cite:`Lodhi:2002`.
             To supply multiple values of lambda, provide an Iterable of numeric
             values, such as (0.5, 0.05) or np.arange(0.05, 0.5, 0.05)
+        max_gap : int or None
+            The maximum number of characters that may be skipped between
+            consecutive characters of a skipgram; None places no limit on
+            gaps. Limiting gaps also limits the work of tokenizing to linear
+            in the length of the string.
+        counts_only : bool
+            If True, only the (weighted) counts of the skipgrams are computed,
+            by dynamic programming over the positions of the string and the
+            skipgram prefixes ending at them, rather than by enumerating every
+            combination of positions. This takes time proportional to the
+            length of the string times the number of distinct skipgram
+            prefixes, rather than to the number of skipgrams, but the ordered
+            list of skipgrams (from :py:meth:`get_list`) is left empty.
 
         Raises
         ------
@@ -137,7 +165,15 @@ class QSkipgrams(_Tokenizer):
         'TC': 0.531441, 'T#': 0.4782969000000001, 'GA': 1.5390000000000001,
         'GC': 0.6561, 'G#': 0.5904900000000001})
 
+        Limiting the gap between characters, here to at most one skipped
+        character, keeps only the nearer skipgrams:
+
+        >>> QSkipgrams(start_stop='', max_gap=1).tokenize('ABCD')
+        QSkipgrams({'AB': 1, 'AC': 1, 'BC': 1, 'BD': 1, 'CD': 1})
+
         .. versionadded:: 0.4.0
+        .. versionchanged:: 0.6.0
+            Added max_gap & counts_only parameters
 
         """
         super(QSkipgrams, self).__init__(scaler)
@@ -148,6 +184,9 @@ class QSkipgrams(_Tokenizer):
         if qval == 1:
             self.start_stop = ''
 
+        self._max_gap = max_gap
+        self._counts_only = counts_only
+
         self._string_ss = self._string
         if isinstance(ssk_lambda, float):
             self._lambda = (ssk_lambda,)  # type: TIterable[float]
@@ -172,6 +211,7 @@ class QSkipgrams(_Tokenizer):
         self._string = string
         self._ordered_tokens = []
         self._ordered_weights = []
+        counts = defaultdict(int)  # type: DefaultDict[str, float]
 
         if not isinstance(self.qval, Iterable):
             self.qval = (self.qval,)
@@ -197,7 +237,28 @@ class QSkipgrams(_Tokenizer):
             if len(string) > len(self._string_ss):
                 self._string_ss = string
 
-            combs = list(combinations(enumerate(string), qval_i))
+            if self._counts_only:
+                if self._scaler == 'SSK':
+                    for lambda_i in self._lambda:
+                        scale = lambda_i ** (qval_i - 1)
+                        for token, weight in self._count(
+                            string, qval_i, lambda_i
+                        ).items():
+                            counts[token] += scale * weight
+                else:
+                    for token, count in self._count(string, qval_i).items():
+                        counts[token] += count
+                continue
+
+            if self._max_gap is None:
+                combs = list(combinations(enumerate(string), qval_i))
+            else:
+                combs = [
+                    tuple((pos, string[pos]) for pos in positions)
+                    for positions in self._gapped_combinations(
+                        len(string), qval_i
+                    )
+                ]
             self._ordered_tokens += [''.join(l[1] for l in t) for t in combs]
 
             if self._scaler == 'SSK':
@@ -211,9 +272,177 @@ class QSkipgrams(_Tokenizer):
             else:
                 self._ordered_weights += [1] * len(combs)
 
+        if self._counts_only:
+            self._counterize_counts(counts)
+            return self
+
         self._scale_and_counterize()
         return self
 
+    def _gapped_combinations(
+        self, length: int, qval: int
+    ) -> TIterator[Tuple[int, ...]]:
+        """Yield the position tuples of skipgrams with limited gaps.
+
+        Parameters
+        ----------
+        length : int
+            The length of the string
+        qval : int
+            The skipgram length
+
+        Yields
+        ------
+        tuple of ints
+            Increasing positions, no two consecutive positions of which are
+            more than max_gap + 1 apart, in the same order as
+            :py:func:`itertools.combinations`
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        reach = cast(int, self._max_gap) + 1
+
+        def _extend(positions: Tuple[int, ...]) -> TIterator[Tuple[int, ...]]:
+            if len(positions) == qval:
+                yield positions
+                return
+            for pos in range(
+                positions[-1] + 1, min(positions[-1] + reach, length - 1) + 1
+            ):
+                yield from _extend(positions + (pos,))
+
+        for first in range(length):
+            yield from _extend((first,))
+
+    def _count(
+        self, string: str, qval: int, decay: float = 1
+    ) -> DefaultDict[str, float]:
+        """Return the weighted counts of the skipgrams of a string.
+
+        Each occurrence of a skipgram, spanning positions first to last, is
+        weighted by decay ** (last - first). The string is scanned once; at
+        each position, the skipgrams ending there are the extensions of the
+        (weighted) prefixes that end within reach before it, so no
+        combination of positions is enumerated.
+
+        Parameters
+        ----------
+        string : str
+            The string to count the skipgrams of
+        qval : int
+            The skipgram length
+        decay : float
+            The factor by which the weight of an occurrence decays with each
+            position it spans; with the default of 1, the counts are integers
+
+        Returns
+        -------
+        defaultdict
+            The skipgrams & their weighted counts
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        counts = defaultdict(int)  # type: DefaultDict[str, float]
+        if qval == 1:
+            for char in string:
+                counts[char] += 1
+            return counts
+
+        if self._max_gap is None:
+            # prefixes[k] holds the prefixes of length k + 1 ending before the
+            # current position, each weighted by decay ** (current - first)
+            prefixes = [
+                defaultdict(int) for _ in range(qval - 1)
+            ]  # type: List[DefaultDict[str, float]]
+            for char in string:
+                for token, weight in prefixes[-1].items():
+                    counts[token + char] += weight
+                for k in range(qval - 2, 0, -1):
+                    extended = prefixes[k]
+                    for token, weight in prefixes[k - 1].items():
+                        extended[token + char] += weight
+                prefixes[0][char] += 1
+                if decay != 1:
+                    for level in prefixes:
+                        for token in level:
+                            level[token] *= decay
+            return counts
+
+        # With gaps limited, only the prefixes ending at the last
+        # max_gap + 1 positions can be extended, so those are kept per
+        # position, each weighted by decay ** (position - first)
+        reach = self._max_gap + 1
+        decays = [decay ** dist for dist in range(reach + 1)]
+        windows = [
+            deque(maxlen=reach) for _ in range(qval - 1)
+        ]  # type: List[Deque[Dict[str, float]]]
+        for char in string:
+            ending = []  # type: List[Dict[str, float]]
+            for k in range(qval - 1):
+                if k == 0:
+                    ending.append({char: 1})
+                    continue
+                extended = defaultdict(int)  # type: DefaultDict[str, float]
+                for dist, level in enumerate(reversed(windows[k - 1]), 1):
+                    for token, weight in level.items():
+                        extended[token + char] += weight * decays[dist]
+                ending.append(extended)
+            for dist, level in enumerate(reversed(windows[-1]), 1):
+                for token, weight in level.items():
+                    counts[token + char] += weight * decays[dist]
+            for window, level in zip(windows, ending):
+                window.append(level)
+        return counts
+
+    def _counterize_counts(self, counts: DefaultDict[str, float]) -> None:
+        """Scale & store skipgram counts computed without an ordered list.
+
+        This mirrors :py:meth:`_Tokenizer._scale_and_counterize`, for which
+        each skipgram's weights or count are already summed.
+
+        Parameters
+        ----------
+        counts : defaultdict
+            The skipgrams & their (weighted) counts
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._scaler == 'SSK':
+            self._tokens = defaultdict(float)
+            self._tokens.update(counts)
+        elif self._scaler in {'length', 'length-log', 'length-exp'}:
+            if self._scaler == 'length-log':
+                scale = log1p  # type: Callable[[float], float]
+            elif self._scaler == 'length-exp':
+                scale = exp
+            else:
+                scale = float
+            self._tokens = defaultdict(float)
+            self._tokens.update(
+                {
+                    token: scale(len(token)) * count
+                    for token, count in counts.items()
+                }
+            )
+        elif self._scaler == 'entropy':
+            n = sum(counts.values())
+            self._tokens = defaultdict(float)
+            self._tokens.update(
+                {
+                    key: -(val / n) * log2(val / n)
+                    for key, val in counts.items()
+                }
+            )
+        else:
+            self._tokens = defaultdict(int)
+            self._tokens.update(counts)
+
 
 if __name__ == '__main__':
     import doctest
@@ -18,9 +18,20 @@
 
 Regexp tokenizer
 """
+import codecs
+import os
 import re
-
-from typing import Callable, Optional, Union
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Counter as TCounter,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from ._tokenizer import _Tokenizer
 
@@ -100,6 +111,155 @@ class RegexpTokenizer(_Tokenizer):
         self._scale_and_counterize()
         return self
 
+    def iter_tokens(
+        self,
+        source: Union[str, 'os.PathLike[str]', IO[Any]],
+        encoding: str = 'utf-8',
+        chunk_size: int = 1 << 20,
+        counter: Optional[TCounter[str]] = None,
+    ) -> Iterator[str]:
+        """Yield the tokens of a file, reading it a chunk at a time.
+
+        The tokens are those that :py:meth:`tokenize` would find in the whole
+        text of the file, in order, but at most one chunk of the text (plus
+        the text after the last token of the chunk before it) is held in
+        memory at a time, so files of any size may be tokenized.
+
+        The text after the last match in a chunk is held back & read again
+        with the start of the next chunk, as is a match that runs to the end
+        of a chunk, since it may continue into the next one.
+        Scalers are not applied to the yielded tokens.
+
+        Parameters
+        ----------
+        source : str, path-like, or file object
+            The path of a file to open with the given encoding, or a file
+            object opened in text or binary mode
+        encoding : str
+            The encoding of the file (ignored for file objects opened in text
+            mode)
+        chunk_size : int
+            The number of characters (or bytes, for binary file objects) to
+            read at a time
+        counter : Counter or None
+            A Counter to which the count of each token is added, one chunk at
+            a time, as the tokens are yielded; its keys are then the
+            vocabulary of the file
+
+        Yields
+        ------
+        str
+            The tokens of the file
+
+        Examples
+        --------
+        >>> import io
+        >>> text = io.StringIO('AA-CT-AG-AA-CD')
+        >>> tok = RegexpTokenizer(regexp=r'[^-]+')
+        >>> list(tok.iter_tokens(text, chunk_size=4))
+        ['AA', 'CT', 'AG', 'AA', 'CD']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, encoding=encoding) as fileobj:
+                yield from self._iter_file_tokens(
+                    fileobj, encoding, chunk_size, counter
+                )
+        else:
+            yield from self._iter_file_tokens(
+                source, encoding, chunk_size, counter
+            )
+
+    def _iter_file_tokens(
+        self,
+        fileobj: IO[Any],
+        encoding: str,
+        chunk_size: int,
+        counter: Optional[TCounter[str]],
+    ) -> Iterator[str]:
+        """Yield the tokens of an open file, reading it a chunk at a time.
+
+        Parameters
+        ----------
+        fileobj : file object
+            A file object opened in text or binary mode
+        encoding : str
+            The encoding of a binary file object
+        chunk_size : int
+            The number of characters or bytes to read at a time
+        counter : Counter or None
+            A Counter to which the count of each token is added
+
+        Yields
+        ------
+        str
+            The tokens of the file
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        decoder = None
+        carry = ''
+        while True:
+            chunk = fileobj.read(chunk_size)
+            final = not chunk
+            if isinstance(chunk, bytes):
+                if decoder is None:
+                    decoder = codecs.getincrementaldecoder(encoding)()
+                chunk = decoder.decode(chunk, final)
+
+            tokens, carry = self._split_chunk(carry + chunk, final)
+            yield from tokens
+            if counter is not None:
+                counter.update(tokens)
+            if final:
+                return
+
+    def _split_chunk(self, text: str, final: bool) -> Tuple[List[Any], str]:
+        """Split text into its complete tokens & the text they leave over.
+
+        Parameters
+        ----------
+        text : str
+            The text to tokenize
+        final : bool
+            True if no text follows, so that every token is complete
+
+        Returns
+        -------
+        tuple(list, str)
+            The tokens found by the regexp, except any that run to the end of
+            the text (unless it is final), & the text from which the next
+            search must resume
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if final:
+            return self._regexp.findall(text), ''
+
+        matches = list(self._regexp.finditer(text))
+        # the search resumes after the last match, or at the start of the
+        # matches that run to the end of the text, which the next chunk may
+        # extend (an empty match at the end may follow a non-empty one)
+        resume = matches[-1].end() if matches else 0
+        while matches and matches[-1].end() == len(text):
+            resume = matches.pop().start()
+
+        groups = self._regexp.groups
+        if not groups:
+            tokens = [match.group() for match in matches]  # type: List[Any]
+        elif groups == 1:
+            tokens = [match.groups('')[0] for match in matches]
+        else:
+            tokens = [match.groups('') for match in matches]
+        return tokens, text[resume:]
+
 
 if __name__ == '__main__':
     import doctest
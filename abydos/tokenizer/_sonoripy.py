@@ -19,7 +19,8 @@
 SonoriPy class
 """
 
-from typing import Callable, Optional, Union
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from ._tokenizer import _Tokenizer
 
@@ -31,6 +32,15 @@ except ImportError:  # pragma: no cover
     SonoriPy = None  # type: ignore
 
 
+@lru_cache(maxsize=1 << 16)
+def _sonoripy(word: str) -> Tuple[str, ...]:
+    """Return the SonoriPy syllables of a word, caching them.
+
+    The cache is shared by every SonoriPyTokenizer.
+    """
+    return tuple(SonoriPy(word))
+
+
 class SonoriPyTokenizer(_Tokenizer):
     """SonoriPy tokenizer.
 
@@ -98,13 +108,51 @@ class SonoriPyTokenizer(_Tokenizer):
 
         self._ordered_tokens = []
         for word in string.split():
-            self._ordered_tokens += SonoriPy(word)
+            self._ordered_tokens += _sonoripy(word)
         if not self._ordered_tokens:
             self._ordered_tokens = [self._string]
 
         self._scale_and_counterize()
         return self
 
+    def tokenize_many(self, strings: Iterable[str]) -> List[List[str]]:
+        """Return the syllables of many strings.
+
+        Each distinct word of the strings is syllabified only once, and the
+        syllabifications are cached as by :py:meth:`tokenize`.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            The strings to tokenize
+
+        Returns
+        -------
+        list of lists of str
+            The syllables of each string, as :py:meth:`tokens` would return
+            them
+
+        Examples
+        --------
+        >>> SonoriPyTokenizer().tokenize_many(['character', 'character set'])
+        [['cha', 'rac', 'ter'], ['cha', 'rac', 'ter', 'set']]
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        syllables = {}  # type: Dict[str, Tuple[str, ...]]
+        tokens = []
+        for string in strings:
+            string_tokens = []  # type: List[str]
+            for word in string.split():
+                word_tokens = syllables.get(word)
+                if word_tokens is None:
+                    word_tokens = syllables[word] = _sonoripy(word)
+                string_tokens += word_tokens
+            tokens.append(string_tokens if string_tokens else [string])
+        return tokens
+
 
 if __name__ == '__main__':
     import doctest
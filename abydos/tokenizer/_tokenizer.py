@@ -20,19 +20,25 @@ _Tokenizer base class
 """
 
 from collections import Counter, defaultdict
+from copy import copy
 from math import exp, log1p, log2
 from typing import (
     Any,
     Callable,
     Counter as TCounter,
     DefaultDict,
+    Dict,
+    Iterable,
     List,
     Optional,
     Set,
+    Tuple,
     Union,
     cast,
 )
 
+import numpy as np
+
 __all__ = ['_Tokenizer']
 
 
@@ -80,6 +86,7 @@ class _Tokenizer:
         self._string = ''
         self._ordered_tokens = []  # type: List[str]
         self._ordered_weights = []  # type: List[float]
+        self._vocabulary = None  # type: Optional[Dict[str, int]]
 
     def tokenize(self, string: str) -> '_Tokenizer':
         """Tokenize the term and store it.
@@ -107,6 +114,220 @@ class _Tokenizer:
         self._scale_and_counterize()
         return self
 
+    def tokens(self, string: str) -> List[str]:
+        """Return the tokens of a string as an ordered list.
+
+        Unlike :py:meth:`tokenize`, this leaves the tokenizer itself
+        unchanged, so a single tokenizer may be used by several threads at
+        once.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        list
+            The tokens, in the order :py:meth:`get_list` would return them
+
+        Examples
+        --------
+        >>> _Tokenizer().tokens('term')
+        ['term']
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tokenized(string).get_list()
+
+    def counts(self, string: str) -> TCounter[str]:
+        """Return the (scaled) token counts of a string as a Counter.
+
+        Unlike :py:meth:`tokenize`, this leaves the tokenizer itself
+        unchanged, so a single tokenizer may be used by several threads at
+        once.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        Counter
+            The Counter of tokens, as :py:meth:`get_counter` would return it
+
+        Examples
+        --------
+        >>> _Tokenizer().counts('term')
+        Counter({'term': 1})
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._tokenized(string).get_counter()
+
+    def fit_transform(
+        self, strings: Iterable[str]
+    ) -> Tuple[Dict[str, int], np.ndarray, np.ndarray, np.ndarray]:
+        """Learn the vocabulary of strings & return their count matrix.
+
+        Each string is tokenized as by :py:meth:`counts`, so the tokenizer's
+        scaler applies, and each distinct token is given the next column of
+        the matrix. The vocabulary is kept for :py:meth:`transform`.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            The strings to tokenize, one per row of the matrix
+
+        Returns
+        -------
+        tuple(dict, numpy.ndarray, numpy.ndarray, numpy.ndarray)
+            The vocabulary, mapping each token to its column, and the
+            document-term matrix in compressed sparse row form: its indptr
+            (of dtype int64, with row i in positions indptr[i] to
+            indptr[i + 1] of the other two), indices (the columns, of dtype
+            int64, ascending within each row), and data (the scaled counts, of
+            dtype float64), as accepted by ``scipy.sparse.csr_matrix((data,
+            indices, indptr))``
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import WhitespaceTokenizer
+        >>> tok = WhitespaceTokenizer()
+        >>> vocab, indptr, indices, data = tok.fit_transform(['a b a', 'b c'])
+        >>> vocab
+        {'a': 0, 'b': 1, 'c': 2}
+        >>> indptr, indices, data
+        (array([0, 2, 4]), array([0, 1, 1, 2]), array([2., 1., 1., 1.]))
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._vocabulary = {}
+        return (self._vocabulary,) + self._csr(strings, self._vocabulary, True)
+
+    def transform(
+        self, strings: Iterable[str]
+    ) -> Tuple[Dict[str, int], np.ndarray, np.ndarray, np.ndarray]:
+        """Return the count matrix of strings over the fitted vocabulary.
+
+        Tokens that are not in the vocabulary learnt by
+        :py:meth:`fit_transform` are left out of the matrix.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            The strings to tokenize, one per row of the matrix
+
+        Returns
+        -------
+        tuple(dict, numpy.ndarray, numpy.ndarray, numpy.ndarray)
+            The vocabulary and the document-term matrix in compressed sparse
+            row form, as from :py:meth:`fit_transform`
+
+        Raises
+        ------
+        ValueError
+            The tokenizer has not been fit
+
+        Examples
+        --------
+        >>> from abydos.tokenizer import WhitespaceTokenizer
+        >>> tok = WhitespaceTokenizer()
+        >>> vocab, *_ = tok.fit_transform(['a b a', 'b c'])
+        >>> tok.transform(['c d a'])
+        ({'a': 0, 'b': 1, 'c': 2}, array([0, 2]), array([0, 2]),
+        array([1., 1.]))
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        if self._vocabulary is None:
+            raise ValueError(
+                'The tokenizer must be fit with fit_transform before '
+                + 'transform can be used.'
+            )
+        return (self._vocabulary,) + self._csr(
+            strings, self._vocabulary, False
+        )
+
+    def _csr(
+        self, strings: Iterable[str], vocabulary: Dict[str, int], grow: bool
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the count matrix of strings in compressed sparse row form.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            The strings to tokenize, one per row of the matrix
+        vocabulary : dict
+            The mapping of tokens to columns
+        grow : bool
+            If True, tokens not in the vocabulary are added to it; otherwise
+            they are left out
+
+        Returns
+        -------
+        tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray)
+            The indptr, indices, and data arrays of the matrix
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        indptr = [0]
+        indices = []  # type: List[int]
+        data = []  # type: List[float]
+        for string in strings:
+            row = []
+            for token, count in self.counts(string).items():
+                column = vocabulary.get(token)
+                if column is None:
+                    if not grow:
+                        continue
+                    column = vocabulary[token] = len(vocabulary)
+                row.append((column, count))
+            row.sort()
+            indices.extend(column for column, _ in row)
+            data.extend(count for _, count in row)
+            indptr.append(len(indices))
+
+        return (
+            np.array(indptr, dtype=np.int64),
+            np.array(indices, dtype=np.int64),
+            np.array(data, dtype=np.float64),
+        )
+
+    def _tokenized(self, string: str) -> '_Tokenizer':
+        """Return a copy of the tokenizer that has tokenized a string.
+
+        Every tokenizer's tokenize method rebinds, rather than mutates, the
+        attributes it stores its results in, so a shallow copy shares nothing
+        with this tokenizer that tokenizing changes.
+
+        Parameters
+        ----------
+        string : str
+            The string to tokenize
+
+        Returns
+        -------
+        _Tokenizer
+            The tokenized copy
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return copy(self).tokenize(string)
+
     def _scale_and_counterize(self) -> None:
         """Scale the tokens and store them in a defaultdict.
 
@@ -289,4 +510,4 @@ class _Tokenizer:
 if __name__ == '__main__':
     import doctest
 
-    doctest.testmod()
+    doctest.testmod(optionflags=doctest.NORMALIZE_WHITESPACE)
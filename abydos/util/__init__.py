@@ -19,7 +19,11 @@
 The util module defines various utility functions for other modules within
 Abydos, including:
 
+    - _lru_cache -- a least-recently-used cache of a function's results that
+      holds no reference to the function
     - _prod -- computes the product of a collection of numbers (akin to sum)
+    - _string_table -- reads & writes the string tables & columns of
+      memory-mapped files
 
 These functions are not intended for use by users.
 """
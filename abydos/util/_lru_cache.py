@@ -0,0 +1,129 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._lru_cache.
+
+The util._lru_cache module defines _LRUCache, a least-recently-used cache of
+the results of a function that, unlike functools.lru_cache, holds no reference
+to the function.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Tuple
+
+__all__ = []  # type: List[str]
+
+
+class _LRUCache:
+    """A least-recently-used cache of the results of a function.
+
+    The function is passed on each call rather than wrapped, so an object can
+    keep a cache of one of its methods' results among its attributes without
+    the cache referring back to the object, and the object is freed by
+    reference counting alone.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize _LRUCache instance.
+
+        Parameters
+        ----------
+        maxsize : int
+            The number of results to retain
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = (
+            OrderedDict()
+        )  # type: OrderedDict[Tuple[Hashable, ...], Any]
+
+    def __call__(self, function: Callable[..., Any], *args: Hashable) -> Any:
+        """Return the result of a function, from the cache if possible.
+
+        Parameters
+        ----------
+        function : function
+            The function, which must be the same on every call
+        *args
+            The arguments to the function
+
+        Returns
+        -------
+        Any
+            The result of the function
+
+        Examples
+        --------
+        >>> cache = _LRUCache(2)
+        >>> cache(len, 'abc')
+        3
+        >>> cache(len, 'abc')
+        3
+        >>> cache.hits, cache.misses
+        (1, 1)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        try:
+            result = self._results[args]
+        except KeyError:
+            pass
+        else:
+            try:
+                self._results.move_to_end(args)
+            except KeyError:  # evicted by another thread
+                pass
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = function(*args)
+        self._results[args] = result
+        while len(self._results) > self.maxsize:
+            try:
+                self._results.popitem(last=False)
+            except KeyError:  # emptied by another thread
+                break
+        return result
+
+    def __len__(self) -> int:
+        """Return the number of results in the cache.
+
+        Returns
+        -------
+        int
+            The number of results
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return len(self._results)
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -0,0 +1,314 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.util._string_table.
+
+The util._string_table module defines the string tables & little-endian
+columns that Abydos's memory-mapped file formats are built from: a string
+table is a blob of UTF-8 encoded strings, concatenated, with a column of
+N + 1 offsets of the strings within the blob.
+"""
+
+import sys
+from array import array
+from typing import Any, BinaryIO, Iterable, List, Sequence, Tuple, Union
+
+__all__ = []  # type: List[str]
+
+# The size in bytes of an item of a column
+_ITEM_SIZE = 8
+
+
+def _encode(string: str) -> bytes:
+    """Return a string, UTF-8 encoded.
+
+    UTF-8 (with lone surrogates passed through) orders bytes by code point,
+    so the byte order of encoded strings matches the order of the strings.
+
+    Parameters
+    ----------
+    string : str
+        The string to encode
+
+    Returns
+    -------
+    bytes
+        The encoded string
+
+    Examples
+    --------
+    >>> _encode('zoë')
+    b'zo\\xc3\\xab'
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return string.encode('utf-8', 'surrogatepass')
+
+
+def _decode(data: Union[bytes, memoryview]) -> str:
+    """Return a string decoded by :py:func:`_encode`.
+
+    Parameters
+    ----------
+    data : bytes
+        The encoded string
+
+    Returns
+    -------
+    str
+        The string
+
+    Examples
+    --------
+    >>> _decode(b'zo\\xc3\\xab')
+    'zoë'
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    return bytes(data).decode('utf-8', 'surrogatepass')
+
+
+def _pack_strings(strings: Iterable[str]) -> Tuple[array, bytes]:
+    """Return the offsets & blob of a string table of strings.
+
+    Parameters
+    ----------
+    strings : iterable of str
+        The strings, in the order to store them in (sorted, if the table is
+        to be searched by :py:meth:`_StringTable.find`)
+
+    Returns
+    -------
+    tuple
+        The N + 1 offsets of the strings, as an unsigned 64-bit array, & the
+        encoded strings, concatenated
+
+    Examples
+    --------
+    >>> offsets, blob = _pack_strings(['ab', 'c', 'zoë'])
+    >>> offsets.tolist()
+    [0, 2, 3, 7]
+    >>> blob
+    b'abczo\\xc3\\xab'
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    encoded = [_encode(string) for string in strings]
+    offsets = array('Q', [0])
+    for string in encoded:
+        offsets.append(offsets[-1] + len(string))
+    return offsets, b''.join(encoded)
+
+
+def _write_columns(out: BinaryIO, columns: Iterable[array]) -> None:
+    """Write columns to a file, little-endian.
+
+    Parameters
+    ----------
+    out : file
+        The file to write to
+    columns : iterable of arrays
+        The columns
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    for column in columns:
+        if sys.byteorder != 'little':
+            column = array(column.typecode, column)
+            column.byteswap()
+        out.write(column.tobytes())
+
+
+def _view_columns(
+    buffer: Any, start: int, columns: Iterable[Tuple[int, str]]
+) -> Tuple[List[Sequence[Any]], int]:
+    """Return views of the little-endian columns of a buffer.
+
+    The columns are viewed in place, so every process that maps the same file
+    shares its pages; only big-endian machines need byte-swapped copies.
+
+    Parameters
+    ----------
+    buffer : mmap, bytes, etc.
+        The buffer, which must be long enough to hold the columns
+    start : int
+        The offset of the first column within the buffer
+    columns : iterable of (int, str) tuples
+        The length & 8-byte array typecode ('Q' or 'd') of each column
+
+    Returns
+    -------
+    tuple
+        The columns & the offset of the end of the last one
+
+    Examples
+    --------
+    >>> buffer = bytes([1, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0])
+    >>> columns, end = _view_columns(buffer, 0, [(1, 'Q'), (1, 'Q')])
+    >>> [list(column) for column in columns], end
+    ([[1], [2]], 16)
+
+
+    .. versionadded:: 0.6.0
+
+    """
+    views = []
+    for length, code in columns:
+        end = start + length * _ITEM_SIZE
+        view = memoryview(buffer)[start:end].cast(code)  # type: Any
+        if sys.byteorder != 'little':
+            view = array(code, view)
+            view.byteswap()
+        views.append(view)
+        start = end
+    return views, start
+
+
+class _StringTable:
+    """String table.
+
+    A read-only view of the strings of a string table within a buffer, by
+    index. A table whose strings are sorted by :py:func:`_encode` can be
+    searched by bisection with :py:meth:`find`.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self, buffer: Any, offsets: Sequence[int], start: int
+    ) -> None:
+        """Initialize _StringTable instance.
+
+        Parameters
+        ----------
+        buffer : mmap, bytes, etc.
+            The buffer holding the blob of the table
+        offsets : sequence of int
+            The N + 1 offsets of the strings within the blob
+        start : int
+            The offset of the blob within the buffer
+
+        Examples
+        --------
+        >>> offsets, blob = _pack_strings(['ab', 'c', 'zoë'])
+        >>> table = _StringTable(blob, offsets, 0)
+        >>> len(table), table[2], table.find('c'), table.find('d')
+        (3, 'zoë', 1, -1)
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        self._buffer = buffer
+        self._offsets = offsets
+        self._start = start
+        self._size = len(offsets) - 1
+
+    def __len__(self) -> int:
+        """Return the number of strings in the table.
+
+        Returns
+        -------
+        int
+            The number of strings
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._size
+
+    def __getitem__(self, index: int) -> str:
+        """Return a string of the table, by its index.
+
+        Parameters
+        ----------
+        index : int
+            The index of the string
+
+        Returns
+        -------
+        str
+            The string
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        start = self._start + self._offsets[index]
+        end = self._start + self._offsets[index + 1]
+        return _decode(self._buffer[start:end])
+
+    def end(self) -> int:
+        """Return the offset of the end of the blob within the buffer.
+
+        Returns
+        -------
+        int
+            The offset of the end of the blob
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        return self._start + self._offsets[self._size]
+
+    def find(self, string: str) -> int:
+        """Return the index of a string in a sorted table.
+
+        Parameters
+        ----------
+        string : str
+            The string to look up
+
+        Returns
+        -------
+        int
+            The index of the string, or -1 if it is not in the table
+
+
+        .. versionadded:: 0.6.0
+
+        """
+        key = _encode(string)
+        buffer = self._buffer
+        offsets = self._offsets
+        start = self._start
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = buffer[start + offsets[mid] : start + offsets[mid + 1]]
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+
+if __name__ == '__main__':
+    import doctest
+
+    doctest.testmod()
@@ -19,10 +19,15 @@
 This module contains unit tests for abydos.corpus.Corpus
 """
 
+import os
+import shutil
+import tempfile
 import unittest
+from math import log
+from unittest import mock
 
 from abydos.corpus import Corpus
-from abydos.tokenizer import QSkipgrams
+from abydos.tokenizer import QSkipgrams, WhitespaceTokenizer
 
 
 class CorpusTestCases(unittest.TestCase):
@@ -274,6 +279,153 @@ class CorpusTestCases(unittest.TestCase):
             wiki_idf_corpus.idf('A', lambda w: w.upper()), 0.69314718056
         )
 
+        # idf looks terms up in a table of document frequencies, which must
+        # agree with counting the documents containing each term
+        docs = self.sotu2015_corpus.docs_of_words()
+        terms = sorted(set(self.sotu2015_corpus.words())) + ['absent']
+        for transform in (None, str.lower, lambda w: w[:3]):
+            for term in terms:
+                docs_with_term = sum(
+                    term in {transform(w) if transform else w for w in doc}
+                    for doc in docs
+                )
+                self.assertEqual(
+                    self.sotu2015_corpus.doc_freqs(transform)[term],
+                    docs_with_term,
+                )
+            idfs = self.sotu2015_corpus.idf_many(terms, transform)
+            self.assertEqual(len(idfs), len(terms))
+            for term, idf in zip(terms, idfs):
+                self.assertAlmostEqual(
+                    idf, self.sotu2015_corpus.idf(term, transform)
+                )
+        self.assertEqual(self.sotu2015_corpus.idf_many([]).tolist(), [])
+
+        # the tables follow changes to the documents
+        corpus = Corpus('a b\n\nb c')
+        self.assertAlmostEqual(corpus.idf('d'), float('inf'))
+        corpus.corpus.append([['d']])
+        self.assertAlmostEqual(corpus.idf('d'), 1.09861228867)
+        self.assertAlmostEqual(corpus.idf('b'), 0.405465108108)
+        # a replaced document list is noticed, even if it has the same length
+        corpus.corpus = [[['a']], [['a']], [['c']]]
+        self.assertAlmostEqual(corpus.idf('a'), 0.405465108108)
+        # documents edited in place are noticed once the tables are
+        # invalidated
+        corpus = Corpus('a b\n\nc d')
+        self.assertAlmostEqual(corpus.idf('a'), 0.69314718056)
+        corpus.corpus[0] = [['x']]
+        corpus.invalidate()
+        self.assertEqual(corpus.idf('a'), float('inf'))
+        self.assertAlmostEqual(corpus.idf('x'), 0.69314718056)
+
+        self.assertEqual(Corpus().idf('a'), float('inf'))
+        self.assertEqual(Corpus().idf_many(['a']).tolist(), [float('inf')])
+
+    def test_corpus_from_files_iterable(self):
+        """Test abydos.corpus.Corpus.from_files & .from_iterable."""
+        kwargs = {
+            'filter_chars': '.?-;,:',
+            'stop_words': ('the', 'and', 'The'),
+            'word_tokenizer': WhitespaceTokenizer(),
+        }
+        expected = Corpus(self.sotu2015_sample, **kwargs)
+        docs = self.sotu2015_sample.split('\n\n')
+
+        tmpdir = tempfile.mkdtemp()
+        try:
+            paths = []
+            for i in range(3):
+                paths.append(os.path.join(tmpdir, '{}.txt'.format(i)))
+                with open(paths[-1], 'w', encoding='utf-8') as text:
+                    text.write('\n\n'.join(docs[i::3]))
+            by_file = [
+                doc
+                for i in range(3)
+                for doc in Corpus('\n\n'.join(docs[i::3]), **kwargs).docs()
+            ]
+
+            for corpus, expected_docs in (
+                (Corpus.from_iterable(docs, **kwargs), expected.docs()),
+                (Corpus.from_files(paths, **kwargs), by_file),
+                (
+                    Corpus.from_files(os.path.join(tmpdir, '*.txt'), **kwargs),
+                    by_file,
+                ),
+            ):
+                # every traversal reads the documents afresh
+                for _ in range(2):
+                    self.assertEqual(list(corpus.iter_docs()), expected_docs)
+                self.assertEqual(corpus.docs(), expected_docs)
+                self.assertEqual(corpus.paras(), expected_docs)
+                self.assertEqual(
+                    list(corpus.iter_sents()),
+                    [sent for doc in expected_docs for sent in doc],
+                )
+                self.assertEqual(
+                    list(corpus.iter_words()),
+                    [
+                        word
+                        for doc in expected_docs
+                        for sent in doc
+                        for word in sent
+                    ],
+                )
+                self.assertEqual(corpus.sents(), list(corpus.iter_sents()))
+                self.assertEqual(corpus.words(), list(corpus.iter_words()))
+                self.assertEqual(
+                    corpus.docs_of_words(), list(corpus.iter_docs_of_words()),
+                )
+                for term in ('Am', 'we', 'the', 'absent'):
+                    self.assertEqual(
+                        corpus.idf(term),
+                        Corpus.from_iterable(docs, **kwargs).idf(term),
+                    )
+                    self.assertEqual(corpus.idf(term), expected.idf(term))
+
+            # documents are split correctly however the files are chunked,
+            # including by doc_splits that straddle two chunks
+            for doc_split in ('\n\n', '. '):
+                expected = Corpus(
+                    self.sotu2015_sample, doc_split=doc_split, sent_split='?'
+                )
+                with open(paths[0], 'w', encoding='utf-8') as text:
+                    text.write(self.sotu2015_sample)
+                for chunk_size in (1, 3, 1 << 16):
+                    with mock.patch(
+                        'abydos.corpus._corpus._CHUNK_SIZE', chunk_size
+                    ):
+                        self.assertEqual(
+                            Corpus.from_files(
+                                paths[:1], doc_split=doc_split, sent_split='?'
+                            ).docs(),
+                            expected.docs(),
+                        )
+
+            # a one-off iterator can be traversed only once
+            corpus = Corpus.from_iterable(iter(docs))
+            self.assertEqual(len(corpus.docs()), len(docs))
+            self.assertEqual(corpus.docs(), [])
+
+            # the idf tables of a lazy corpus are rebuilt from its changed
+            # source once invalidated
+            source = ['a b', 'c d']
+            corpus = Corpus.from_iterable(source)
+            self.assertAlmostEqual(corpus.idf('a'), log(2))
+            source.append('a')
+            corpus.invalidate()
+            self.assertAlmostEqual(corpus.idf('a'), log(3 / 2))
+            with open(paths[0], 'w', encoding='utf-8') as text:
+                text.write('a b\n\nc d')
+            corpus = Corpus.from_files(paths[:1])
+            self.assertAlmostEqual(corpus.idf('a'), log(2))
+            with open(paths[0], 'a', encoding='utf-8') as text:
+                text.write('\n\na')
+            corpus.invalidate()
+            self.assertAlmostEqual(corpus.idf('a'), log(3 / 2))
+        finally:
+            shutil.rmtree(tmpdir)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,12 +19,24 @@
 This module contains unit tests for abydos.corpus._n_gram_corpus
 """
 
+import bz2
+import gzip
+import math
+import os
+import pickle  # noqa: S403
+import shutil
+import tempfile
 import unittest
 from collections import Counter
 
+import numpy as np
+
 from abydos.corpus import Corpus
 from abydos.corpus import NGramCorpus
 
+# noinspection PyProtectedMember
+from abydos.corpus._ngram_table import _NGramTable
+
 from .. import _corpus_file
 
 
@@ -188,6 +200,143 @@ class NGramCorpusTestCases(unittest.TestCase):
         self.assertEqual(self.simple_corpus.get_count('the'), 20)
         self.assertEqual(self.double_corpus.get_count('the'), 40)
 
+    def test_gng_import_many(self):
+        """Test abydos.corpus.NGramCorpus.gng_import_many."""
+        tmpdir = tempfile.mkdtemp()
+        try:
+            with open(
+                _corpus_file('simple-ngrams.txt'), encoding='utf-8'
+            ) as gng:
+                lines = gng.readlines()
+            paths = []
+            for i, opener in enumerate((open, gzip.open, bz2.open) * 2):
+                paths.append(os.path.join(tmpdir, str(i)))
+                with opener(paths[-1], 'wt', encoding='utf-8') as shard:
+                    shard.writelines(lines[i % 3 :: 3])
+
+            for n_jobs in (None, 2):
+                corpus = NGramCorpus()
+                corpus.gng_import_many(paths, n_jobs=n_jobs)
+                self.assertEqual(corpus.ngcorpus, self.double_corpus.ngcorpus)
+
+            checkpoint = os.path.join(tmpdir, 'checkpoint')
+
+            def _interrupt(done, total, path):
+                if done == 4:
+                    raise KeyboardInterrupt
+
+            corpus = NGramCorpus()
+            self.assertRaises(
+                KeyboardInterrupt,
+                corpus.gng_import_many,
+                os.path.join(tmpdir, '[0-9]'),
+                checkpoint=checkpoint,
+                progress=_interrupt,
+            )
+            corpus.gng_import_many(
+                os.path.join(tmpdir, '[0-9]'), checkpoint=checkpoint
+            )
+            self.assertEqual(corpus.ngcorpus, self.double_corpus.ngcorpus)
+            self.assertFalse(os.path.exists(checkpoint))
+        finally:
+            shutil.rmtree(tmpdir)
+
+    @staticmethod
+    def _ngrams(counter, prefix=()):
+        for word, value in counter.items():
+            if word is None:
+                yield prefix, value
+            else:
+                yield from NGramCorpusTestCases._ngrams(
+                    value, prefix + (word,)
+                )
+
+    def test_hashed(self):
+        """Test abydos.corpus.NGramCorpus with hashed n-gram tables."""
+        handle, path = tempfile.mkstemp('.ngt')
+        os.close(handle)
+        try:
+            for trie, args in (
+                (self.sotu_ngcorpus_uni, ()),
+                (self.sotu_ngcorpus_tri, (3, '<SOS>', '<EOS>')),
+                (self.sotu_ngcorpus_5, (5, '', '')),
+            ):
+                ngrams = dict(self._ngrams(trie.ngcorpus))
+                hashed = NGramCorpus(hashed=True)
+                hashed.corpus_importer(self.sotu2015_corpus, *args)
+                self.assertIsInstance(hashed.ngcorpus, _NGramTable)
+                self.assertEqual(len(hashed.ngcorpus), len(ngrams))
+                self.assertEqual(dict(hashed.ngcorpus.items()), ngrams)
+                for ngram, count in ngrams.items():
+                    self.assertEqual(hashed.get_count(list(ngram)), count)
+                    if all(ngram):
+                        self.assertEqual(
+                            hashed.get_count(' '.join(ngram)), count
+                        )
+                for ngram in ('', 'trolley', 'the trolley', 'the ' * 6):
+                    self.assertEqual(
+                        hashed.get_count(ngram), trie.get_count(ngram)
+                    )
+
+                # saved from either backend, & memory-mapped when loaded
+                for corpus in (trie, hashed):
+                    corpus.save_hashed(path)
+                    loaded = NGramCorpus()
+                    loaded.load_hashed(path)
+                    self.assertEqual(dict(loaded.ngcorpus.items()), ngrams)
+                    self.assertEqual(
+                        loaded.get_count('Tonight'), trie.get_count('Tonight'),
+                    )
+                    unpickled = pickle.loads(  # noqa: S301
+                        pickle.dumps(loaded)
+                    )
+                    self.assertEqual(dict(unpickled.ngcorpus.items()), ngrams)
+
+            # a loaded table can be added to without changing its file
+            loaded.gng_importer(_corpus_file('simple-ngrams.txt'))
+            self.assertEqual(
+                loaded.get_count('the'),
+                self.sotu_ngcorpus_5.get_count('the') + 20,
+            )
+            self.assertEqual(loaded.get_count('the quick'), 2)
+            loaded.load_hashed(path)
+            self.assertEqual(
+                loaded.get_count('the'), self.sotu_ngcorpus_5.get_count('the')
+            )
+
+            # an empty corpus
+            NGramCorpus(hashed=True).save_hashed(path)
+            loaded.load_hashed(path)
+            self.assertEqual(len(loaded.ngcorpus), 0)
+            self.assertEqual(loaded.get_count('the'), 0)
+
+            # files that are not hashed n-gram tables
+            with open(path, 'wb') as table:
+                table.write(b'short')
+            self.assertRaises(ValueError, loaded.load_hashed, path)
+            with open(path, 'wb') as table:
+                table.write(b'not an n-gram table, just some bytes')
+            self.assertRaises(ValueError, loaded.load_hashed, path)
+        finally:
+            del loaded, unpickled
+            os.remove(path)
+
+    def test_ngram_table(self):
+        """Test abydos.corpus._NGramTable."""
+        # enough n-grams to grow the table & flush several batches
+        table = _NGramTable()
+        expected = Counter()
+        for i in range(150000):
+            ngram = tuple(str(i * 7 % (j + 97)) for j in range(1 + i % 4))
+            table.add(ngram, i % 5)
+            expected[ngram] += i % 5
+        self.assertEqual(len(table), len(expected))
+        self.assertEqual(dict(table.items()), expected)
+        for ngram in list(expected)[::97]:
+            self.assertEqual(table.get(ngram), expected[ngram])
+        self.assertEqual(table.get(('0', '0', '0', '0', '0')), 0)
+        self.assertEqual(table.get(()), 0)
+
     def test_get_count(self):
         """Test abydos.corpus.NGramCorpus.get_count."""
         # string-style tests
@@ -200,6 +349,144 @@ class NGramCorpusTestCases(unittest.TestCase):
         self.assertEqual(self.simple_corpus.get_count(['the', 'quick']), 2)
         self.assertEqual(self.simple_corpus.get_count(['trolley']), 0)
 
+    def test_language_model(self):
+        """Test abydos.corpus.NGramCorpus language model queries."""
+        trie = self.sotu_ngcorpus_tri
+        hashed = NGramCorpus(hashed=True)
+        hashed.corpus_importer(self.sotu2015_corpus, 3, '<SOS>', '<EOS>')
+        vocabulary = {ngram[-1] for ngram, _ in trie._ngrams()}  # noqa: SF01
+
+        for context in (
+            None,
+            'we',
+            'will we',
+            ['Or', 'will', 'we'],
+            'trolley',
+            'the trolley',
+        ):
+            # Kneser-Ney & conditional probabilities sum to 1 over the words
+            self.assertAlmostEqual(
+                sum(trie.kneser_ney(word, context) for word in vocabulary), 1
+            )
+            if context not in ('trolley', 'the trolley'):
+                self.assertAlmostEqual(
+                    sum(
+                        trie.probability(word, context) for word in vocabulary
+                    ),
+                    1,
+                )
+            for word in ('we', 'will', 'economy', 'trolley'):
+                self.assertEqual(
+                    hashed.kneser_ney(word, context),
+                    trie.kneser_ney(word, context),
+                )
+                self.assertEqual(
+                    hashed.stupid_backoff(word, context),
+                    trie.stupid_backoff(word, context),
+                )
+                self.assertEqual(
+                    hashed.probability(word, context),
+                    trie.probability(word, context),
+                )
+
+        # the hashed corpus's statistics are kept over word ids, not tuples
+        trie_stats = trie._get_stats()  # noqa: SF01
+        hashed_stats = hashed._get_stats()  # noqa: SF01
+        self.assertEqual(hashed_stats.order, trie_stats.order)
+        self.assertEqual(hashed_stats.vocabulary, trie_stats.vocabulary)
+        for name in (
+            'totals',
+            'types',
+            'continuations',
+            'continuation_totals',
+            'continuation_types',
+        ):
+            counts = getattr(hashed_stats, name)
+            self.assertNotIsInstance(counts, Counter)
+            for ngram, count in getattr(trie_stats, name).items():
+                self.assertEqual(counts[ngram], count)
+                self.assertIn(ngram, counts)
+            self.assertNotIn(('we', 'trolley'), counts)
+            self.assertEqual(counts.get(('we', 'trolley'), -1), -1)
+
+        self.assertAlmostEqual(trie.probability('we', 'will'), 3 / 4)
+        self.assertAlmostEqual(trie.probability('we', 'Or will'), 1)
+        self.assertEqual(trie.probability('trolley', 'will'), 0)
+        self.assertAlmostEqual(trie.stupid_backoff('we', 'Or will'), 1)
+        self.assertAlmostEqual(
+            trie.stupid_backoff('economy', 'Or will'),
+            0.16 * trie.probability('economy'),
+        )
+        self.assertAlmostEqual(
+            trie.stupid_backoff('economy', 'Or will', alpha=0.5),
+            0.25 * trie.probability('economy'),
+        )
+        self.assertEqual(trie.stupid_backoff('trolley', 'Or will'), 0)
+        self.assertGreater(trie.kneser_ney('trolley', 'Or will'), 0)
+        self.assertGreater(
+            trie.kneser_ney('we', 'will'), trie.kneser_ney('economy', 'will')
+        )
+        self.assertGreater(
+            trie.kneser_ney('we', 'will', discount=0.1),
+            trie.kneser_ney('we', 'will'),
+        )
+
+        # score_many sums the logs of the words' scores
+        sequences = [
+            'Or will we lead wisely',
+            ['will', 'we', 'accept', 'an', 'economy'],
+            'we will economy',
+            'trolley',
+            '',
+        ]
+        for method, score in (
+            ('probability', trie.probability),
+            ('stupid_backoff', trie.stupid_backoff),
+            ('kneser_ney', trie.kneser_ney),
+        ):
+            scores = trie.score_many(sequences, method=method)
+            self.assertEqual(len(scores), len(sequences))
+            for sequence, log_score in zip(sequences, scores):
+                words = (
+                    sequence.split() if isinstance(sequence, str) else sequence
+                )
+                expected = sum(
+                    math.log(score(word, words[max(0, i - 2) : i]))
+                    if score(word, words[max(0, i - 2) : i])
+                    else float('-inf')
+                    for i, word in enumerate(words)
+                )
+                self.assertAlmostEqual(log_score, expected)
+            self.assertTrue(
+                np.array_equal(
+                    hashed.score_many(sequences, method=method), scores
+                )
+            )
+        self.assertEqual(trie.score_many([]).shape, (0,))
+        self.assertAlmostEqual(
+            trie.score_many(['will we'], 'probability', order=1)[0],
+            math.log(trie.probability('will') * trie.probability('we')),
+        )
+        self.assertRaises(ValueError, trie.score_many, sequences, 'mle')
+
+        # the statistics are recomputed after n-grams are added
+        corpus = NGramCorpus()
+        corpus.gng_importer(_corpus_file('simple-ngrams.txt'))
+        self.assertAlmostEqual(corpus.probability('quick', 'the'), 1 / 2)
+        corpus._add_to_ngcorpus(  # noqa: SF01
+            corpus.ngcorpus, ['the', 'lazy'], 3
+        )
+        self.assertAlmostEqual(corpus.probability('quick', 'the'), 2 / 7)
+        self.assertIsNotNone(corpus._stats)  # noqa: SF01
+        unpickled = pickle.loads(pickle.dumps(corpus))  # noqa: S301
+        self.assertIsNone(unpickled._stats)  # noqa: SF01
+        self.assertAlmostEqual(unpickled.probability('quick', 'the'), 2 / 7)
+
+        empty = NGramCorpus()
+        self.assertEqual(empty.kneser_ney('the'), 0)
+        self.assertEqual(empty.stupid_backoff('the'), 0)
+        self.assertEqual(empty.probability('the'), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
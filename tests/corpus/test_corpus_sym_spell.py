@@ -0,0 +1,133 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.corpus.test_sym_spell.
+
+This module contains unit tests for abydos.corpus._sym_spell
+"""
+
+import os
+import pickle  # noqa: S403
+import tempfile
+import unittest
+
+from abydos.corpus import SymSpell, UnigramCorpus
+from abydos.distance import DamerauLevenshtein, Levenshtein
+
+from .. import _corpus_file
+
+
+class SymSpellTestCases(unittest.TestCase):
+    """Test abydos.corpus.SymSpell."""
+
+    with open(_corpus_file('wikipediaCommonMisspellings.csv')) as missp:
+        pairs = [line.strip().split(',') for line in missp][1:1001]
+    corpus = UnigramCorpus()
+    for i, (_, word) in enumerate(pairs):
+        corpus.add_document(' '.join([word] * (1 + i % 3)))
+
+    def _brute_force(self, word, max_distance, metric):
+        suggestions = []
+        for term, (count, _) in self.corpus.corpus.items():
+            if abs(len(term) - len(word)) <= max_distance:
+                distance = metric.dist_abs(word, term)
+                if distance <= max_distance:
+                    suggestions.append((term, distance, count))
+        return sorted(suggestions, key=lambda _: (_[1], -_[2], _[0]))
+
+    def test_sym_spell_lookup(self):
+        """Test abydos.corpus.SymSpell.lookup."""
+        dam_lev = DamerauLevenshtein()
+        osa = Levenshtein(mode='osa')
+        spell = SymSpell(self.corpus, prefix_length=None)
+        spell_osa = SymSpell(self.corpus, prefix_length=None, metric=osa)
+        spell_prefix = SymSpell(self.corpus, max_distance=1)
+        for error, correct in self.pairs[::125]:
+            # all the words within the maximum distance are suggested
+            expected = self._brute_force(error, 2, dam_lev)
+            self.assertEqual(spell.lookup(error), expected)
+            self.assertEqual(
+                spell.lookup(error, max_distance=1),
+                [_ for _ in expected if _[1] <= 1],
+            )
+            self.assertEqual(spell.lookup(error, limit=1), expected[:1])
+            self.assertEqual(
+                spell_osa.lookup(error), self._brute_force(error, 2, osa)
+            )
+            # indexing prefixes only may miss some words
+            for suggestion in spell_prefix.lookup(error):
+                self.assertIn(suggestion, expected)
+            self.assertEqual(
+                spell.lookup(correct)[0],
+                (correct, 0, self.corpus.corpus[correct][0]),
+            )
+
+        self.assertEqual(spell.lookup(''), [])
+        self.assertEqual(spell.lookup('zzzzzzzzzzzz'), [])
+        self.assertRaises(ValueError, spell_prefix.lookup, 'abilty', 2)
+
+        # words are ranked by count among those at the same distance
+        corpus = UnigramCorpus('bat cat cat hat hat hat bar')
+        spell = SymSpell(corpus)
+        self.assertEqual(
+            spell.lookup('gat'),
+            [('hat', 1, 3), ('cat', 1, 2), ('bat', 1, 1), ('bar', 2, 1)],
+        )
+        self.assertEqual(
+            spell.lookup('gat', 1, 2), [('hat', 1, 3), ('cat', 1, 2)]
+        )
+        self.assertEqual(
+            SymSpell(corpus, min_count=2).lookup('bat'),
+            [('hat', 1, 3), ('cat', 1, 2)],
+        )
+        self.assertEqual(SymSpell().lookup('bat'), [])
+
+    def test_sym_spell_save_load(self):
+        """Test abydos.corpus.SymSpell.save & load."""
+        handle, path = tempfile.mkstemp('.sym')
+        os.close(handle)
+        try:
+            for spell in (
+                SymSpell(self.corpus),
+                SymSpell(self.corpus, max_distance=3, prefix_length=None),
+                SymSpell(),
+            ):
+                spell.save(path)
+                loaded = SymSpell.load(path)
+                self.assertEqual(loaded.max_distance, spell.max_distance)
+                self.assertEqual(loaded.prefix_length, spell.prefix_length)
+                unpickled = pickle.loads(pickle.dumps(loaded))  # noqa: S301
+                copied = pickle.loads(pickle.dumps(spell))  # noqa: S301
+                for error, _ in self.pairs[::97]:
+                    expected = spell.lookup(error)
+                    self.assertEqual(loaded.lookup(error), expected)
+                    self.assertEqual(unpickled.lookup(error), expected)
+                    self.assertEqual(copied.lookup(error), expected)
+
+            # a file that is not a SymSpell index
+            with open(path, 'wb') as index:
+                index.write(b'short')
+            self.assertRaises(ValueError, SymSpell.load, path)
+            with open(path, 'wb') as index:
+                index.write(b'not a SymSpell index, just some bytes...')
+            self.assertRaises(ValueError, SymSpell.load, path)
+        finally:
+            del loaded, unpickled
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,7 +19,12 @@
 This module contains unit tests for abydos.corpus._unigram_corpus
 """
 
+import bz2
+import gzip
+import json
 import os
+import pickle  # noqa: S403
+import shutil
 import sys
 import tempfile
 import unittest
@@ -151,6 +156,127 @@ class UnigramCorpusTestCases(unittest.TestCase):
         for term, _ in self.pos_corpus.corpus.items():
             self.assertTrue('_' not in term)
 
+    def test_unigram_corpus_gng_import_many(self):
+        """Test abydos.corpus.UnigramCorpus.gng_import_many."""
+        tmpdir = tempfile.mkdtemp()
+        try:
+            # split the test files into plain, gzip & bzip2 shards
+            paths = []
+            for filename in ('simple-ngrams.txt', 'simple-ngrams-pos.txt'):
+                with open(_corpus_file(filename), encoding='utf-8') as gng:
+                    lines = gng.readlines()
+                for i, opener in enumerate((open, gzip.open, bz2.open)):
+                    paths.append(
+                        os.path.join(tmpdir, '{}.{}'.format(filename, i))
+                    )
+                    with opener(paths[-1], 'wt', encoding='utf-8') as shard:
+                        shard.writelines(lines[i::3])
+
+            for kwargs in ({'word_transform': Soundex().encode}, {}):
+                expected = UnigramCorpus(**kwargs)
+                for filename in ('simple-ngrams.txt', 'simple-ngrams-pos.txt'):
+                    expected.gng_importer(_corpus_file(filename))
+
+                for n_jobs in (None, 2):
+                    corpus = UnigramCorpus(**kwargs)
+                    corpus.gng_import_many(paths, n_jobs=n_jobs)
+                    self.assertEqual(
+                        dict(corpus.corpus), dict(expected.corpus)
+                    )
+                    self.assertEqual(corpus.doc_count, expected.doc_count)
+
+                # a glob pattern, reporting progress
+                reports = []
+                corpus = UnigramCorpus(**kwargs)
+                corpus.gng_import_many(
+                    os.path.join(tmpdir, '*'),
+                    progress=lambda *args: reports.append(args),
+                )
+                self.assertEqual(dict(corpus.corpus), dict(expected.corpus))
+                self.assertEqual(
+                    reports,
+                    [
+                        (i + 1, len(paths), path)
+                        for i, path in enumerate(sorted(paths))
+                    ],
+                )
+
+            # an interrupted import resumes from its checkpoint
+            checkpoint = os.path.join(tmpdir, 'checkpoint')
+
+            def _interrupt(done, total, path):
+                if done == 2:
+                    raise KeyboardInterrupt
+
+            corpus = UnigramCorpus()
+            self.assertRaises(
+                KeyboardInterrupt,
+                corpus.gng_import_many,
+                paths,
+                checkpoint=checkpoint,
+                progress=_interrupt,
+            )
+            self.assertEqual(len(corpus.corpus), 0)
+            self.assertTrue(os.path.exists(checkpoint))
+
+            reports = []
+            corpus.gng_import_many(
+                paths,
+                checkpoint=checkpoint,
+                progress=lambda *args: reports.append(args),
+            )
+            self.assertEqual(dict(corpus.corpus), dict(expected.corpus))
+            self.assertEqual(
+                [report[0] for report in reports], list(range(3, 7))
+            )
+            self.assertFalse(os.path.exists(checkpoint))
+
+            # the checkpoint is appended to with each file's counts, rather
+            # than rewritten with the totals, & an interruption while
+            # appending to it loses only that file
+            logs = []
+
+            def _interrupt_appending(done, total, path):
+                with open(checkpoint, 'rb') as log:
+                    logs.append(log.read())
+                if done == 4:
+                    raise KeyboardInterrupt
+
+            corpus = UnigramCorpus()
+            self.assertRaises(
+                KeyboardInterrupt,
+                corpus.gng_import_many,
+                paths,
+                checkpoint=checkpoint,
+                progress=_interrupt_appending,
+            )
+            self.assertEqual(len(logs), 4)
+            for log, next_log in zip(logs, logs[1:]):
+                self.assertLess(len(log), len(next_log))
+                self.assertTrue(next_log.startswith(log))
+            sizes = [len(log) for log in logs]
+            with open(checkpoint, 'r+b') as log:
+                log.truncate(sizes[3] - 5)
+
+            reports = []
+            corpus.gng_import_many(
+                paths,
+                checkpoint=checkpoint,
+                progress=lambda *args: reports.append(args),
+            )
+            self.assertEqual(dict(corpus.corpus), dict(expected.corpus))
+            self.assertEqual(
+                [report[0] for report in reports], list(range(4, 7))
+            )
+            self.assertFalse(os.path.exists(checkpoint))
+
+            # no files at all
+            corpus = UnigramCorpus()
+            corpus.gng_import_many([])
+            self.assertEqual(len(corpus.corpus), 0)
+        finally:
+            shutil.rmtree(tmpdir)
+
     def test_unigram_corpus_save_load_corpus(self):
         """Test abydos.corpus.UnigramCorpus.save_corpus & .load_corpus."""
         handle, path = tempfile.mkstemp('.dat')
@@ -161,6 +287,260 @@ class UnigramCorpusTestCases(unittest.TestCase):
         os.close(handle)
         os.remove(path)
 
+    def test_unigram_corpus_save_load_columnar(self):
+        """Test abydos.corpus.UnigramCorpus.save_columnar & .load_columnar."""
+        handle, path = tempfile.mkstemp('.uni')
+        os.close(handle)
+        try:
+            for corpus in (
+                self.sotu2015_corpus,
+                self.simple_corpus,
+                self.double_corpus,
+                UnigramCorpus('zoë ångström ápple zebra \ud800 zoë'),
+                UnigramCorpus(word_tokenizer=QSkipgrams(scaler='SSK')),
+            ):
+                corpus.save_columnar(path)
+                mapped = UnigramCorpus()
+                mapped.load_columnar(path)
+                self.assertEqual(mapped.doc_count, corpus.doc_count)
+                self.assertEqual(len(mapped.corpus), len(corpus.corpus))
+                self.assertEqual(list(mapped.corpus), sorted(corpus.corpus))
+                for term, counts in corpus.corpus.items():
+                    self.assertIn(term, mapped.corpus)
+                    self.assertEqual(mapped.corpus[term], counts)
+                    self.assertEqual(mapped.idf(term), corpus.idf(term))
+                self.assertNotIn('trolley', mapped.corpus)
+                self.assertNotIn(None, mapped.corpus)
+                self.assertEqual(mapped.idf('trolley'), float('inf'))
+                self.assertRaises(KeyError, mapped.corpus.__getitem__, 'x')
+
+                # the memory map is reopened when unpickled
+                unpickled = pickle.loads(pickle.dumps(mapped))  # noqa: S301
+                self.assertEqual(dict(unpickled.corpus), dict(corpus.corpus))
+
+            # skipgram counts scaled by SSK are floats
+            corpus = UnigramCorpus(
+                'the quick brown fox', word_tokenizer=QSkipgrams(scaler='SSK')
+            )
+            corpus.save_columnar(path)
+            mapped = UnigramCorpus()
+            mapped.load_columnar(path)
+            for term, counts in corpus.corpus.items():
+                self.assertAlmostEqual(mapped.corpus[term][0], counts[0])
+                self.assertEqual(mapped.corpus[term][1], counts[1])
+
+            # a columnar corpus is read-only
+            for method, args in (
+                (mapped.add_document, ('the quick dog',)),
+                (mapped.add_document, ('',)),
+                (mapped.gng_importer, (_corpus_file('simple-ngrams.txt'),)),
+                (
+                    mapped.gng_import_many,
+                    ([_corpus_file('simple-ngrams.txt')],),
+                ),
+            ):
+                with self.assertRaisesRegex(ValueError, 'open_segments'):
+                    method(*args)
+            self.assertEqual(mapped.doc_count, corpus.doc_count)
+
+            # files that are not columnar corpora
+            with open(path, 'wb') as table:
+                table.write(b'short')
+            self.assertRaises(ValueError, mapped.load_columnar, path)
+            with open(path, 'wb') as table:
+                table.write(b'not a unigram table, just some bytes')
+            self.assertRaises(ValueError, mapped.load_columnar, path)
+        finally:
+            del mapped, unpickled
+            os.remove(path)
+
+    def test_unigram_corpus_segments(self):
+        """Test abydos.corpus.UnigramCorpus segments."""
+        tmpdir = tempfile.mkdtemp()
+        docs = [
+            'the quick brown fox',
+            'jumped over the lazy dog',
+            'and then it slept',
+            'and the dog ran off',
+            'the end',
+        ]
+        try:
+            expected = UnigramCorpus()
+            writer = UnigramCorpus()
+            writer.open_segments(tmpdir)
+            # the reader, like any UnigramCorpus(), counts one empty document
+            # of its own
+            reader = UnigramCorpus()
+            reader.open_segments(tmpdir)
+
+            for doc in docs:
+                expected.add_document(doc)
+                writer.add_document(doc)
+                self.assertEqual(writer.doc_count, expected.doc_count)
+                self.assertEqual(dict(writer.corpus), dict(expected.corpus))
+                self.assertEqual(len(writer.corpus), len(expected.corpus))
+                writer.append_segment()
+                self.assertEqual(len(writer.corpus), len(expected.corpus))
+                reader.open_segments(tmpdir)
+                self.assertEqual(reader.doc_count, expected.doc_count + 1)
+                self.assertEqual(dict(reader.corpus), dict(expected.corpus))
+                self.assertEqual(len(reader.corpus), len(expected.corpus))
+            self.assertEqual(len(writer.corpus.segments), len(docs))
+
+            writer.add_document('the dog slept')
+            expected.add_document('the dog slept')
+            writer.merge_segments()
+            self.assertEqual(len(writer.corpus.segments), 1)
+            self.assertEqual(len(writer.corpus.delta), 3)
+            self.assertEqual(dict(writer.corpus), dict(expected.corpus))
+            self.assertEqual(len(writer.corpus), len(expected.corpus))
+            self.assertEqual(writer.doc_count, expected.doc_count)
+            for term in expected.corpus:
+                self.assertEqual(writer.idf(term), expected.idf(term))
+            self.assertEqual(writer.idf('trolley'), float('inf'))
+            self.assertRaises(KeyError, writer.corpus.__getitem__, 'x')
+            self.assertNotIn('x', writer.corpus)
+            self.assertEqual(
+                os.listdir(tmpdir).count('MANIFEST'), 1
+            )  # merged segments are removed
+            self.assertEqual(len(os.listdir(tmpdir)), 2)
+
+            # the reader keeps its mapped segments until it reopens them
+            self.assertEqual(len(reader.corpus.segments), len(docs))
+            self.assertEqual(reader.corpus['the'], (4, 4))
+            writer.append_segment()
+            reader.open_segments(tmpdir)
+            self.assertEqual(len(reader.corpus.segments), 2)
+            self.assertEqual(dict(reader.corpus), dict(expected.corpus))
+            self.assertEqual(reader.doc_count, expected.doc_count + 1)
+
+            # refreshing keeps the reader's own documents & counts the new
+            # segments' documents
+            reader.add_document('a trolley')
+            writer.add_document('the lazy fox')
+            expected.add_document('the lazy fox')
+            writer.append_segment()
+            reader.refresh_segments()
+            self.assertEqual(len(reader.corpus.segments), 3)
+            self.assertEqual(reader.doc_count, expected.doc_count + 2)
+            self.assertEqual(reader.corpus['the'], (6, 6))
+            self.assertEqual(reader.corpus['trolley'], (1, 1))
+            self.assertEqual(len(reader.corpus), len(expected.corpus) + 2)
+            # a writer that appends after another process maps its segments
+            other = UnigramCorpus('the end')
+            other.open_segments(tmpdir)
+            other.append_segment()
+            expected.add_document('the end')
+            writer.add_document('the dog')
+            expected.add_document('the dog')
+            writer.append_segment()
+            self.assertEqual(writer.doc_count, expected.doc_count)
+            self.assertEqual(dict(writer.corpus), dict(expected.corpus))
+            self.assertEqual(len(writer.corpus), len(expected.corpus))
+            self.assertRaises(ValueError, expected.refresh_segments)
+            del other
+
+            # a manifest without a count of terms has its terms counted
+            with open(os.path.join(tmpdir, 'MANIFEST')) as manifest:
+                contents = json.load(manifest)
+            del contents['terms']
+            with open(os.path.join(tmpdir, 'MANIFEST'), 'w') as manifest:
+                json.dump(contents, manifest)
+            reader.refresh_segments()
+            self.assertEqual(len(reader.corpus), len(expected.corpus) + 2)
+            writer.merge_segments()
+            reader.refresh_segments()
+            self.assertEqual(len(reader.corpus.segments), 1)
+            self.assertEqual(len(reader.corpus), len(expected.corpus) + 2)
+            self.assertEqual(reader.doc_count, expected.doc_count + 2)
+
+            # a segmented corpus's IDFs are those of an in-memory corpus of
+            # the same documents
+            for kwargs in ({}, {'corpus_text': docs[0]}, {'documents': 1000}):
+                in_memory = UnigramCorpus(**kwargs)
+                corpus = UnigramCorpus(**kwargs)
+                corpus.open_segments(os.path.join(tmpdir, 'idf'))
+                for doc in docs[1:]:
+                    in_memory.add_document(doc)
+                    corpus.add_document(doc)
+                    corpus.append_segment()
+                corpus.add_document('x y')
+                in_memory.add_document('x y')
+                self.assertEqual(corpus.doc_count, in_memory.doc_count)
+                for term in list(in_memory.corpus) + ['trolley']:
+                    self.assertEqual(corpus.idf(term), in_memory.idf(term))
+                corpus.merge_segments()
+                self.assertEqual(corpus.doc_count, in_memory.doc_count)
+                for term in in_memory.corpus:
+                    self.assertEqual(corpus.idf(term), in_memory.idf(term))
+                corpus.append_segment()
+                del corpus
+                shutil.rmtree(os.path.join(tmpdir, 'idf'))
+
+            # an existing corpus, in memory or columnar, becomes the first
+            # segment
+            tmpdir2 = os.path.join(tmpdir, 'copy')
+            corpus = UnigramCorpus()
+            corpus.gng_importer(_corpus_file('simple-ngrams.txt'))
+            counts = dict(corpus.corpus)
+            doc_count = corpus.doc_count
+            idfs = {term: corpus.idf(term) for term in counts}
+            columnar = os.path.join(tmpdir, 'columnar.uni')
+            corpus.save_columnar(columnar)
+            corpus.open_segments(tmpdir2)
+            self.assertEqual(corpus.doc_count, doc_count)
+            self.assertEqual(len(corpus.corpus), len(counts))
+
+            # importing into segments counts documents as in memory does
+            in_memory = UnigramCorpus()
+            segmented = UnigramCorpus()
+            segmented.open_segments(os.path.join(tmpdir, 'gng'))
+            for _ in range(2):
+                in_memory.gng_importer(_corpus_file('simple-ngrams.txt'))
+                segmented.gng_importer(_corpus_file('simple-ngrams.txt'))
+                self.assertEqual(segmented.doc_count, in_memory.doc_count)
+                self.assertEqual(
+                    dict(segmented.corpus), dict(in_memory.corpus)
+                )
+                segmented.append_segment()
+                self.assertEqual(segmented.doc_count, in_memory.doc_count)
+            del segmented
+            corpus.append_segment()
+            self.assertEqual(dict(corpus.corpus), counts)
+            self.assertEqual(corpus.corpus.doc_count, doc_count)
+
+            # as do a columnar corpus & the segments of another directory
+            columnar_corpus = UnigramCorpus()
+            columnar_corpus.load_columnar(columnar)
+            for source, name in (
+                (columnar_corpus, 'columnar'),
+                (corpus, 'to'),
+            ):
+                source.open_segments(os.path.join(tmpdir, name))
+                self.assertEqual(dict(source.corpus), counts)
+                self.assertEqual(source.doc_count, doc_count)
+                source.append_segment()
+                source.open_segments(os.path.join(tmpdir, name))
+                self.assertEqual(dict(source.corpus), counts)
+                self.assertEqual(source.doc_count, doc_count)
+                self.assertEqual(
+                    {term: source.idf(term) for term in counts}, idfs
+                )
+            del columnar_corpus
+
+            # the segments are reopened when unpickled
+            unpickled = pickle.loads(pickle.dumps(writer))  # noqa: S301
+            self.assertEqual(dict(unpickled.corpus), dict(expected.corpus))
+
+            self.assertRaises(ValueError, expected.append_segment)
+            self.assertRaises(ValueError, expected.merge_segments)
+            with open(os.path.join(tmpdir2, 'MANIFEST'), 'w') as manifest:
+                manifest.write('[]')
+            self.assertRaises(ValueError, expected.open_segments, tmpdir2)
+        finally:
+            del writer, reader, corpus, unpickled
+            shutil.rmtree(tmpdir)
+
     def test_unigram_corpus_idf(self):
         """Test abydos.corpus.UnigramCorpus.idf."""
         # string-style tests
@@ -0,0 +1,155 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.corpus.test_word_segmenter.
+
+This module contains unit tests for abydos.corpus._word_segmenter
+"""
+
+import pickle  # noqa: S403
+import unittest
+
+from abydos.corpus import Corpus, NGramCorpus, UnigramCorpus, WordSegmenter
+
+from .. import _corpus_file
+
+
+class WordSegmenterTestCases(unittest.TestCase):
+    """Test abydos.corpus.WordSegmenter."""
+
+    unigram_corpus = UnigramCorpus()
+    unigram_corpus.gng_importer(_corpus_file('simple-ngrams.txt'))
+
+    ngram_corpus = NGramCorpus()
+    ngram_corpus.gng_importer(_corpus_file('simple-ngrams.txt'))
+
+    def _segmentations(self, text):
+        if not text:
+            yield []
+        for i in range(1, len(text) + 1):
+            for rest in self._segmentations(text[i:]):
+                yield [text[:i]] + rest
+
+    def test_word_segmenter_segment(self):
+        """Test abydos.corpus.WordSegmenter.segment."""
+        for corpus in (self.unigram_corpus, self.ngram_corpus):
+            segmenter = WordSegmenter(corpus)
+            self.assertEqual(
+                segmenter.segment('thequickbrownfoxjumpedoverthelazydog'),
+                'the quick brown fox jumped over the lazy dog'.split(),
+            )
+            self.assertEqual(
+                segmenter.segment('thelazydogz'), ['the', 'lazy', 'dog', 'z']
+            )
+            self.assertEqual(segmenter.segment(''), [])
+            self.assertEqual(segmenter.segment('x'), ['x'])
+
+            # the segmentation is the most probable of all of them
+            for text in ('quickfox', 'overthe', 'dogzx'):
+                best = max(
+                    sum(
+                        segmenter._score(None, word)  # noqa: SF01
+                        for word in words
+                    )
+                    for words in self._segmentations(text)
+                )
+                self.assertAlmostEqual(
+                    sum(
+                        segmenter._score(None, word)  # noqa: SF01
+                        for word in segmenter.segment(text)
+                    ),
+                    best,
+                )
+
+        words = WordSegmenter(self.unigram_corpus, max_word_length=3).segment(
+            'thequick'
+        )
+        self.assertEqual(words[0], 'the')
+        self.assertEqual(''.join(words), 'thequick')
+        self.assertLessEqual(max(map(len, words)), 3)
+
+        # German compounds
+        segmenter = WordSegmenter(
+            UnigramCorpus('kunden service zentrum kundin dienst zentren')
+        )
+        self.assertEqual(
+            segmenter.segment('kundenservicezentrum'),
+            ['kunden', 'service', 'zentrum'],
+        )
+        self.assertEqual(
+            segmenter.segment('kundendienst'), ['kunden', 'dienst']
+        )
+
+        # bigrams
+        text = '\n'.join(['a b'] * 5 + ['ab'] * 3)
+        ngcorpus = NGramCorpus()
+        ngcorpus.corpus_importer(Corpus(text), n_val=2)
+        self.assertEqual(WordSegmenter(ngcorpus).segment('ab'), ['ab'])
+        bigram_segmenter = WordSegmenter(ngcorpus, order=2)
+        self.assertEqual(bigram_segmenter.segment('ab'), ['a', 'b'])
+        self.assertEqual(bigram_segmenter.segment('abab'), ['a', 'b'] * 2)
+        self.assertEqual(bigram_segmenter.segment('ba'), ['b', 'a'])
+        self.assertEqual(bigram_segmenter.segment('abc'), ['a', 'b', 'c'])
+        self.assertEqual(bigram_segmenter.segment(''), [])
+        bigram_segmenter = WordSegmenter(self.ngram_corpus, order=2)
+        self.assertEqual(
+            bigram_segmenter.segment('thequickbrownfoxjumpedoverthelazydog'),
+            'the quick brown fox jumped over the lazy dog'.split(),
+        )
+
+        self.assertRaises(
+            ValueError, WordSegmenter, self.unigram_corpus, order=2
+        )
+        self.assertRaises(ValueError, WordSegmenter, self.ngram_corpus, 3)
+        self.assertEqual(
+            ''.join(WordSegmenter(UnigramCorpus()).segment('ab')), 'ab'
+        )
+
+    def test_word_segmenter_segment_many(self):
+        """Test abydos.corpus.WordSegmenter.segment_many."""
+        texts = [
+            'thequickbrownfox',
+            'thelazydog',
+            'thequickbrownfox',
+            'overthelazydog',
+            '',
+        ]
+        for order in (1, 2):
+            segmenter = WordSegmenter(self.ngram_corpus, order)
+            segmentations = segmenter.segment_many(texts)
+            self.assertEqual(
+                segmentations,
+                [
+                    WordSegmenter(self.ngram_corpus, order).segment(text)
+                    for text in texts
+                ],
+            )
+            self.assertIsNot(segmentations[0], segmentations[2])
+
+            # the words of later strings are scored from the cache
+            cache = segmenter.__dict__['_score_cache']
+            misses = cache.misses
+            segmenter.segment_many(['thelazydog', 'thequickbrownfox'])
+            self.assertEqual(cache.misses, misses)
+
+            # the cache is not pickled
+            unpickled = pickle.loads(pickle.dumps(segmenter))  # noqa: S301
+            self.assertNotIn('_score_cache', unpickled.__dict__)
+            self.assertEqual(unpickled.segment_many(texts), segmentations)
+
+
+if __name__ == '__main__':
+    unittest.main()
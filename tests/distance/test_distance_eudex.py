@@ -21,7 +21,10 @@ This module contains unit tests for abydos.distance.Eudex
 
 import unittest
 
+import numpy as np
+
 from abydos.distance import Eudex
+from abydos.phonetic import Eudex as EudexPhonetic
 
 
 def _yield_1():
@@ -123,6 +126,59 @@ class EudexTestCases(unittest.TestCase):
             Eudex('fibonacci').sim('Niall', 'Colin'), 0.79022989
         )
 
+    def test_eudex_dist_abs_array(self):
+        """Test abydos.distance.Eudex.dist_abs_array."""
+        tars = ['', 'Niall', 'Neil', 'Colin', 'Cuilen', 'ATCG', 'TAGC']
+        hashes = EudexPhonetic().encode_array(tars)
+        for cmp in (
+            self.cmp,
+            Eudex(None),
+            Eudex('fibonacci'),
+            Eudex([10, 1, 1, 1]),
+            Eudex(_yield_1),
+        ):
+            for src in ('', 'Niall', 'Colin', 'ATCG'):
+                expected = [cmp.dist_abs(src, tar) for tar in tars]
+                self.assertEqual(list(cmp.dist_abs_array(src, tars)), expected)
+                self.assertEqual(
+                    list(cmp.dist_abs_array(src, hashes)), expected
+                )
+                np.testing.assert_allclose(
+                    cmp.dist_abs_array(src, hashes, normalized=True),
+                    [cmp.dist_abs(src, tar, True) for tar in tars],
+                )
+
+        # src given as a hash
+        self.assertEqual(
+            list(
+                self.cmp.dist_abs_array(
+                    EudexPhonetic().encode_int('Niall'), hashes
+                )
+            ),
+            [self.cmp.dist_abs('Niall', tar) for tar in tars],
+        )
+
+        with self.assertRaises(ValueError):
+            Eudex('veryLarge').dist_abs_array('Niall', hashes)
+
+    def test_eudex_dist_array(self):
+        """Test abydos.distance.Eudex.dist_array."""
+        tars = ['', 'Niall', 'Neil', 'Colin']
+        for cmp in (self.cmp, Eudex(None), Eudex('fibonacci')):
+            np.testing.assert_allclose(
+                cmp.dist_array('Niall', tars),
+                [cmp.dist('Niall', tar) for tar in tars],
+            )
+
+    def test_eudex_sim_array(self):
+        """Test abydos.distance.Eudex.sim_array."""
+        tars = ['', 'Niall', 'Neil', 'Colin']
+        for cmp in (self.cmp, Eudex(None), Eudex('fibonacci')):
+            np.testing.assert_allclose(
+                cmp.sim_array('Niall', tars),
+                [cmp.sim('Niall', tar) for tar in tars],
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -118,6 +118,19 @@ class MetaLevenshteinTestCases(unittest.TestCase):
             self.cmp.dist_abs('ATCAACGAGT', 'AACGATTAG'), 2.9317526638
         )
 
+        # the tokenizer is not changed by tokenizing the strings
+        tokenizer = QGrams(qval=2)
+        corpus = UnigramCorpus(word_tokenizer=QGrams(qval=2))
+        corpus.add_document('Nigel')
+        corpus.add_document('Niall')
+        self.assertAlmostEqual(
+            MetaLevenshtein(tokenizer=tokenizer, corpus=corpus).dist_abs(
+                'Nigel', 'Niall'
+            ),
+            MetaLevenshtein(corpus=corpus).dist_abs('Nigel', 'Niall'),
+        )
+        self.assertEqual(tokenizer.get_list(), [])
+
     def test_meta_levenshtein_corpus(self):
         """Test abydos.distance.MetaLevenshtein with corpus."""
         q3_corpus = UnigramCorpus(word_tokenizer=QGrams(qval=3))
@@ -56,6 +56,18 @@ class RougeSTestCases(unittest.TestCase):
         self.assertEqual(round(self.cmp.sim('pktg', 'tgip', beta=1), 3), 0.167)
         self.assertEqual(round(self.cmp.sim('pktg', 'tgpk', beta=1), 3), 0.333)
 
+        # Limited skip distance
+        cmp_gap0 = RougeS(max_gap=0)
+        self.assertAlmostEqual(cmp_gap0.sim('Nigel', 'Niall'), 0.25)
+        self.assertAlmostEqual(cmp_gap0.sim('Colin', 'Coiln'), 0.25)
+        cmp_gap1 = RougeS(max_gap=1)
+        self.assertAlmostEqual(
+            cmp_gap1.sim('Nigel', 'Niall'), 0.14285714285714285
+        )
+        self.assertAlmostEqual(
+            cmp_gap1.sim('ATCAACGAGT', 'AACGATTAG'), 0.7071622846781506
+        )
+
     def test_rouge_s_dist(self):
         """Test abydos.distance.RougeS.dist."""
         # Base cases
@@ -51,6 +51,15 @@ class RougeSUTestCases(unittest.TestCase):
             self.cmp.sim('ATCAACGAGT', 'AACGATTAG'), 0.7840112202
         )
 
+        # Limited skip distance
+        cmp_gap1 = RougeSU(max_gap=1)
+        self.assertAlmostEqual(
+            cmp_gap1.sim('Nigel', 'Niall'), 0.3333333333333333
+        )
+        self.assertAlmostEqual(
+            cmp_gap1.sim('Colin', 'Coiln'), 0.7777777777777778
+        )
+
     def test_rouge_su_dist(self):
         """Test abydos.distance.RougeSU.dist."""
         # Base cases
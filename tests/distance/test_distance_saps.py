@@ -22,7 +22,19 @@ This module contains unit tests for abydos.distance.SAPS
 import unittest
 
 from abydos.distance import SAPS
-from abydos.tokenizer import QGrams
+from abydos.tokenizer import QGrams, SAPSTokenizer
+
+
+class _CountingTokenizer(SAPSTokenizer):
+    """A SAPSTokenizer that records the strings it tokenizes."""
+
+    def __init__(self):
+        super().__init__()
+        self.tokenized = []
+
+    def tokenize(self, string):
+        self.tokenized.append(string)
+        return super().tokenize(string)
 
 
 class SAPSTestCases(unittest.TestCase):
@@ -63,6 +75,13 @@ class SAPSTestCases(unittest.TestCase):
             self.cmp.sim('Stevenson', 'Stinson'), 0.551724138
         )
 
+        # each string is tokenized once
+        tokenizer = _CountingTokenizer()
+        self.assertAlmostEqual(
+            SAPS(tokenizer=tokenizer).sim('Stevenson', 'Stinson'), 0.551724138,
+        )
+        self.assertEqual(tokenizer.tokenized, ['Stevenson', 'Stinson'])
+
     def test_saps_dist(self):
         """Test abydos.distance.SAPS.dist."""
         # Base cases
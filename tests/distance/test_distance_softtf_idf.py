@@ -20,10 +20,11 @@ This module contains unit tests for abydos.distance.SoftTFIDF
 """
 
 import os
+import pickle  # noqa: S403
 import unittest
 
 from abydos.corpus import UnigramCorpus
-from abydos.distance import Levenshtein, SoftTFIDF
+from abydos.distance import JaroWinkler, Levenshtein, SoftTFIDF
 from abydos.tokenizer import QGrams
 from abydos.util import download_package, package_path
 
@@ -120,6 +121,59 @@ class SoftTFIDFTestCases(unittest.TestCase):
         self.assertLess(cmp_q3_03.dist('Colin', 'Coiln'), 0.5)
         self.assertLess(cmp_q3_03.dist('Coiln', 'Colin'), 0.5)
 
+    def test_softtf_idf_fit(self):
+        """Test abydos.distance.SoftTFIDF.fit & metric caching."""
+        records = [
+            'Niall',
+            'Neil',
+            'Nigel',
+            'Colin',
+            'Coiln',
+            'Niall',
+            'Nell',
+            'ATCAACGAGT',
+        ]
+
+        class _CountingMetric(JaroWinkler):
+            calls = 0
+
+            def sim(self, src, tar):
+                _CountingMetric.calls += 1
+                return super(_CountingMetric, self).sim(src, tar)
+
+        for kwargs in (
+            {'threshold': 0.5},
+            {'metric': Levenshtein(), 'threshold': 0.3},
+            {'qval': 1, 'threshold': 0.5},
+        ):
+            cmp = SoftTFIDF(**kwargs).fit(records)
+            corpus = UnigramCorpus(word_tokenizer=cmp.params['tokenizer'])
+            for record in records:
+                corpus.add_document(record)
+            cmp_corpus = SoftTFIDF(corpus=corpus, **kwargs)
+            pairs = [(src, tar) for src in records for tar in records]
+            sims = cmp.sim_many(pairs)
+            for (src, tar), sim in zip(pairs, sims):
+                self.assertAlmostEqual(sim, cmp_corpus.sim(src, tar))
+
+        # each token pair is scored by the metric only once
+        cmp = SoftTFIDF(metric=_CountingMetric(), threshold=0.5)
+        cmp.fit(records)
+        first = cmp.sim_many(pairs)
+        calls = _CountingMetric.calls
+        self.assertGreater(calls, 0)
+        self.assertEqual(cmp.sim_many(pairs).tolist(), first.tolist())
+        self.assertEqual(_CountingMetric.calls, calls)
+
+        # the cache is dropped when pickled
+        self.cmp.sim('Niall', 'Neil')
+        self.assertIn('_metric_cache', self.cmp.__dict__)
+        unpickled = pickle.loads(pickle.dumps(self.cmp))  # noqa: S301
+        self.assertNotIn('_metric_cache', unpickled.__dict__)
+        self.assertEqual(
+            unpickled.sim('Niall', 'Neil'), self.cmp.sim('Niall', 'Neil')
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -60,6 +60,14 @@ class SSKTestCases(unittest.TestCase):
             self.cmp_05.sim('cat', 'car'), 0.4993757802746567
         )
 
+        # Limited gaps
+        cmp_gap1 = SSK(max_gap=1)
+        self.assertAlmostEqual(cmp_gap1.sim('Nigel', 'Niall'), 0.137465778503)
+        self.assertAlmostEqual(cmp_gap1.sim('Colin', 'Coiln'), 0.715396578538)
+        self.assertAlmostEqual(
+            cmp_gap1.sim('ATCAACGAGT', 'AACGATTAG'), 0.832762337442
+        )
+
     def test_ssk_sim_score(self):
         """Test abydos.distance.SSK.sim_score."""
         # Base cases
@@ -24,7 +24,7 @@ import unittest
 
 from abydos.corpus import UnigramCorpus
 from abydos.distance import TFIDF
-from abydos.tokenizer import QGrams
+from abydos.tokenizer import QGrams, WhitespaceTokenizer
 from abydos.util import download_package, package_path
 
 
@@ -93,6 +93,63 @@ class TFIDFTestCases(unittest.TestCase):
         self.assertAlmostEqual(cmp_q3.dist('Colin', 'Coiln'), 0.885132437)
         self.assertAlmostEqual(cmp_q3.dist('Coiln', 'Colin'), 0.885132437)
 
+    def test_tf_idf_fit(self):
+        """Test abydos.distance.TFIDF.fit, .transform & .sim_many."""
+        records = [
+            'Niall',
+            'Neil',
+            'Nigel',
+            'Colin',
+            'Coiln',
+            'Niall',
+            'ATCAACGAGT',
+            '',
+        ]
+        self.assertRaises(ValueError, TFIDF().transform, records)
+
+        for kwargs in ({}, {'qval': 1}, {'tokenizer': WhitespaceTokenizer()}):
+            cmp = TFIDF(**kwargs)
+            self.assertIs(cmp.fit(records), cmp)
+
+            # fitting is equivalent to using a corpus of the records
+            corpus = UnigramCorpus(word_tokenizer=cmp.params['tokenizer'])
+            for record in records:
+                corpus.add_document(record)
+            cmp_corpus = TFIDF(corpus=corpus, **kwargs)
+            for src in records:
+                for tar in records:
+                    self.assertAlmostEqual(
+                        cmp.sim(src, tar), cmp_corpus.sim(src, tar)
+                    )
+
+            pairs = [(src, tar) for src in records for tar in records[::-1]]
+            self.assertEqual(
+                cmp.sim_many(pairs).tolist(),
+                [cmp.sim(src, tar) for src, tar in pairs],
+            )
+            self.assertEqual(len(cmp.sim_many([])), 0)
+
+            for vector in cmp.transform(records[:-1]):
+                self.assertAlmostEqual(
+                    sum(weight ** 2 for weight in vector.values()), 1.0
+                )
+            self.assertEqual(cmp.transform(['']), [cmp.transform([''])[0]])
+
+        # a measure with a corpus takes its IDFs from the corpus
+        corpus = UnigramCorpus(word_tokenizer=QGrams())
+        corpus.add_document('Niall Nigel Neil')
+        cmp = TFIDF(corpus=corpus).fit(records)
+        self.assertAlmostEqual(
+            cmp.sim('Niall', 'Nigel'),
+            TFIDF(corpus=corpus).sim('Niall', 'Nigel'),
+        )
+
+        # Counters are compared as unfit, but with the collection's IDFs
+        cmp = TFIDF().fit(records)
+        self.assertAlmostEqual(
+            cmp.sim(QGrams().counts('Niall'), 'Neil'), cmp.sim('Niall', 'Neil')
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,7 +21,15 @@ This module contains unit tests for abydos.phonetic._Phonetic
 
 import unittest
 
-from abydos.phonetic import Davidson
+import numpy as np
+
+from abydos.phonetic import (
+    Davidson,
+    FuzzySoundex,
+    NYSIIS,
+    RefinedSoundex,
+    Soundex,
+)
 
 # noinspection PyProtectedMember
 from abydos.phonetic._phonetic import _Phonetic
@@ -62,6 +70,37 @@ class PhoneticTestCases(unittest.TestCase):
             self.dav.encode_alpha('word'), self.dav.encode('word')
         )
 
+    def test_phonetic_encode_int(self):
+        """Test abydos.phonetic._Phonetic.encode_int."""
+        with self.assertRaises(NotImplementedError):
+            self.pa.encode_int('word')
+        with self.assertRaises(NotImplementedError):
+            self.dav.encode_array(['word'])
+        with self.assertRaises(NotImplementedError):
+            self.pa.decode_int(0)
+
+        # codes of unbounded length are packed without padding
+        pa = RefinedSoundex()
+        self.assertEqual(pa.decode_int(pa.encode_int('Smith')), 'S86')
+        self.assertEqual(pa.decode_int(pa.encode_int('Christopher')), 'C93619')
+        self.assertEqual(NYSIIS(max_length=-1).decode_int(0), '')
+        # codes beyond 64 bits are packed into arrays of Python ints
+        pa_64 = Soundex(max_length=-1)
+        codes = pa_64.encode_array(['Niall'])
+        self.assertEqual(codes.dtype, object)
+        self.assertEqual(pa_64.decode_int(codes[0]), pa_64.encode('Niall'))
+        # characters outside the code alphabet are escaped, & their codes
+        # sort after those of alphabet characters
+        pa = FuzzySoundex()
+        self.assertEqual(pa.decode_int(pa.encode_int("'s")), "'9000")
+        self.assertGreater(pa.encode_int("'s"), pa.encode_int('Zz'))
+        pa = NYSIIS()
+        codes = pa.encode_array(['Smith', 'Förster'])
+        self.assertEqual(codes.dtype, np.uint64)
+        self.assertEqual(
+            [pa.decode_int(code) for code in codes], ['SNAT', 'FÖRSTA']
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
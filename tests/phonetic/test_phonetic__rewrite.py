@@ -0,0 +1,85 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.phonetic.test_phonetic__rewrite.
+
+This module contains unit tests for abydos.phonetic._Rewriter
+"""
+
+import random
+import unittest
+
+# noinspection PyProtectedMember
+from abydos.phonetic._rewrite import _Rewriter, _alternation
+
+
+class RewriterTestCases(unittest.TestCase):
+    """Test _Rewriter class.
+
+    test cases for abydos.phonetic._Rewriter
+    """
+
+    rules = (
+        ('SC', 'C'),
+        ('SZ', 'C'),
+        ('CZ', 'C'),
+        ('X', 'KS'),
+        ('Ä', 'AE'),
+        ('AE', 'E'),
+        ('EI', 'AY'),
+        ('Y', ''),
+        ('AB', 'BA'),
+        ('BAB', 'B'),
+    )
+
+    def test_rewriter_stages(self):
+        """Test abydos.phonetic._Rewriter stage partitioning."""
+        self.assertEqual(len(_Rewriter(())._stages), 0)
+        self.assertEqual(len(_Rewriter(self.rules[:2])._stages), 1)
+        self.assertEqual(len(_Rewriter(self.rules[:3])._stages), 2)
+        self.assertEqual(
+            len(_Rewriter((('Ä', 'AE'), ('Ö', 'OE'), ('Ü', 'UE')))._stages), 1,
+        )
+
+    def test_rewriter_apply(self):
+        """Test abydos.phonetic._Rewriter.apply."""
+        rw = _Rewriter(self.rules)
+        self.assertEqual(rw.apply(''), '')
+        self.assertEqual(rw.apply('SCZ'), 'C')
+        self.assertEqual(rw.apply('XÄI'), 'KSA')
+        self.assertEqual(rw.apply('ABAB'), 'BA')
+
+        # applying the stages must match applying each rule in sequence
+        rng = random.Random(0)
+        for _ in range(2000):
+            word = ''.join(
+                rng.choice('ABCEISXYZÄ') for _ in range(rng.randint(0, 12))
+            )
+            expected = word
+            for src, tar in self.rules:
+                expected = expected.replace(src, tar)
+            self.assertEqual(rw.apply(word), expected)
+
+    def test_alternation(self):
+        """Test abydos.phonetic._alternation."""
+        self.assertEqual(
+            _alternation(('A', 'AB', 'C')).findall('ABAC'), ['AB', 'A', 'C']
+        )
+        self.assertEqual(_alternation(('.', '*')).findall('A.*B'), ['.', '*'])
+
+
+if __name__ == '__main__':
+    unittest.main()
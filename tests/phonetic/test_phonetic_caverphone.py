@@ -21,6 +21,8 @@ This module contains unit tests for abydos.phonetic.Caverphone
 
 import unittest
 
+import numpy as np
+
 from abydos.phonetic import Caverphone, Metaphone, Soundex
 
 from .. import _corpus_file
@@ -375,6 +377,25 @@ class CaverphoneTestCases(unittest.TestCase):
                         self.pa.encode(name1), self.pa.encode(name2)
                     )
 
+    def test_caverphone_encode_int(self):
+        """Test abydos.phonetic.Caverphone.encode_int."""
+        self.assertEqual(self.pa.encode_int('Christopher'), 183948067390473)
+        self.assertEqual(self.pa.encode_int('Niall'), 218625548407277)
+        self.assertEqual(self.pa.encode_int(''), 15025258332150)
+        self.assertEqual(self.pa.decode_int(183948067390473), 'KRSTFA1111')
+        self.assertEqual(
+            self.pa.decode_int(self.pa.encode_int('Smith')), 'SMT1111111'
+        )
+        self.assertLess(
+            self.pa.encode_int('Christopher'), self.pa.encode_int('Smith')
+        )
+
+        codes = self.pa.encode_array(['Christopher', 'Niall'])
+        self.assertEqual(codes.dtype, np.uint64)
+        self.assertEqual(codes.tolist(), [183948067390473, 218625548407277])
+        self.assertEqual(self.pa_1.encode_int('Christopher'), 260077772)
+        self.assertEqual(self.pa_1.decode_int(260077772), 'KRSTF1')
+
 
 if __name__ == '__main__':
     unittest.main()
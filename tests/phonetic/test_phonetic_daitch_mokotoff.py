@@ -89,6 +89,18 @@ class DaitchMokotoffTestCases(unittest.TestCase):
         self.assertEqual(self.pa.encode('Shwarzenegger'), '474659,479465')
         self.assertEqual(self.pa.encode('Schwartsenegger'), '479465')
 
+        # branching codes truncated at max_length
+        self.assertEqual(
+            self.pa.encode('Chojnacki-Czechowicz'),
+            '464544,464545,465447,465457,564544,564545,565447,565457',
+        )
+        self.assertEqual(
+            DaitchMokotoff(max_length=12, zero_pad=False).encode(
+                'Czechowicz-Czechowicz'
+            ),
+            '4474474,4474574,4574474,4574574',
+        )
+
         # max_length bounds tests
         self.assertEqual(
             DaitchMokotoff(max_length=-1).encode('Niall'), '68' + '0' * 62
@@ -2727,6 +2727,132 @@ class DoubleMetaphoneTestCases(unittest.TestCase):
         self.assertEqual(self.pa_4.encode('weikersheim'), 'AKRS,FKRS')
         self.assertEqual(self.pa_4.encode('zhao'), 'J,')
 
+    def test_double_metaphone_handlers(self):
+        """Test the letter handlers of abydos.phonetic.DoubleMetaphone."""
+        # these words take every branch of every handler
+        handled = (
+            (
+                'gewasbeschermingsmiddelenrichtlijn',
+                'JSPXRMNKSMTLNRKTLN,KSPSKRMNKSMTLNRKTLN',
+                'JSPX,KSPS',
+            ),
+            ('hushållsprinciper', 'HXLSPRNSPR,', 'HXLS,'),
+            ('vrijzinnigheid', 'FRSNT,', 'FRSN,'),
+            ('belachelijkheidjes', 'PLXLKTJS,PLKLKTJS', 'PLXL,PLKL'),
+            ('schlussfolgerungen', 'XLSFLKRNKN,SLSFLJRNKN', 'XLSF,SLSF'),
+            ('chatterbox', 'XTRPKS,', 'XTRP,'),
+            ('enthusiastically', 'AN0SSTKL,ANTXSTKL', 'AN0S,ANTX'),
+            ('wQgnir', 'KKNR,', 'KKNR,'),
+            ('mccaw', 'MK,MKF', 'MK,MKF'),
+            ('bellocchio', 'PLX,', 'PLX,'),
+            ('nachbarregier', 'NKPRJ,NKPRJR', 'NKPR,'),
+            ('xaughaj', 'SKJ,SK', 'SKJ,SK'),
+            ('jizzija', 'JSJ,ATSH', 'JSJ,ATSH'),
+            ('weggeschafft', 'AKXFT,FKXFT', 'AKXF,FKXF'),
+            ('agnosc', 'AKNSK,ANSK', 'AKNS,ANSK'),
+            ('excommunication', 'AKSMNKXN,', 'AKSM,'),
+            ('kneppeskjærsutstikker', 'NPSKRSTSTKR,', 'NPSK,'),
+            ('håndgangn', 'NTKNN,NTKNKN', 'NTKN,'),
+            ('Josephine', 'JSFN,HSFN', 'JSFN,HSFN'),
+            ('McHugh', 'MK,', 'MK,'),
+            ('ghislane', 'JLN,', 'JLN,'),
+            ('Czarnecki', 'SRNK,XRNK', 'SRNK,XRNK'),
+            ('chemcial', 'KMSL,KMXL', 'KMSL,KMXL'),
+            ('français', 'FRNS,FRNSS', 'FRNS,'),
+            ('Gibbs', 'KPS,JPS', 'KPS,JPS'),
+            ('Schwinghammer', 'XNKMR,XFNKMR', 'XNKM,XFNK'),
+            ('Switzer', 'STSR,XFXR', 'STSR,XFXR'),
+            ('accordingli', 'AKRTNKL,AKRTNL', 'AKRT,'),
+            ('adulescentia', 'ATLSNX,', 'ATLS,'),
+            ('boroughbridge', 'PRFPRJ,', 'PRFP,'),
+            ('schoolmeasth', 'SKLMST,', 'SKLM,'),
+            ('wheelwright', 'ALRT,', 'ALRT,'),
+            ('gallegos', 'KLKS,KKS', 'KLKS,KKS'),
+            ('Krumbholz', 'KRMPLS,KRMPLTS', 'KRMP,'),
+            ('Olszewski', 'ALSSK,ALXFSK', 'ALSS,ALXF'),
+            ('appalachia', 'APLK,', 'APLK,'),
+            ('archaelogy', 'ARKLJ,ARXLK', 'ARKL,ARXL'),
+            ('schatzhaus', 'XTJS,', 'XTJS,'),
+            ('', ',', ','),
+            ('Jose', 'HS,', 'HS,'),
+            ('focaccia', 'FKX,', 'FKX,'),
+            ('San Jacinto', 'SNHSNT,', 'SNHS,'),
+            ('breaux', 'PR,', 'PR,'),
+            ('accident', 'AKSTNT,', 'AKST,'),
+            ('mac caffrey', 'MKFR,', 'MKFR,'),
+            ('Ajjam', 'AJM,', 'AJM,'),
+            ('Año', 'AN,', 'AN,'),
+            ('Kaukasian', 'KKSN,', 'KKSN,'),
+            ('Zaqqum', 'SKM,', 'SKM,'),
+            ('stevven', 'STFN,', 'STFN,'),
+            ('ghoul', 'KL,', 'KL,'),
+            ('adelsheim', 'ATLSM,', 'ATLS,'),
+            ('caesar', 'SSR,', 'SSR,'),
+            ('hochmeier', 'HKMR,', 'HKMR,'),
+            ('sugarcane', 'XKRKN,SKRKN', 'XKRK,SKRK'),
+            ('abflughalle', 'APFLL,APFL', 'APFL,'),
+            ('schwiegertocht', 'XKRTKT,XFKRTKT', 'XKRT,XFKR'),
+            ('tigheumbers', 'TMRS,', 'TMRS,'),
+            ('bacher', 'PKR,', 'PKR,'),
+            ('bacchus', 'PKS,', 'PKS,'),
+            ('biaggi', 'PJ,PK', 'PJ,PK'),
+            ('Charac', 'KRK,', 'KRK,'),
+            ('chore', 'XR,', 'XR,'),
+            ('orchestra', 'ARKSTR,', 'ARKS,'),
+            ('succeed', 'SKST,', 'SKST,'),
+            ('danger', 'TNJR,TNKR', 'TNJR,TNKR'),
+            ('Brigham', 'PRM,', 'PRM,'),
+            ('de Vaux', 'TF,', 'TF,'),
+            ('AR', 'AR,', 'AR,'),
+            ('As', 'AS,', 'AS,'),
+            ('BMW', 'PM,', 'PM,'),
+            ('agnew', 'AKN,AKNF', 'AKN,AKNF'),
+            ('ccix', 'XKS,', 'XKS,'),
+            ('lgn', 'LN,LKN', 'LN,LKN'),
+            ('ll', 'L,', 'L,'),
+            ('mccielland', 'MKSLNT,MKXLNT', 'MKSL,MKXL'),
+            ('w', ',', ','),
+        )
+        for word, code, code_4 in handled:
+            self.assertEqual(self.pa.encode(word), code)
+            self.assertEqual(self.pa_4.encode(word), code_4)
+
+        # every letter with a handler is encoded
+        self.assertLessEqual(
+            set(DoubleMetaphone._dispatch),  # noqa: SF01
+            set(''.join(word for word, _, _ in handled).upper()),
+        )
+
+        # a W, K, or CZ marks a word as Slavo-Germanic, which changes the
+        # codes of G, J, R, S & Z
+        for word, code, slavo_germanic, slavo_germanic_code in (
+            ('cagli', 'KKL,KL', 'kagli', 'KKL,'),
+            ('tagliaro', 'TKLR,TLR', 'tagliarko', 'TKLRK,'),
+            ('jose', 'HS,', 'joswe', 'JS,AS'),
+            ('saja', 'SJ,SH', 'sajak', 'SJK,'),
+            ('rogier', 'RJ,RJR', 'rogierk', 'RJRK,RKRK'),
+            ('asia', 'AS,AX', 'wasia', 'AS,FS'),
+            ('bozo', 'PS,', 'bozok', 'PSK,PTSK'),
+            ('cerny', 'SRN,', 'czerny', 'SRN,XRN'),
+        ):
+            self.assertEqual(self.pa.encode(word), code)
+            self.assertEqual(
+                self.pa.encode(slavo_germanic), slavo_germanic_code
+            )
+
+        # a leading VAN, VON, or SCH marks a word as Germanic, which changes
+        # the codes of CH, G & TH
+        for word, code, germanic, germanic_code in (
+            ('shenker', 'XNKR,', 'schenker', 'XNKR,SKNKR'),
+            ('vanchapel', 'FNXPL,FNKPL', 'van chapel', 'FNKPL,'),
+            ('gelder', 'KLTR,JLTR', 'van gelder', 'FNKLTR,'),
+            ('gift', 'JFT,KFT', 'von gift', 'FNKFT,'),
+            ('thal', '0L,TL', 'von thal', 'FNTL,'),
+            ('thomas', 'TMS,', 'van thomas', 'FNTMS,'),
+        ):
+            self.assertEqual(self.pa.encode(word), code)
+            self.assertEqual(self.pa.encode(germanic), germanic_code)
+
 
 if __name__ == '__main__':
     unittest.main()
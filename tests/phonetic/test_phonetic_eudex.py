@@ -21,6 +21,8 @@ This module contains unit tests for abydos.phonetic.Eudex
 
 import unittest
 
+import numpy as np
+
 from abydos.phonetic import Eudex
 
 
@@ -84,6 +86,28 @@ class EudexTestCases(unittest.TestCase):
         self.assertEqual(self.pa.encode('christopher'), '433648490138894409')
         self.assertEqual(self.pa.encode('colin'), '432345564238053650')
 
+    def test_eudex_encode_int(self):
+        """Test abydos.phonetic.Eudex.encode_int."""
+        self.assertEqual(self.pa.encode_int(''), 18374686479671623680)
+        self.assertEqual(self.pa.encode_int('niall'), 648518346341351840)
+        self.assertEqual(
+            Eudex(max_length=4).encode_int('christopher'),
+            int(Eudex(max_length=4).encode('christopher')),
+        )
+
+    def test_eudex_encode_array(self):
+        """Test abydos.phonetic.Eudex.encode_array."""
+        words = ['', 'guillaume', 'niall', 'hello', 'christopher', 'colin']
+        hashes = self.pa.encode_array(words)
+        self.assertEqual(hashes.dtype, np.uint64)
+        self.assertEqual(
+            [int(_) for _ in hashes], [int(self.pa.encode(_)) for _ in words]
+        )
+        self.assertEqual(len(self.pa.encode_array([])), 0)
+
+        with self.assertRaises(ValueError):
+            Eudex(max_length=9).encode_array(words)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,8 @@ This module contains unit tests for abydos.phonetic.FuzzySoundex
 
 import unittest
 
+import numpy as np
+
 from abydos.phonetic import FuzzySoundex
 
 
@@ -99,6 +101,43 @@ class FuzzySoundexTestCases(unittest.TestCase):
         self.assertEqual(self.pa.encode_alpha('stephen'), 'STPN')
         self.assertEqual(self.pa.encode_alpha('steve'), 'STP')
 
+    def test_fuzzy_soundex_encode_int(self):
+        """Test abydos.phonetic.FuzzySoundex.encode_int."""
+        self.assertEqual(self.pa.encode_int('Christopher'), 44186554)
+        self.assertEqual(self.pa.encode_int('Niall'), 50319107)
+        self.assertEqual(self.pa.encode_int(''), 2141491)
+        self.assertEqual(self.pa.decode_int(44186554), 'K6931')
+        self.assertEqual(
+            self.pa.decode_int(self.pa.encode_int('Smith')), 'S5300'
+        )
+        self.assertLess(
+            self.pa.encode_int('Christopher'), self.pa.encode_int('Smith')
+        )
+
+        codes = self.pa.encode_array(['Christopher', 'Niall'])
+        self.assertEqual(codes.dtype, np.uint32)
+        self.assertEqual(codes.tolist(), [44186554, 50319107])
+
+        # the codes of every setting pack & unpack, including those of
+        # non-ASCII names
+        names = (
+            'Förster',
+            'Øster',
+            'Fëdor',
+            'Vandeusen',
+            "O'Neil",
+            'Smith',
+            '',
+        )
+        for max_length in (-1, 4, 10):
+            for zero_pad in (False, True):
+                pa = FuzzySoundex(max_length, zero_pad)
+                codes = pa.encode_array(names)
+                self.assertEqual(
+                    [pa.decode_int(code) for code in codes],
+                    [pa.encode(name) for name in names],
+                )
+
 
 if __name__ == '__main__':
     unittest.main()
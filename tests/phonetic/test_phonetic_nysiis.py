@@ -21,6 +21,8 @@ This module contains unit tests for abydos.phonetic.NYSIIS
 
 import unittest
 
+import numpy as np
+
 from abydos.phonetic import NYSIIS
 
 
@@ -194,6 +196,43 @@ class NysiisTestCases(unittest.TestCase):
         self.assertEqual(self.pa_mod.encode('Bosch'), 'BAS')
         self.assertEqual(self.pa_mod.encode('Schrader'), 'SRADAR')
 
+    def test_nysiis_encode_int(self):
+        """Test abydos.phonetic.NYSIIS.encode_int."""
+        self.assertEqual(self.pa.encode_int('Christopher'), 62732321)
+        self.assertEqual(self.pa.encode_int('Niall'), 241823232)
+        self.assertEqual(self.pa.encode_int(''), 0)
+        self.assertEqual(self.pa.decode_int(62732321), 'CRASTA')
+        self.assertEqual(
+            self.pa.decode_int(self.pa.encode_int('Smith')), 'SNAT'
+        )
+        self.assertLess(
+            self.pa.encode_int('Christopher'), self.pa.encode_int('Smith')
+        )
+
+        codes = self.pa.encode_array(['Christopher', 'Niall'])
+        self.assertEqual(codes.dtype, np.uint32)
+        self.assertEqual(codes.tolist(), [62732321, 241823232])
+
+        # the codes of every setting pack & unpack, including those of
+        # non-ASCII names
+        names = (
+            'Förster',
+            'Øster',
+            'Fëdor',
+            'Vandeusen',
+            "O'Neil",
+            'Smith',
+            '',
+        )
+        for max_length in (-1, 0, 6, 10):
+            for modified in (False, True):
+                pa = NYSIIS(max_length, modified)
+                codes = pa.encode_array(names)
+                self.assertEqual(
+                    [pa.decode_int(code) for code in codes],
+                    [pa.encode(name) for name in names],
+                )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,8 @@ This module contains unit tests for abydos.phonetic.Phonex
 
 import unittest
 
+import numpy as np
+
 from abydos.phonetic import Phonex
 
 
@@ -96,6 +98,43 @@ class PhonexTestCases(unittest.TestCase):
         self.assertEqual(self.pa.encode_alpha('Heames'), 'AN')
         self.assertEqual(self.pa.encode_alpha('Kneves'), 'NP')
 
+    def test_phonex_encode_int(self):
+        """Test abydos.phonetic.Phonex.encode_int."""
+        self.assertEqual(self.pa.encode_int('Christopher'), 723562)
+        self.assertEqual(self.pa.encode_int('Niall'), 1324187)
+        self.assertEqual(self.pa.encode_int(''), 56355)
+        self.assertEqual(self.pa.decode_int(723562), 'C623')
+        self.assertEqual(
+            self.pa.decode_int(self.pa.encode_int('Smith')), 'S530'
+        )
+        self.assertLess(
+            self.pa.encode_int('Christopher'), self.pa.encode_int('Smith')
+        )
+
+        codes = self.pa.encode_array(['Christopher', 'Niall'])
+        self.assertEqual(codes.dtype, np.uint32)
+        self.assertEqual(codes.tolist(), [723562, 1324187])
+
+        # the codes of every setting pack & unpack, including those of
+        # non-ASCII names
+        names = (
+            'Förster',
+            'Øster',
+            'Fëdor',
+            'Vandeusen',
+            "O'Neil",
+            'Smith',
+            '',
+        )
+        for max_length in (-1, 4, 10):
+            for zero_pad in (False, True):
+                pa = Phonex(max_length, zero_pad)
+                codes = pa.encode_array(names)
+                self.assertEqual(
+                    [pa.decode_int(code) for code in codes],
+                    [pa.encode(name) for name in names],
+                )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -21,6 +21,8 @@ This module contains unit tests for abydos.phonetic.RefinedSoundex
 
 import unittest
 
+import numpy as np
+
 from abydos.phonetic import RefinedSoundex
 
 
@@ -234,6 +236,43 @@ class RefinedSoundexTestCases(unittest.TestCase):
         self.assertEqual(self.pa.encode_alpha('Hairs'), 'HRK')
         self.assertEqual(self.pa.encode_alpha('Lamperd'), 'LNPRT')
 
+    def test_refined_soundex_encode_int(self):
+        """Test abydos.phonetic.RefinedSoundex.encode_int."""
+        pa_4 = RefinedSoundex(max_length=4)
+        self.assertEqual(pa_4.encode_int('Christopher'), 727935)
+        self.assertEqual(pa_4.encode_int('Niall'), 1328480)
+        self.assertEqual(pa_4.encode_int(''), 0)
+        self.assertEqual(pa_4.decode_int(727935), 'C936')
+        self.assertEqual(pa_4.decode_int(pa_4.encode_int('Smith')), 'S86')
+        self.assertLess(
+            pa_4.encode_int('Christopher'), pa_4.encode_int('Smith')
+        )
+
+        codes = pa_4.encode_array(['Christopher', 'Niall'])
+        self.assertEqual(codes.dtype, np.uint32)
+        self.assertEqual(codes.tolist(), [727935, 1328480])
+
+        # the codes of every setting pack & unpack, including those of
+        # non-ASCII names
+        names = (
+            'Förster',
+            'Øster',
+            'Fëdor',
+            'Vandeusen',
+            "O'Neil",
+            'Smith',
+            '',
+        )
+        for max_length in (-1, 0, 4, 10):
+            for zero_pad in (False, True):
+                for retain_vowels in (False, True):
+                    pa = RefinedSoundex(max_length, zero_pad, retain_vowels)
+                    codes = pa.encode_array(names)
+                    self.assertEqual(
+                        [pa.decode_int(code) for code in codes],
+                        [pa.encode(name) for name in names],
+                    )
+
 
 if __name__ == '__main__':
     unittest.main()
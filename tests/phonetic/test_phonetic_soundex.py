@@ -21,6 +21,8 @@ This module contains unit tests for abydos.phonetic.Soundex
 
 import unittest
 
+import numpy as np
+
 from abydos.phonetic import Soundex
 
 
@@ -144,6 +146,53 @@ class SoundexTestCases(unittest.TestCase):
         self.assertEqual(pa_census.encode('la Cruz'), 'L262,C620')
         self.assertEqual(pa_census.encode('vanDamme'), 'V535,D500')
 
+    def test_soundex_encode_int(self):
+        """Test abydos.phonetic.Soundex.encode_int."""
+        self.assertEqual(self.pa.encode_int('Christopher'), 523733)
+        self.assertEqual(self.pa.encode_int('Niall'), 1034282)
+        self.assertEqual(self.pa.encode_int(''), 95978)
+        self.assertEqual(self.pa.decode_int(523733), 'C623')
+        self.assertEqual(
+            self.pa.decode_int(self.pa.encode_int('Smith')), 'S530'
+        )
+        self.assertLess(
+            self.pa.encode_int('Christopher'), self.pa.encode_int('Smith')
+        )
+
+        codes = self.pa.encode_array(['Christopher', 'Niall'])
+        self.assertEqual(codes.dtype, np.uint32)
+        self.assertEqual(codes.tolist(), [523733, 1034282])
+
+        # the codes of every setting pack & unpack, including those of
+        # non-ASCII names & those of prefixed names in Census Soundex
+        names = (
+            'Förster',
+            'Øster',
+            'Fëdor',
+            'Vandeusen',
+            "O'Neil",
+            'Smith',
+            '',
+        )
+        for max_length in (-1, 4, 10):
+            for var in ('American', 'special', 'Census'):
+                for reverse in (False, True):
+                    for zero_pad in (False, True):
+                        pa = Soundex(max_length, var, reverse, zero_pad)
+                        codes = pa.encode_array(names)
+                        self.assertEqual(
+                            [pa.decode_int(code) for code in codes],
+                            [pa.encode(name) for name in names],
+                        )
+
+        # the ints of Census codes sort like the codes, prefixed or not
+        pa_census = Soundex(var='Census')
+        names = ('Vandeusen', 'Vance', 'Van', 'Dusen', 'Delacroix', 'Lacroix')
+        self.assertEqual(
+            sorted(names, key=pa_census.encode_int),
+            sorted(names, key=pa_census.encode),
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
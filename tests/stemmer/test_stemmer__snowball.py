@@ -97,6 +97,40 @@ class SnowballTestCases(unittest.TestCase):
         self.assertEqual(self.stmr._sb_r2('sprinkled'), 9)  # noqa: SF01
         self.assertEqual(self.stmr._sb_r2('eucharist'), 6)  # noqa: SF01
 
+    def test_sb_regions(self):
+        """Test abydos.stemmer._Snowball._sb_regions."""
+        # base case
+        self.assertEqual(self.stmr._sb_regions(''), (0, 0))  # noqa: SF01
+
+        # examples from http://snowball.tartarus.org/texts/r1r2.html
+        for word in (
+            'beautiful',
+            'beauty',
+            'beau',
+            'animadversion',
+            'sprinkled',
+            'eucharist',
+        ):
+            self.assertEqual(
+                self.stmr._sb_regions(word),  # noqa: SF01
+                (
+                    self.stmr._sb_r1(word),  # noqa: SF01
+                    self.stmr._sb_r2(word),  # noqa: SF01
+                ),
+            )
+
+        self.assertEqual(
+            self.stmr._sb_regions('generously', {'gener'}),  # noqa: SF01
+            (5, 8),
+        )
+
+    def test_sb_first_vowel(self):
+        """Test abydos.stemmer._Snowball._sb_first_vowel."""
+        self.assertEqual(self.stmr._sb_first_vowel(''), 0)  # noqa: SF01
+        self.assertEqual(self.stmr._sb_first_vowel('pfY'), 3)  # noqa: SF01
+        self.assertEqual(self.stmr._sb_first_vowel('phi'), 2)  # noqa: SF01
+        self.assertEqual(self.stmr._sb_first_vowel('ade'), 0)  # noqa: SF01
+
     def test_sb_ends_in_short_syllable(self):
         """Test abydos.stemmer._Snowball._sb_ends_in_short_syllable."""
         # base case
@@ -19,7 +19,11 @@
 This module contains unit tests for abydos.stemmer._Stemmer
 """
 
+import pickle
 import unittest
+import weakref
+
+from abydos.stemmer import Porter
 
 # noinspection PyProtectedMember
 from abydos.stemmer._stemmer import _Stemmer
@@ -39,6 +43,61 @@ class SnowballTestCases(unittest.TestCase):
         self.assertEqual(self.stmr.stem(''), '')
         self.assertEqual(self.stmr.stem('word'), 'word')
 
+    def test__stemmer_stem_cached(self):
+        """Test abydos.stemmer._Stemmer.stem_cached."""
+        self.assertEqual(self.stmr.stem_cached(''), '')
+        self.assertEqual(self.stmr.stem_cached('word'), 'word')
+
+        stmr = Porter()
+        self.assertEqual(stmr.stem_cached('democracy'), 'democraci')
+        self.assertEqual(stmr.stem_cached('democracy'), 'democraci')
+        self.assertEqual(stmr._stem_cache.hits, 1)  # noqa: SF01
+
+        # the cache does not refer back to the stemmer, so it is freed as soon
+        # as it is unreferenced
+        ref = weakref.ref(stmr)
+        del stmr
+        self.assertIsNone(ref())
+        stmr = Porter()
+        stmr.stem_cached('democracy')
+
+        # the cache is dropped when pickling
+        stmr = pickle.loads(pickle.dumps(stmr))
+        self.assertNotIn('_stem_cache', stmr.__dict__)
+        self.assertEqual(stmr.stem_cached('trusted'), 'trust')
+
+    def test__stemmer_stem_many(self):
+        """Test abydos.stemmer._Stemmer.stem_many."""
+        self.assertEqual(list(self.stmr.stem_many([])), [])
+        self.assertEqual(
+            list(self.stmr.stem_many(['word', 'words', 'word'])),
+            ['word', 'words', 'word'],
+        )
+
+        stmr = Porter()
+        tokens = 'the trusted democracy trusted the trusting people'.split()
+        stems = [stmr.stem(token) for token in tokens]
+        self.assertEqual(list(stmr.stem_many(tokens)), stems)
+        self.assertEqual(list(stmr.stem_many(iter(tokens))), stems)
+        self.assertEqual(list(Porter().stem_many(tokens, n_jobs=2)), stems)
+        self.assertEqual(list(Porter().stem_many(tokens, n_jobs=-1)), stems)
+
+        # tokens are read a batch at a time, so an endless stream is stemmed
+        # lazily
+        stmr = Porter()
+        stmr._batch_size = 4  # noqa: SF01
+        stream = iter(tokens * 3)
+        stemmed = stmr.stem_many(stream)
+        self.assertEqual([next(stemmed) for _ in range(5)], stems[:5])
+        self.assertEqual(len(list(stream)), len(tokens) * 3 - 8)
+        for n_jobs in (None, 2):
+            self.assertEqual(
+                list(stmr.stem_many(tokens * 3, n_jobs=n_jobs)), stems * 3
+            )
+        self.assertRaises(ValueError, stmr.stem_many, tokens, n_jobs=0)
+        self.assertRaises(ValueError, stmr.stem_many, tokens, n_jobs=-2)
+        self.assertRaises(ValueError, stmr.stem_many, [], n_jobs=0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,103 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.stemmer.test_stemmer__suffix_trie.
+
+This module contains unit tests for abydos.stemmer._SuffixTrie
+"""
+
+import codecs
+import unittest
+from itertools import chain
+
+from abydos.stemmer import Lovins, PaiceHusk, UEALite
+
+# noinspection PyProtectedMember
+from abydos.stemmer._suffix_trie import _SuffixTrie
+
+from .. import _corpus_file
+
+
+class SuffixTrieTestCases(unittest.TestCase):
+    """Test _SuffixTrie class.
+
+    test cases for abydos.stemmer._SuffixTrie
+    """
+
+    @staticmethod
+    def _corpus_words():
+        words = set()
+        for filename in (
+            'snowball_lovins.csv',
+            'paicehusk.csv',
+            'uea-lite_wsj.csv',
+        ):
+            with codecs.open(_corpus_file(filename), encoding='utf-8') as ts:
+                for line in ts:
+                    if line[0] != '#':
+                        words.add(line.strip().split(',')[0])
+        return words
+
+    def test_suffix_trie_matches(self):
+        """Test abydos.stemmer._SuffixTrie.matches."""
+        trie = _SuffixTrie(('s', 'es', 'ies', 'ing'))
+        self.assertEqual(trie.matches(''), [])
+        self.assertEqual(trie.matches('s'), ['s'])
+        self.assertEqual(trie.matches('flies'), ['ies', 'es', 's'])
+        self.assertEqual(trie.matches('flies', 3), ['es', 's'])
+        self.assertEqual(trie.matches('flies', 5), [])
+        self.assertEqual(trie.matches('fly'), [])
+        self.assertEqual(trie.matches('singing'), ['ing'])
+
+        self.assertEqual(_SuffixTrie(()).matches('flies'), [])
+
+    def test_suffix_trie_rule_tables(self):
+        """Test abydos.stemmer._SuffixTrie against probing rule tables."""
+        words = self._corpus_words()
+
+        # Lovins probes its endings from the longest down, requiring a stem
+        # of at least two letters
+        lovins = Lovins()._suffix  # noqa: SF01
+        trie = _SuffixTrie(lovins)
+        for word in words:
+            self.assertEqual(
+                trie.matches(word, 2),
+                [
+                    word[-n:]
+                    for n in range(11, 0, -1)
+                    if word[-n:] in lovins and len(word) - n >= 2
+                ],
+            )
+
+        # Paice-Husk and UEA-Lite probe tables keyed by ending length
+        for tables in (
+            PaiceHusk._rule_table,  # noqa: SF01
+            *UEALite._rules.values(),  # noqa: SF01
+        ):
+            trie = _SuffixTrie(chain.from_iterable(tables.values()))
+            for word in words:
+                self.assertEqual(
+                    trie.matches(word),
+                    [
+                        word[-n:]
+                        for n in sorted(tables, reverse=True)
+                        if word[-n:] in tables[n]
+                    ],
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.stemmer.test_stemmer_lexicon_stemmer.
+
+This module contains unit tests for abydos.stemmer.LexiconStemmer
+"""
+
+import codecs
+import os
+import pickle
+import tempfile
+import unittest
+
+from abydos.corpus import Corpus, UnigramCorpus
+from abydos.stemmer import LexiconStemmer, Porter, Porter2
+
+from .. import _corpus_file
+
+
+class LexiconStemmerTestCases(unittest.TestCase):
+    """Test LexiconStemmer functions.
+
+    abydos.stemmer.LexiconStemmer
+    """
+
+    def setUp(self):
+        """Write a Porter2 lexicon of the Snowball Porter2 test words."""
+        with codecs.open(
+            _corpus_file('snowball_porter2.csv'), encoding='utf-8'
+        ) as snowball_ts:
+            self.words = [
+                line.strip().split(',')[0]
+                for line in snowball_ts
+                if line[0] != '#'
+            ][1:]
+
+        handle, self.path = tempfile.mkstemp('.lex')
+        os.close(handle)
+        LexiconStemmer.write_lexicon(self.path, Porter2(), self.words)
+
+    def tearDown(self):
+        """Remove the lexicon."""
+        os.remove(self.path)
+
+    def test_lexicon_stemmer(self):
+        """Test abydos.stemmer.LexiconStemmer."""
+        stmr = LexiconStemmer(self.path, Porter2())
+        porter2 = Porter2()
+
+        self.assertEqual(len(stmr), len(set(self.words)))
+        for word in self.words:
+            self.assertIn(word, stmr)
+            self.assertEqual(stmr.stem(word), porter2.stem(word))
+
+        # misses fall back to the live stemmer, or return the word unchanged
+        self.assertNotIn('democratization', stmr)
+        self.assertEqual(stmr.stem('democratization'), 'democrat')
+        self.assertEqual(
+            LexiconStemmer(self.path).stem('democratization'),
+            'democratization',
+        )
+
+        # the fallback stemmer need not be the one that wrote the lexicon
+        stmr = LexiconStemmer(self.path, Porter())
+        self.assertEqual(stmr.stem('generously'), 'generous')
+        self.assertEqual(stmr.stem('quuxing'), 'quux')
+
+    def test_lexicon_stemmer_write_lexicon(self):
+        """Test abydos.stemmer.LexiconStemmer.write_lexicon."""
+        # an empty vocabulary
+        LexiconStemmer.write_lexicon(self.path, Porter(), [])
+        stmr = LexiconStemmer(self.path, Porter())
+        self.assertEqual(len(stmr), 0)
+        self.assertEqual(stmr.stem('trusted'), 'trust')
+
+        # non-ASCII words & stems
+        words = ['zoë', 'ångström', 'ápple', 'zebra', '\ud800', '']
+        LexiconStemmer.write_lexicon(self.path, Porter(), words)
+        stmr = LexiconStemmer(self.path)
+        self.assertEqual(len(stmr), len(words))
+        for word in words:
+            self.assertIn(word, stmr)
+            self.assertEqual(stmr.stem(word), Porter().stem(word))
+        self.assertNotIn('zoe', stmr)
+
+        # the words of a UnigramCorpus
+        corpus = UnigramCorpus()
+        corpus.add_document('The trusted democracies trusted the people')
+        LexiconStemmer.write_lexicon(self.path, Porter(), corpus)
+        stmr = LexiconStemmer(self.path)
+        self.assertEqual(len(stmr), 5)
+        self.assertEqual(stmr.stem('democracies'), 'democraci')
+        self.assertEqual(stmr.stem('The'), 'the')
+
+        # the words of a Corpus
+        corpus = Corpus(
+            'The trusted democracies.\n\nThe democracies trusted people',
+            filter_chars='.',
+        )
+        LexiconStemmer.write_lexicon(self.path, Porter(), corpus)
+        stmr = LexiconStemmer(self.path)
+        self.assertEqual(len(stmr), 4)
+        self.assertIn('democracies', stmr)
+        self.assertEqual(stmr.stem('people'), 'peopl')
+
+        # vocabularies of things other than strings
+        self.assertRaises(
+            TypeError,
+            LexiconStemmer.write_lexicon,
+            self.path,
+            Porter(),
+            [['trusted', 'people']],
+        )
+        self.assertRaises(
+            TypeError,
+            LexiconStemmer.write_lexicon,
+            self.path,
+            Porter(),
+            [1, 2, 3],
+        )
+
+        # files that are not lexicons
+        with open(self.path, 'wb') as lexicon:
+            lexicon.write(b'not a lexicon, just some bytes')
+        self.assertRaises(ValueError, LexiconStemmer, self.path)
+        with open(self.path, 'wb') as lexicon:
+            lexicon.write(b'short')
+        self.assertRaises(ValueError, LexiconStemmer, self.path)
+        with open(self.path, 'wb') as lexicon:
+            lexicon.write(b'ABYDLEX1' + bytes((255,) * 8))
+        self.assertRaises(ValueError, LexiconStemmer, self.path)
+
+    def test_lexicon_stemmer_pickle(self):
+        """Test abydos.stemmer.LexiconStemmer pickling & stem_many."""
+        stmr = pickle.loads(  # noqa: S301
+            pickle.dumps(LexiconStemmer(self.path, Porter2()))
+        )
+        self.assertEqual(stmr.stem('generously'), 'generous')
+        self.assertEqual(stmr.stem('ghostwritings'), 'ghostwrit')
+
+        tokens = self.words[:200] + ['ghostwritings']
+        self.assertEqual(
+            list(stmr.stem_many(tokens, n_jobs=2)),
+            list(Porter2().stem_many(tokens)),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
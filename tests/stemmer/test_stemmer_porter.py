@@ -62,6 +62,12 @@ class PorterTestCases(unittest.TestCase):
         self.assertEqual(self.stmr._m_degree('oaten'), 2)  # noqa: SF01
         self.assertEqual(self.stmr._m_degree('orrery'), 2)  # noqa: SF01
 
+        # suffix_len excludes a candidate suffix
+        self.assertEqual(self.stmr._m_degree('troubles', 1), 1)  # noqa: SF01
+        self.assertEqual(self.stmr._m_degree('oaten', 2), 1)  # noqa: SF01
+        self.assertEqual(self.stmr._m_degree('oaten', 3), 0)  # noqa: SF01
+        self.assertEqual(self.stmr._m_degree('tree', 7), 0)  # noqa: SF01
+
     def test_has_vowel(self):
         """Test abydos.stemmer.Porter._has_vowel."""
         # base case
@@ -91,6 +97,11 @@ class PorterTestCases(unittest.TestCase):
 
         self.assertFalse(self.stmr._has_vowel('pfY'))  # noqa: SF01
 
+        # suffix_len excludes a candidate suffix
+        self.assertTrue(self.stmr._has_vowel('cading', 3))  # noqa: SF01
+        self.assertFalse(self.stmr._has_vowel('thing', 3))  # noqa: SF01
+        self.assertFalse(self.stmr._has_vowel('ed', 3))  # noqa: SF01
+
     def test_ends_in_doubled_cons(self):
         """Test abydos.stemmer.Porter._ends_in_doubled_cons."""
         # base case
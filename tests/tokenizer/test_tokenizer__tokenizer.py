@@ -22,9 +22,21 @@ This module contains unit tests for abydos.tokenizer._Tokenizer
 import sys
 import unittest
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from math import log1p
 
-from abydos.tokenizer import QGrams, QSkipgrams, _Tokenizer
+import numpy as np
+
+from abydos.tokenizer import (
+    CVClusterTokenizer,
+    CharacterTokenizer,
+    QGrams,
+    QSkipgrams,
+    SAPSTokenizer,
+    WhitespaceTokenizer,
+    WordpunctTokenizer,
+    _Tokenizer,
+)
 
 
 class TokenizerTestCases(unittest.TestCase):
@@ -180,6 +192,96 @@ class TokenizerTestCases(unittest.TestCase):
         nelson_entropy = QSkipgrams(scaler='entropy').tokenize('NELSON')
         self.assertAlmostEqual(nelson_entropy.count(), 4.6644977792)
 
+    def test__tokenizer_stateless(self):
+        """Test abydos.tokenizer._Tokenizer.tokens & counts."""
+        strings = ('', 'a', 'NELSON', 'Good to be home for a night', 'ABAB')
+        for tokenizer in (
+            _Tokenizer(),
+            QGrams(),
+            QGrams(qval=range(3), skip=[0, 1], scaler='set'),
+            QSkipgrams(scaler='SSK'),
+            QSkipgrams(counts_only=True),
+            CharacterTokenizer(scaler=log1p),
+            CVClusterTokenizer(),
+            SAPSTokenizer(scaler='length'),
+            WhitespaceTokenizer(scaler='entropy'),
+            WordpunctTokenizer(),
+        ):
+            tokenizer.tokenize('previous')
+            before = tokenizer.get_counter(), list(tokenizer.get_list())
+            for string in strings:
+                gold = type(tokenizer).__new__(type(tokenizer))
+                gold.__dict__.update(tokenizer.__dict__)
+                gold.tokenize(string)
+                self.assertEqual(tokenizer.tokens(string), gold.get_list())
+                self.assertEqual(tokenizer.counts(string), gold.get_counter())
+            # the tokenizer's own tokens are untouched
+            self.assertEqual(
+                (tokenizer.get_counter(), tokenizer.get_list()), before
+            )
+
+        # one tokenizer may be shared between threads
+        tokenizer = QGrams(qval=3)
+        words = ['word{}'.format(i) * (i % 7 + 1) for i in range(500)]
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(tokenizer.counts, words))
+        self.assertEqual(
+            results,
+            [QGrams(qval=3).tokenize(word).get_counter() for word in words],
+        )
+
+    def test__tokenizer_fit_transform(self):
+        """Test abydos.tokenizer._Tokenizer.fit_transform & transform."""
+        strings = ['NELSON', 'NEILSEN', '', 'NELSON NEILSEN', 'ABAB']
+        for tokenizer in (
+            QGrams(),
+            QGrams(scaler='set'),
+            QGrams(scaler='length-log'),
+            QSkipgrams(scaler='SSK'),
+            WhitespaceTokenizer(scaler='entropy'),
+            CharacterTokenizer(scaler=log1p),
+        ):
+            vocab, indptr, indices, data = tokenizer.fit_transform(strings)
+            self.assertEqual(sorted(vocab.values()), list(range(len(vocab))))
+            self.assertEqual(len(indptr), len(strings) + 1)
+            self.assertEqual(indptr[-1], len(indices))
+            self.assertEqual(len(indices), len(data))
+            self.assertEqual(indices.dtype, np.int64)
+            self.assertEqual(data.dtype, np.float64)
+
+            tokens = {column: token for token, column in vocab.items()}
+            for i, string in enumerate(strings):
+                row = indices[indptr[i] : indptr[i + 1]]
+                self.assertEqual(list(row), sorted(row))
+                counts = tokenizer.counts(string)
+                self.assertEqual(
+                    {tokens[column] for column in row}, set(counts)
+                )
+                for column, value in zip(row, data[indptr[i] : indptr[i + 1]]):
+                    self.assertAlmostEqual(value, counts[tokens[column]])
+
+            # transforming the same strings gives the same matrix
+            vocab2, indptr2, indices2, data2 = tokenizer.transform(strings)
+            self.assertIs(vocab2, vocab)
+            self.assertEqual(list(indptr2), list(indptr))
+            self.assertEqual(list(indices2), list(indices))
+            self.assertEqual(list(data2), list(data))
+
+        tokenizer = WhitespaceTokenizer()
+        self.assertRaises(ValueError, tokenizer.transform, ['a'])
+        vocab, indptr, indices, data = tokenizer.fit_transform([])
+        self.assertEqual(vocab, {})
+        self.assertEqual(list(indptr), [0])
+        self.assertEqual(list(indices), [])
+
+        # unknown tokens are left out of transformed rows
+        tokenizer.fit_transform(['a b a', 'b c'])
+        vocab, indptr, indices, data = tokenizer.transform(['d', 'c d a c'])
+        self.assertEqual(vocab, {'a': 0, 'b': 1, 'c': 2})
+        self.assertEqual(list(indptr), [0, 0, 2])
+        self.assertEqual(list(indices), [0, 2])
+        self.assertEqual(list(data), [1.0, 2.0])
+
 
 if __name__ == '__main__':
     unittest.main()
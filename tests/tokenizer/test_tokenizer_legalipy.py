@@ -19,9 +19,12 @@
 This module contains unit tests for abydos.tokenizer.QGrams
 """
 
+import os
+import tempfile
 import unittest
 
 from abydos.tokenizer import LegaliPyTokenizer
+from abydos.tokenizer._legalipy import _legalipy
 
 from .. import _corpus_file
 
@@ -89,6 +92,77 @@ class LegaliPyTokenizerTestCases(unittest.TestCase):
             sorted(['ca', 'ter', 'pil', 'lars']),
         )
 
+    def test_legalipy_tokenizer_onsets(self):
+        """Test abydos.tokenizer.LegaliPyTokenizer save & load_onsets."""
+        try:
+            from syllabipy.legalipy import LegaliPy  # noqa: F401
+        except ImportError:  # pragma: no cover
+            return
+
+        tok = LegaliPyTokenizer()
+        with open(_corpus_file('wikipediaCommonMisspellings.csv')) as corpus:
+            text = ' '.join([_.split(',')[1] for _ in corpus.readlines()])
+        tok.train_onsets(text)
+
+        handle, path = tempfile.mkstemp('.json')
+        os.close(handle)
+        try:
+            tok.save_onsets(path)
+            loaded = LegaliPyTokenizer()
+            loaded.load_onsets(path)
+            self.assertEqual(
+                sorted(loaded._onsets), sorted(tok._onsets)  # noqa: SF01
+            )
+            for word in ('nelson', 'neilson', 'peninsular', 'caterpillars'):
+                self.assertEqual(loaded.tokens(word), tok.tokens(word))
+
+            loaded = LegaliPyTokenizer()
+            loaded.load_onsets(path, append=True)
+            self.assertIn('', loaded._onsets)  # noqa: SF01
+            self.assertEqual(
+                len(loaded._onsets), len(set(tok._onsets) | {''})  # noqa: SF01
+            )
+
+            with open(path, 'w') as onset_file:
+                onset_file.write('{"onsets": ["n"]}')
+            self.assertRaises(ValueError, loaded.load_onsets, path)
+        finally:
+            os.remove(path)
+
+    def test_legalipy_tokenizer_tokenize_many(self):
+        """Test abydos.tokenizer.LegaliPyTokenizer.tokenize_many."""
+        try:
+            from syllabipy.legalipy import LegaliPy  # noqa: F401
+        except ImportError:  # pragma: no cover
+            return
+
+        tok = LegaliPyTokenizer()
+        strings = ['nelson', '', 'nelson neilson', 'a', '  ', 'seven-twelfths']
+        self.assertEqual(
+            tok.tokenize_many(strings), [tok.tokens(_) for _ in strings]
+        )
+        self.assertEqual(tok.tokenize_many([]), [])
+
+        # the syllabification cache distinguishes onset sets
+        tok.train_onsets('nelson sonnet nest nelly')
+        self.assertEqual(
+            tok.tokenize_many(strings), [tok.tokens(_) for _ in strings]
+        )
+        self.assertNotEqual(
+            tok.tokens('nelson'), LegaliPyTokenizer().tokens('nelson')
+        )
+
+        # tokenize & tokenize_many share the syllabification cache
+        tok = LegaliPyTokenizer()
+        _legalipy.cache_clear()
+        tok.tokenize_many(['nelson neilson', 'nelson'])
+        self.assertEqual(_legalipy.cache_info().misses, 2)
+        tok.tokenize('nelson')
+        self.assertEqual(_legalipy.cache_info().hits, 1)
+        tok.tokenize_many(['neilson', 'nelson', 'nelly'])
+        info = _legalipy.cache_info()
+        self.assertEqual((info.hits, info.misses), (3, 3))
+
 
 if __name__ == '__main__':
     unittest.main()
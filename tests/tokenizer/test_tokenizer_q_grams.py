@@ -24,6 +24,8 @@ import unittest
 from collections import Counter
 from math import log1p
 
+import numpy as np
+
 from abydos.tokenizer import QGrams
 
 
@@ -378,6 +380,55 @@ class QGramsTestCases(unittest.TestCase):
             ),
         )
 
+    def test_qgrams_encode_array(self):
+        """Test abydos.tokenizer.QGrams.encode_array & tokenize_array."""
+        self.assertEqual(QGrams().encode_array('').tolist(), [])
+        self.assertEqual(QGrams(-1).encode_array('NELSON').tolist(), [])
+        self.assertEqual(QGrams(qval=1).encode_array('AB').tolist(), [66, 67])
+        self.assertEqual(
+            QGrams(qval=2, start_stop='').encode_array('AB').tolist(),
+            [66 * 0x110001 + 67],
+        )
+        self.assertEqual(QGrams().encode_array('A').dtype, np.uint64)
+
+        # the ids of q-grams up to length 3 identify them exactly, in the
+        # order tokenize produces them
+        for params in (
+            {},
+            {'qval': 1},
+            {'qval': 3, 'start_stop': ''},
+            {'qval': range(4), 'skip': [0, 1]},
+            {'start_stop': '', 'skip': 2},
+        ):
+            for string in ('', 'a', 'AACTAGAAC', 'interdisciplinarian', 'zoë'):
+                tokens = QGrams(**params).tokenize(string).get_list()
+                ids = QGrams(**params).encode_array(string).tolist()
+                self.assertEqual(len(tokens), len(ids))
+                self.assertEqual(len(set(zip(tokens, ids))), len(set(tokens)))
+                self.assertEqual(len(set(ids)), len(set(tokens)))
+
+        # longer q-grams are hashed consistently
+        qg = QGrams(qval=5, start_stop='')
+        self.assertEqual(
+            qg.encode_array('AACTAGAAC')[1:4].tolist(),
+            qg.encode_array('ACTAGAA')[:3].tolist(),
+        )
+
+        strings = ['AACTAGAAC', '', 'a', 'GAAGATAC', 'zoë']
+        for qg in (QGrams(), QGrams(qval=(1, 3), skip=[0, 1])):
+            ids, offsets = qg.tokenize_array(strings)
+            self.assertEqual(len(offsets), len(strings) + 1)
+            self.assertEqual(offsets[-1], len(ids))
+            for i, string in enumerate(strings):
+                self.assertEqual(
+                    ids[offsets[i] : offsets[i + 1]].tolist(),
+                    qg.encode_array(string).tolist(),
+                )
+
+        ids, offsets = QGrams().tokenize_array([])
+        self.assertEqual(ids.tolist(), [])
+        self.assertEqual(offsets.tolist(), [0])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -616,6 +616,94 @@ class QSkipgramsTestCases(unittest.TestCase):
         for key in gold_counter.keys():
             self.assertAlmostEqual(gold_counter[key], test_counter[key])
 
+    def test_qskipgrams_max_gap(self):
+        """Test abydos.tokenizer.QSkipgrams with max_gap."""
+        self.assertEqual(
+            sorted(
+                QSkipgrams(start_stop='', max_gap=0)
+                .tokenize('ABCD')
+                .get_list()
+            ),
+            ['AB', 'BC', 'CD'],
+        )
+        self.assertEqual(
+            QSkipgrams(start_stop='', max_gap=1).tokenize('ABCDE').get_list(),
+            ['AB', 'AC', 'BC', 'BD', 'CD', 'CE', 'DE'],
+        )
+        self.assertEqual(
+            QSkipgrams(qval=3, start_stop='', max_gap=1)
+            .tokenize('ABCDE')
+            .get_list(),
+            ['ABC', 'ABD', 'ACD', 'ACE', 'BCD', 'BCE', 'BDE', 'CDE'],
+        )
+        self.assertEqual(
+            QSkipgrams(qval=3, start_stop='', max_gap=1)
+            .tokenize('AB')
+            .get_list(),
+            [],
+        )
+        # a gap as long as the padded string is no limit at all
+        self.assertEqual(
+            QSkipgrams(qval=3, max_gap=11).tokenize('AACTAGAAC').get_counter(),
+            QSkipgrams(qval=3).tokenize('AACTAGAAC').get_counter(),
+        )
+
+        test_counter = (
+            QSkipgrams(start_stop='', scaler='SSK', max_gap=1)
+            .tokenize('ABAB')
+            .get_counter()
+        )
+        self.assertAlmostEqual(test_counter['AB'], 2 * 0.9 ** 2)
+        self.assertAlmostEqual(test_counter['AA'], 0.9 ** 3)
+        self.assertAlmostEqual(test_counter['BA'], 0.9 ** 2)
+        self.assertAlmostEqual(test_counter['BB'], 0.9 ** 3)
+
+    def test_qskipgrams_counts_only(self):
+        """Test abydos.tokenizer.QSkipgrams with counts_only."""
+        self.assertEqual(
+            QSkipgrams(counts_only=True).tokenize('').get_counter(), Counter()
+        )
+        self.assertEqual(
+            QSkipgrams(counts_only=True).tokenize('NELSON').get_list(), []
+        )
+
+        for string in ('', 'a', 'NELSON', 'AACTAGAAC', 'ABCABCABCABC'):
+            for params in (
+                {},
+                {'qval': 1},
+                {'qval': 3},
+                {'qval': (2, 3), 'start_stop': ''},
+                {'qval': 3, 'max_gap': 1},
+                {'scaler': 'set'},
+                {'scaler': 'length'},
+                {'scaler': 'length-log'},
+                {'scaler': 'length-exp'},
+                {'scaler': 'entropy'},
+                {'qval': 3, 'scaler': 'SSK'},
+                {'scaler': 'SSK', 'ssk_lambda': (0.5, 0.05), 'max_gap': 2},
+            ):
+                gold_counter = (
+                    QSkipgrams(**params).tokenize(string).get_counter()
+                )
+                test_counter = (
+                    QSkipgrams(counts_only=True, **params)
+                    .tokenize(string)
+                    .get_counter()
+                )
+                self.assertEqual(set(gold_counter), set(test_counter))
+                for key in gold_counter.keys():
+                    self.assertAlmostEqual(
+                        gold_counter[key], test_counter[key]
+                    )
+
+        # long strings are counted without enumerating their skipgrams
+        test_counter = (
+            QSkipgrams(qval=3, start_stop='', counts_only=True)
+            .tokenize('A' * 1000)
+            .get_counter()
+        )
+        self.assertEqual(test_counter, Counter({'AAA': 166167000}))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,7 +19,11 @@
 This module contains unit tests for abydos.tokenizer.QGrams
 """
 
+import io
+import os
+import tempfile
 import unittest
+from collections import Counter
 
 from abydos.tokenizer import RegexpTokenizer
 
@@ -79,6 +83,84 @@ class RegexpTokenizerTestCases(unittest.TestCase):
             ),
         )
 
+    def test_regexp_tokenizer_iter_tokens(self):
+        """Test abydos.tokenizer.RegexpTokenizer.iter_tokens."""
+        text = (
+            "Looking forward to hearing your ideas about what we can "
+            "accomplish this year & beyond.\nI'll answer your questions on "
+            "#AskPOTUS at 12:30p ET. Zoë's naïve café, 東京!"
+        )
+        for tokenizer in (
+            RegexpTokenizer(),
+            RegexpTokenizer(regexp=r'[^ ]+'),
+            RegexpTokenizer(regexp=r'([a-z]+)(\d*)'),
+            RegexpTokenizer(regexp=r'(a)|(\d+)'),
+            RegexpTokenizer(regexp=r'\w*'),
+        ):
+            gold = tokenizer.tokens(text)
+            for chunk_size in (1, 2, 3, 7, 64, 1 << 20):
+                counter = Counter()
+                self.assertEqual(
+                    list(
+                        tokenizer.iter_tokens(
+                            io.StringIO(text),
+                            chunk_size=chunk_size,
+                            counter=counter,
+                        )
+                    ),
+                    gold,
+                )
+                self.assertEqual(counter, Counter(gold))
+                # multi-byte characters may be split between binary chunks
+                self.assertEqual(
+                    list(
+                        tokenizer.iter_tokens(
+                            io.BytesIO(text.encode('utf-8')),
+                            chunk_size=chunk_size,
+                        )
+                    ),
+                    gold,
+                )
+
+        self.assertEqual(
+            list(RegexpTokenizer().iter_tokens(io.StringIO())), []
+        )
+
+        # regexps that match fixed-width tokens, rather than runs, resume
+        # each search where the last one ended
+        for regexp, text in (
+            ('[a-z]{3}', 'abcdefghijkl'),
+            ('([a-z]{3})', 'abcdefghijkl'),
+            ('aa', 'aaaa'),
+            ('ab|ba', 'abababa'),
+        ):
+            tokenizer = RegexpTokenizer(regexp=regexp)
+            for chunk_size in (1, 2, 3, 4, 5):
+                self.assertEqual(
+                    list(
+                        tokenizer.iter_tokens(
+                            io.StringIO(text), chunk_size=chunk_size
+                        )
+                    ),
+                    tokenizer.tokens(text),
+                )
+
+        handle, path = tempfile.mkstemp('.txt')
+        os.close(handle)
+        try:
+            with open(path, 'w', encoding='utf-16') as text_file:
+                text_file.write(text)
+            self.assertEqual(
+                list(
+                    RegexpTokenizer().iter_tokens(
+                        path, encoding='utf-16', chunk_size=5
+                    )
+                ),
+                RegexpTokenizer().tokens(text),
+            )
+        finally:
+            os.remove(path)
+
 
 if __name__ == '__main__':
     unittest.main()
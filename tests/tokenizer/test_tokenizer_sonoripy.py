@@ -22,6 +22,7 @@ This module contains unit tests for abydos.tokenizer.QGrams
 import unittest
 
 from abydos.tokenizer import SonoriPyTokenizer
+from abydos.tokenizer._sonoripy import _sonoripy
 
 
 class SonoriPyTokenizerTestCases(unittest.TestCase):
@@ -70,6 +71,37 @@ class SonoriPyTokenizerTestCases(unittest.TestCase):
             sorted(['ca', 'ter', 'pil', 'lars']),
         )
 
+    def test_sonoripy_tokenizer_tokenize_many(self):
+        """Test abydos.tokenizer.SonoriPyTokenizer.tokenize_many."""
+        try:
+            from syllabipy.sonoripy import SonoriPy  # noqa: F401
+        except ImportError:  # pragma: no cover
+            return
+
+        tok = SonoriPyTokenizer()
+        strings = [
+            'character',
+            '',
+            'character set',
+            'a',
+            'seven-twelfths',
+            'character',
+        ]
+        self.assertEqual(
+            tok.tokenize_many(strings), [tok.tokens(_) for _ in strings]
+        )
+        self.assertEqual(tok.tokenize_many([]), [])
+
+        # tokenize & tokenize_many share the syllabification cache
+        _sonoripy.cache_clear()
+        tok.tokenize_many(['character set', 'character'])
+        self.assertEqual(_sonoripy.cache_info().misses, 2)
+        tok.tokenize('character')
+        self.assertEqual(_sonoripy.cache_info().hits, 1)
+        tok.tokenize_many(['set', 'character', 'sets'])
+        info = _sonoripy.cache_info()
+        self.assertEqual((info.hits, info.misses), (3, 3))
+
 
 if __name__ == '__main__':
     unittest.main()
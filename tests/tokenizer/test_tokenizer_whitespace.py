@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.tokenizer.QGrams
 """
 
+import io
 import unittest
 
 from abydos.tokenizer import WhitespaceTokenizer
@@ -74,6 +75,19 @@ class WhitespaceTokenizerTestCases(unittest.TestCase):
             ),
         )
 
+    def test_whitespace_tokenizer_iter_tokens(self):
+        """Test abydos.tokenizer.WhitespaceTokenizer.iter_tokens."""
+        text = 'a b  c\tf\n\na c g e a b   right! #SeeRed '
+        for chunk_size in (1, 2, 3, 5, 100):
+            self.assertEqual(
+                list(
+                    WhitespaceTokenizer().iter_tokens(
+                        io.StringIO(text), chunk_size=chunk_size
+                    )
+                ),
+                WhitespaceTokenizer().tokens(text),
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
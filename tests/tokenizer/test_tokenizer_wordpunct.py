@@ -19,6 +19,7 @@
 This module contains unit tests for abydos.tokenizer.QGrams
 """
 
+import io
 import unittest
 
 from abydos.tokenizer import WordpunctTokenizer
@@ -79,6 +80,19 @@ class WordpunctTokenizerTestCases(unittest.TestCase):
             ),
         )
 
+    def test_wordpunct_tokenizer_iter_tokens(self):
+        """Test abydos.tokenizer.WordpunctTokenizer.iter_tokens."""
+        text = "Can't stop the feelin'!! #AstronomyNight... 12:30p"
+        for chunk_size in (1, 2, 3, 5, 100):
+            self.assertEqual(
+                list(
+                    WordpunctTokenizer().iter_tokens(
+                        io.StringIO(text), chunk_size=chunk_size
+                    )
+                ),
+                WordpunctTokenizer().tokens(text),
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,76 @@
+# Copyright 2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_lru_cache.
+
+This module contains unit tests for abydos.util._lru_cache
+"""
+
+import unittest
+import weakref
+
+from abydos.util._lru_cache import _LRUCache
+
+
+class _Squarer:
+    """An object that caches one of its methods' results."""
+
+    def __init__(self):
+        self.cache = _LRUCache(2)
+        self.calls = []
+
+    def square(self, num):
+        self.calls.append(num)
+        return num * num
+
+    def cached_square(self, num):
+        return self.cache(self.square, num)
+
+
+class LRUCacheTestCases(unittest.TestCase):
+    """Test cases for abydos.util._lru_cache."""
+
+    def test_lru_cache(self):
+        """Test abydos.util._lru_cache._LRUCache."""
+        squarer = _Squarer()
+        self.assertEqual(squarer.cached_square(2), 4)
+        self.assertEqual(squarer.cached_square(2), 4)
+        self.assertEqual(squarer.cached_square(3), 9)
+        self.assertEqual(squarer.calls, [2, 3])
+        self.assertEqual((squarer.cache.hits, squarer.cache.misses), (1, 2))
+
+        # the least recently used result is evicted
+        self.assertEqual(squarer.cached_square(2), 4)
+        self.assertEqual(squarer.cached_square(4), 16)
+        self.assertEqual(len(squarer.cache), 2)
+        self.assertEqual(squarer.cached_square(2), 4)
+        self.assertEqual(squarer.cached_square(3), 9)
+        self.assertEqual(squarer.calls, [2, 3, 4, 3])
+
+        # results are keyed by all of the arguments
+        cache = _LRUCache(4)
+        self.assertEqual(cache(pow, 2, 3), 8)
+        self.assertEqual(cache(pow, 3, 2), 9)
+        self.assertEqual(cache.misses, 2)
+
+        # the cache holds no reference to the object whose method it caches
+        ref = weakref.ref(squarer)
+        del squarer
+        self.assertIsNone(ref())
+
+
+if __name__ == '__main__':
+    unittest.main()
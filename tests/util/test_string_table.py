@@ -0,0 +1,91 @@
+# Copyright 2014-2020 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.util.test_string_table.
+
+This module contains unit tests for abydos.util._string_table
+"""
+
+import io
+import unittest
+from array import array
+
+from abydos.util._string_table import (
+    _StringTable,
+    _decode,
+    _encode,
+    _pack_strings,
+    _view_columns,
+    _write_columns,
+)
+
+
+class StringTableTestCases(unittest.TestCase):
+    """Test cases for abydos.util._string_table."""
+
+    strings = sorted(
+        ['', 'a', 'ab', 'zoë', 'ångström', 'zebra', '\ud800', '\U0001f600'],
+        key=_encode,
+    )
+
+    def test_encode(self):
+        """Test abydos.util._string_table._encode & _decode."""
+        for string in self.strings:
+            self.assertEqual(_decode(_encode(string)), string)
+            self.assertEqual(_decode(memoryview(_encode(string))), string)
+        # byte order matches str order
+        self.assertEqual(self.strings, sorted(self.strings))
+
+    def test_string_table(self):
+        """Test abydos.util._string_table._StringTable."""
+        offsets, blob = _pack_strings(self.strings)
+        self.assertEqual(len(offsets), len(self.strings) + 1)
+        self.assertEqual(offsets[-1], len(blob))
+
+        # a table within a larger buffer
+        buffer = b'header' + blob + b'trailer'
+        table = _StringTable(buffer, offsets, 6)
+        self.assertEqual(len(table), len(self.strings))
+        self.assertEqual(table.end(), 6 + len(blob))
+        for i, string in enumerate(self.strings):
+            self.assertEqual(table[i], string)
+            self.assertEqual(table.find(string), i)
+        for string in ('b', 'zo', 'header', 'trailer', '\uffff'):
+            self.assertEqual(table.find(string), -1)
+
+        table = _StringTable(b'', _pack_strings([])[0], 0)
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.find(''), -1)
+
+    def test_columns(self):
+        """Test abydos.util._string_table._write_columns & _view_columns."""
+        columns = [array('Q', [0, 1, 2 ** 64 - 1]), array('d', [0.5, -1e300])]
+        out = io.BytesIO()
+        out.write(b'head')
+        _write_columns(out, columns)
+        buffer = out.getvalue()
+        self.assertEqual(buffer[4:12], bytes(8))
+        self.assertEqual(buffer[12:20], bytes([1] + [0] * 7))
+
+        views, end = _view_columns(buffer, 4, [(3, 'Q'), (2, 'd')])
+        self.assertEqual(end, len(buffer))
+        self.assertEqual(
+            [list(view) for view in views], [list(_) for _ in columns]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()